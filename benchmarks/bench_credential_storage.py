@@ -0,0 +1,72 @@
+"""Benchmark: CredentialStorage save/load latency with and without the key cache
+
+Runs against a throwaway SQLite database in a temporary directory. The
+"uncached" mode clears EncryptionService's key cache before every key use,
+which reproduces the previous behaviour of looking up the machine ID on each
+encrypt/decrypt call.
+
+Usage:
+    python -m benchmarks.bench_credential_storage [--rounds 50]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from src.infrastructure.database.repository import SQLAlchemyCardRepository, SQLAlchemyUserRepository
+from src.infrastructure.database.session import DatabaseManager
+from src.infrastructure.security.credential_storage import CredentialStorage
+from src.infrastructure.security.encryption import EncryptionService
+
+
+def _save_and_load(storage: CredentialStorage) -> None:
+    storage.save_ktx_login("010-1234-5678", "password")
+    storage.save_payment("1234567812345678", "12", "2912", "900101", False)
+    assert storage.load_ktx_login() is not None
+    assert storage.load_payment() is not None
+
+
+def _measure(storage: CredentialStorage, rounds: int) -> float:
+    _save_and_load(storage)  # warm-up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        _save_and_load(storage)
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def run(rounds: int) -> None:
+    derive_key = EncryptionService._derive_key
+
+    def uncached_derive_key() -> bytes:
+        EncryptionService.clear_key_cache()
+        return derive_key()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "credentials.db"
+        with mock.patch.object(DatabaseManager, "get_db_path", return_value=db_path):
+            storage = CredentialStorage(SQLAlchemyUserRepository(), SQLAlchemyCardRepository())
+
+            print(f"save+load of login and payment credentials, {rounds} rounds")
+            with mock.patch.object(EncryptionService, "_derive_key", uncached_derive_key):
+                uncached = _measure(storage, rounds)
+            EncryptionService.clear_key_cache()
+            cached = _measure(storage, rounds)
+
+            print(f"  uncached {uncached:8.2f} ms/round")
+            print(f"  cached   {cached:8.2f} ms/round")
+
+            DatabaseManager._engine.dispose()
+            DatabaseManager._engine = None
+            DatabaseManager._session_factory = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    run(args.rounds)
+
+
+if __name__ == "__main__":
+    main()
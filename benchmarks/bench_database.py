@@ -0,0 +1,101 @@
+"""Benchmark: DatabaseManager.initialize() and credential round trip, cold and warm
+
+"cold" starts from a missing database file, "warm" reopens an existing one, as
+on every app start after the first. Each is measured for the tuned profile
+(WAL, pooled connection, create_all skipped on a matching revision) and for
+the previous default engine that ran create_all unconditionally.
+
+Usage:
+    python -m benchmarks.bench_database [--rounds 20] [--ops 50]
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.database.models import Base
+from src.infrastructure.database.repository import SQLAlchemyCardRepository, SQLAlchemyUserRepository
+from src.infrastructure.database.session import DatabaseManager
+
+
+def _legacy_initialize() -> None:
+    """DatabaseManager.initialize() as it was before the SQLite profile"""
+    engine = create_engine(
+        f"sqlite:///{DatabaseManager.get_db_path()}",
+        connect_args={"check_same_thread": False}
+    )
+    DatabaseManager._session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    DatabaseManager._engine = engine
+    Base.metadata.create_all(engine)
+
+
+def _shutdown() -> None:
+    if DatabaseManager._engine is not None:
+        DatabaseManager._engine.dispose()
+    DatabaseManager._engine = None
+    DatabaseManager._session_factory = None
+
+
+def _round_trip(ops: int) -> None:
+    users = SQLAlchemyUserRepository()
+    cards = SQLAlchemyCardRepository()
+    for i in range(ops):
+        users.save(username=f"user{i}", password="pass", train_type="KORAIL")
+        cards.save(
+            card_number="1234567812345678",
+            card_password="12",
+            card_expired_date="2912",
+            card_validate_number="900101",
+            is_corporate=False,
+            train_type="SRT"
+        )
+        users.find_by_train_type("KORAIL")
+        cards.find_by_train_type("SRT")
+
+
+def _measure(initialize, db_path: Path, cold: bool, rounds: int, ops: int) -> tuple[float, float]:
+    init_times, trip_times = [], []
+    for _ in range(rounds):
+        _shutdown()
+        if cold:
+            for suffix in ("", "-wal", "-shm", "-journal"):
+                Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+        start = time.perf_counter()
+        initialize()
+        init_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        _round_trip(ops)
+        trip_times.append(time.perf_counter() - start)
+    _shutdown()
+    return statistics.median(init_times) * 1000, statistics.median(trip_times) / ops * 1000
+
+
+def run(rounds: int, ops: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"median of {rounds} rounds, {ops} save+find pairs per round trip")
+        for name, initialize in (("legacy", _legacy_initialize), ("tuned", DatabaseManager.initialize)):
+            db_path = Path(tmp) / f"{name}.db"
+            with mock.patch.object(DatabaseManager, "get_db_path", return_value=db_path):
+                for cold in (True, False):
+                    init_ms, op_ms = _measure(initialize, db_path, cold, rounds, ops)
+                    label = f"{name} {'cold' if cold else 'warm'}"
+                    print(f"  {label:<12} initialize {init_ms:7.2f} ms  round trip {op_ms:6.3f} ms/op")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--ops", type=int, default=50)
+    args = parser.parse_args()
+    run(args.rounds, args.ops)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark: decoding search and reservation responses
+
+Records the search and reservation list bodies of the local fake SRT and
+Korail servers, then decodes each one repeatedly in three ways:
+
+- text + json: ``json.loads(r.text)``, which decodes the body to str first
+- bytes + json: stdlib ``json.loads`` on the raw ``r.content``
+- bytes + orjson: ``orjson.loads`` on ``r.content`` (when installed)
+
+The SRT payloads are also timed through the old SRTResponseData path (json
+on text, ``get_all()`` returning a copy) and through
+``SRTResponseData.from_response`` with its read-only ``get_all()`` view.
+
+``--cassette`` decodes the JSON bodies of a recorded cassette (see
+src/infrastructure/external/cassette.py) instead of the fake servers' bodies.
+
+Usage:
+    python -m benchmarks.bench_json_decode [--trains 50] [--reservations 10] [--rounds 2000]
+                                           [--cassette traffic.jsonl]
+"""
+import argparse
+import json
+import time
+from datetime import date, timedelta
+
+from src.infrastructure.external import json_codec
+from src.infrastructure.external.cassette import load_cassette
+from src.infrastructure.external.srt import SRTResponseData
+from tests.fakes.base import FakeTrain
+from tests.fakes.korail_server import FakeKorailServer
+from tests.fakes.srt_server import FakeSRTServer
+
+
+class _RecordedResponse:
+    """Recorded body with the content/text surface of a transport response"""
+
+    def __init__(self, body: bytes):
+        self.content = body
+
+    @property
+    def text(self) -> str:
+        # requests and curl_cffi decode the body again on every access
+        return self.content.decode("utf-8")
+
+
+def _record(trains: int, reservations: int) -> dict[str, _RecordedResponse]:
+    timetable = [FakeTrain(str(301 + i), general_seats=reservations + 1) for i in range(trains)]
+    travel_date = (date.today() + timedelta(days=7)).strftime("%Y%m%d")
+    srt = FakeSRTServer(timetable)
+    korail = FakeKorailServer(timetable)
+    for i in range(reservations):
+        train_number = timetable[i % trains].train_number
+        srt._on_reserve({"trnNo1": f"{int(train_number):05d}", "dptDt1": travel_date,
+                         "dptRsStnCd1": "0551", "arvRsStnCd1": "0020"})
+        korail._on_reserve({"txtTrnNo1": train_number, "txtDptDt1": travel_date,
+                            "txtDptRsStnCd1": "0001", "txtArvRsStnCd1": "0020"})
+
+    bodies = {
+        "SRT search": srt._on_search_schedule(
+            {"dptDt": travel_date, "dptRsStnCd": "0551", "arvRsStnCd": "0020"}
+        ),
+        "SRT reservations": srt._on_tickets({}),
+        "Korail search": korail._on_search_schedule(
+            {"txtGoAbrdDt": travel_date, "txtGoStart": "서울", "txtGoEnd": "부산"}
+        ),
+        "Korail reservations": korail._on_myreservationview({}),
+    }
+    return {
+        name: _RecordedResponse(json.dumps(body, ensure_ascii=False).encode("utf-8"))
+        for name, body in bodies.items()
+    }
+
+
+def _from_cassette(path: str) -> dict[str, _RecordedResponse]:
+    responses = {}
+    for n, interaction in enumerate(load_cassette(path)):
+        if "json" in interaction.content_type:
+            name = f"{n:03d} {interaction.path.rsplit('/', 1)[-1]}"
+            responses[name[:20]] = _RecordedResponse(interaction.body.encode("utf-8"))
+    return responses
+
+
+def _per_call_us(fn, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def run(trains: int, reservations: int, rounds: int, cassette: str | None = None) -> None:
+    responses = _from_cassette(cassette) if cassette else _record(trains, reservations)
+    decoders = {
+        "text + json": lambda r: json.loads(r.text),
+        "bytes + json": lambda r: json.loads(r.content),
+    }
+    if json_codec.HAS_ORJSON:
+        decoders["bytes + orjson"] = lambda r: json_codec.orjson.loads(r.content)
+
+    print(f"{rounds} decodes per case, times in microseconds")
+    print(f"  {'payload':<20s} {'KiB':>6s}" + "".join(f" {name:>15s}" for name in decoders))
+    for name, response in responses.items():
+        timings = [_per_call_us(lambda: decode(response), rounds) for decode in decoders.values()]
+        print(f"  {name:<20s} {len(response.content) / 1024:6.1f}" + "".join(f" {t:15.1f}" for t in timings))
+
+    if cassette:
+        return
+    print("SRTResponseData, parse and read all data twice:")
+    for name in ("SRT search", "SRT reservations"):
+        response = responses[name]
+
+        def copies():
+            parsed = json.loads(response.text)
+            return parsed.copy(), parsed.copy()
+
+        def views():
+            parser = SRTResponseData.from_response(response)
+            return parser.get_all(), parser.get_all()
+
+        print(
+            f"  {name:<20s} text + copy {_per_call_us(copies, rounds):8.1f}"
+            f"   bytes + view {_per_call_us(views, rounds):8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trains", type=int, default=50)
+    parser.add_argument("--reservations", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--cassette", help="recorded cassette whose JSON bodies are decoded")
+    args = parser.parse_args()
+    run(args.trains, args.reservations, args.rounds, args.cassette)
+
+
+if __name__ == "__main__":
+    main()
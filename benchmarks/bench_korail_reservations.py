@@ -0,0 +1,145 @@
+"""Benchmark: request count of Korail.reservations(rsv_id) against a local fake server
+
+Serves ReservationView (N reservations) and ReservationList from a localhost
+HTTP server and compares a targeted lookup with the eager path, where every
+reservation's seat details are fetched.
+
+Usage:
+    python -m benchmarks.bench_korail_reservations [--reservations 5] [--rounds 20]
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from src.infrastructure.external import ktx
+from src.infrastructure.external.ktx import Korail
+
+
+def _train_info(rsv_id: str) -> dict:
+    return {
+        "h_trn_clsf_cd": "100",
+        "h_trn_clsf_nm": "KTX",
+        "h_trn_gp_cd": "100",
+        "h_trn_no": "001",
+        "h_dpt_rs_stn_nm": "서울",
+        "h_dpt_rs_stn_cd": "0001",
+        "h_dpt_dt": "20250110",
+        "h_dpt_tm": "100000",
+        "h_arv_rs_stn_nm": "부산",
+        "h_arv_rs_stn_cd": "0020",
+        "h_arv_dt": "20250110",
+        "h_arv_tm": "125959",
+        "h_run_dt": "20250110",
+        "h_pnr_no": rsv_id,
+        "h_tot_seat_cnt": "1",
+        "h_ntisu_lmt_dt": "20250110",
+        "h_ntisu_lmt_tm": "095959",
+        "h_rsv_amt": "59800",
+    }
+
+
+class FakeKorailHandler(BaseHTTPRequestHandler):
+    """Serves the two reservation endpoints and counts requests per path"""
+
+    reservation_ids: list[str] = []
+    counts: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        with self.lock:
+            self.counts[path] = self.counts.get(path, 0) + 1
+
+        if path.endswith("reservation.ReservationView"):
+            body = {
+                "strResult": "SUCC",
+                "jrny_infos": {
+                    "jrny_info": [
+                        {"train_infos": {"train_info": [_train_info(rsv_id)]}}
+                        for rsv_id in self.reservation_ids
+                    ]
+                },
+            }
+        elif path.endswith("certification.ReservationList"):
+            body = {
+                "strResult": "SUCC",
+                "h_wct_no": "001",
+                "jrny_infos": {
+                    "jrny_info": [
+                        {"seat_infos": {"seat_info": [{"h_srcar_no": "05", "h_seat_no": "12A", "h_rcvd_amt": "59800"}]}}
+                    ]
+                },
+            }
+        else:
+            self.send_error(404)
+            return
+
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _eager_lookup(korail: Korail, rsv_id: str):
+    """Previous behaviour: seat details for every reservation before matching"""
+    for reservation in korail.reservations():
+        _ = reservation.tickets, reservation.wct_no
+        if reservation.rsv_id == rsv_id:
+            return reservation
+    return None
+
+
+def _targeted_lookup(korail: Korail, rsv_id: str):
+    reservation = korail.reservations(rsv_id)
+    _ = reservation.tickets, reservation.wct_no
+    return reservation
+
+
+def run(reservations: int, rounds: int) -> None:
+    FakeKorailHandler.reservation_ids = [f"{i:05d}" for i in range(1, reservations + 1)]
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeKorailHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    base = f"http://127.0.0.1:{server.server_port}/classes/com.korail.mobile"
+    original = dict(ktx.API_ENDPOINTS)
+    ktx.API_ENDPOINTS["myreservationview"] = f"{base}.reservation.ReservationView"
+    ktx.API_ENDPOINTS["myreservationlist"] = f"{base}.certification.ReservationList"
+
+    try:
+        korail = Korail(auto_login=False)
+        korail._session.headers.pop("Host", None)
+        target = FakeKorailHandler.reservation_ids[-1]
+
+        print(f"{reservations} reservations, target={target}, {rounds} rounds")
+        for name, lookup in (("eager", _eager_lookup), ("targeted", _targeted_lookup)):
+            FakeKorailHandler.counts.clear()
+            start = time.perf_counter()
+            for _ in range(rounds):
+                assert lookup(korail, target).rsv_id == target
+            elapsed = (time.perf_counter() - start) / rounds * 1000
+            requests_per_lookup = sum(FakeKorailHandler.counts.values()) / rounds
+            print(f"  {name:<9} {requests_per_lookup:5.1f} requests/lookup  {elapsed:7.2f} ms/lookup")
+    finally:
+        ktx.API_ENDPOINTS.clear()
+        ktx.API_ENDPOINTS.update(original)
+        server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reservations", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    run(args.reservations, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
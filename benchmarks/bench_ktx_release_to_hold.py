@@ -0,0 +1,164 @@
+"""Benchmark: seat-released to hold-confirmed latency of the KTX reservation loop
+
+Runs ReservationEngine with KTXService against a local fake Korail server. Every
+round starts on a sold-out train and frees one seat after a random delay, as
+when another passenger cancels. The time from that release to the engine's
+RESERVED event is what the retry delay, the request latency and injected errors
+cost a user waiting for a seat. Each worker thread drives its own engine,
+service and train.
+
+An injected error after TicketReservation took the seat leaves a hold the
+client never learns about. Such lost holds are cancelled as soon as the engine
+reports a failed attempt, as if they had expired, and counted separately. The
+latency of that round is then measured from the re-release.
+
+Usage:
+    python -m benchmarks.bench_ktx_release_to_hold [--rounds 50] [--threads 1]
+        [--retry-min-ms 50] [--retry-max-ms 200] [--release-max-ms 300]
+        [--latency-ms 0] [--jitter-ms 0] [--error-rate 0]
+"""
+import argparse
+import random
+import statistics
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+from src.domain.models.entities import ReservationRequest, TrainSchedule
+from src.domain.models.enums import TrainType
+from src.domain.services.reservation_engine import (
+    ReservationEngine, ReservationEvent, ReservationEventType, ReservationJob, ReservationState
+)
+from src.infrastructure.adapters.ktx_service import KTXService
+from tests.fakes.korail_server import FakeKorailServer, FakeTrain
+
+_FAILURES = (ReservationEventType.RESERVE_FAILED, ReservationEventType.ERROR, ReservationEventType.TIMEOUT)
+
+
+def _job(train_number: str) -> ReservationJob:
+    travel_date = date.today() + timedelta(days=7)
+    departure = datetime.combine(travel_date, datetime.min.time()) + timedelta(hours=10)
+    schedule = TrainSchedule(
+        train_number=train_number,
+        departure_station="서울",
+        arrival_station="부산",
+        departure_time=departure,
+        arrival_time=departure + timedelta(hours=2, minutes=30),
+        train_type=TrainType.KTX,
+        available_seats=0,
+    )
+    return ReservationJob(
+        trains=[schedule],
+        request=ReservationRequest("서울", "부산", travel_date, "080000"),
+        user_id="benchmark@example.com",
+        password="password",
+    )
+
+
+def _worker(
+    server: FakeKorailServer,
+    train_number: str,
+    rounds: int,
+    retry_delay: tuple[float, float],
+    release_max: float,
+    holds: list,
+    attempts: list,
+    lost: list,
+) -> None:
+    service = KTXService(**server.client_options())
+    while not service.login("benchmark@example.com", "password"):
+        pass  # injected error
+    job = _job(train_number)
+
+    for _ in range(rounds):
+        server.set_seats(train_number, general=0)
+        reserved = {}
+
+        def on_event(event: ReservationEvent) -> None:
+            if event.type == ReservationEventType.RESERVED:
+                reserved["at"] = time.perf_counter()
+                reserved["number"] = event.reservation.reservation_number
+            elif event.type in _FAILURES:
+                # Before RESERVED this worker holds nothing it knows about
+                for number in server.reservations_for(train_number):
+                    server.cancel_reservation(number)
+                    lost.append(number)
+
+        engine = ReservationEngine(service, job, on_event, retry_delay=retry_delay)
+        server.release_after(random.uniform(0, release_max), train_number, general=1)
+        if engine.run() != ReservationState.AWAITING_PAYMENT:
+            raise RuntimeError(f"reservation loop ended in {engine.state}")
+
+        holds.append(reserved["at"] - server.released_at[train_number])
+        attempts.append(engine.attempt)
+        server.cancel_reservation(reserved["number"])
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def run(
+    rounds: int,
+    threads: int,
+    retry_delay: tuple[float, float],
+    release_max: float,
+    latency_ms: float,
+    jitter_ms: float,
+    error_rate: float,
+) -> None:
+    trains = [FakeTrain(f"1{i:02d}") for i in range(threads)]
+    holds: list[float] = []
+    attempts: list[int] = []
+    lost: list[str] = []
+
+    with FakeKorailServer(trains, latency=latency_ms / 1000, jitter=jitter_ms / 1000, error_rate=error_rate) as server:
+        workers = [
+            threading.Thread(
+                target=_worker,
+                args=(server, train.train_number, rounds, retry_delay, release_max, holds, attempts, lost),
+            )
+            for train in trains
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        counts = dict(server.counts)
+
+    print(
+        f"{rounds} rounds x {threads} thread(s), retry delay {retry_delay[0] * 1000:g}-{retry_delay[1] * 1000:g} ms, "
+        f"latency {latency_ms:g} ms (+{jitter_ms:g} ms jitter), error rate {error_rate:.0%}"
+    )
+    print(
+        f"  release -> hold  p50 {_percentile(holds, 50) * 1000:7.2f} ms  "
+        f"p99 {_percentile(holds, 99) * 1000:7.2f} ms  max {max(holds) * 1000:7.2f} ms"
+    )
+    print(f"  attempts/round {statistics.mean(attempts):5.2f}  lost holds {len(lost)}")
+    print("  requests " + ", ".join(f"{name}={count}" for name, count in sorted(counts.items())))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--retry-min-ms", type=float, default=50.0)
+    parser.add_argument("--retry-max-ms", type=float, default=200.0)
+    parser.add_argument("--release-max-ms", type=float, default=300.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    run(
+        args.rounds,
+        args.threads,
+        (args.retry_min_ms / 1000, args.retry_max_ms / 1000),
+        args.release_max_ms / 1000,
+        args.latency_ms,
+        args.jitter_ms,
+        args.error_rate,
+    )
+
+
+if __name__ == "__main__":
+    main()
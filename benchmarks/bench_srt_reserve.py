@@ -0,0 +1,114 @@
+"""Benchmark: SRTService.reserve_train time-to-reserve against a local fake SRT server
+
+Every round calls reserve_train until it succeeds, with one seat released on
+the target train before each attempt and failed attempts retried at once, so
+injected errors show up as extra attempts in the time-to-reserve. Each worker
+thread drives its own SRTService over real HTTP (search, NetFunnel, reserve and
+ticket_info), which also gives the throughput of concurrent reservation loops.
+
+Usage:
+    python -m benchmarks.bench_srt_reserve [--rounds 200] [--threads 1]
+        [--latency-ms 0] [--jitter-ms 0] [--error-rate 0]
+"""
+import argparse
+import statistics
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+from src.domain.models.entities import ReservationRequest, TrainSchedule
+from src.domain.models.enums import TrainType
+from src.infrastructure.adapters.srt_service import SRTService
+from tests.fakes.srt_server import FakeSRTServer, FakeTrain
+
+
+def _request() -> ReservationRequest:
+    return ReservationRequest(
+        departure_station="수서",
+        arrival_station="부산",
+        departure_date=date.today() + timedelta(days=7),
+        departure_time="080000",
+    )
+
+
+def _schedule(train_number: str) -> TrainSchedule:
+    departure = datetime.combine(date.today() + timedelta(days=7), datetime.min.time())
+    return TrainSchedule(
+        train_number=train_number,
+        departure_station="수서",
+        arrival_station="부산",
+        departure_time=departure + timedelta(hours=10),
+        arrival_time=departure + timedelta(hours=12, minutes=30),
+        train_type=TrainType.SRT,
+        available_seats=0,
+    )
+
+
+def _worker(server: FakeSRTServer, train_number: str, rounds: int, times: list, attempts: list) -> None:
+    service = SRTService(**server.client_options())
+    while not service.login("benchmark@example.com", "password"):
+        pass  # injected error
+    request, schedules = _request(), [_schedule(train_number)]
+
+    for _ in range(rounds):
+        tries = 0
+        start = time.perf_counter()
+        while True:
+            # An injected error after the seat was taken (e.g. on ticket_info)
+            # still holds it server side, so release one before every attempt
+            server.set_seats(train_number, general=1)
+            tries += 1
+            if service.reserve_train(schedules, request).success:
+                break
+        times.append(time.perf_counter() - start)
+        attempts.append(tries)
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def run(rounds: int, threads: int, latency_ms: float, jitter_ms: float, error_rate: float) -> None:
+    trains = [FakeTrain(f"3{i:02d}") for i in range(threads)]
+    times: list[float] = []
+    attempts: list[int] = []
+
+    with FakeSRTServer(trains, latency=latency_ms / 1000, jitter=jitter_ms / 1000, error_rate=error_rate) as server:
+        workers = [
+            threading.Thread(target=_worker, args=(server, train.train_number, rounds, times, attempts))
+            for train in trains
+        ]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        counts = dict(server.counts)
+
+    print(
+        f"{rounds} rounds x {threads} thread(s), latency {latency_ms:g} ms "
+        f"(+{jitter_ms:g} ms jitter), error rate {error_rate:.0%}"
+    )
+    print(
+        f"  time-to-reserve  p50 {_percentile(times, 50) * 1000:7.2f} ms  "
+        f"p99 {_percentile(times, 99) * 1000:7.2f} ms  max {max(times) * 1000:7.2f} ms"
+    )
+    print(f"  attempts/reservation {statistics.mean(attempts):5.2f}")
+    print(f"  throughput {len(times) / elapsed:8.1f} reservations/s")
+    print("  requests " + ", ".join(f"{name}={count}" for name, count in sorted(counts.items())))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    run(args.rounds, args.threads, args.latency_ms, args.jitter_ms, args.error_rate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Benchmark: memory per train object and allocation churn of search polling
+
+Builds Korail Train, SRTTrain and TrainSchedule objects from the search
+responses of the local fake servers, the way a polling loop does. Every poll
+decodes a fresh JSON body, so each row brings its own copies of the station
+and train type strings, as on the wire. Reports, with tracemalloc:
+
+- retained bytes per object once the response rows are dropped, for the
+  slotted read-only classes and for the same fields in a plain instance
+  ``__dict__`` without interning (the layout the classes had before)
+- churn of a poll: peak traced memory and time per object while each poll's
+  objects are built and dropped
+
+Usage:
+    python -m benchmarks.bench_train_objects [--trains 50] [--polls 200]
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+from src.domain.models.entities import TrainSchedule
+from src.domain.models.enums import TrainType
+from src.infrastructure.external.ktx import Train
+from src.infrastructure.external.srt import SRTTrain
+from tests.fakes.base import FakeTrain
+from tests.fakes.korail_server import FakeKorailServer
+from tests.fakes.srt_server import FakeSRTServer
+
+
+class _DictBacked:
+    """The same fields in an instance __dict__, each string its own object"""
+
+    def __init__(self, fields: dict):
+        self.__dict__.update(fields)
+
+
+def _fresh(value):
+    # a distinct copy, like the one json.loads makes for every row
+    return value[:1] + value[1:] if isinstance(value, str) and len(value) > 1 else value
+
+
+def _fields(obj) -> dict:
+    names = [name for cls in type(obj).__mro__ for name in cls.__dict__.get("__slots__", ())]
+    return {name: _fresh(getattr(obj, name)) for name in names if hasattr(obj, name)}
+
+
+def _schedule(train: Train) -> TrainSchedule:
+    return TrainSchedule(
+        train_number=train.train_no,
+        departure_station=train.dep_name,
+        arrival_station=train.arr_name,
+        departure_time=datetime.strptime(train.dep_date + train.dep_time, "%Y%m%d%H%M%S"),
+        arrival_time=datetime.strptime(train.arr_date + train.arr_time, "%Y%m%d%H%M%S"),
+        train_type=TrainType.KTX,
+        available_seats=0,
+    )
+
+
+def _retained_bytes(build, rows_source, count: int) -> float:
+    """Bytes still traced per object after building `count` objects and dropping their rows"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = []
+    while len(objects) < count:
+        objects.extend(build(row) for row in rows_source())
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return retained / len(objects)
+
+
+def _churn(build, rows_source, polls: int) -> tuple[float, float]:
+    """Peak traced KiB of one poll and microseconds per object"""
+    tracemalloc.start()
+    peak = 0
+    built = 0
+    elapsed = 0.0
+    for _ in range(polls):
+        rows = rows_source()
+        tracemalloc.reset_peak()
+        start_mem = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        objects = [build(row) for row in rows]
+        elapsed += time.perf_counter() - started
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - start_mem)
+        built += len(objects)
+        del objects, rows
+    tracemalloc.stop()
+    return peak / 1024, elapsed / built * 1e6
+
+
+def run(trains: int, polls: int) -> None:
+    timetable = [FakeTrain(f"{i + 1:03d}", general_seats=i % 2) for i in range(trains)]
+    travel_date = (date.today() + timedelta(days=7)).strftime("%Y%m%d")
+    korail_body = json.dumps(FakeKorailServer(timetable)._on_search_schedule(
+        {"txtGoAbrdDt": travel_date, "txtGoStart": "서울", "txtGoEnd": "부산"}
+    ))
+    srt_body = json.dumps(FakeSRTServer(timetable)._on_search_schedule(
+        {"dptDt": travel_date, "dptRsStnCd": "0551", "arvRsStnCd": "0020"}
+    ))
+
+    def korail_rows():
+        return json.loads(korail_body)["trn_infos"]["trn_info"]
+
+    def srt_rows():
+        return json.loads(srt_body)["outDataSets"]["dsOutput1"]
+
+    cases = [
+        ("ktx.Train", Train, korail_rows),
+        ("SRTTrain", SRTTrain, srt_rows),
+        ("TrainSchedule", lambda row: _schedule(Train(row)), korail_rows),
+    ]
+    count = trains * polls
+
+    print(f"{trains} trains per response, {polls} polls")
+    print(f"  {'class':<14s} {'slotted B/obj':>13s} {'dict B/obj':>11s} {'peak KiB/poll':>14s} {'us/obj':>7s}")
+    for name, build, rows_source in cases:
+        slotted = _retained_bytes(build, rows_source, count)
+        dict_backed = _retained_bytes(lambda row: _DictBacked(_fields(build(row))), rows_source, count)
+        peak, per_object = _churn(build, rows_source, polls)
+        print(f"  {name:<14s} {slotted:13.0f} {dict_backed:11.0f} {peak:14.1f} {per_object:7.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trains", type=int, default=50)
+    parser.add_argument("--polls", type=int, default=200)
+    args = parser.parse_args()
+    run(args.trains, args.polls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark: per-request latency of each HTTP transport and connection setting
+
+Runs Korail searches against a local fake Korail server through every
+available sync backend, with keep-alive on and off. Latencies are collected
+through the transport's timing hooks, the same way an app would measure them.
+
+Usage:
+    python -m benchmarks.bench_transport [--requests 500] [--latency-ms 0]
+"""
+import argparse
+import statistics
+from datetime import date, timedelta
+
+from src.infrastructure.external import transport as transport_module
+from src.infrastructure.external.ktx import Korail
+from src.infrastructure.external.transport import CurlTransport, RequestsTransport, TransportConfig
+from tests.fakes.korail_server import FakeKorailServer, FakeTrain
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def _measure(server: FakeKorailServer, transport_class, config: TransportConfig, requests: int) -> list[float]:
+    transport = transport_class(config)
+    korail = Korail("benchmark@example.com", "password", transport=transport, **server.client_options())
+    travel_date = (date.today() + timedelta(days=7)).strftime("%Y%m%d")
+    elapsed: list[float] = []
+    transport.add_hook(lambda timing: elapsed.append(timing.elapsed))
+    for _ in range(requests):
+        korail.search_train("서울", "부산", travel_date, "080000", include_no_seats=True)
+    return elapsed
+
+
+def run(requests: int, latency_ms: float) -> None:
+    backends = [RequestsTransport]
+    if transport_module.HAS_CURL_CFFI:
+        backends.insert(0, CurlTransport)
+
+    print(f"{requests} searches per case, server latency {latency_ms:g} ms")
+    with FakeKorailServer([FakeTrain(f"1{i:02d}") for i in range(10)], latency=latency_ms / 1000) as server:
+        for transport_class in backends:
+            for keep_alive in (True, False):
+                elapsed = _measure(server, transport_class, TransportConfig(keep_alive=keep_alive), requests)
+                print(
+                    f"  {transport_class.name:<10s} keep-alive {'on ' if keep_alive else 'off'}  "
+                    f"p50 {_percentile(elapsed, 50) * 1000:6.2f} ms  "
+                    f"p99 {_percentile(elapsed, 99) * 1000:6.2f} ms"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    run(args.requests, args.latency_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,16 @@ DEFAULT_SRT_ARRIVAL = "부산"
 RETRY_DELAY_MIN = 1.0
 RETRY_DELAY_MAX = 4.0
 CLIENT_RESET_INTERVAL = 500
+RESERVE_ATTEMPT_TIMEOUT = 30.0  # deadline for one reserve -> pay attempt (seconds)
 
 # Log settings
 LOG_MIN_LINES = 8
-LOG_MAX_LINES = 10
\ No newline at end of file
+LOG_MAX_LINES = 10
+LOG_BUFFER_LINES = 5000  # lines kept in the log view; older ones are dropped or spilled
+LOG_FLUSH_INTERVAL_MS = 100  # new log lines reach the view in one batch per interval
+LOG_SPILL_MAX_BYTES = 5 * 1024 * 1024  # size of one spill file before it is rotated
+LOG_SPILL_BACKUPS = 3
+
+# Performance panel settings
+PERF_PANEL_FPS = 4  # refreshes per second while the panel is open
+PERF_RATE_WINDOW = 60.0  # seconds of attempts averaged into attempts per minute
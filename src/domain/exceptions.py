@@ -0,0 +1,36 @@
+"""Errors that TrainService implementations let through to their callers"""
+
+
+class TrainServiceError(Exception):
+    """Base class for train service errors"""
+
+
+class TrainServiceTimeoutError(TrainServiceError):
+    """A request, or the deadline of a reserve -> pay attempt, ran out
+
+    The request has already been abandoned, so the caller can retry at once.
+    """
+
+
+class TrainServiceCancelledError(TrainServiceError):
+    """The cancel token was set while a request was pending"""
+
+
+class TrainServiceConnectionError(TrainServiceError):
+    """The request failed below HTTP (connection refused, reset, TLS error)"""
+
+
+class TrainServiceLoginError(TrainServiceError):
+    """The service rejected the credentials"""
+
+
+class TrainServiceLoginExpiredError(TrainServiceError):
+    """The session is not logged in (any more); log in again before retrying"""
+
+
+class TrainServiceSoldOutError(TrainServiceError):
+    """None of the requested trains has a seat the request allows"""
+
+
+class TrainServiceResponseError(TrainServiceError):
+    """The service answered with an error no more specific class covers"""
@@ -1,7 +1,8 @@
 """Domain entities and value objects"""
 
-from dataclasses import dataclass
-from typing import List, Optional, Protocol
+import sys
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Protocol
 from datetime import datetime, date
 
 from src.domain.models.enums import PassengerType, TrainType
@@ -39,9 +40,9 @@ class Station:
     code: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TrainSchedule:
-    """열차 스케줄 정보"""
+    """열차 스케줄 정보 (불변)"""
     train_number: str
     departure_station: str
     arrival_station: str
@@ -51,6 +52,13 @@ class TrainSchedule:
     available_seats: int
     price: Optional[int] = None
 
+    def __post_init__(self):
+        # 반복되는 역 이름은 하나의 문자열 객체를 공유
+        for name in ("departure_station", "arrival_station"):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, sys.intern(value))
+
 
 @dataclass
 class ReservationRequest:
@@ -76,6 +84,8 @@ class ReservationResult:
     reservation_number: Optional[str] = None
     message: str = ""
     train_schedule: Optional[TrainSchedule] = None
+    # 결제 시 재조회 없이 재사용하는 외부 서비스 예약 객체 (어댑터 전용)
+    handle: Optional[Any] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
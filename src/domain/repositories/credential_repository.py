@@ -33,6 +33,28 @@ class IUserRepository(Protocol):
         """
         ...
 
+    def find_all(self) -> list[UserEntity]:
+        """
+        Find all stored users with a single query
+
+        Returns:
+            List of UserEntity (at most one per train type)
+        """
+        ...
+
+    def save_all(self, entries: list[dict]) -> list[UserEntity]:
+        """
+        Save or update several users in one transaction
+
+        Args:
+            entries: Keyword arguments of save() (username, password, train_type)
+                for each user
+
+        Returns:
+            The saved UserEntitys, in the order given
+        """
+        ...
+
     def delete(self, train_type: str) -> bool:
         """
         Delete user by train type
@@ -86,6 +108,29 @@ class ICardRepository(Protocol):
         """
         ...
 
+    def find_all(self) -> list[CardEntity]:
+        """
+        Find all stored cards with a single query
+
+        Returns:
+            List of CardEntity (at most one per train type)
+        """
+        ...
+
+    def save_all(self, entries: list[dict]) -> list[CardEntity]:
+        """
+        Save or update several cards in one transaction
+
+        Args:
+            entries: Keyword arguments of save() (card_number, card_password,
+                card_expired_date, card_validate_number, is_corporate, train_type)
+                for each card
+
+        Returns:
+            The saved CardEntitys, in the order given
+        """
+        ...
+
     def delete(self, train_type: str) -> bool:
         """
         Delete card by train type
@@ -0,0 +1,21 @@
+"""Cancellation token shared between the reservation engine and train clients"""
+import threading
+
+
+class CancellationToken(threading.Event):
+    """
+    A threading.Event used as a cancellation flag
+
+    Being a plain Event, it can be handed to the SRT/Korail clients, which only
+    call ``is_set()`` and ``wait(timeout)`` on it. ``wait`` returns as soon as the
+    token is cancelled, so it doubles as an interruptible sleep.
+    """
+
+    def cancel(self) -> None:
+        """Signal cancellation and wake up every waiter"""
+        self.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called"""
+        return self.is_set()
@@ -0,0 +1,261 @@
+"""UI-independent poll -> reserve -> pay loop for any TrainService"""
+import os
+import random
+import threading
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, List, Optional
+
+from src.constants.ui import CLIENT_RESET_INTERVAL, RETRY_DELAY_MAX, RETRY_DELAY_MIN
+from src.domain.exceptions import TrainServiceTimeoutError
+from src.domain.models.entities import (
+    CreditCard, PaymentResult, ReservationRequest, ReservationResult, TrainSchedule
+)
+from src.domain.services.cancellation import CancellationToken
+from src.domain.services.tracing import NULL_TRACER, Tracer
+from src.domain.services.train_service import TrainService
+
+
+class ReservationState(Enum):
+    """예약 엔진 상태"""
+    IDLE = "idle"
+    RUNNING = "running"
+    PAYING = "paying"
+    COMPLETED = "completed"  # 예약 및 결제 완료
+    AWAITING_PAYMENT = "awaiting_payment"  # 예약 완료, 앱에서 직접 결제 필요
+    FAILED = "failed"  # 재로그인 실패 등으로 중단
+    STOPPED = "stopped"
+
+
+class ReservationEventType(Enum):
+    """예약 엔진 이벤트 유형"""
+    ATTEMPT = "attempt"
+    SESSION_RESET = "session_reset"
+    RELOGGED_IN = "relogged_in"
+    RELOGIN_FAILED = "relogin_failed"
+    RESERVE_FAILED = "reserve_failed"
+    ERROR = "error"
+    TIMEOUT = "timeout"  # 요청 시간 초과, 즉시 재시도
+    RESERVED = "reserved"
+    PAYMENT_STARTED = "payment_started"
+    PAID = "paid"
+    PAYMENT_FAILED = "payment_failed"
+    PAYMENT_INFO_MISSING = "payment_info_missing"
+    STOPPED = "stopped"
+
+
+@dataclass(frozen=True)
+class ReservationEvent:
+    """예약 엔진이 발행하는 이벤트"""
+    type: ReservationEventType
+    attempt: int
+    message: str = ""
+    delay: Optional[float] = None  # 다음 시도까지 대기 시간 (초)
+    reservation: Optional[ReservationResult] = None
+    payment: Optional[PaymentResult] = None
+
+
+@dataclass
+class ReservationJob:
+    """예약 엔진 실행 단위"""
+    trains: List[TrainSchedule]
+    request: ReservationRequest
+    user_id: str
+    password: str
+    credit_card: Optional[CreditCard] = None  # 없으면 예약 후 직접 결제 안내
+    train_numbers: str = field(init=False)
+
+    def __post_init__(self):
+        self.train_numbers = ", ".join(train.train_number for train in self.trains)
+
+
+class ReservationEngine:
+    """
+    Runs the reservation loop for one job against a TrainService
+
+    Every step is reported to ``on_event`` (called on the engine thread), so the
+    same engine can be driven by the Qt app, a CLI or tests. The loop retries
+    with a random delay between ``retry_delay`` bounds (at once after a
+    TrainServiceTimeoutError) and re-logs in every ``reset_interval`` attempts,
+    until the train is paid for, payment has to be finished by hand, or
+    ``stop()`` is called.
+
+    ``stop()`` cancels the engine's CancellationToken: the retry wait returns at
+    once, and the token is handed to the service so a NetFunnel queue wait or a
+    pending search/reserve call raises instead of continuing. An engine is
+    single-use; start a new one to run again with other parameters.
+
+    With a ``tracer``, every iteration of the loop is traced as an "attempt"
+    span. Its attributes name the service, train numbers, attempt number,
+    ``loop`` (an id of this engine run) and ``result``, the last event type
+    of the iteration; the spans of the service calls nest below it.
+    """
+
+    def __init__(
+        self,
+        service: TrainService,
+        job: ReservationJob,
+        on_event: Callable[[ReservationEvent], None],
+        retry_delay: tuple[float, float] = (RETRY_DELAY_MIN, RETRY_DELAY_MAX),
+        reset_interval: int = CLIENT_RESET_INTERVAL,
+        sleep: Optional[Callable[[float], None]] = None,
+        tracer: Tracer = NULL_TRACER,
+    ) -> None:
+        self._service = service
+        self._job = job
+        self._on_event = on_event
+        self._retry_delay = retry_delay
+        self._reset_interval = reset_interval
+        self._cancel_token = CancellationToken()
+        # Default wait returns as soon as stop() is called
+        self._sleep = sleep or self._cancel_token.wait
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._tracer = tracer
+        self._loop_id = os.urandom(4).hex()
+        self._attempt_span = None
+        self._retry_wait: Optional[float] = None
+        self.state = ReservationState.IDLE
+        self.attempt = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the loop has been started and not stopped yet"""
+        return self._running
+
+    def start(self) -> threading.Thread:
+        """Run the loop on a daemon thread"""
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    @property
+    def cancel_token(self) -> CancellationToken:
+        """Token cancelled by stop()"""
+        return self._cancel_token
+
+    def stop(self) -> None:
+        """Stop the loop, interrupting the current wait"""
+        self._running = False
+        self._cancel_token.cancel()
+
+    def run(self) -> ReservationState:
+        """Run the loop on the calling thread until it finishes or is stopped"""
+        self._running = True
+        return self._run()
+
+    def _run(self) -> ReservationState:
+        self.state = ReservationState.RUNNING
+        self._service.set_cancel_token(self._cancel_token)
+
+        while self._running and not self._cancel_token.cancelled:
+            self.attempt += 1
+            with self._tracer.trace(
+                "attempt",
+                service=self._service.service_name,
+                trains=self._job.train_numbers,
+                attempt=self.attempt,
+                loop=self._loop_id,
+            ) as self._attempt_span:
+                state = self._iterate()
+            self._attempt_span = None
+            if state is not None:
+                return self._finish(state)
+            if self._retry_wait is not None:
+                # Waited out of the attempt's span, so traces show the pacing as pauses
+                delay, self._retry_wait = self._retry_wait, None
+                self._sleep(delay)
+            if self._cancel_token.cancelled:
+                break
+
+        return self._finish(ReservationState.STOPPED)
+
+    def _iterate(self) -> Optional[ReservationState]:
+        """One attempt; returns the final state if the loop is done, else None"""
+        self._emit(ReservationEventType.ATTEMPT, message=self._job.train_numbers)
+
+        if self.attempt % self._reset_interval == 0 and not self._reset_session():
+            if self._cancel_token.cancelled:
+                return None
+            return ReservationState.FAILED
+
+        try:
+            reservation = self._service.reserve_train(self._job.trains, self._job.request)
+        except TrainServiceTimeoutError as e:
+            self._attempt_span.set(error=type(e).__name__)
+            if self._cancel_token.cancelled:
+                return None
+            # The stalled request is already abandoned: retry without backing off
+            self._emit(ReservationEventType.TIMEOUT, message=str(e))
+            return None
+        except Exception as e:
+            self._attempt_span.set(error=type(e).__name__)
+            if self._cancel_token.cancelled:
+                return None
+            self._retry(ReservationEventType.ERROR, str(e))
+            return None
+
+        if not reservation.success:
+            if self._cancel_token.cancelled:
+                return None
+            self._retry(ReservationEventType.RESERVE_FAILED, reservation.message)
+            return None
+
+        self._emit(ReservationEventType.RESERVED, reservation=reservation)
+        if self._cancel_token.cancelled:
+            # Reserved while stopping: report it, but leave payment to the user
+            return None
+        return self._pay(reservation)
+
+    def _reset_session(self) -> bool:
+        """Clear the client session and log in again"""
+        self._emit(ReservationEventType.SESSION_RESET)
+        try:
+            self._service.clear()
+            if self._service.login(self._job.user_id, self._job.password):
+                self._emit(ReservationEventType.RELOGGED_IN)
+                return True
+            self._emit(ReservationEventType.RELOGIN_FAILED)
+        except Exception as e:
+            self._emit(ReservationEventType.RELOGIN_FAILED, message=str(e))
+        return False
+
+    def _pay(self, reservation: ReservationResult) -> ReservationState:
+        if self._job.credit_card is None:
+            self._emit(ReservationEventType.PAYMENT_INFO_MISSING, reservation=reservation)
+            return ReservationState.AWAITING_PAYMENT
+
+        self.state = ReservationState.PAYING
+        self._emit(ReservationEventType.PAYMENT_STARTED, reservation=reservation)
+        error = ""
+        try:
+            payment = self._service.payment_reservation(reservation, self._job.credit_card)
+        except Exception as e:
+            error = str(e)
+            payment = PaymentResult(success=False, message=f"Payment error: {error}")
+
+        if payment.success:
+            self._emit(ReservationEventType.PAID, reservation=reservation, payment=payment)
+            return ReservationState.COMPLETED
+
+        self._emit(ReservationEventType.PAYMENT_FAILED, message=error, reservation=reservation, payment=payment)
+        return ReservationState.AWAITING_PAYMENT
+
+    def _retry(self, event_type: ReservationEventType, message: str) -> None:
+        delay = random.uniform(*self._retry_delay)
+        self._emit(event_type, message=message, delay=delay)
+        self._retry_wait = delay
+
+    def _finish(self, state: ReservationState) -> ReservationState:
+        self._running = False
+        self._service.release_cancel_token(self._cancel_token)
+        self.state = state
+        if state == ReservationState.STOPPED:
+            self._emit(ReservationEventType.STOPPED)
+        return state
+
+    def _emit(self, event_type: ReservationEventType, **kwargs) -> None:
+        if self._attempt_span is not None:
+            self._attempt_span.set(result=event_type.value)
+        self._on_event(ReservationEvent(type=event_type, attempt=self.attempt, **kwargs))
@@ -0,0 +1,170 @@
+"""Traces of reservation attempts: nested, timed spans handed to an exporter
+
+A Tracer opens the root span of a trace, one per iteration of the
+reservation loop. While it is open, span() anywhere below it (adapters,
+clients, NetFunnel) opens a child of the innermost open span of the calling
+thread or task. Outside a trace span() returns a shared no-op, so the
+instrumented code costs one context variable lookup when nobody traces.
+
+Spans carry time.monotonic() start and end times and free-form attributes
+(train numbers, result, ...). A span left by an exception records its class
+as ``error`` and, when the exception has one, its ``code`` as
+``error_code``. When the root span ends, all spans of the trace go to the
+tracer's SpanExporter in one call.
+"""
+import contextvars
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed section of a trace; start and end are time.monotonic() seconds"""
+    name: str
+    trace_id: str
+    span_id: int
+    parent_id: Optional[int]
+    start: float
+    end: Optional[float] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    wall_start: Optional[float] = None  # time.time() at the start of a root span
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.monotonic()) - self.start
+
+    def set(self, **attributes) -> None:
+        """Add or replace attributes"""
+        self.attributes.update(attributes)
+
+
+class SpanExporter(ABC):
+    """Receives the spans of every finished trace"""
+
+    @abstractmethod
+    def export(self, spans: list[Span]) -> None:
+        """Store spans, the root last; called on the thread that ended the trace"""
+        pass
+
+    def close(self) -> None:
+        """Flush and release resources (no-op by default)"""
+        pass
+
+
+class _Trace:
+    __slots__ = ("trace_id", "exporter", "spans", "next_id")
+
+    def __init__(self, exporter: SpanExporter):
+        self.trace_id = os.urandom(8).hex()
+        self.exporter = exporter
+        self.spans: list[Span] = []
+        self.next_id = 0
+
+
+_current: contextvars.ContextVar[Optional[tuple[_Trace, Span]]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **attributes) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _ActiveSpan:
+    __slots__ = ("_trace", "_span", "_token")
+
+    def __init__(self, trace: _Trace, span: Span):
+        self._trace = trace
+        self._span = span
+
+    def __enter__(self) -> Span:
+        self._token = _current.set((self._trace, self._span))
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        span = self._span
+        span.end = time.monotonic()
+        _current.reset(self._token)
+        if exc is not None:
+            span.attributes["error"] = exc_type.__name__
+            code = getattr(exc, "code", None)
+            if code is not None:
+                span.attributes["error_code"] = code
+        trace = self._trace
+        trace.spans.append(span)
+        if span.parent_id is None:
+            trace.exporter.export(trace.spans)
+        return False
+
+
+def _open(trace: _Trace, parent: Optional[Span], name: str, attributes: dict) -> _ActiveSpan:
+    trace.next_id += 1
+    span = Span(
+        name=name,
+        trace_id=trace.trace_id,
+        span_id=trace.next_id,
+        parent_id=None if parent is None else parent.span_id,
+        start=time.monotonic(),
+        attributes=attributes,
+    )
+    if parent is None:
+        span.wall_start = time.time()
+    return _ActiveSpan(trace, span)
+
+
+def span(name: str, **attributes):
+    """Context manager for a child of the current span, or a no-op outside a trace
+
+    ``with span("search", trains=...) as s:`` yields the Span (or NOOP_SPAN),
+    whose set() adds attributes once the outcome is known.
+    """
+    current = _current.get()
+    if current is None:
+        return NOOP_SPAN
+    trace, parent = current
+    return _open(trace, parent, name, attributes)
+
+
+def current_span():
+    """Innermost open span of the calling thread or task, or NOOP_SPAN"""
+    current = _current.get()
+    return NOOP_SPAN if current is None else current[1]
+
+
+class Tracer:
+    """Starts traces whose spans go to exporter; without one it traces nothing"""
+
+    def __init__(self, exporter: Optional[SpanExporter] = None):
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def trace(self, name: str, **attributes):
+        """Context manager for the root span of a new trace (NOOP_SPAN when disabled)"""
+        if self.exporter is None:
+            return NOOP_SPAN
+        return _open(_Trace(self.exporter), None, name, attributes)
+
+    def close(self) -> None:
+        if self.exporter is not None:
+            self.exporter.close()
+
+
+NULL_TRACER = Tracer()
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
+from src.domain.services.cancellation import CancellationToken
 from src.domain.models.entities import (
-    Station, TrainSchedule, ReservationRequest, ReservationResult
+    CreditCard, PaymentResult, Station, TrainSchedule, ReservationRequest, ReservationResult
 )
 
 
@@ -29,6 +30,11 @@ class TrainService(ABC):
         """Reserve a specific train"""
         pass
 
+    @abstractmethod
+    def payment_reservation(self, reservation: ReservationResult, credit_card: CreditCard) -> PaymentResult:
+        """Pay for a reservation made by reserve_train; failures are an unsuccessful result"""
+        pass
+
     @abstractmethod
     def get_stations(self) -> List[Station]:
         """Get list of available stations"""
@@ -44,8 +50,94 @@ class TrainService(ABC):
         """Clear client sessions"""
         pass
 
+    def set_cancel_token(self, token: Optional[CancellationToken]) -> None:
+        """Let in-flight searches and reservations observe token (no-op by default)"""
+        pass
+
+    def release_cancel_token(self, token: CancellationToken) -> None:
+        """Detach token if it is still the one set (no-op by default)"""
+        pass
+
     @property
     @abstractmethod
     def service_name(self) -> str:
         """Name of the train service (KTX, SRT, etc.)"""
-        pass
\ No newline at end of file
+        pass
+
+
+class AsyncTrainService(ABC):
+    """Asyncio counterpart of TrainService
+
+    Failures are raised as TrainServiceError subclasses (see
+    src.domain.exceptions) instead of being folded into an empty list or an
+    unsuccessful result, so a caller can tell a timeout from a sold-out train
+    or an expired login by the exception class. One instance serves one job
+    at a time; run several jobs on one loop with one service each.
+    """
+
+    @abstractmethod
+    async def login(self, user_id: str, password: str) -> None:
+        """Login to the train service
+
+        Raises:
+            TrainServiceLoginError: If the credentials are rejected
+        """
+        pass
+
+    @abstractmethod
+    async def logout(self) -> None:
+        """Logout from the train service"""
+        pass
+
+    @abstractmethod
+    async def search_trains(self, request: ReservationRequest) -> List[TrainSchedule]:
+        """Search for trains; an empty list means the search found none"""
+        pass
+
+    @abstractmethod
+    async def reserve_train(self, schedules: list[TrainSchedule], request: ReservationRequest) -> ReservationResult:
+        """Reserve the first of schedules with a seat the request allows
+
+        Raises:
+            TrainServiceSoldOutError: If none of them has such a seat
+        """
+        pass
+
+    @abstractmethod
+    async def payment_reservation(self, reservation: ReservationResult, credit_card: CreditCard) -> PaymentResult:
+        """Pay for a reservation made by reserve_train"""
+        pass
+
+    @abstractmethod
+    def get_stations(self) -> List[Station]:
+        """Get list of available stations"""
+        pass
+
+    @abstractmethod
+    def is_logged_in(self) -> bool:
+        """Check if user is logged in"""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Log out and start over with a new client session"""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the HTTP sessions of the service"""
+        pass
+
+    def set_cancel_token(self, token: Optional[CancellationToken]) -> None:
+        """Let in-flight searches and reservations observe token (no-op by default)"""
+        pass
+
+    def release_cancel_token(self, token: CancellationToken) -> None:
+        """Detach token if it is still the one set (no-op by default)"""
+        pass
+
+    @property
+    @abstractmethod
+    def service_name(self) -> str:
+        """Name of the train service (KTX, SRT, etc.)"""
+        pass
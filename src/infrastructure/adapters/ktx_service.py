@@ -1,20 +1,159 @@
+import time
+from contextlib import contextmanager
 from typing import List
 from datetime import datetime
-from src.domain.services.train_service import TrainService
+from src.constants.ui import RESERVE_ATTEMPT_TIMEOUT
+from src.domain.exceptions import (
+    TrainServiceCancelledError,
+    TrainServiceConnectionError,
+    TrainServiceError,
+    TrainServiceLoginError,
+    TrainServiceLoginExpiredError,
+    TrainServiceResponseError,
+    TrainServiceSoldOutError,
+    TrainServiceTimeoutError,
+)
+from src.domain.services.tracing import span
+from src.domain.services.train_service import AsyncTrainService, TrainService
 from src.domain.models.entities import (
     Station, TrainSchedule, ReservationRequest, ReservationResult, CreditCard, PaymentResult
 )
 from src.domain.models.enums import TrainType
-from src.infrastructure.external.ktx import Korail, TrainType as KorailTrainType
+from src.infrastructure.external.ktx import AsyncKorail, Korail, TrainType as KorailTrainType
+from src.infrastructure.external.metrics import MetricsRegistry
+from src.infrastructure.external.transport import TransportError
 from src.infrastructure.mappers import PassengerMapper
 from src.constants.stations import KTX_STATIONS
-from src.infrastructure.external.ktx import ReserveOption
+from src.infrastructure.external.ktx import (
+    KorailCancelledError,
+    KorailError,
+    KorailTimeoutError,
+    NeedToLoginError,
+    NoResultsError,
+    Reservation,
+    ReserveOption,
+    SoldOutError,
+    row_has_seat,
+)
+
+
+def _parse_time(time_str: str) -> datetime:
+    """Parse time string to datetime"""
+    return datetime.strptime(time_str, "%Y%m%d%H%M%S")
+
+
+def _convert_train_type(train_type_str: str) -> TrainType:
+    """Convert Korail train type to domain train type"""
+    if "KTX" in train_type_str.upper():
+        return TrainType.KTX
+    elif "무궁화" in train_type_str:
+        return TrainType.MUGUNGHWA
+    elif "새마을" in train_type_str:
+        return TrainType.SAEMAEUL
+    else:
+        return TrainType.KTX
+
+
+def _to_schedule(train, request: ReservationRequest) -> TrainSchedule:
+    """Convert a Korail Train found for request to a TrainSchedule"""
+    return TrainSchedule(
+        train_number=getattr(train, 'train_no', ''),
+        departure_station=request.departure_station,
+        arrival_station=request.arrival_station,
+        departure_time=_parse_time(train.dep_date + train.dep_time),
+        arrival_time=_parse_time(train.arr_date + train.arr_time),
+        train_type=_convert_train_type(getattr(train, 'train_type', '')),
+        available_seats=getattr(train, 'seat_count', 0),
+        price=getattr(train, 'adultcharge', None)
+    )
+
+
+def _reserve_option(train, request: ReservationRequest) -> ReserveOption | None:
+    """Seat class to reserve on train for request, or None if it has none allowed"""
+    if train.has_special_seat() and (request.is_special_seat_allowed or request.is_only_special_seat):
+        return ReserveOption.SPECIAL_ONLY
+    if not request.is_only_special_seat:
+        return ReserveOption.GENERAL_ONLY
+    return None
+
+
+def _search_kwargs(request: ReservationRequest) -> dict:
+    return {
+        "dep": request.departure_station,
+        "arr": request.arrival_station,
+        "date": request.departure_date.strftime("%Y%m%d"),
+        "time": request.departure_time,
+        "train_type": KorailTrainType.KTX,
+        "include_no_seats": True,
+    }
+
+
+def _reservation_result(reservation: Reservation, train, schedules: list[TrainSchedule]) -> ReservationResult:
+    return ReservationResult(
+        success=True,
+        reservation_number=reservation.rsv_id,
+        message="Reservation successful",
+        train_schedule=[
+            schedule
+            for schedule in schedules
+            if train.train_no == schedule.train_number
+        ][0],
+        handle=reservation,
+    )
+
+
+def _held_reservation(reservation: ReservationResult) -> Reservation | None:
+    """Return the Korail reservation held by reserve_train, if it matches"""
+    handle = reservation.handle
+    if isinstance(handle, Reservation) and handle.rsv_id == reservation.reservation_number:
+        return handle
+    return None
+
+
+@contextmanager
+def _service_errors():
+    """Re-raise Korail client errors as the matching TrainServiceError"""
+    try:
+        yield
+    except KorailTimeoutError as e:
+        raise TrainServiceTimeoutError(str(e)) from e
+    except KorailCancelledError as e:
+        raise TrainServiceCancelledError(str(e)) from e
+    except NeedToLoginError as e:
+        raise TrainServiceLoginExpiredError(str(e)) from e
+    except SoldOutError as e:
+        raise TrainServiceSoldOutError(str(e)) from e
+    except KorailError as e:
+        raise TrainServiceResponseError(str(e)) from e
+    except TransportError as e:
+        raise TrainServiceConnectionError(str(e)) from e
+
 
 class KTXService(TrainService):
     """KTX/Korail train service implementation"""
 
-    def __init__(self):
-        self._korail = Korail(auto_login=False)
+    def __init__(
+        self,
+        timeouts: dict[str, float] | None = None,
+        attempt_timeout: float = RESERVE_ATTEMPT_TIMEOUT,
+        base_url: str | None = None,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Args:
+            timeouts: Per-endpoint request timeouts passed to the Korail client
+            attempt_timeout: Seconds one reserve -> pay attempt may take in total
+            base_url: Korail host, e.g. of a local stand-in server
+            metrics: Registry the clients record their requests in, kept across
+                clear() (default: a new one per service)
+        """
+        self._cancel_token = None
+        self._timeouts = timeouts
+        self._base_url = base_url
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self._attempt_timeout = attempt_timeout
+        self._attempt_deadline: tuple[str, float] | None = None  # (reservation number, deadline)
+        self._korail = self._new_client()
         self._logged_in = False
 
     def login(self, user_id: str, password: str) -> bool:
@@ -43,82 +182,77 @@ class KTXService(TrainService):
 
         try:
             # Convert domain request to Korail format
-            trains = self._korail.search_train(
-                dep=request.departure_station,
-                arr=request.arrival_station,
-                date=request.departure_date.strftime("%Y%m%d"),
-                time=request.departure_time,
-                train_type=KorailTrainType.KTX,
-                include_no_seats=True,
-            )
-
-            schedules = []
-            for train in trains:
-                schedule = TrainSchedule(
-                    train_number=getattr(train, 'train_no', ''),
-                    departure_station=request.departure_station,
-                    arrival_station=request.arrival_station,
-                    departure_time=self._parse_time(train.dep_date + train.dep_time),
-                    arrival_time=self._parse_time(train.arr_date + train.arr_time),
-                    train_type=self._convert_train_type(getattr(train, 'train_type', '')),
-                    available_seats=self._get_available_seats(train),
-                    price=getattr(train, 'adultcharge', None)
-                )
-                schedules.append(schedule)
-
-            return schedules
+            trains = self._korail.search_train(**_search_kwargs(request))
+            return [_to_schedule(train, request) for train in trains]
         except Exception:
             return []
 
     def reserve_train(self, schedules: list[TrainSchedule], request: ReservationRequest) -> ReservationResult:
-        """Reserve a KTX train"""
+        """Reserve a KTX train
+
+        Starts the deadline of a reserve -> pay attempt; paying the reservation
+        made here gets whatever is left of it.
+
+        Raises:
+            TrainServiceTimeoutError: If a request or the attempt deadline times out
+        """
         if not self._logged_in:
             return ReservationResult(success=False, message="Not logged in")
 
+        deadline = time.monotonic() + self._attempt_timeout
+        self._korail.deadline = deadline
+        try:
+            result = self._reserve(schedules, request)
+        except KorailTimeoutError as e:
+            raise TrainServiceTimeoutError(str(e)) from e
+        finally:
+            self._korail.deadline = None
+
+        self._attempt_deadline = (result.reservation_number, deadline) if result.success else None
+        return result
+
+    def _reserve(self, schedules: list[TrainSchedule], request: ReservationRequest) -> ReservationResult:
         try:
             # Convert passengers to Korail format
             passengers = [PassengerMapper.to_korail(p) for p in request.passengers]
 
-            # Find the train again for reservation
-            trains = self._korail.search_train(
-                dep=request.departure_station,
-                arr=request.arrival_station,
-                date=request.departure_date.strftime("%Y%m%d"),
-                time=request.departure_time,
-                passengers=passengers,
-                train_type=KorailTrainType.KTX,
-                include_no_seats=True,
-            )
-
             schedules.sort(key=lambda x: x.departure_time)
-            target_train_numbers = [schedule.train_number for schedule in schedules]
+            target_train_numbers = {schedule.train_number for schedule in schedules}
 
-            for train in trains:
-                reservation = None
-                if train.train_no in target_train_numbers and train.has_seat():
-                    # Check for special seat preference
-                    if train.has_special_seat() and (request.is_special_seat_allowed or request.is_only_special_seat):
-                        reservation = self._korail.reserve(train=train, passengers=passengers, option=ReserveOption.SPECIAL_ONLY)
-                    else:
-                        if not request.is_only_special_seat:
-                            reservation = self._korail.reserve(train=train, passengers=passengers, option=ReserveOption.GENERAL_ONLY)
-
-                    if reservation:
-                        return ReservationResult(
-                            success=True,
-                            reservation_number=reservation.rsv_id,
-                            message="Reservation successful",
-                            train_schedule=[
-                                schedule
-                                for schedule in schedules
-                                if train.train_no == schedule.train_number
-                            ][0],
-                        )
-                    else:
-                        continue
+            # Find the train again for reservation, building only targets with seats
+            try:
+                with span("search", targets=len(target_train_numbers)) as searching:
+                    trains = self._korail.search_train(
+                        passengers=passengers,
+                        train_numbers=target_train_numbers,
+                        seat_filter=row_has_seat,
+                        **_search_kwargs(request),
+                    )
+                    searching.set(found=len(trains))
+            except NoResultsError:
+                trains = []
+
+            with span("select", candidates=len(trains)) as selecting:
+                for train in trains:
+                    reservation = None
+                    if train.train_no in target_train_numbers and train.has_seat():
+                        # Check for special seat preference
+                        option = _reserve_option(train, request)
+                        if option is not None:
+                            with span("reserve", train=train.train_no, option=option):
+                                reservation = self._korail.reserve(train=train, passengers=passengers, option=option)
+
+                        if reservation:
+                            selecting.set(result="reserved", train=train.train_no)
+                            return _reservation_result(reservation, train, schedules)
+                        else:
+                            continue
+                selecting.set(result="no_seats")
 
             return ReservationResult(success=False, message="Any requested trains have no seats")
 
+        except KorailTimeoutError:
+            raise
         except Exception as e:
             return ReservationResult(success=False, message=f"Reservation error: {e}")
 
@@ -135,53 +269,278 @@ class KTXService(TrainService):
         """Name of the service"""
         return "KTX"
 
-    def _parse_time(self, time_str: str) -> datetime:
-        """Parse time string to datetime"""
-        return datetime.strptime(time_str, "%Y%m%d%H%M%S")
-
-    def _convert_train_type(self, train_type_str: str) -> TrainType:
-        """Convert Korail train type to domain train type"""
-        if "KTX" in train_type_str.upper():
-            return TrainType.KTX
-        elif "무궁화" in train_type_str:
-            return TrainType.MUGUNGHWA
-        elif "새마을" in train_type_str:
-            return TrainType.SAEMAEUL
-        else:
-            return TrainType.KTX
-
-    def _get_available_seats(self, train) -> int:
-        """Get available seats count"""
-        try:
-            # Try to get seat availability information
-            return getattr(train, 'seat_count', 0)
-        except:
-            return 0
-
     def payment_reservation(self, reservation: ReservationResult, credit_card: CreditCard) -> PaymentResult:
-        """Pay for a reservation with credit card"""
+        """Pay for a reservation with credit card
+
+        Raises:
+            TrainServiceTimeoutError: If a request or the attempt deadline times out
+        """
         if not self._logged_in:
             return PaymentResult(success=False, message="Not logged in")
 
-        target_reservation = self._korail.reservations(reservation.reservation_number)
+        # Paying the reservation just made continues its attempt deadline
+        pending, self._attempt_deadline = self._attempt_deadline, None
+        if pending is not None and pending[0] == reservation.reservation_number:
+            self._korail.deadline = pending[1]
+        else:
+            self._korail.deadline = time.monotonic() + self._attempt_timeout
+        try:
+            return self._pay(reservation, credit_card)
+        except KorailTimeoutError as e:
+            raise TrainServiceTimeoutError(str(e)) from e
+        finally:
+            self._korail.deadline = None
+
+    def _pay(self, reservation: ReservationResult, credit_card: CreditCard) -> PaymentResult:
+        target_reservation = _held_reservation(reservation)
+        if target_reservation is None:
+            with span("reservation_lookup"):
+                target_reservation = self._korail.reservations(reservation.reservation_number)
 
         if not target_reservation:
             return PaymentResult(success=False, message="Reservation not found")
 
-        is_success = self._korail.pay_with_card(
-            target_reservation,
-            card_number=credit_card.number,
-            card_password=credit_card.password,
-            birthday=credit_card.validation_number,
-            card_expire=credit_card.expire,
-            card_type="J" if not credit_card.is_corporate else "S",
-        )
+        with span("payment", reservation=target_reservation.rsv_id) as paying:
+            is_success = self._korail.pay_with_card(
+                target_reservation,
+                card_number=credit_card.number,
+                card_password=credit_card.password,
+                birthday=credit_card.validation_number,
+                card_expire=credit_card.expire,
+                card_type="J" if not credit_card.is_corporate else "S",
+            )
+            paying.set(result="paid" if is_success else "failed")
 
         if is_success:
             return PaymentResult(success=True, message="Payment successful", reservation_number=target_reservation.rsv_id)
         else:
             return PaymentResult(success=False, message="Payment failed")
-        
+
+    def set_cancel_token(self, token) -> None:
+        """Make searches and reservations raise once token (threading.Event) is set"""
+        self._cancel_token = token
+        self._korail.cancel_token = token
+
+    def release_cancel_token(self, token) -> None:
+        """Detach token unless another token has been set since"""
+        if self._cancel_token is token:
+            self.set_cancel_token(None)
+
     def clear(self) -> None:
         self.logout()
-        self._korail = Korail(auto_login=False)
+        self._korail = self._new_client()
+
+    def _new_client(self) -> Korail:
+        return Korail(
+            auto_login=False,
+            cancel_token=self._cancel_token,
+            timeouts=self._timeouts,
+            base_url=self._base_url,
+            metrics=self.metrics,
+        )
+
+
+class AsyncKTXService(AsyncTrainService):
+    """KTX/Korail train service on AsyncKorail
+
+    Client failures surface as TrainServiceError subclasses (see
+    _service_errors) rather than empty results.
+    """
+
+    def __init__(
+        self,
+        timeouts: dict[str, float] | None = None,
+        attempt_timeout: float = RESERVE_ATTEMPT_TIMEOUT,
+        base_url: str | None = None,
+        transport=None,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Args:
+            timeouts: Per-endpoint request timeouts passed to the Korail client
+            attempt_timeout: Seconds one reserve -> pay attempt may take in total
+            base_url: Korail host, e.g. of a local stand-in server
+            transport: AsyncTransport shared with other services on the loop
+                (default: default_async_transport())
+            metrics: Registry the clients record their requests in, kept across
+                clear() (default: a new one per service)
+        """
+        self._cancel_token = None
+        self._timeouts = timeouts
+        self._base_url = base_url
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self._transport = transport
+        self._attempt_timeout = attempt_timeout
+        self._attempt_deadline: tuple[str, float] | None = None  # (reservation number, deadline)
+        self._korail = self._new_client()
+        self._logged_in = False
+
+    async def login(self, user_id: str, password: str) -> None:
+        """Login to Korail service
+
+        Raises:
+            TrainServiceLoginError: If Korail rejects the credentials
+        """
+        self._logged_in = False
+        with _service_errors():
+            if not await self._korail.login(user_id, password):
+                raise TrainServiceLoginError("Korail rejected the login")
+        self._logged_in = True
+
+    async def logout(self) -> None:
+        """Logout from Korail service"""
+        self._logged_in = False
+        with _service_errors():
+            await self._korail.logout()
+
+    async def search_trains(self, request: ReservationRequest) -> List[TrainSchedule]:
+        """Search for KTX trains, with or without seats"""
+        self._require_login()
+        with _service_errors():
+            try:
+                trains = await self._korail.search_train(**_search_kwargs(request))
+            except NoResultsError:
+                return []
+        return [_to_schedule(train, request) for train in trains]
+
+    async def reserve_train(self, schedules: list[TrainSchedule], request: ReservationRequest) -> ReservationResult:
+        """Reserve the earliest of schedules that has a seat the request allows
+
+        Starts the deadline of a reserve -> pay attempt; paying the reservation
+        made here gets whatever is left of it.
+
+        Raises:
+            TrainServiceSoldOutError: If none of the trains has such a seat
+            TrainServiceTimeoutError: If a request or the attempt deadline times out
+        """
+        self._require_login()
+        deadline = time.monotonic() + self._attempt_timeout
+        self._korail.deadline = deadline
+        try:
+            with _service_errors():
+                result = await self._reserve(schedules, request)
+        finally:
+            self._korail.deadline = None
+
+        self._attempt_deadline = (result.reservation_number, deadline)
+        return result
+
+    async def _reserve(self, schedules: list[TrainSchedule], request: ReservationRequest) -> ReservationResult:
+        passengers = [PassengerMapper.to_korail(p) for p in request.passengers]
+        schedules = sorted(schedules, key=lambda x: x.departure_time)
+        target_train_numbers = {schedule.train_number for schedule in schedules}
+        try:
+            with span("search", targets=len(target_train_numbers)) as searching:
+                trains = await self._korail.search_train(
+                    passengers=passengers,
+                    train_numbers=target_train_numbers,
+                    seat_filter=row_has_seat,
+                    **_search_kwargs(request),
+                )
+                searching.set(found=len(trains))
+        except NoResultsError as e:
+            raise TrainServiceSoldOutError("Any requested trains have no seats") from e
+
+        with span("select", candidates=len(trains)) as selecting:
+            for train in trains:
+                if train.train_no not in target_train_numbers or not train.has_seat():
+                    continue
+                option = _reserve_option(train, request)
+                if option is None:
+                    continue
+                with span("reserve", train=train.train_no, option=option):
+                    reservation = await self._korail.reserve(train=train, passengers=passengers, option=option)
+                if reservation:
+                    selecting.set(result="reserved", train=train.train_no)
+                    return _reservation_result(reservation, train, schedules)
+            selecting.set(result="no_seats")
+
+        raise TrainServiceSoldOutError("Any requested trains have no seats")
+
+    async def payment_reservation(self, reservation: ReservationResult, credit_card: CreditCard) -> PaymentResult:
+        """Pay for a reservation with credit card
+
+        Raises:
+            TrainServiceResponseError: If the reservation is gone or the payment is declined
+            TrainServiceTimeoutError: If a request or the attempt deadline times out
+        """
+        self._require_login()
+
+        # Paying the reservation just made continues its attempt deadline
+        pending, self._attempt_deadline = self._attempt_deadline, None
+        if pending is not None and pending[0] == reservation.reservation_number:
+            self._korail.deadline = pending[1]
+        else:
+            self._korail.deadline = time.monotonic() + self._attempt_timeout
+        try:
+            with _service_errors():
+                return await self._pay(reservation, credit_card)
+        finally:
+            self._korail.deadline = None
+
+    async def _pay(self, reservation: ReservationResult, credit_card: CreditCard) -> PaymentResult:
+        target_reservation = _held_reservation(reservation)
+        if target_reservation is None:
+            with span("reservation_lookup"):
+                target_reservation = await self._korail.reservations(reservation.reservation_number)
+
+        if not target_reservation:
+            raise TrainServiceResponseError(f"Reservation {reservation.reservation_number} not found")
+
+        with span("payment", reservation=target_reservation.rsv_id):
+            await self._korail.pay_with_card(
+                target_reservation,
+                card_number=credit_card.number,
+                card_password=credit_card.password,
+                birthday=credit_card.validation_number,
+                card_expire=credit_card.expire,
+                card_type="J" if not credit_card.is_corporate else "S",
+            )
+        return PaymentResult(success=True, message="Payment successful", reservation_number=target_reservation.rsv_id)
+
+    def get_stations(self) -> List[Station]:
+        """Get list of KTX stations"""
+        return [Station(station.name, station.code) for station in KTX_STATIONS]
+
+    def is_logged_in(self) -> bool:
+        """Check if logged in to KTX service"""
+        return self._logged_in
+
+    @property
+    def service_name(self) -> str:
+        """Name of the service"""
+        return "KTX"
+
+    def set_cancel_token(self, token) -> None:
+        """Make searches and reservations raise once token (threading.Event) is set"""
+        self._cancel_token = token
+        self._korail.cancel_token = token
+
+    def release_cancel_token(self, token) -> None:
+        """Detach token unless another token has been set since"""
+        if self._cancel_token is token:
+            self.set_cancel_token(None)
+
+    async def clear(self) -> None:
+        try:
+            await self.logout()
+        except TrainServiceError:
+            pass  # the old session is dropped either way
+        await self._korail.close()
+        self._korail = self._new_client()
+
+    async def close(self) -> None:
+        await self._korail.close()
+
+    def _require_login(self) -> None:
+        if not self._logged_in:
+            raise TrainServiceLoginExpiredError("Not logged in")
+
+    def _new_client(self) -> AsyncKorail:
+        return AsyncKorail(
+            cancel_token=self._cancel_token,
+            timeouts=self._timeouts,
+            base_url=self._base_url,
+            transport=self._transport,
+            metrics=self.metrics,
+        )
@@ -1,21 +1,153 @@
+import time
+from contextlib import contextmanager
 from typing import List
 from datetime import datetime
-from src.domain.services.train_service import TrainService
+from src.constants.ui import RESERVE_ATTEMPT_TIMEOUT
+from src.domain.exceptions import (
+    TrainServiceCancelledError,
+    TrainServiceConnectionError,
+    TrainServiceError,
+    TrainServiceLoginError,
+    TrainServiceLoginExpiredError,
+    TrainServiceResponseError,
+    TrainServiceSoldOutError,
+    TrainServiceTimeoutError,
+)
+from src.domain.services.tracing import span
+from src.domain.services.train_service import AsyncTrainService, TrainService
 from src.domain.models.entities import (
     Station, TrainSchedule, ReservationRequest, ReservationResult, CreditCard, PaymentResult
 )
 from src.domain.models.enums import TrainType
-from src.infrastructure.external.srt import SRT
+from src.infrastructure.external.metrics import MetricsRegistry
+from src.infrastructure.external.srt import AsyncSRT, SRT
+from src.infrastructure.external.transport import TransportError
 from src.infrastructure.mappers import PassengerMapper
 from src.constants.stations import SRT_STATIONS
-from src.infrastructure.external.srt import SeatType
+from src.infrastructure.external.srt import (
+    SeatType,
+    SRTCancelledError,
+    SRTError,
+    SRTLoginError,
+    SRTLoginExpiredError,
+    SRTNotLoggedInError,
+    SRTReservation,
+    SRTSoldOutError,
+    SRTTimeoutError,
+    row_seat_available,
+)
+
+
+def _parse_time(time_str: str) -> datetime:
+    """Parse time string to datetime"""
+    return datetime.strptime(time_str, "%Y%m%d%H%M%S")
+
+
+def _to_schedule(train, request: ReservationRequest) -> TrainSchedule:
+    """Convert an SRTTrain found for request to a TrainSchedule"""
+    return TrainSchedule(
+        train_number=train.train_number,
+        departure_station=request.departure_station,
+        arrival_station=request.arrival_station,
+        departure_time=_parse_time(train.dep_date + train.dep_time),
+        arrival_time=_parse_time(train.arr_date + train.arr_time),
+        train_type=TrainType.SRT,
+        available_seats=getattr(train, 'seat_count', 0),
+        price=getattr(train, 'adultcharge', None)
+    )
+
+
+def _reserve_option(train, request: ReservationRequest) -> SeatType | None:
+    """Seat class to reserve on train for request, or None if it has none allowed"""
+    if train.special_seat_available() and (request.is_special_seat_allowed or request.is_only_special_seat):
+        return SeatType.SPECIAL_ONLY
+    if not request.is_only_special_seat:
+        return SeatType.GENERAL_ONLY
+    return None
+
+
+def _search_kwargs(request: ReservationRequest, passengers: list) -> dict:
+    return {
+        "dep": request.departure_station,
+        "arr": request.arrival_station,
+        "date": request.departure_date.strftime("%Y%m%d"),
+        "time": request.departure_time,
+        "passengers": passengers,
+        "available_only": False,
+    }
+
+
+def _reservation_result(reservation: SRTReservation, train, schedules: list[TrainSchedule]) -> ReservationResult:
+    return ReservationResult(
+        success=True,
+        reservation_number=reservation.reservation_number,
+        message="Reservation successful",
+        train_schedule=[
+            schedule
+            for schedule in schedules
+            if train.train_number == schedule.train_number
+        ][0],
+        handle=reservation,
+    )
+
+
+def _held_reservation(reservation: ReservationResult) -> SRTReservation | None:
+    """Return the SRT reservation held by reserve_train, if it matches"""
+    handle = reservation.handle
+    if isinstance(handle, SRTReservation) and handle.reservation_number == reservation.reservation_number:
+        return handle
+    return None
+
+
+@contextmanager
+def _service_errors():
+    """Re-raise SRT client errors as the matching TrainServiceError"""
+    try:
+        yield
+    except SRTTimeoutError as e:
+        raise TrainServiceTimeoutError(str(e)) from e
+    except SRTCancelledError as e:
+        raise TrainServiceCancelledError(str(e)) from e
+    except SRTLoginError as e:
+        raise TrainServiceLoginError(str(e)) from e
+    except (SRTNotLoggedInError, SRTLoginExpiredError) as e:
+        raise TrainServiceLoginExpiredError(str(e)) from e
+    except SRTSoldOutError as e:
+        raise TrainServiceSoldOutError(str(e)) from e
+    except SRTError as e:
+        raise TrainServiceResponseError(str(e)) from e
+    except TransportError as e:
+        raise TrainServiceConnectionError(str(e)) from e
 
 
 class SRTService(TrainService):
     """SRT train service implementation"""
 
-    def __init__(self):
-        self._srt = SRT(auto_login=False)
+    def __init__(
+        self,
+        timeouts: dict[str, float] | None = None,
+        attempt_timeout: float = RESERVE_ATTEMPT_TIMEOUT,
+        base_url: str | None = None,
+        netfunnel_url: str | None = None,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Args:
+            timeouts: Per-endpoint request timeouts passed to the SRT client
+            attempt_timeout: Seconds one reserve -> pay attempt may take in total
+            base_url: SRT API root, e.g. of a local stand-in server
+            netfunnel_url: NetFunnel ts.wseq URL to use with base_url
+            metrics: Registry the clients record their requests in, kept across
+                clear() (default: a new one per service)
+        """
+        self._cancel_token = None
+        self._timeouts = timeouts
+        self._base_url = base_url
+        self._netfunnel_url = netfunnel_url
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self._attempt_timeout = attempt_timeout
+        self._attempt_deadline: tuple[str, float] | None = None  # (reservation number, deadline)
+        self._srt = self._new_client()
         self._logged_in = False
 
     def login(self, user_id: str, password: str) -> bool:
@@ -46,108 +178,117 @@ class SRTService(TrainService):
 
         try:
             # Convert domain request to SRT format
-            trains = self._srt.search_train(
-                dep=request.departure_station,
-                arr=request.arrival_station,
-                date=request.departure_date.strftime("%Y%m%d"),
-                time=request.departure_time,
-                passengers=passengers,
-                available_only=False,
-            )
-
-            schedules: list[TrainSchedule] = []
-            for train in trains:
-                schedule = TrainSchedule(
-                    train_number=train.train_number,
-                    departure_station=request.departure_station,
-                    arrival_station=request.arrival_station,
-                    departure_time=self._parse_time(train.dep_date + train.dep_time),
-                    arrival_time=self._parse_time(train.arr_date + train.arr_time),
-                    train_type=TrainType.SRT,
-                    available_seats=self._get_available_seats(train),
-                    price=getattr(train, 'adultcharge', None)
-                )
-                schedules.append(schedule)
-
-            return schedules
+            trains = self._srt.search_train(**_search_kwargs(request, passengers))
+            return [_to_schedule(train, request) for train in trains]
         except Exception:
             return []
 
     def reserve_train(self, schedules: list[TrainSchedule], request: ReservationRequest) -> ReservationResult:
-        """Reserve an SRT train"""
+        """Reserve an SRT train
+
+        Starts the deadline of a reserve -> pay attempt; paying the reservation
+        made here gets whatever is left of it.
+
+        Raises:
+            TrainServiceTimeoutError: If a request or the attempt deadline times out
+        """
         if not self._logged_in:
             return ReservationResult(success=False, message="Not logged in")
 
+        deadline = time.monotonic() + self._attempt_timeout
+        self._srt.deadline = deadline
+        try:
+            result = self._reserve(schedules, request)
+        except SRTTimeoutError as e:
+            raise TrainServiceTimeoutError(str(e)) from e
+        finally:
+            self._srt.deadline = None
+
+        self._attempt_deadline = (result.reservation_number, deadline) if result.success else None
+        return result
+
+    def _reserve(self, schedules: list[TrainSchedule], request: ReservationRequest) -> ReservationResult:
         try:
             # Convert passengers to SRT format
             passengers = [PassengerMapper.to_srt(p) for p in request.passengers]
 
-            # Find the trains for reservation
-            trains = self._srt.search_train(
-                dep=request.departure_station,
-                arr=request.arrival_station,
-                date=request.departure_date.strftime("%Y%m%d"),
-                time=request.departure_time,
-                passengers=passengers,
-                available_only=False,
-            )
-
             schedules.sort(key=lambda x: x.departure_time)
-            target_train_numbers = [schedule.train_number for schedule in schedules]
+            target_train_numbers = {schedule.train_number for schedule in schedules}
 
-            for train in trains:
-                reservation = None
-                if train.train_number in target_train_numbers and train.seat_available():
-                    # Check for special seat preference
-                    if train.special_seat_available() and (request.is_special_seat_allowed or request.is_only_special_seat):
-                        reservation = self._srt.reserve(train=train, passengers=passengers, option=SeatType.SPECIAL_ONLY)
-                    else:
-                        if not request.is_only_special_seat:
-                            reservation = self._srt.reserve(train=train, passengers=passengers, option=SeatType.GENERAL_ONLY)
-
-                    if reservation:
-                        return ReservationResult(
-                            success=True,
-                            reservation_number=reservation.reservation_number,
-                            message="Reservation successful",
-                            train_schedule=[
-                                schedule
-                                for schedule in schedules
-                                if train.train_number == schedule.train_number
-                            ][0],
-                        )
-                    else:
-                        continue
+            # Find the trains for reservation, building only targets with seats
+            with span("search", targets=len(target_train_numbers)) as searching:
+                trains = self._srt.search_train(
+                    train_numbers=target_train_numbers,
+                    seat_filter=row_seat_available,
+                    **_search_kwargs(request, passengers),
+                )
+                searching.set(found=len(trains))
+
+            with span("select", candidates=len(trains)) as selecting:
+                for train in trains:
+                    reservation = None
+                    if train.train_number in target_train_numbers and train.seat_available():
+                        # Check for special seat preference
+                        option = _reserve_option(train, request)
+                        if option is not None:
+                            with span("reserve", train=train.train_number, option=option.name):
+                                reservation = self._srt.reserve(train=train, passengers=passengers, option=option)
+
+                        if reservation:
+                            selecting.set(result="reserved", train=train.train_number)
+                            return _reservation_result(reservation, train, schedules)
+                        else:
+                            continue
+                selecting.set(result="no_seats")
 
             return ReservationResult(success=False, message="Any requested trains have no seats")
 
+        except SRTTimeoutError:
+            raise
         except Exception as e:
             return ReservationResult(success=False, message=f"Reservation error: {e}")
 
     def payment_reservation(self, reservation: ReservationResult, credit_card: CreditCard) -> PaymentResult:
-        """Pay for a reservation with credit card"""
+        """Pay for a reservation with credit card
+
+        Raises:
+            TrainServiceTimeoutError: If a request or the attempt deadline times out
+        """
         if not self._logged_in:
             return PaymentResult(success=False, message="Not logged in")
 
-        srt_reservations = self._srt.get_reservations(paid_only=False)
-        target_reservation = None
+        # Paying the reservation just made continues its attempt deadline
+        pending, self._attempt_deadline = self._attempt_deadline, None
+        if pending is not None and pending[0] == reservation.reservation_number:
+            self._srt.deadline = pending[1]
+        else:
+            self._srt.deadline = time.monotonic() + self._attempt_timeout
+        try:
+            return self._pay(reservation, credit_card)
+        except SRTTimeoutError as e:
+            raise TrainServiceTimeoutError(str(e)) from e
+        finally:
+            self._srt.deadline = None
 
-        for srt_reservation in srt_reservations:
-            if srt_reservation.reservation_number == reservation.reservation_number:
-                target_reservation = srt_reservation
-                break
+    def _pay(self, reservation: ReservationResult, credit_card: CreditCard) -> PaymentResult:
+        target_reservation = _held_reservation(reservation)
+        if target_reservation is None:
+            with span("reservation_lookup"):
+                target_reservation = self._srt.get_reservation(reservation.reservation_number)
 
         if not target_reservation:
             return PaymentResult(success=False, message="Reservation not found")
         
-        is_success = self._srt.pay_with_card(
-            target_reservation,
-            number=credit_card.number,
-            password=credit_card.password,
-            validation_number=credit_card.validation_number,
-            expire_date=credit_card.expire,
-            card_type="J" if not credit_card.is_corporate else "S",
-        )
+        with span("payment", reservation=target_reservation.reservation_number) as paying:
+            is_success = self._srt.pay_with_card(
+                target_reservation,
+                number=credit_card.number,
+                password=credit_card.password,
+                validation_number=credit_card.validation_number,
+                expire_date=credit_card.expire,
+                card_type="J" if not credit_card.is_corporate else "S",
+            )
+            paying.set(result="paid" if is_success else "failed")
 
         if is_success:
             return PaymentResult(success=True, message="Payment successful", reservation_number=target_reservation.reservation_number)
@@ -167,19 +308,233 @@ class SRTService(TrainService):
         """Name of the service"""
         return "SRT"
 
-    def _parse_time(self, time_str: str) -> datetime:
-        """Parse time string to datetime"""
-        return datetime.strptime(time_str, "%Y%m%d%H%M%S")
+    def set_cancel_token(self, token) -> None:
+        """Make searches and reservations raise once token (threading.Event) is set"""
+        self._cancel_token = token
+        self._srt.cancel_token = token
+
+    def release_cancel_token(self, token) -> None:
+        """Detach token unless another token has been set since"""
+        if self._cancel_token is token:
+            self.set_cancel_token(None)
 
-    def _get_available_seats(self, train) -> int:
-        """Get available seats count"""
-        try:
-            # Try to get seat availability information
-            return getattr(train, 'seat_count', 0)
-        except:
-            return 0
-        
     def clear(self) -> None:
         self.logout()
         self._srt.clear()
-        self._srt = SRT(auto_login=False)
+        self._srt = self._new_client()
+
+    def _new_client(self) -> SRT:
+        return SRT(
+            auto_login=False,
+            cancel_token=self._cancel_token,
+            timeouts=self._timeouts,
+            base_url=self._base_url,
+            netfunnel_url=self._netfunnel_url,
+            metrics=self.metrics,
+        )
+
+
+class AsyncSRTService(AsyncTrainService):
+    """SRT train service on AsyncSRT
+
+    Client failures surface as TrainServiceError subclasses (see
+    _service_errors) rather than empty results.
+    """
+
+    def __init__(
+        self,
+        timeouts: dict[str, float] | None = None,
+        attempt_timeout: float = RESERVE_ATTEMPT_TIMEOUT,
+        base_url: str | None = None,
+        netfunnel_url: str | None = None,
+        transport=None,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Args:
+            timeouts: Per-endpoint request timeouts passed to the SRT client
+            attempt_timeout: Seconds one reserve -> pay attempt may take in total
+            base_url: SRT API root, e.g. of a local stand-in server
+            netfunnel_url: NetFunnel ts.wseq URL to use with base_url
+            transport: AsyncTransport shared with other services on the loop
+                (default: default_async_transport())
+            metrics: Registry the clients record their requests in, kept across
+                clear() (default: a new one per service)
+        """
+        self._cancel_token = None
+        self._timeouts = timeouts
+        self._base_url = base_url
+        self._netfunnel_url = netfunnel_url
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self._transport = transport
+        self._attempt_timeout = attempt_timeout
+        self._attempt_deadline: tuple[str, float] | None = None  # (reservation number, deadline)
+        self._srt = self._new_client()
+        self._logged_in = False
+
+    async def login(self, user_id: str, password: str) -> None:
+        """Login to SRT service
+
+        Raises:
+            TrainServiceLoginError: If SRT rejects the credentials
+        """
+        self._logged_in = False
+        with _service_errors():
+            await self._srt.login(user_id, password)
+        self._logged_in = True
+
+    async def logout(self) -> None:
+        """Logout from SRT service"""
+        self._logged_in = False
+        with _service_errors():
+            await self._srt.logout()
+
+    async def search_trains(self, request: ReservationRequest) -> list[TrainSchedule]:
+        """Search for SRT trains, with or without seats"""
+        self._require_login()
+        passengers = [PassengerMapper.to_srt(p) for p in request.passengers]
+        with _service_errors():
+            trains = await self._srt.search_train(**_search_kwargs(request, passengers))
+        return [_to_schedule(train, request) for train in trains]
+
+    async def reserve_train(self, schedules: list[TrainSchedule], request: ReservationRequest) -> ReservationResult:
+        """Reserve the earliest of schedules that has a seat the request allows
+
+        Starts the deadline of a reserve -> pay attempt; paying the reservation
+        made here gets whatever is left of it.
+
+        Raises:
+            TrainServiceSoldOutError: If none of the trains has such a seat
+            TrainServiceTimeoutError: If a request or the attempt deadline times out
+        """
+        self._require_login()
+        deadline = time.monotonic() + self._attempt_timeout
+        self._srt.deadline = deadline
+        try:
+            with _service_errors():
+                result = await self._reserve(schedules, request)
+        finally:
+            self._srt.deadline = None
+
+        self._attempt_deadline = (result.reservation_number, deadline)
+        return result
+
+    async def _reserve(self, schedules: list[TrainSchedule], request: ReservationRequest) -> ReservationResult:
+        passengers = [PassengerMapper.to_srt(p) for p in request.passengers]
+        schedules = sorted(schedules, key=lambda x: x.departure_time)
+        target_train_numbers = {schedule.train_number for schedule in schedules}
+        with span("search", targets=len(target_train_numbers)) as searching:
+            trains = await self._srt.search_train(
+                train_numbers=target_train_numbers,
+                seat_filter=row_seat_available,
+                **_search_kwargs(request, passengers),
+            )
+            searching.set(found=len(trains))
+
+        with span("select", candidates=len(trains)) as selecting:
+            for train in trains:
+                if train.train_number not in target_train_numbers or not train.seat_available():
+                    continue
+                option = _reserve_option(train, request)
+                if option is None:
+                    continue
+                with span("reserve", train=train.train_number, option=option.name):
+                    reservation = await self._srt.reserve(train=train, passengers=passengers, option=option)
+                if reservation:
+                    selecting.set(result="reserved", train=train.train_number)
+                    return _reservation_result(reservation, train, schedules)
+            selecting.set(result="no_seats")
+
+        raise TrainServiceSoldOutError("Any requested trains have no seats")
+
+    async def payment_reservation(self, reservation: ReservationResult, credit_card: CreditCard) -> PaymentResult:
+        """Pay for a reservation with credit card
+
+        Raises:
+            TrainServiceResponseError: If the reservation is gone or the payment is declined
+            TrainServiceTimeoutError: If a request or the attempt deadline times out
+        """
+        self._require_login()
+
+        # Paying the reservation just made continues its attempt deadline
+        pending, self._attempt_deadline = self._attempt_deadline, None
+        if pending is not None and pending[0] == reservation.reservation_number:
+            self._srt.deadline = pending[1]
+        else:
+            self._srt.deadline = time.monotonic() + self._attempt_timeout
+        try:
+            with _service_errors():
+                return await self._pay(reservation, credit_card)
+        finally:
+            self._srt.deadline = None
+
+    async def _pay(self, reservation: ReservationResult, credit_card: CreditCard) -> PaymentResult:
+        target_reservation = _held_reservation(reservation)
+        if target_reservation is None:
+            with span("reservation_lookup"):
+                target_reservation = await self._srt.get_reservation(reservation.reservation_number)
+
+        if not target_reservation:
+            raise TrainServiceResponseError(f"Reservation {reservation.reservation_number} not found")
+
+        with span("payment", reservation=target_reservation.reservation_number):
+            await self._srt.pay_with_card(
+                target_reservation,
+                number=credit_card.number,
+                password=credit_card.password,
+                validation_number=credit_card.validation_number,
+                expire_date=credit_card.expire,
+                card_type="J" if not credit_card.is_corporate else "S",
+            )
+        return PaymentResult(
+            success=True, message="Payment successful", reservation_number=target_reservation.reservation_number
+        )
+
+    def get_stations(self) -> List[Station]:
+        """Get list of SRT stations"""
+        return [Station(station.name, station.code) for station in SRT_STATIONS]
+
+    def is_logged_in(self) -> bool:
+        """Check if logged in to SRT service"""
+        return self._logged_in
+
+    @property
+    def service_name(self) -> str:
+        """Name of the service"""
+        return "SRT"
+
+    def set_cancel_token(self, token) -> None:
+        """Make searches and reservations raise once token (threading.Event) is set"""
+        self._cancel_token = token
+        self._srt.cancel_token = token
+
+    def release_cancel_token(self, token) -> None:
+        """Detach token unless another token has been set since"""
+        if self._cancel_token is token:
+            self.set_cancel_token(None)
+
+    async def clear(self) -> None:
+        try:
+            await self.logout()
+        except TrainServiceError:
+            pass  # the old session is dropped either way
+        self._srt.clear()
+        await self._srt.close()
+        self._srt = self._new_client()
+
+    async def close(self) -> None:
+        await self._srt.close()
+
+    def _require_login(self) -> None:
+        if not self._logged_in:
+            raise TrainServiceLoginExpiredError("Not logged in")
+
+    def _new_client(self) -> AsyncSRT:
+        return AsyncSRT(
+            cancel_token=self._cancel_token,
+            timeouts=self._timeouts,
+            base_url=self._base_url,
+            netfunnel_url=self._netfunnel_url,
+            transport=self._transport,
+            metrics=self.metrics,
+        )
@@ -29,6 +29,21 @@ class SQLAlchemyUserRepository:
                 session.expunge(user)
             return user
 
+    def find_all(self) -> list[User]:
+        """
+        Find all stored users with a single query
+
+        Returns:
+            List of User entities (at most one per train type)
+        """
+        with DatabaseManager.get_session() as session:
+            users = list(session.execute(select(User)).scalars())
+            for user in users:
+                # Load attributes before expunging
+                _ = (user.id, user.username, user.password, user.train_type)
+                session.expunge(user)
+            return users
+
     def save(self, username: str, password: str, train_type: str) -> User:
         """
         Save or update user credentials
@@ -70,6 +85,40 @@ class SQLAlchemyUserRepository:
                 session.expunge(new_user)
                 return new_user
 
+    def save_all(self, entries: list[dict]) -> list[User]:
+        """
+        Save or update several users in one transaction
+
+        Args:
+            entries: Keyword arguments of save() (username, password, train_type)
+                for each user
+
+        Returns:
+            The saved User entities, in the order given
+        """
+        train_types = [TrainType.KORAIL if e["train_type"] == "KORAIL" else TrainType.SRT for e in entries]
+
+        with DatabaseManager.get_session() as session:
+            stmt = select(User).where(User.train_type.in_(train_types))
+            existing = {user.train_type: user for user in session.execute(stmt).scalars()}
+
+            saved = []
+            for entry, train_type_enum in zip(entries, train_types):
+                user = existing.get(train_type_enum)
+                if user is None:
+                    user = User(train_type=train_type_enum)
+                    session.add(user)
+                user.username = entry["username"]
+                user.password = entry["password"]
+                saved.append(user)
+            session.flush()
+
+            for user in saved:
+                # Load attributes before expunging
+                _ = (user.id, user.username, user.password, user.train_type)
+                session.expunge(user)
+            return saved
+
     def delete(self, train_type: str) -> bool:
         """
         Delete user by train type
@@ -118,6 +167,23 @@ class SQLAlchemyCardRepository:
                 session.expunge(card)
             return card
 
+    def find_all(self) -> list[Card]:
+        """
+        Find all stored cards with a single query
+
+        Returns:
+            List of Card entities (at most one per train type)
+        """
+        with DatabaseManager.get_session() as session:
+            cards = list(session.execute(select(Card)).scalars())
+            for card in cards:
+                # Load attributes before expunging
+                _ = (card.id, card.card_number, card.card_password,
+                     card.card_expired_date, card.card_validate_number,
+                     card.is_corporate, card.train_type)
+                session.expunge(card)
+            return cards
+
     def save(
         self,
         card_number: str,
@@ -180,6 +246,46 @@ class SQLAlchemyCardRepository:
                 session.expunge(new_card)
                 return new_card
 
+    def save_all(self, entries: list[dict]) -> list[Card]:
+        """
+        Save or update several cards in one transaction
+
+        Args:
+            entries: Keyword arguments of save() (card_number, card_password,
+                card_expired_date, card_validate_number, is_corporate, train_type)
+                for each card
+
+        Returns:
+            The saved Card entities, in the order given
+        """
+        train_types = [TrainType.KORAIL if e["train_type"] == "KORAIL" else TrainType.SRT for e in entries]
+
+        with DatabaseManager.get_session() as session:
+            stmt = select(Card).where(Card.train_type.in_(train_types))
+            existing = {card.train_type: card for card in session.execute(stmt).scalars()}
+
+            saved = []
+            for entry, train_type_enum in zip(entries, train_types):
+                card = existing.get(train_type_enum)
+                if card is None:
+                    card = Card(train_type=train_type_enum)
+                    session.add(card)
+                card.card_number = entry["card_number"]
+                card.card_password = entry["card_password"]
+                card.card_expired_date = entry["card_expired_date"]
+                card.card_validate_number = entry["card_validate_number"]
+                card.is_corporate = entry["is_corporate"]
+                saved.append(card)
+            session.flush()
+
+            for card in saved:
+                # Load attributes before expunging
+                _ = (card.id, card.card_number, card.card_password,
+                     card.card_expired_date, card.card_validate_number,
+                     card.is_corporate, card.train_type)
+                session.expunge(card)
+            return saved
+
     def delete(self, train_type: str) -> bool:
         """
         Delete card by train type
@@ -1,18 +1,43 @@
 """Database session management"""
+import threading
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
 from typing import Generator
 
 from src.infrastructure.database.models import Base
 
+# Alembic head revision matching Base.metadata; bump together with new migrations
+SCHEMA_REVISION = "0eeb39075ab1"
+
+# Applied to every new SQLite connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class DatabaseManager:
     """Database connection and session manager"""
 
     _engine = None
     _session_factory = None
+    _local = threading.local()
+    _init_lock = threading.Lock()
 
     @classmethod
     def get_db_path(cls) -> Path:
@@ -25,24 +50,83 @@ class DatabaseManager:
 
     @classmethod
     def initialize(cls) -> None:
-        """Initialize database engine and create tables if needed"""
-        if cls._engine is None:
+        """
+        Initialize database engine and create tables if needed
+
+        The engine runs SQLite in WAL mode with synchronous=NORMAL and keeps its
+        connections pooled, so sessions opened from worker threads reuse an open
+        connection instead of reconnecting. A database without an Alembic
+        revision (new or pre-Alembic) gets its tables created and is stamped
+        with SCHEMA_REVISION; one at any other revision than SCHEMA_REVISION
+        must be migrated with `alembic upgrade head` first.
+
+        Raises:
+            RuntimeError: If the database is at another Alembic revision
+        """
+        if cls._engine is not None:
+            return
+
+        with cls._init_lock:
+            if cls._engine is not None:
+                return
+
             db_path = cls.get_db_path()
             # Use sqlite with absolute path
             database_url = f"sqlite:///{db_path}"
-            cls._engine = create_engine(
+            engine = create_engine(
                 database_url,
                 echo=False,  # Set to True for SQL debugging
-                connect_args={"check_same_thread": False}  # Needed for SQLite
+                connect_args={"check_same_thread": False},  # Needed for SQLite
+                poolclass=QueuePool,
+                pool_size=1,  # One persistent connection for the UI thread
+                max_overflow=4,  # Extra connections for concurrent worker threads
             )
+            event.listen(engine, "connect", _apply_sqlite_pragmas)
+
+            revision = cls._stored_revision(engine)
+            if revision is None:
+                # Create all tables and record the revision they correspond to
+                Base.metadata.create_all(engine)
+                cls._stamp_revision(engine)
+            elif revision != SCHEMA_REVISION:
+                # Pending migrations must not be skipped by stamping over them
+                engine.dispose()
+                raise RuntimeError(
+                    f"Database {db_path} is at schema revision {revision}, expected {SCHEMA_REVISION}; "
+                    "run 'alembic upgrade head'"
+                )
+
             cls._session_factory = sessionmaker(
-                bind=cls._engine,
+                bind=engine,
                 autocommit=False,
                 autoflush=False
             )
+            cls._engine = engine
 
-            # Create all tables
-            Base.metadata.create_all(cls._engine)
+    @staticmethod
+    def _stored_revision(engine) -> str | None:
+        """Read the Alembic revision recorded in the database, if any"""
+        try:
+            with engine.connect() as connection:
+                return connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+        except OperationalError:
+            # No alembic_version table yet (new or pre-Alembic database)
+            return None
+
+    @staticmethod
+    def _stamp_revision(engine) -> None:
+        """Record SCHEMA_REVISION the same way `alembic stamp` does"""
+        with engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE IF NOT EXISTS alembic_version ("
+                "version_num VARCHAR(32) NOT NULL, "
+                "CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num))"
+            ))
+            connection.execute(text("DELETE FROM alembic_version"))
+            connection.execute(
+                text("INSERT INTO alembic_version (version_num) VALUES (:revision)"),
+                {"revision": SCHEMA_REVISION}
+            )
 
     @classmethod
     @contextmanager
@@ -50,15 +134,24 @@ class DatabaseManager:
         """
         Get a database session context manager
 
+        Nested calls on the same thread join the outermost session, so several
+        repository calls inside one ``with`` block share a single transaction.
+
         Usage:
             with DatabaseManager.get_session() as session:
                 # Use session here
                 pass
         """
+        current = getattr(cls._local, "session", None)
+        if current is not None:
+            yield current
+            return
+
         if cls._session_factory is None:
             cls.initialize()
 
         session = cls._session_factory()
+        cls._local.session = session
         try:
             yield session
             session.commit()
@@ -66,6 +159,7 @@ class DatabaseManager:
             session.rollback()
             raise
         finally:
+            cls._local.session = None
             session.close()
 
     @classmethod
@@ -0,0 +1,254 @@
+"""Record and replay the HTTP traffic of the SRT and Korail clients
+
+RecordingTransport wraps a real transport and appends every request of its
+sessions, including NetFunnel, to a cassette: a JSON Lines file with one
+interaction per line. Credentials, card details and personal fields are
+scrubbed before anything is written (see scrub_fields/scrub_body): by field
+name in request fields and JSON bodies, and as whole tokens in other bodies.
+
+ReplayTransport answers from a cassette without any network I/O. The n-th
+request to an endpoint (method and URL path, so any base URL works) gets
+the n-th recorded answer to it, whether that was a response, a timeout or a
+connection error. ``speed=None`` replays at full speed; ``speed=1.0`` waits
+as long as the original request took, ``2.0`` half as long, and so on.
+
+Async clients can record and replay through ThreadedAsyncTransport.
+"""
+import json
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from src.infrastructure.external.transport import (
+    InMemoryResponse,
+    Session,
+    TimingHook,
+    Transport,
+    TransportError,
+    TransportTimeout,
+    default_transport,
+)
+
+REDACTED = "***"
+
+# Request and response fields holding login IDs, passwords, card details,
+# membership numbers or personal data, matched case-insensitively
+SECRET_FIELD = re.compile(
+    r"pw|passw|crd_?no|cardno|memberno|srchdvnm|athnval|vlidtrm|phone|cpno|email|cust_?nm|ps_nm",
+    re.IGNORECASE,
+)
+MIN_SECRET_LENGTH = 4  # shorter values are too common to scrub from non-JSON bodies
+
+
+class CassetteError(LookupError):
+    """A replayed request has no recorded answer left"""
+
+
+@dataclass
+class Interaction:
+    """One recorded request and its outcome"""
+    method: str
+    path: str
+    params: dict = field(default_factory=dict)
+    data: dict = field(default_factory=dict)
+    status: int | None = None
+    content_type: str = ""
+    body: str = ""
+    elapsed: float = 0.0
+    error: str | None = None  # "timeout" or "error" when the request failed
+    error_message: str = ""
+
+
+def load_cassette(path: str | Path) -> list[Interaction]:
+    """Read the interactions of a cassette file"""
+    with open(path, encoding="utf-8") as f:
+        return [Interaction(**json.loads(line)) for line in f if line.strip()]
+
+
+def _path(url: str) -> str:
+    return urlsplit(url).path
+
+
+def _is_token_secret(value: str) -> bool:
+    # All-digit values (expiry, birthday, PIN) also occur inside dates and amounts
+    return len(value) >= MIN_SECRET_LENGTH and not value.isdigit()
+
+
+def scrub_fields(fields: dict | None, secrets: set[str] | None = None) -> dict:
+    """Copy of fields with secret values redacted
+
+    Redacted values that can be told apart from ordinary data are added to
+    secrets, for scrub_body() to find in bodies that are not JSON.
+    """
+    scrubbed = {}
+    for key, value in (fields or {}).items():
+        if SECRET_FIELD.search(key) and value not in (None, ""):
+            if secrets is not None and _is_token_secret(str(value)):
+                secrets.add(str(value))
+            value = REDACTED
+        scrubbed[key] = value
+    return scrubbed
+
+
+def _scrub_json(value, secrets: set[str]):
+    if isinstance(value, dict):
+        scrubbed = scrub_fields(value, secrets)
+        return {key: _scrub_json(item, secrets) for key, item in scrubbed.items()}
+    if isinstance(value, list):
+        return [_scrub_json(item, secrets) for item in value]
+    return value
+
+
+def scrub_body(body: str, secrets: set[str]) -> str:
+    """Body with its secret JSON fields redacted
+
+    Other values of a JSON body are kept as they are, so dates and amounts
+    stay parseable. A body that is not JSON (NetFunnel replies, error
+    messages) has every known secret redacted where it occurs as a whole token.
+    """
+    try:
+        return json.dumps(_scrub_json(json.loads(body), secrets), ensure_ascii=False)
+    except ValueError:
+        pass
+    if not secrets:
+        return body
+    tokens = "|".join(re.escape(secret) for secret in sorted(secrets, key=len, reverse=True))
+    return re.sub(rf"(?<!\w)(?:{tokens})(?!\w)", REDACTED, body)
+
+
+class _RecordingBackend:
+    def __init__(self, transport: "RecordingTransport", session: Session):
+        self._transport = transport
+        self._session = session
+
+    @property
+    def headers(self):
+        return self._session.headers
+
+    @property
+    def cookies(self):
+        return self._session.cookies
+
+    def request(self, method: str, url: str, params=None, data=None, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = self._session.request(method, url, params=params, data=data, **kwargs)
+        except TransportError as ex:
+            kind = "timeout" if isinstance(ex, TransportTimeout) else "error"
+            self._transport._record(
+                method, url, params, data, time.perf_counter() - start, error=kind, error_message=str(ex)
+            )
+            raise
+        self._transport._record(method, url, params, data, time.perf_counter() - start, response=response)
+        return response
+
+    def close(self) -> None:
+        self._session.close()
+
+
+class RecordingTransport(Transport):
+    """Sessions of another transport whose traffic is appended, scrubbed, to a cassette
+
+    Requests go through the wrapped transport, which also reports them to
+    hooks: hooks added here are added to it.
+    """
+
+    def __init__(self, path: str | Path, transport: Transport | None = None):
+        self.transport = transport or default_transport()
+        super().__init__(self.transport.config)
+        self.name = self.transport.name
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("", encoding="utf-8")
+        self._secrets: set[str] = set()
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: TimingHook) -> None:
+        self.transport.add_hook(hook)
+
+    def remove_hook(self, hook: TimingHook) -> None:
+        self.transport.remove_hook(hook)
+
+    def _new_backend(self, impersonate: str | None):
+        # A session of the wrapped transport, which applies its config and hooks
+        return _RecordingBackend(self, self.transport.session(impersonate=impersonate))
+
+    def _record(self, method, url, params, data, elapsed, response=None, error=None, error_message=""):
+        with self._lock:
+            interaction = Interaction(
+                method=method,
+                path=_path(url),
+                params=scrub_fields(params, self._secrets),
+                data=scrub_fields(data, self._secrets),
+                elapsed=round(elapsed, 6),
+                error=error,
+                error_message=scrub_body(error_message, self._secrets),
+            )
+            if response is not None:
+                interaction.status = response.status_code
+                interaction.content_type = response.headers.get("Content-Type", "")
+                interaction.body = scrub_body(response.text, self._secrets)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(interaction), ensure_ascii=False) + "\n")
+
+
+class _ReplayBackend:
+    def __init__(self, transport: "ReplayTransport"):
+        self._transport = transport
+        self.headers: dict[str, str] = {}
+        self.cookies: dict[str, str] = {}
+
+    def request(self, method: str, url: str, timeout=None, **kwargs):
+        return self._transport._answer(method, url, timeout)
+
+    def close(self) -> None:
+        pass
+
+
+class ReplayTransport(Transport):
+    """Answers every request from a recorded cassette"""
+    name = "replay"
+
+    def __init__(self, cassette: str | Path | list[Interaction], speed: float | None = None):
+        super().__init__()
+        interactions = cassette if isinstance(cassette, list) else load_cassette(cassette)
+        self.speed = speed
+        self._queues: dict[tuple[str, str], deque[Interaction]] = defaultdict(deque)
+        for interaction in interactions:
+            self._queues[interaction.method, interaction.path].append(interaction)
+        self._lock = threading.Lock()
+
+    @property
+    def unplayed(self) -> int:
+        """Recorded interactions not replayed yet"""
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def _new_backend(self, impersonate: str | None):
+        return _ReplayBackend(self)
+
+    def _answer(self, method: str, url: str, timeout: float | None) -> InMemoryResponse:
+        path = _path(url)
+        with self._lock:
+            queue = self._queues.get((method, path))
+            if not queue:
+                raise CassetteError(f"No recorded answer left for {method} {path}")
+            interaction = queue.popleft()
+
+        if self.speed:
+            delay = interaction.elapsed / self.speed
+            if timeout is not None and delay > timeout:
+                time.sleep(timeout)
+                raise TransportTimeout(f"Replayed request took longer than {timeout}s")
+            time.sleep(delay)
+
+        if interaction.error == "timeout":
+            raise TransportTimeout(interaction.error_message)
+        if interaction.error is not None:
+            raise TransportError(interaction.error_message)
+        headers = {"Content-Type": interaction.content_type} if interaction.content_type else {}
+        return InMemoryResponse(interaction.body, interaction.status, headers)
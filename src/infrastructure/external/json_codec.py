@@ -0,0 +1,40 @@
+"""JSON decoding of API responses
+
+Responses are parsed from their raw body bytes, which skips building the
+``r.text`` string first. orjson is used when it is installed and the stdlib
+json module otherwise; both raise json.JSONDecodeError on malformed input.
+"""
+import json
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+if HAS_ORJSON:
+    def loads(data: bytes | str):
+        """Parse a JSON document from bytes or str"""
+        return orjson.loads(data)
+else:
+    def loads(data: bytes | str):
+        """Parse a JSON document from bytes or str"""
+        return json.loads(data)
+
+
+def response_json(r):
+    """Parse the JSON body of a transport response
+
+    Uses the raw ``content`` bytes when the response has them. Responses
+    without bytes (test doubles) and bodies that are not UTF-8 are decoded
+    from ``text`` instead.
+    """
+    content = getattr(r, "content", None)
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        try:
+            return loads(content)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            # orjson reads only UTF-8; r.text honours the declared charset
+            pass
+    return loads(r.text)
@@ -6,27 +6,33 @@ korail2.korail2
 :license: BSD, see LICENSE for more details.
 """
 
+import asyncio
 import base64
-try:
-    import curl_cffi
-    HAS_CURL_CFFI = True
-except ImportError:
-    import requests
-    HAS_CURL_CFFI = False
 import itertools
-import json
+import logging
 import re
 import time
+from contextlib import contextmanager
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad
 from datetime import datetime, timedelta
 from functools import reduce
 
+from src.domain.services.tracing import span
+from src.infrastructure.external.json_codec import response_json
+from src.infrastructure.external.metrics import default_metrics
+from src.infrastructure.external.records import Record, intern
+from src.infrastructure.external.transport import TransportTimeout, default_async_transport, default_transport
+from src.infrastructure.logs import client_response_logger, log_response, response_logger
+
+log = logging.getLogger(__name__)
+_responses = response_logger("korail")
 
 # Constants
 EMAIL_REGEX = re.compile(r"[^@]+@[^@]+\.[^@]+")
 PHONE_NUMBER_REGEX = re.compile(r"(\d{3})-(\d{3,4})-(\d{4})")
 
+IMPERSONATE = "chrome131_android"  # browser fingerprint presented by curl_cffi
 USER_AGENT = "Dalvik/2.1.0 (Linux; U; Android 14; SM-S912N Build/UP1A.231005.007)"
 
 DEFAULT_HEADERS = {
@@ -37,45 +43,71 @@ DEFAULT_HEADERS = {
     "Accept-Encoding": "gzip",
 }
 
-KORAIL_MOBILE = "https://smart.letskorail.com:443/classes/com.korail.mobile"
-API_ENDPOINTS = {
-    "login": f"{KORAIL_MOBILE}.login.Login",
-    "logout": f"{KORAIL_MOBILE}.common.logout",
-    "search_schedule": f"{KORAIL_MOBILE}.seatMovie.ScheduleView",
-    "reserve": f"{KORAIL_MOBILE}.certification.TicketReservation",
-    "cancel": f"{KORAIL_MOBILE}.reservationCancel.ReservationCancelChk",
-    "myticketseat": f"{KORAIL_MOBILE}.refunds.SelTicketInfo",
-    "myticketlist": f"{KORAIL_MOBILE}.myTicket.MyTicketList",
-    "myreservationview": f"{KORAIL_MOBILE}.reservation.ReservationView",
-    "myreservationlist": f"{KORAIL_MOBILE}.certification.ReservationList",
-    "pay": f"{KORAIL_MOBILE}.payment.ReservationPayment",
-    "refund": f"{KORAIL_MOBILE}.refunds.RefundsRequest",
-    "code": f"{KORAIL_MOBILE}.common.code.do",
-}
+KORAIL_HOST = "https://smart.letskorail.com:443"
+KORAIL_MOBILE = f"{KORAIL_HOST}/classes/com.korail.mobile"
+
+
+def build_endpoints(base_url: str) -> dict:
+    """Return the API endpoint URLs of the Korail host at base_url"""
+    mobile = f"{base_url}/classes/com.korail.mobile"
+    return {
+        "login": f"{mobile}.login.Login",
+        "logout": f"{mobile}.common.logout",
+        "search_schedule": f"{mobile}.seatMovie.ScheduleView",
+        "reserve": f"{mobile}.certification.TicketReservation",
+        "cancel": f"{mobile}.reservationCancel.ReservationCancelChk",
+        "myticketseat": f"{mobile}.refunds.SelTicketInfo",
+        "myticketlist": f"{mobile}.myTicket.MyTicketList",
+        "myreservationview": f"{mobile}.reservation.ReservationView",
+        "myreservationlist": f"{mobile}.certification.ReservationList",
+        "pay": f"{mobile}.payment.ReservationPayment",
+        "refund": f"{mobile}.refunds.RefundsRequest",
+        "code": f"{mobile}.common.code.do",
+    }
 
 
-# Schedule classes
-class Schedule:
-    """Base class for train schedules"""
+API_ENDPOINTS = build_endpoints(KORAIL_HOST)
 
-    def __init__(self, data):
-        self.train_type = data.get("h_trn_clsf_cd")
-        self.train_type_name = data.get("h_trn_clsf_nm")
-        self.train_group = data.get("h_trn_gp_cd")
-        self.train_no = data.get("h_trn_no")
-        self.delay_time = data.get("h_expct_dlay_hr")
+# Request timeouts in seconds, keyed by API_ENDPOINTS name or "netfunnel";
+# endpoints without an entry use "default"
+DEFAULT_TIMEOUTS = {
+    "default": 10.0,
+    "login": 10.0,
+    "search_schedule": 5.0,
+    "reserve": 10.0,
+    "pay": 20.0,
+    "netfunnel": 5.0,
+}
 
-        self.dep_name = data.get("h_dpt_rs_stn_nm")
-        self.dep_code = data.get("h_dpt_rs_stn_cd")
-        self.dep_date = data.get("h_dpt_dt")
-        self.dep_time = data.get("h_dpt_tm")
 
-        self.arr_name = data.get("h_arv_rs_stn_nm")
-        self.arr_code = data.get("h_arv_rs_stn_cd")
-        self.arr_date = data.get("h_arv_dt")
-        self.arr_time = data.get("h_arv_tm")
+# Schedule classes
+class Schedule(Record):
+    """Base class for train schedules (read-only)"""
 
-        self.run_date = data.get("h_run_dt")
+    __slots__ = (
+        "train_type", "train_type_name", "train_group", "train_no", "delay_time",
+        "dep_name", "dep_code", "dep_date", "dep_time",
+        "arr_name", "arr_code", "arr_date", "arr_time",
+        "run_date",
+    )
+
+    def __init__(self, data):
+        self._set(
+            train_type=intern(data.get("h_trn_clsf_cd")),
+            train_type_name=intern(data.get("h_trn_clsf_nm")),
+            train_group=intern(data.get("h_trn_gp_cd")),
+            train_no=data.get("h_trn_no"),
+            delay_time=data.get("h_expct_dlay_hr"),
+            dep_name=intern(data.get("h_dpt_rs_stn_nm")),
+            dep_code=intern(data.get("h_dpt_rs_stn_cd")),
+            dep_date=data.get("h_dpt_dt"),
+            dep_time=data.get("h_dpt_tm"),
+            arr_name=intern(data.get("h_arv_rs_stn_nm")),
+            arr_code=intern(data.get("h_arv_rs_stn_cd")),
+            arr_date=data.get("h_arv_dt"),
+            arr_time=data.get("h_arv_tm"),
+            run_date=data.get("h_run_dt"),
+        )
 
     def __repr__(self):
         dep_time = f"{self.dep_time[:2]}:{self.dep_time[2:4]}"
@@ -95,15 +127,20 @@ class Schedule:
 class Train(Schedule):
     """Train schedule with seat availability"""
 
+    __slots__ = (
+        "reserve_possible", "reserve_possible_name", "special_seat", "general_seat", "wait_reserve_flag",
+    )
+
     def __init__(self, data):
         super().__init__(data)
-        self.reserve_possible = data.get("h_rsv_psb_flg")
-        self.reserve_possible_name = data.get("h_rsv_psb_nm")
-        self.special_seat = data.get("h_spe_rsv_cd")
-        self.general_seat = data.get("h_gen_rsv_cd")
-        self.wait_reserve_flag = data.get("h_wait_rsv_flg")
-        if self.wait_reserve_flag:
-            self.wait_reserve_flag = int(self.wait_reserve_flag)
+        wait_reserve_flag = data.get("h_wait_rsv_flg")
+        self._set(
+            reserve_possible=intern(data.get("h_rsv_psb_flg")),
+            reserve_possible_name=intern(data.get("h_rsv_psb_nm")),
+            special_seat=intern(data.get("h_spe_rsv_cd")),
+            general_seat=intern(data.get("h_gen_rsv_cd")),
+            wait_reserve_flag=int(wait_reserve_flag) if wait_reserve_flag else wait_reserve_flag,
+        )
 
     def __repr__(self):
         repr_str = super().__repr__()
@@ -142,24 +179,54 @@ class Train(Schedule):
         return self.wait_reserve_flag == 9
 
 
+# Seat tests on raw trn_info rows, matching the Train methods of the same name;
+# search_train(seat_filter=...) applies one before building any Train
+def row_has_special_seat(row):
+    return row.get("h_spe_rsv_cd") == "11"
+
+
+def row_has_general_seat(row):
+    return row.get("h_gen_rsv_cd") == "11"
+
+
+def row_has_seat(row):
+    return row_has_general_seat(row) or row_has_special_seat(row)
+
+
+def row_has_waiting_list(row):
+    flag = row.get("h_wait_rsv_flg")
+    return bool(flag) and int(flag) == 9
+
+
+def _row_has_seat_or_waiting_list(row):
+    return row_has_seat(row) or row_has_waiting_list(row)
+
+
 class Ticket(Train):
     """Train ticket information"""
 
+    __slots__ = (
+        "seat_no_end", "seat_no_count", "buyer_name", "sale_date", "pnr_no",
+        "sale_info1", "sale_info2", "sale_info3", "sale_info4", "price", "car_no", "seat_no",
+    )
+
     def __init__(self, data):
         raw_data = data["ticket_list"][0]["train_info"][0]
         super().__init__(raw_data)
-        self.seat_no_end = raw_data.get("h_seat_no_end")
-        self.seat_no_count = int(raw_data.get("h_seat_cnt"))
-        self.buyer_name = raw_data.get("h_buy_ps_nm")
-        self.sale_date = raw_data.get("h_orgtk_sale_dt")
-        self.pnr_no = raw_data.get("h_pnr_no")
-        self.sale_info1 = raw_data.get("h_orgtk_wct_no")
-        self.sale_info2 = raw_data.get("h_orgtk_ret_sale_dt")
-        self.sale_info3 = raw_data.get("h_orgtk_sale_sqno")
-        self.sale_info4 = raw_data.get("h_orgtk_ret_pwd")
-        self.price = int(raw_data.get("h_rcvd_amt"))
-        self.car_no = raw_data.get("h_srcar_no")
-        self.seat_no = raw_data.get("h_seat_no")
+        self._set(
+            seat_no_end=raw_data.get("h_seat_no_end"),
+            seat_no_count=int(raw_data.get("h_seat_cnt")),
+            buyer_name=raw_data.get("h_buy_ps_nm"),
+            sale_date=raw_data.get("h_orgtk_sale_dt"),
+            pnr_no=raw_data.get("h_pnr_no"),
+            sale_info1=raw_data.get("h_orgtk_wct_no"),
+            sale_info2=raw_data.get("h_orgtk_ret_sale_dt"),
+            sale_info3=raw_data.get("h_orgtk_sale_sqno"),
+            sale_info4=raw_data.get("h_orgtk_ret_pwd"),
+            price=int(raw_data.get("h_rcvd_amt")),
+            car_no=raw_data.get("h_srcar_no"),
+            seat_no=raw_data.get("h_seat_no"),
+        )
 
     def __repr__(self):
         repr_str = super(Train, self).__repr__()
@@ -181,24 +248,70 @@ class Ticket(Train):
 
 
 class Reservation(Train):
-    """Train reservation information"""
+    """Train reservation information
 
-    def __init__(self, data):
+    Seat details (``tickets``) and ``wct_no`` are fetched on first access
+    through ``ticket_loader`` (called with the reservation id) and memoized.
+    They are the only fields that can be set after construction.
+    """
+
+    __slots__ = (
+        "rsv_id", "seat_no_count", "buy_limit_date", "buy_limit_time", "price",
+        "journey_no", "journey_cnt", "rsv_chg_no", "is_waiting",
+        "_ticket_loader", "_tickets", "_wct_no",
+    )
+
+    def __init__(self, data, ticket_loader=None):
         super().__init__(data)
-        self.dep_date = data.get("h_run_dt")
-        self.arr_date = data.get("h_run_dt")
-        self.rsv_id = data.get("h_pnr_no")
-        self.seat_no_count = int(data.get("h_tot_seat_cnt"))
-        self.buy_limit_date = data.get("h_ntisu_lmt_dt")
-        self.buy_limit_time = data.get("h_ntisu_lmt_tm")
-        self.price = int(data.get("h_rsv_amt"))
-        self.journey_no = data.get("txtJrnySqno", "001")
-        self.journey_cnt = data.get("txtJrnyCnt", "01")
-        self.rsv_chg_no = data.get("hidRsvChgNo", "00000")
-        self.is_waiting = (
-            self.buy_limit_date == "00000000" or self.buy_limit_time == "235959"
+        buy_limit_date = data.get("h_ntisu_lmt_dt")
+        buy_limit_time = data.get("h_ntisu_lmt_tm")
+        self._set(
+            dep_date=data.get("h_run_dt"),
+            arr_date=data.get("h_run_dt"),
+            rsv_id=data.get("h_pnr_no"),
+            seat_no_count=int(data.get("h_tot_seat_cnt")),
+            buy_limit_date=buy_limit_date,
+            buy_limit_time=buy_limit_time,
+            price=int(data.get("h_rsv_amt")),
+            journey_no=data.get("txtJrnySqno", "001"),
+            journey_cnt=data.get("txtJrnyCnt", "01"),
+            rsv_chg_no=data.get("hidRsvChgNo", "00000"),
+            is_waiting=buy_limit_date == "00000000" or buy_limit_time == "235959",
+            _ticket_loader=ticket_loader,
+            _tickets=None,
+            _wct_no=None,
         )
 
+    def _load_ticket_info(self):
+        if self._ticket_loader is not None:
+            tickets, wct_no = self._ticket_loader(self.rsv_id) or ([], None)
+            self._set(_ticket_loader=None, _tickets=tickets, _wct_no=wct_no)
+
+    @property
+    def tickets(self):
+        self._load_ticket_info()
+        return self._tickets
+
+    @tickets.setter
+    def tickets(self, value):
+        self._set(_ticket_loader=None, _tickets=value)
+
+    @property
+    def wct_no(self):
+        self._load_ticket_info()
+        return self._wct_no
+
+    @wct_no.setter
+    def wct_no(self, value):
+        self._set(_ticket_loader=None, _wct_no=value)
+
+    def __setattr__(self, name, value):
+        # Only the lazily loaded ticket info is writable, through its properties
+        if name in ("tickets", "wct_no"):
+            object.__setattr__(self, name, value)
+        else:
+            super().__setattr__(name, value)
+
     def __repr__(self):
         repr_str = super().__repr__()
         repr_str += f", {self.price}원({self.seat_no_count}석)"
@@ -213,18 +326,23 @@ class Reservation(Train):
         return repr_str
 
 
-class Seat:
+class Seat(Record):
     """Train seat information"""
 
+    __slots__ = ("car", "seat", "seat_type", "passenger_type", "price", "original_price", "discount", "is_waiting")
+
     def __init__(self, data: dict):
-        self.car = data.get("h_srcar_no")
-        self.seat = data.get("h_seat_no")
-        self.seat_type = data.get("h_psrm_cl_nm")
-        self.passenger_type = data.get("h_psg_tp_dv_nm")
-        self.price = int(data.get("h_rcvd_amt", 0))
-        self.original_price = int(data.get("h_seat_prc", 0))
-        self.discount = int(data.get("h_dcnt_amt", 0))
-        self.is_waiting = self.seat == ""
+        seat = data.get("h_seat_no")
+        self._set(
+            car=data.get("h_srcar_no"),
+            seat=seat,
+            seat_type=intern(data.get("h_psrm_cl_nm")),
+            passenger_type=intern(data.get("h_psg_tp_dv_nm")),
+            price=int(data.get("h_rcvd_amt", 0)),
+            original_price=int(data.get("h_seat_prc", 0)),
+            discount=int(data.get("h_dcnt_amt", 0)),
+            is_waiting=seat == "",
+        )
 
     def __repr__(self):
         if self.is_waiting:
@@ -391,6 +509,32 @@ class SoldOutError(KorailError):
         super().__init__("Sold out", code)
 
 
+class KorailCancelledError(KorailError):
+    def __init__(self, code=None):
+        super().__init__("Cancelled", code)
+
+
+class KorailTimeoutError(KorailError):
+    def __init__(self, msg="Request timed out", code=None):
+        super().__init__(msg, code)
+
+
+def _raise_if_cancelled(cancel_token):
+    """Raise KorailCancelledError if the given threading.Event has been set"""
+    if cancel_token is not None and cancel_token.is_set():
+        raise KorailCancelledError()
+
+
+def _capped_timeout(timeout, deadline, name):
+    """Return timeout, shortened to what is left until deadline (time.monotonic)"""
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise KorailTimeoutError(f"Deadline exceeded before {name}")
+    return min(timeout, remaining)
+
+
 class NetFunnelError(Exception):
     def __init__(self, msg):
         self.msg = msg
@@ -401,6 +545,13 @@ class NetFunnelError(Exception):
 
 # NetFunnel
 class NetFunnelHelper:
+    """Client of Korail's NetFunnel queue (nf.letskorail.com)
+
+    Korail and AsyncKorail do not go through NetFunnel: no request of theirs
+    needs a queue key, so nothing here is called by them, and the request
+    metrics, spans and queue gauge of the SRT helper are not recorded for it.
+    """
+
     NETFUNNEL_URL = "http://nf.letskorail.com/ts.wseq"
 
     WAIT_STATUS_PASS = "200"
@@ -419,35 +570,37 @@ class NetFunnelHelper:
         "User-Agent": "Apache-HttpClient/UNAVAILABLE (java 1.4)",
     }
 
-    def __init__(self):
-        if HAS_CURL_CFFI:
-            try:
-                import certifi
-                self._session = curl_cffi.Session(
-                    impersonate="chrome131_android",
-                    verify=certifi.where()
-                )
-            except ImportError:
-                self._session = curl_cffi.Session(impersonate="chrome131_android")
-        else:
-            self._session = requests.session()
-        self._session.headers.update(self.DEFAULT_HEADERS)
+    def __init__(self, timeout=DEFAULT_TIMEOUTS["netfunnel"], transport=None):
+        self._transport = transport or default_transport()
+        self._session = self._transport.session(self.DEFAULT_HEADERS, impersonate=IMPERSONATE)
         self._cached_key = None
         self._last_fetch_time = 0
         self._cache_ttl = 50  # 50 seconds
+        self._deadline = None
+        self.timeout = timeout
 
-    def run(self):
+    def run(self, cancel_token=None, deadline=None):
+        """Return a NetFunnel key; setting cancel_token (threading.Event) ends the wait
+
+        Requests and the queue wait past deadline (a time.monotonic() value)
+        raise KorailTimeoutError.
+        """
         current_time = time.time()
         if self._is_cache_valid(current_time):
             return self._cached_key
 
+        self._deadline = deadline
         try:
+            _raise_if_cancelled(cancel_token)
             status, self._cached_key, nwait = self._start()
             self._last_fetch_time = current_time
 
             while status == self.WAIT_STATUS_FAIL:
-                print(f"\r현재 {nwait}명 대기중...", end="", flush=True)
-                time.sleep(1)
+                log.debug("현재 %s명 대기중...", nwait)
+                if cancel_token is None:
+                    time.sleep(1)
+                elif cancel_token.wait(1):
+                    raise KorailCancelledError()
                 status, self._cached_key, nwait = self._check()
 
             # Try completing once
@@ -458,10 +611,17 @@ class NetFunnelHelper:
             self.clear()
             raise NetFunnelError("Failed to complete NetFunnel")
 
+        except (KorailCancelledError, KorailTimeoutError):
+            self.clear()
+            raise
+
         except Exception as ex:
             self.clear()
             raise NetFunnelError(str(ex))
 
+        finally:
+            self._deadline = None
+
     def clear(self):
         self._cached_key = None
         self._last_fetch_time = 0
@@ -477,9 +637,12 @@ class NetFunnelHelper:
 
     def _make_request(self, opcode: str):
         params = self._build_params(self.OP_CODE[opcode])
-        response = self._parse(
-            self._session.get(self.NETFUNNEL_URL, params=params).text
-        )
+        timeout = _capped_timeout(self.timeout, self._deadline, "netfunnel")
+        try:
+            r = self._session.get(self.NETFUNNEL_URL, params=params, timeout=timeout)
+        except TransportTimeout as ex:
+            raise KorailTimeoutError(f"netfunnel timed out after {timeout:.1f}s") from ex
+        response = self._parse(r.text)
         return response.get("status"), response.get("key"), response.get("nwait")
 
     def _build_params(self, opcode: str, key: str = None) -> dict:
@@ -513,21 +676,49 @@ class NetFunnelHelper:
 
 
 class Korail:
-    """Main Korail API interface"""
+    """Main Korail API interface
+
+    ``timeouts`` maps API_ENDPOINTS names to request timeouts in seconds and is
+    merged over DEFAULT_TIMEOUTS; a request that times out raises
+    KorailTimeoutError. Setting ``deadline`` (a time.monotonic() value) caps
+    every request to the time left before it, except the lookup of a seat that
+    reserve has already held. ``base_url`` (scheme://host[:port])
+    points the client at another Korail host, such as a local stand-in server.
+    ``transport`` (see transport.py) creates the HTTP session; by default the
+    process-wide default_transport() does. Every request is timed in
+    ``metrics`` (see metrics.py, default: default_metrics()) under its
+    endpoint name, or the name METRIC_NAMES gives it. Response bodies are logged
+    to the "responses.korail" logger; ``verbose`` logs the bodies of this client
+    alone, to a child of it (see src.infrastructure.logs).
+    """
+
+    # Metric names of endpoints whose API name differs from the SRT client's
+    METRIC_NAMES = {
+        "code": "login_key",
+        "myticketlist": "tickets",
+        "myticketseat": "ticket_info",
+        "pay": "payment",
+    }
 
-    def __init__(self, korail_id=None, korail_pw=None, auto_login=True, verbose=False):
-        if HAS_CURL_CFFI:
-            try:
-                import certifi
-                self._session = curl_cffi.Session(
-                    impersonate="chrome131_android",
-                    verify=certifi.where()
-                )
-            except ImportError:
-                self._session = curl_cffi.Session(impersonate="chrome131_android")
+    def __init__(
+        self,
+        korail_id=None,
+        korail_pw=None,
+        auto_login=True,
+        verbose=False,
+        cancel_token=None,
+        timeouts=None,
+        base_url=None,
+        transport=None,
+        metrics=None,
+    ):
+        self._transport = transport or default_transport()
+        self._session = self._transport.session(DEFAULT_HEADERS, impersonate=IMPERSONATE)
+        if base_url is None:
+            self.endpoints = API_ENDPOINTS
         else:
-            self._session = requests.session()
-        self._session.headers.update(DEFAULT_HEADERS)
+            self.endpoints = build_endpoints(base_url)
+            self._session.headers.pop("Host", None)
         self._device = "AD"
         self._version = "240531001"
         self._key = "korail1234567890"
@@ -535,6 +726,12 @@ class Korail:
         self.korail_id = korail_id
         self.korail_pw = korail_pw
         self.verbose = verbose
+        self._responses = client_response_logger("korail", self) if verbose else _responses
+        # threading.Event; once set, search and reserve raise KorailCancelledError
+        self.cancel_token = cancel_token
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.deadline = None
+        self.metrics = metrics or default_metrics()
         self.logined = False
         self.membership_number = None
         self.name = None
@@ -543,15 +740,32 @@ class Korail:
         if auto_login:
             self.login(korail_id, korail_pw)
 
-    def _log(self, msg: str) -> None:
-        if self.verbose:
-            print(f"[*] {msg}")
+    def _request(self, method, endpoint, timeout_key=None, **kwargs):
+        """Send a request to self.endpoints[endpoint] with that endpoint's timeout, timed in self.metrics"""
+        timeout_key = timeout_key or endpoint
+        timeout = _capped_timeout(
+            self.timeouts.get(timeout_key, self.timeouts["default"]), self.deadline, endpoint
+        )
+        with self.metrics.timed(self.METRIC_NAMES.get(endpoint, endpoint)):
+            try:
+                r = method(self.endpoints[endpoint], timeout=timeout, **kwargs)
+            except TransportTimeout as ex:
+                raise KorailTimeoutError(f"{endpoint} timed out after {timeout:.1f}s") from ex
+        log_response(self._responses, endpoint, r)
+        return r
+
+    def _get(self, endpoint, **kwargs):
+        return self._request(self._session.get, endpoint, **kwargs)
+
+    def _post(self, endpoint, **kwargs):
+        return self._request(self._session.post, endpoint, **kwargs)
 
     def __enc_password(self, password):
-        url = API_ENDPOINTS["code"]
-        data = {"code": "app.login.cphd"}
-        r = self._session.post(url, data=data)
-        j = json.loads(r.text)
+        r = self._post("code", timeout_key="login", data={"code": "app.login.cphd"})
+        return self._encrypt_password(r, password)
+
+    def _encrypt_password(self, r, password):
+        j = response_json(r)
 
         if j["strResult"] == "SUCC" and j.get("app.login.cphd"):
             self._idx = j["app.login.cphd"]["idx"]
@@ -565,12 +779,33 @@ class Korail:
             ).decode("utf-8")
         return False
 
+    def _auth_params(self, **params):
+        """Return the Device/Version/Key fields most endpoints expect, plus params"""
+        return {
+            "Device": self._device,
+            "Version": self._version,
+            "Key": self._key,
+            **params,
+        }
+
+    def _checked(self, r):
+        """Decode a response, raising the KorailError its code maps to"""
+        j = response_json(r)
+        self._result_check(j)
+        return j
+
     def login(self, korail_id=None, korail_pw=None):
+        self._set_credentials(korail_id, korail_pw)
+        r = self._post("login", data=self._login_data(self.__enc_password(self.korail_pw)))
+        return self._on_login(r)
+
+    def _set_credentials(self, korail_id, korail_pw):
         if korail_id:
             self.korail_id = korail_id
         if korail_pw:
             self.korail_pw = korail_pw
 
+    def _login_data(self, encrypted_password):
         txt_input_flg = (
             "5"
             if EMAIL_REGEX.match(self.korail_id)
@@ -579,19 +814,18 @@ class Korail:
             else "2"
         )
 
-        data = {
+        return {
             "Device": self._device,
             "Version": self._version,
             "Key": self._key,
             "txtMemberNo": self.korail_id,
-            "txtPwd": self.__enc_password(self.korail_pw),
+            "txtPwd": encrypted_password,
             "txtInputFlg": txt_input_flg,
             "idx": self._idx,
         }
 
-        r = self._session.post(API_ENDPOINTS["login"], data=data)
-        self._log(r.text)
-        j = json.loads(r.text)
+    def _on_login(self, r):
+        j = response_json(r)
 
         if j["strResult"] == "SUCC" and j.get("strMbCrdNo"):
             # self._key = j['Key']
@@ -599,8 +833,8 @@ class Korail:
             self.name = j["strCustNm"]
             self.email = j["strEmailAdr"]
             self.phone_number = j["strCpNo"]
-            print(
-                f"로그인 성공: {self.name} (멤버십번호: {self.membership_number}, 전화번호: {self.phone_number})"
+            log.info(
+                "로그인 성공: %s (멤버십번호: %s, 전화번호: %s)", self.name, self.membership_number, self.phone_number
             )
             self.logined = True
             return True
@@ -608,8 +842,7 @@ class Korail:
         return False
 
     def logout(self):
-        r = self._session.get(API_ENDPOINTS["logout"])
-        self._log(r.text)
+        self._get("logout")
         self.logined = False
 
     def _result_check(self, j):
@@ -632,7 +865,24 @@ class Korail:
         passengers=None,
         include_no_seats=False,
         include_waiting_list=False,
+        train_numbers=None,
+        seat_filter=None,
     ):
+        """Search trains; raises NoResultsError if none passes the filters
+
+        ``train_numbers`` (ideally a set) keeps only those trains, and
+        ``seat_filter`` (a test of a raw result row such as row_has_seat)
+        replaces the include_* options. Rows are filtered before any Train is
+        built, so a poll that only cares about a few trains builds just those.
+        """
+        params = self._search_params(dep, arr, date, time, train_type, passengers)
+        _raise_if_cancelled(self.cancel_token)
+        r = self._get("search_schedule", params=params)
+        return self._trains_from_response(
+            r, include_no_seats, include_waiting_list, train_numbers, seat_filter
+        )
+
+    def _search_params(self, dep, arr, date, time, train_type, passengers):
         kst_now = datetime.now() + timedelta(hours=9)
         date = date or kst_now.strftime("%Y%m%d")
         time = time or kst_now.strftime("%H%M%S")
@@ -656,7 +906,7 @@ class Korail:
             ),
         }
 
-        data = {
+        return {
             "Device": self._device,
             "Version": self._version,
             "Sid": "",
@@ -683,29 +933,53 @@ class Korail:
             "mbCrdNo": self.membership_number,
         }
 
-        r = self._session.get(API_ENDPOINTS["search_schedule"], params=data)
-        self._log(r.text)
-        j = json.loads(r.text)
+    def _trains_from_response(
+        self, r, include_no_seats, include_waiting_list, train_numbers=None, seat_filter=None
+    ):
+        with span("parse") as parsing:
+            j = self._checked(r)
+            if seat_filter is None and not include_no_seats:
+                seat_filter = _row_has_seat_or_waiting_list if include_waiting_list else row_has_seat
 
-        if self._result_check(j):
+            rows = j.get("trn_infos", {}).get("trn_info", [])
             trains = [
-                Train(info) for info in j.get("trn_infos", {}).get("trn_info", [])
+                Train(row)
+                for row in rows
+                if (train_numbers is None or row.get("h_trn_no") in train_numbers)
+                and (seat_filter is None or seat_filter(row))
             ]
-            filter_fns = [lambda x: x.has_seat()]
-
-            if include_no_seats:
-                filter_fns.append(lambda x: not x.has_seat())
-            if include_waiting_list:
-                filter_fns.append(lambda x: x.has_waiting_list())
-
-            trains = [t for t in trains if any(f(t) for f in filter_fns)]
+            parsing.set(rows=len(rows), trains=len(trains))
 
-            if not trains:
-                raise NoResultsError()
+        if not trains:
+            raise NoResultsError()
 
-            return trains
+        return trains
 
     def reserve(self, train, passengers=None, option=ReserveOption.GENERAL_FIRST):
+        params = self._reserve_params(train, passengers, option)
+        _raise_if_cancelled(self.cancel_token)
+        r = self._get("reserve", params=params)
+        rsv_id = self._checked(r).get("h_pnr_no")
+        with self._reservation_lookup():
+            return self.reservations(rsv_id)
+
+    @contextmanager
+    def _reservation_lookup(self):
+        """Span of the lookup of a seat just reserved, run without the deadline
+
+        The seat is held once the reserve request succeeds. A lookup that
+        missed the attempt deadline would lose its reservation number and
+        turn the held seat into a retried attempt, so only the endpoint's own
+        timeout applies to it.
+        """
+        deadline, self.deadline = self.deadline, None
+        try:
+            with span("reservation_lookup"):
+                yield
+        finally:
+            self.deadline = deadline
+
+    def _reserve_params(self, train, passengers, option):
         reserving_seat = train.has_seat() or train.wait_reserve_flag < 0
         if reserving_seat:
             is_special_seat = {
@@ -771,114 +1045,90 @@ class Korail:
         for i, psg in enumerate(passengers, 1):
             data.update(psg.get_dict(i))
 
-        r = self._session.get(API_ENDPOINTS["reserve"], params=data)
-        self._log(r.text)
-        j = json.loads(r.text)
-        if self._result_check(j):
-            rsv_id = j.get("h_pnr_no")
-            reservation = self.reservations(rsv_id)
-            return reservation
-        else:
-            raise SoldOutError()
+        return data
 
     def tickets(self):
-        data = {
-            "Device": self._device,
-            "Version": self._version,
-            "Key": self._key,
-            "txtDeviceId": "",
-            "txtIndex": "1",
-            "h_page_no": "1",
-            "h_abrd_dt_from": "",
-            "h_abrd_dt_to": "",
-            "hiduserYn": "Y",
-        }
-
-        r = self._session.get(API_ENDPOINTS["myticketlist"], params=data)
-        self._log(r.text)
-        j = json.loads(r.text)
+        r = self._get("myticketlist", params=self._ticket_list_params())
         try:
-            if self._result_check(j):
-                tickets = []
-                for info in j.get("reservation_list", []):
-                    ticket = Ticket(info)
-                    data = {
-                        "Device": self._device,
-                        "Version": self._version,
-                        "Key": self._key,
-                        "h_orgtk_wct_no": ticket.sale_info1,
-                        "h_orgtk_ret_sale_dt": ticket.sale_info2,
-                        "h_orgtk_sale_sqno": ticket.sale_info3,
-                        "h_orgtk_ret_pwd": ticket.sale_info4,
-                    }
-                    r = self._session.get(API_ENDPOINTS["myticketseat"], params=data)
-                    j = json.loads(r.text)
-                    if self._result_check(j):
-                        seat = (
-                            j.get("ticket_infos", {})
-                            .get("ticket_info", [{}])[0]
-                            .get("tk_seat_info", [{}])[0]
-                        )
-                        ticket.seat_no = seat.get("h_seat_no")
-                        ticket.seat_no_end = None
-                    tickets.append(ticket)
-                return tickets
+            return [
+                self._ticket_with_seat(ticket, self._get("myticketseat", params=self._ticket_seat_params(ticket)))
+                for ticket in self._tickets_from_response(r)
+            ]
         except NoResultsError:
             return []
 
+    def _ticket_list_params(self):
+        return self._auth_params(
+            txtDeviceId="",
+            txtIndex="1",
+            h_page_no="1",
+            h_abrd_dt_from="",
+            h_abrd_dt_to="",
+            hiduserYn="Y",
+        )
+
+    def _tickets_from_response(self, r):
+        j = self._checked(r)
+        return [Ticket(info) for info in j.get("reservation_list", [])]
+
+    def _ticket_seat_params(self, ticket):
+        return self._auth_params(
+            h_orgtk_wct_no=ticket.sale_info1,
+            h_orgtk_ret_sale_dt=ticket.sale_info2,
+            h_orgtk_sale_sqno=ticket.sale_info3,
+            h_orgtk_ret_pwd=ticket.sale_info4,
+        )
+
+    def _ticket_with_seat(self, ticket, r):
+        j = response_json(r)
+        if self._result_check(j):
+            seat = (
+                j.get("ticket_infos", {})
+                .get("ticket_info", [{}])[0]
+                .get("tk_seat_info", [{}])[0]
+            )
+            return ticket._replace(seat_no=seat.get("h_seat_no"), seat_no_end=None)
+        return ticket
+
     def reservations(self, rsv_id=None):
-        data = {
-            "Device": self._device,
-            "Version": self._version,
-            "Key": self._key,
-        }
-        r = self._session.get(API_ENDPOINTS["myreservationview"], params=data)
-        self._log(r.text)
-        j = json.loads(r.text)
-        try:
-            if not self._result_check(j):
-                return []
-
-            jrny_info = j.get("jrny_infos", {}).get("jrny_info", [])
-            reserves = []
-
-            for info in jrny_info:
-                train_info = info.get("train_infos", {}).get("train_info", [])
-                for tinfo in train_info:
-                    reservation = Reservation(tinfo)
-                    reservation.tickets, reservation.wct_no = self.ticket_info(
-                        reservation.rsv_id
-                    )
-                    if rsv_id and reservation.rsv_id == rsv_id:
-                        return reservation
-                    reserves.append(reservation)
-            return reserves
+        r = self._get("myreservationview", params=self._auth_params())
+        return self._reservations_from_response(r, rsv_id, self.ticket_info)
 
+    def _reservations_from_response(self, r, rsv_id, ticket_loader):
+        try:
+            j = self._checked(r)
         except NoResultsError:
             return []
 
-    def ticket_info(self, rsv_id=None):
-        data = {
-            "Device": self._device,
-            "Version": self._version,
-            "Key": self._key,
-            "hidPnrNo": rsv_id,
-        }
-        r = self._session.get(API_ENDPOINTS["myreservationlist"], params=data)
-        self._log(r.text)
-        j = json.loads(r.text)
-        try:
-            if not self._result_check(j):
-                return []
+        jrny_info = j.get("jrny_infos", {}).get("jrny_info", [])
+        reserves = []
 
-            wct_no = j.get("h_wct_no")
-            if jrny_info := j.get("jrny_infos", {}).get("jrny_info", []):
-                if seat_info := jrny_info[0].get("seat_infos", {}).get("seat_info", []):
-                    return [Seat(seat) for seat in seat_info], wct_no
+        for info in jrny_info:
+            train_info = info.get("train_infos", {}).get("train_info", [])
+            for tinfo in train_info:
+                if rsv_id and tinfo.get("h_pnr_no") != rsv_id:
+                    continue
+                reservation = Reservation(tinfo, ticket_loader=ticket_loader)
+                if rsv_id:
+                    return reservation
+                reserves.append(reservation)
+        return reserves
 
+    def ticket_info(self, rsv_id=None):
+        r = self._get("myreservationlist", params=self._auth_params(hidPnrNo=rsv_id))
+        return self._ticket_info_from_response(r)
+
+    def _ticket_info_from_response(self, r):
+        try:
+            j = self._checked(r)
         except NoResultsError:
             return None
 
+        wct_no = j.get("h_wct_no")
+        if jrny_info := j.get("jrny_infos", {}).get("jrny_info", []):
+            if seat_info := jrny_info[0].get("seat_infos", {}).get("seat_info", []):
+                return [Seat(seat) for seat in seat_info], wct_no
+
     def pay_with_card(
         self,
         rsv,
@@ -888,11 +1138,20 @@ class Korail:
         card_expire,
         installment=0,
         card_type="J",
+    ):
+        data = self._payment_data(
+            rsv, card_number, card_password, birthday, card_expire, installment, card_type
+        )
+        self._checked(self._post("pay", data=data))
+        return True
+
+    def _payment_data(
+        self, rsv, card_number, card_password, birthday, card_expire, installment, card_type
     ):
         if not isinstance(rsv, Reservation):
             raise TypeError("rsv must be a Reservation instance")
 
-        data = {
+        return {
             "Device": self._device,
             "Version": self._version,
             "Key": self._key,
@@ -915,48 +1174,183 @@ class Korail:
             "hiduserYn": "Y",
         }
 
-        r = self._session.post(API_ENDPOINTS["pay"], data=data)
-        self._log(r.text)
-        j = json.loads(r.text)
-        if self._result_check(j):
-            return True
-        return False
-
     def cancel(self, rsv):
+        self._checked(self._post("cancel", data=self._cancel_data(rsv)))
+        return True
+
+    def _cancel_data(self, rsv):
         if not isinstance(rsv, Reservation):
             raise TypeError("rsv must be a Reservation instance")
-        data = {
-            "Device": self._device,
-            "Version": self._version,
-            "Key": self._key,
-            "txtPnrNo": rsv.rsv_id,
-            "txtJrnySqno": rsv.journey_no,
-            "txtJrnyCnt": rsv.journey_cnt,
-            "hidRsvChgNo": rsv.rsv_chg_no,
-        }
-        r = self._session.post(API_ENDPOINTS["cancel"], data=data)
-        self._log(r.text)
-        j = json.loads(r.text)
-        return self._result_check(j)
+        return self._auth_params(
+            txtPnrNo=rsv.rsv_id,
+            txtJrnySqno=rsv.journey_no,
+            txtJrnyCnt=rsv.journey_cnt,
+            hidRsvChgNo=rsv.rsv_chg_no,
+        )
 
     def refund(self, ticket):
-        data = {
-            "Device": self._device,
-            "Version": self._version,
-            "Key": self._key,
-            "txtPrnNo": ticket.pnr_no,
-            "h_orgtk_sale_dt": ticket.sale_info2,
-            "h_orgtk_sale_wct_no": ticket.sale_info1,
-            "h_orgtk_sale_sqno": ticket.sale_info3,
-            "h_orgtk_ret_pwd": ticket.sale_info4,
-            "h_mlg_stl": "N",
-            "tk_ret_tms_dv_cd": "21",
-            "trnNo": ticket.train_no,
-            "pbpAcepTgtFlg": "N",
-            "latitude": "",
-            "longitude": "",
-        }
-        r = self._session.post(API_ENDPOINTS["refund"], data=data)
-        self._log(r.text)
-        j = json.loads(r.text)
-        return self._result_check(j)
+        self._checked(self._post("refund", data=self._refund_data(ticket)))
+        return True
+
+    def _refund_data(self, ticket):
+        return self._auth_params(
+            txtPrnNo=ticket.pnr_no,
+            h_orgtk_sale_dt=ticket.sale_info2,
+            h_orgtk_sale_wct_no=ticket.sale_info1,
+            h_orgtk_sale_sqno=ticket.sale_info3,
+            h_orgtk_ret_pwd=ticket.sale_info4,
+            h_mlg_stl="N",
+            tk_ret_tms_dv_cd="21",
+            trnNo=ticket.train_no,
+            pbpAcepTgtFlg="N",
+            latitude="",
+            longitude="",
+        )
+
+
+class AsyncKorail(Korail):
+    """Korail client whose requests run on an asyncio loop
+
+    Shares request building and response parsing with Korail; every method
+    that talks to the server is a coroutine. Clients created on one loop can
+    share a single AsyncTransport and its connection pool. reservations()
+    fetches the seat details of all reservations concurrently and tickets()
+    the seats of all tickets, instead of one request after another.
+
+    There is no auto_login: ``await client.login(...)`` after creating the
+    client, and ``await client.close()`` (or use ``async with``) when done.
+    ``transport`` defaults to default_async_transport(); cancel_token stays
+    a threading.Event.
+    """
+
+    def __init__(
+        self,
+        korail_id=None,
+        korail_pw=None,
+        verbose=False,
+        cancel_token=None,
+        timeouts=None,
+        base_url=None,
+        transport=None,
+        metrics=None,
+    ):
+        super().__init__(
+            korail_id,
+            korail_pw,
+            auto_login=False,
+            verbose=verbose,
+            cancel_token=cancel_token,
+            timeouts=timeouts,
+            base_url=base_url,
+            transport=transport or default_async_transport(),
+            metrics=metrics,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        await self._session.close()
+
+    async def _request(self, method, endpoint, timeout_key=None, **kwargs):
+        timeout_key = timeout_key or endpoint
+        timeout = _capped_timeout(
+            self.timeouts.get(timeout_key, self.timeouts["default"]), self.deadline, endpoint
+        )
+        with self.metrics.timed(self.METRIC_NAMES.get(endpoint, endpoint)):
+            try:
+                r = await method(self.endpoints[endpoint], timeout=timeout, **kwargs)
+            except TransportTimeout as ex:
+                raise KorailTimeoutError(f"{endpoint} timed out after {timeout:.1f}s") from ex
+        log_response(self._responses, endpoint, r)
+        return r
+
+    async def login(self, korail_id=None, korail_pw=None):
+        self._set_credentials(korail_id, korail_pw)
+        r = await self._post("code", timeout_key="login", data={"code": "app.login.cphd"})
+        encrypted_password = self._encrypt_password(r, self.korail_pw)
+        r = await self._post("login", data=self._login_data(encrypted_password))
+        return self._on_login(r)
+
+    async def logout(self):
+        await self._get("logout")
+        self.logined = False
+
+    async def search_train(
+        self,
+        dep,
+        arr,
+        date=None,
+        time=None,
+        train_type=TrainType.ALL,
+        passengers=None,
+        include_no_seats=False,
+        include_waiting_list=False,
+        train_numbers=None,
+        seat_filter=None,
+    ):
+        params = self._search_params(dep, arr, date, time, train_type, passengers)
+        _raise_if_cancelled(self.cancel_token)
+        r = await self._get("search_schedule", params=params)
+        return self._trains_from_response(
+            r, include_no_seats, include_waiting_list, train_numbers, seat_filter
+        )
+
+    async def reserve(self, train, passengers=None, option=ReserveOption.GENERAL_FIRST):
+        params = self._reserve_params(train, passengers, option)
+        _raise_if_cancelled(self.cancel_token)
+        r = await self._get("reserve", params=params)
+        rsv_id = self._checked(r).get("h_pnr_no")
+        with self._reservation_lookup():
+            return await self.reservations(rsv_id)
+
+    async def tickets(self):
+        r = await self._get("myticketlist", params=self._ticket_list_params())
+        try:
+            tickets = self._tickets_from_response(r)
+            seats = await asyncio.gather(
+                *(self._get("myticketseat", params=self._ticket_seat_params(t)) for t in tickets)
+            )
+            return [self._ticket_with_seat(ticket, seat) for ticket, seat in zip(tickets, seats)]
+        except NoResultsError:
+            return []
+
+    async def reservations(self, rsv_id=None):
+        r = await self._get("myreservationview", params=self._auth_params())
+        found = self._reservations_from_response(r, rsv_id, None)
+        reserves = found if isinstance(found, list) else [found]
+        infos = await asyncio.gather(*(self.ticket_info(rsv.rsv_id) for rsv in reserves))
+        for reservation, info in zip(reserves, infos):
+            reservation.tickets, reservation.wct_no = info or ([], None)
+        return found
+
+    async def ticket_info(self, rsv_id=None):
+        r = await self._get("myreservationlist", params=self._auth_params(hidPnrNo=rsv_id))
+        return self._ticket_info_from_response(r)
+
+    async def pay_with_card(
+        self,
+        rsv,
+        card_number,
+        card_password,
+        birthday,
+        card_expire,
+        installment=0,
+        card_type="J",
+    ):
+        data = self._payment_data(
+            rsv, card_number, card_password, birthday, card_expire, installment, card_type
+        )
+        self._checked(await self._post("pay", data=data))
+        return True
+
+    async def cancel(self, rsv):
+        self._checked(await self._post("cancel", data=self._cancel_data(rsv)))
+        return True
+
+    async def refund(self, ticket):
+        self._checked(await self._post("refund", data=self._refund_data(ticket)))
+        return True
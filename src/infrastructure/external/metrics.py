@@ -0,0 +1,201 @@
+"""Per-endpoint request metrics of the SRT and Korail clients
+
+Every client request is timed under a logical endpoint name (login,
+search_schedule, reserve, tickets, ticket_info, payment, ...), as are the
+NetFunnel steps (netfunnel_start, netfunnel_check, netfunnel_complete) and
+the whole NetFunnel pass including its queue wait (netfunnel). For each
+name a MetricsRegistry keeps the call count, the errors raised by exception
+class and a latency histogram.
+
+Recording costs two perf_counter() calls, a lock and a few integer
+operations, so it stays on for every request. ``snapshot()`` returns an
+immutable summary with percentiles for display or logging. Gauges hold the
+latest value of a quantity that is not a request, such as the NetFunnel
+queue position (NETFUNNEL_QUEUE).
+
+Clients record into default_metrics() unless given a registry of their own.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+NETFUNNEL_QUEUE = "netfunnel_queue"  # gauge: people ahead in the NetFunnel queue, 0 once passed
+
+
+class LatencyHistogram:
+    """Log-linear (HDR-style) histogram of durations from 1 us to about 1.2 days
+
+    Values are kept in microseconds with 7 significant bits: below 128 us
+    every microsecond has its own bucket, above it each power of two is split
+    into 64 buckets, so a percentile is off by at most 1/64 (1.6%).
+    """
+
+    SUB_BUCKET_BITS = 7
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS  # 128
+    HALF = SUB_BUCKETS >> 1  # 64
+    MAX_SHIFT = 30
+    SIZE = SUB_BUCKETS + MAX_SHIFT * HALF
+
+    __slots__ = ("counts", "count", "total", "min", "max", "last")
+
+    def __init__(self):
+        self.counts = [0] * self.SIZE
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.last = 0.0
+
+    @classmethod
+    def _index(cls, micros: int) -> int:
+        if micros < cls.SUB_BUCKETS:
+            return micros
+        shift = min(micros.bit_length() - cls.SUB_BUCKET_BITS, cls.MAX_SHIFT)
+        return cls.SUB_BUCKETS + (shift - 1) * cls.HALF + min((micros >> shift) - cls.HALF, cls.HALF - 1)
+
+    @classmethod
+    def _upper_bound(cls, index: int) -> float:
+        """Largest duration in seconds that falls into bucket index"""
+        if index < cls.SUB_BUCKETS:
+            return index / 1e6
+        shift, offset = divmod(index - cls.SUB_BUCKETS, cls.HALF)
+        shift += 1
+        return (((cls.HALF + offset + 1) << shift) - 1) / 1e6
+
+    def record(self, seconds: float) -> None:
+        self.counts[self._index(int(seconds * 1e6))] += 1
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent: float) -> float:
+        """Duration in seconds that percent of the recorded values do not exceed"""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(self.count * percent / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+
+@dataclass(frozen=True)
+class EndpointSnapshot:
+    """Metrics of one endpoint at the time of a snapshot; durations in seconds"""
+    name: str
+    count: int
+    errors: Mapping[str, int]  # exception class name -> count
+    mean: float
+    min: float
+    p50: float
+    p90: float
+    p95: float
+    p99: float
+    max: float
+    last: float
+    last_success: float | None  # time.monotonic() when a call last ended without error
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+
+class _EndpointMetrics:
+    __slots__ = ("histogram", "errors", "last_success")
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.errors: dict[str, int] = {}
+        self.last_success: float | None = None
+
+
+class _Timer:
+    __slots__ = ("_registry", "_name", "_start")
+
+    def __init__(self, registry: "MetricsRegistry", name: str):
+        self._registry = registry
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._registry.record(self._name, time.perf_counter() - self._start, exc)
+        return False
+
+
+class MetricsRegistry:
+    """Call counts, errors by class and latency histograms per endpoint name"""
+
+    def __init__(self):
+        self._endpoints: dict[str, _EndpointMetrics] = {}
+        self._gauges: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def timed(self, name: str) -> _Timer:
+        """Context manager recording the duration of its block and any exception under name"""
+        return _Timer(self, name)
+
+    def record(self, name: str, seconds: float, error: BaseException | None = None) -> None:
+        with self._lock:
+            endpoint = self._endpoints.get(name)
+            if endpoint is None:
+                endpoint = self._endpoints[name] = _EndpointMetrics()
+            endpoint.histogram.record(seconds)
+            if error is None:
+                endpoint.last_success = time.monotonic()
+            else:
+                error_name = type(error).__name__
+                endpoint.errors[error_name] = endpoint.errors.get(error_name, 0) + 1
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def gauges(self) -> dict[str, float]:
+        """Latest value of every gauge set so far"""
+        with self._lock:
+            return dict(self._gauges)
+
+    def snapshot(self) -> dict[str, EndpointSnapshot]:
+        """Summary of every endpoint recorded so far"""
+        with self._lock:
+            return {
+                name: EndpointSnapshot(
+                    name=name,
+                    count=endpoint.histogram.count,
+                    errors=MappingProxyType(dict(endpoint.errors)),
+                    mean=endpoint.histogram.total / endpoint.histogram.count,
+                    min=endpoint.histogram.min,
+                    p50=endpoint.histogram.percentile(50),
+                    p90=endpoint.histogram.percentile(90),
+                    p95=endpoint.histogram.percentile(95),
+                    p99=endpoint.histogram.percentile(99),
+                    max=endpoint.histogram.max,
+                    last=endpoint.histogram.last,
+                    last_success=endpoint.last_success,
+                )
+                for name, endpoint in self._endpoints.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self._gauges.clear()
+
+
+_default_metrics = MetricsRegistry()
+
+
+def default_metrics() -> MetricsRegistry:
+    """Registry used by clients that are not given one"""
+    return _default_metrics
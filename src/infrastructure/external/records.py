@@ -0,0 +1,46 @@
+"""Compact read-only records for the objects the API clients parse
+
+A search poll builds a train object per result row, and a long session
+builds and drops them by the tens of thousands. Record subclasses declare
+``__slots__``, so an instance carries no ``__dict__``, and they reject
+attribute writes once built, so one parsed train can be shared safely between
+the loop, the UI and a reservation. Station names and codes and train type
+strings repeat in every row, so they are interned to one object per value.
+"""
+import sys
+
+
+def intern(value):
+    """Return the interned copy of a string; other values are returned as is"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Record:
+    """Slotted object that is read-only once __init__ has set its fields"""
+
+    __slots__ = ()
+
+    def _set(self, **fields):
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def _replace(self, **changes):
+        """Return a copy with the given fields changed"""
+        copy = object.__new__(type(self))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    object.__setattr__(copy, name, getattr(self, name))
+        copy._set(**changes)
+        return copy
+
+    def __setstate__(self, state):
+        # copy and pickle restore slots through here rather than setattr
+        _, slots = state
+        self._set(**slots)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only")
@@ -1,22 +1,37 @@
 import abc
-try:
-    import curl_cffi
-    HAS_CURL_CFFI = True
-except ImportError:
-    import requests
-    HAS_CURL_CFFI = False
-
+import asyncio
 import json
+import logging
 import re
 import time
+from contextlib import contextmanager
 from enum import Enum
 from datetime import datetime
-from typing import Dict, List, Pattern
+from types import MappingProxyType
+from typing import Callable, Collection, Dict, List, Mapping, Pattern
+
+from src.domain.services.tracing import span
+from src.infrastructure.external.json_codec import loads, response_json
+from src.infrastructure.external.metrics import NETFUNNEL_QUEUE, MetricsRegistry, default_metrics
+from src.infrastructure.external.records import Record, intern
+from src.infrastructure.external.transport import (
+    AsyncTransport,
+    Transport,
+    TransportTimeout,
+    default_async_transport,
+    default_transport,
+)
+from src.infrastructure.logs import client_response_logger, log_response, response_logger
+
+log = logging.getLogger(__name__)
+_responses = response_logger("srt")
 
 # Constants
 EMAIL_REGEX: Pattern = re.compile(r"[^@]+@[^@]+\.[^@]+")
 PHONE_NUMBER_REGEX: Pattern = re.compile(r"(\d{3})-(\d{3,4})-(\d{4})")
 
+IMPERSONATE = "chrome"  # browser fingerprint presented by curl_cffi
+
 USER_AGENT = (
     "Mozilla/5.0 (Linux; Android 15; SM-S912N Build/AP3A.240905.015.A2; wv) AppleWebKit/537.36"
     "(KHTML, like Gecko) Version/4.0 Chrome/136.0.7103.125 Mobile Safari/537.36SRT-APP-Android V.2.0.38"
@@ -86,23 +101,41 @@ TRAIN_NAME = {
 WINDOW_SEAT = {None: "000", True: "012", False: "013"}
 
 SRT_MOBILE = "https://app.srail.or.kr:443"
-API_ENDPOINTS = {
-    "main": f"{SRT_MOBILE}/main/main.do",
-    "login": f"{SRT_MOBILE}/apb/selectListApb01080_n.do",
-    "logout": f"{SRT_MOBILE}/login/loginOut.do",
-    "search_schedule": f"{SRT_MOBILE}/ara/selectListAra10007_n.do",
-    "reserve": f"{SRT_MOBILE}/arc/selectListArc05013_n.do",
-    "tickets": f"{SRT_MOBILE}/atc/selectListAtc14016_n.do",
-    "ticket_info": f"{SRT_MOBILE}/ard/selectListArd02019_n.do",
-    "cancel": f"{SRT_MOBILE}/ard/selectListArd02045_n.do",
-    "standby_option": f"{SRT_MOBILE}/ata/selectListAta01135_n.do",
-    "payment": f"{SRT_MOBILE}/ata/selectListAta09036_n.do",
-    "reserve_info": f"{SRT_MOBILE}/atc/getListAtc14087.do",
-    "reserve_info_referer": f"{SRT_MOBILE}/common/ATC/ATC0201L/view.do?pnrNo=",
-    "refund": f"{SRT_MOBILE}/atc/selectListAtc02063_n.do",
+
+# Request timeouts in seconds, keyed by API_ENDPOINTS name or "netfunnel";
+# endpoints without an entry use "default"
+DEFAULT_TIMEOUTS: Dict[str, float] = {
+    "default": 10.0,
+    "login": 10.0,
+    "search_schedule": 5.0,
+    "reserve": 10.0,
+    "payment": 20.0,
+    "netfunnel": 5.0,
 }
 
 
+def build_endpoints(base_url: str) -> Dict[str, str]:
+    """Return the API endpoint URLs rooted at base_url"""
+    return {
+        "main": f"{base_url}/main/main.do",
+        "login": f"{base_url}/apb/selectListApb01080_n.do",
+        "logout": f"{base_url}/login/loginOut.do",
+        "search_schedule": f"{base_url}/ara/selectListAra10007_n.do",
+        "reserve": f"{base_url}/arc/selectListArc05013_n.do",
+        "tickets": f"{base_url}/atc/selectListAtc14016_n.do",
+        "ticket_info": f"{base_url}/ard/selectListArd02019_n.do",
+        "cancel": f"{base_url}/ard/selectListArd02045_n.do",
+        "standby_option": f"{base_url}/ata/selectListAta01135_n.do",
+        "payment": f"{base_url}/ata/selectListAta09036_n.do",
+        "reserve_info": f"{base_url}/atc/getListAtc14087.do",
+        "reserve_info_referer": f"{base_url}/common/ATC/ATC0201L/view.do?pnrNo=",
+        "refund": f"{base_url}/atc/selectListAtc02063_n.do",
+    }
+
+
+API_ENDPOINTS = build_endpoints(SRT_MOBILE)
+
+
 # Exception classes
 class SRTError(Exception):
     def __init__(self, msg):
@@ -125,6 +158,14 @@ class SRTDuplicateError(SRTResponseError):
     pass
 
 
+class SRTSoldOutError(SRTResponseError):
+    pass
+
+
+class SRTLoginExpiredError(SRTResponseError):
+    pass
+
+
 class SRTNotLoggedInError(SRTError):
     pass
 
@@ -133,6 +174,50 @@ class SRTNetFunnelError(SRTError):
     pass
 
 
+class SRTCancelledError(SRTError):
+    def __init__(self, msg="Cancelled"):
+        super().__init__(msg)
+
+
+class SRTTimeoutError(SRTError):
+    def __init__(self, msg="Request timed out"):
+        super().__init__(msg)
+
+
+# Failure messages that get a more specific SRTResponseError subclass
+SOLD_OUT_MESSAGES = ("잔여석없음",)
+LOGIN_EXPIRED_MESSAGES = ("로그인 후 사용하십시오",)
+
+
+def _response_error(message: str) -> SRTResponseError:
+    """Return the SRTResponseError (sub)class instance for a failure message"""
+    if any(text in message for text in SOLD_OUT_MESSAGES):
+        return SRTSoldOutError(message)
+    if any(text in message for text in LOGIN_EXPIRED_MESSAGES):
+        return SRTLoginExpiredError(message)
+    return SRTResponseError(message)
+
+
+def _raise_if_cancelled(cancel_token) -> None:
+    """Raise SRTCancelledError if the given threading.Event has been set"""
+    if cancel_token is not None and cancel_token.is_set():
+        raise SRTCancelledError()
+
+
+def _capped_timeout(timeout: float, deadline: float | None, name: str) -> float:
+    """Return timeout, shortened to what is left until deadline (time.monotonic)
+
+    Raises:
+        SRTTimeoutError: If the deadline has already passed
+    """
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise SRTTimeoutError(f"Deadline exceeded before {name}")
+    return min(timeout, remaining)
+
+
 # Passenger class
 class Passenger(metaclass=abc.ABCMeta):
     """Base class for different passenger types."""
@@ -303,7 +388,13 @@ class SRTTicket:
 
 
 class SRTReservation:
-    def __init__(self, train, pay, tickets):
+    """SRT reservation
+
+    ``tickets`` may be given up front, or fetched on first access through
+    ``ticket_loader`` (called with the reservation number) and memoized.
+    """
+
+    def __init__(self, train, pay, tickets=None, ticket_loader=None):
         self.reservation_number = train.get("pnrNo")
         self.total_cost = int(train.get("rcvdAmt"))
         self.seat_count = train.get("tkSpecNum") or int(train.get("seatNum"))
@@ -328,6 +419,7 @@ class SRTReservation:
         self.is_waiting = not (self.paid or self.payment_date or self.payment_time)
 
         self._tickets = tickets
+        self._ticket_loader = ticket_loader
 
     def __str__(self):
         return self.dump()
@@ -359,18 +451,35 @@ class SRTReservation:
 
     @property
     def tickets(self):
+        if self._tickets is None and self._ticket_loader is not None:
+            self._tickets = self._ticket_loader(self.reservation_number)
+            self._ticket_loader = None
         return self._tickets
 
 
 # SRTResponseData class
 class SRTResponseData:
-    """SRT Response data class that parses JSON response from API request"""
+    """SRT Response data class that parses JSON response from API request
+
+    ``get_all()`` and ``get_status()`` return read-only views of the parsed
+    response, not copies.
+    """
 
     STATUS_SUCCESS = "SUCC"
     STATUS_FAIL = "FAIL"
 
-    def __init__(self, response: str) -> None:
-        self._json = json.loads(response)
+    def __init__(self, response: str | bytes) -> None:
+        self._set_json(loads(response))
+
+    @classmethod
+    def from_response(cls, r) -> "SRTResponseData":
+        """Parse the body of a transport response"""
+        data = cls.__new__(cls)
+        data._set_json(response_json(r))
+        return data
+
+    def _set_json(self, parsed: dict) -> None:
+        self._json = parsed
         self._status = self._parse()
 
     def __str__(self) -> str:
@@ -403,11 +512,11 @@ class SRTResponseData:
     def message(self) -> str:
         return self._status.get("msgTxt", "")
 
-    def get_all(self) -> dict:
-        return self._json.copy()
+    def get_all(self) -> Mapping:
+        return MappingProxyType(self._json)
 
-    def get_status(self) -> dict:
-        return self._status.copy()
+    def get_status(self) -> Mapping:
+        return MappingProxyType(self._status)
 
 
 class SeatType(Enum):
@@ -419,38 +528,72 @@ class SeatType(Enum):
 
 # Train class
 class Train:
-    pass
+    __slots__ = ()
 
 
-class SRTTrain(Train):
-    def __init__(self, data):
-        self.train_code = data["stlbTrnClsfCd"]
-        self.train_name = TRAIN_NAME[self.train_code]
-        self.train_number = data["trnNo"]
+SEAT_AVAILABLE = "예약가능"
 
-        # Departure info
-        self.dep_date = data["dptDt"]
-        self.dep_time = data["dptTm"]
-        self.dep_station_code = data["dptRsStnCd"]
-        self.dep_station_name = STATION_NAME[self.dep_station_code]
-        self.dep_station_run_order = data["dptStnRunOrdr"]
-        self.dep_station_constitution_order = data["dptStnConsOrdr"]
 
-        # Arrival info
-        self.arr_date = data["arvDt"]
-        self.arr_time = data["arvTm"]
-        self.arr_station_code = data["arvRsStnCd"]
-        self.arr_station_name = STATION_NAME[self.arr_station_code]
-        self.arr_station_run_order = data["arvStnRunOrdr"]
-        self.arr_station_constitution_order = data["arvStnConsOrdr"]
+# Seat tests on raw dsOutput1 rows, matching the SRTTrain methods of the same
+# name; search_train(seat_filter=...) applies one before building any SRTTrain
+def row_general_seat_available(row: dict) -> bool:
+    return SEAT_AVAILABLE in row["gnrmRsvPsbStr"]
+
+
+def row_special_seat_available(row: dict) -> bool:
+    return SEAT_AVAILABLE in row["sprmRsvPsbStr"]
+
+
+def row_seat_available(row: dict) -> bool:
+    return row_general_seat_available(row) or row_special_seat_available(row)
+
+
+def row_reserve_standby_available(row: dict) -> bool:
+    return int(row["rsvWaitPsbCd"]) == 9
+
+
+class SRTTrain(Train, Record):
+    """Read-only train search result"""
 
-        # Seat availability info
-        self.general_seat_state = data["gnrmRsvPsbStr"]
-        self.special_seat_state = data["sprmRsvPsbStr"]
-        self.reserve_wait_possible_name = data["rsvWaitPsbCdNm"]
-        self.reserve_wait_possible_code = int(
-            data["rsvWaitPsbCd"]
-        )  # -1: 예약대기 없음, 9: 예약대기 가능, 0: 매진, -2: 예약대기 불가능
+    __slots__ = (
+        "train_code", "train_name", "train_number",
+        "dep_date", "dep_time", "dep_station_code", "dep_station_name",
+        "dep_station_run_order", "dep_station_constitution_order",
+        "arr_date", "arr_time", "arr_station_code", "arr_station_name",
+        "arr_station_run_order", "arr_station_constitution_order",
+        "general_seat_state", "special_seat_state",
+        "reserve_wait_possible_name", "reserve_wait_possible_code",
+    )
+
+    def __init__(self, data):
+        train_code = intern(data["stlbTrnClsfCd"])
+        dep_station_code = intern(data["dptRsStnCd"])
+        arr_station_code = intern(data["arvRsStnCd"])
+        self._set(
+            train_code=train_code,
+            train_name=TRAIN_NAME[train_code],
+            train_number=data["trnNo"],
+            # Departure info
+            dep_date=data["dptDt"],
+            dep_time=data["dptTm"],
+            dep_station_code=dep_station_code,
+            dep_station_name=STATION_NAME[dep_station_code],
+            dep_station_run_order=data["dptStnRunOrdr"],
+            dep_station_constitution_order=data["dptStnConsOrdr"],
+            # Arrival info
+            arr_date=data["arvDt"],
+            arr_time=data["arvTm"],
+            arr_station_code=arr_station_code,
+            arr_station_name=STATION_NAME[arr_station_code],
+            arr_station_run_order=data["arvStnRunOrdr"],
+            arr_station_constitution_order=data["arvStnConsOrdr"],
+            # Seat availability info
+            general_seat_state=intern(data["gnrmRsvPsbStr"]),
+            special_seat_state=intern(data["sprmRsvPsbStr"]),
+            reserve_wait_possible_name=intern(data["rsvWaitPsbCdNm"]),
+            # -1: 예약대기 없음, 9: 예약대기 가능, 0: 매진, -2: 예약대기 불가능
+            reserve_wait_possible_code=int(data["rsvWaitPsbCd"]),
+        )
 
     def __str__(self):
         return self.dump()
@@ -484,10 +627,10 @@ class SRTTrain(Train):
         return msg
 
     def general_seat_available(self):
-        return "예약가능" in self.general_seat_state
+        return SEAT_AVAILABLE in self.general_seat_state
 
     def special_seat_available(self):
-        return "예약가능" in self.special_seat_state
+        return SEAT_AVAILABLE in self.special_seat_state
 
     def reserve_standby_available(self):
         return self.reserve_wait_possible_code == 9
@@ -508,6 +651,13 @@ class NetFunnelHelper:
         "setComplete": "5004",
     }
 
+    # Names the requests of each opcode are recorded under in self.metrics
+    METRIC_NAMES = {
+        "getTidchkEnter": "netfunnel_start",
+        "chkEnter": "netfunnel_check",
+        "setComplete": "netfunnel_complete",
+    }
+
     DEFAULT_HEADERS = {
         "Host": "nf.letskorail.com",
         "Connection": "keep-alive",
@@ -528,50 +678,84 @@ class NetFunnelHelper:
         "Accept-Language": "en-US,en;q=0.9,ko-KR;q=0.8,ko;q=0.7",
     }
 
-    def __init__(self, debug=False):
-        if HAS_CURL_CFFI:
-            try:
-                import certifi
-                self._session = curl_cffi.Session(
-                    impersonate="chrome",
-                    verify=certifi.where()
-                )
-            except ImportError:
-                self._session = curl_cffi.Session(impersonate="chrome")
-        else:
-            self._session = requests.session()
-        self._session.headers.update(self.DEFAULT_HEADERS)
+    def __init__(
+        self, debug=False, timeout=DEFAULT_TIMEOUTS["netfunnel"], url=None, transport=None, metrics=None
+    ):
+        self._transport = transport or default_transport()
+        self._session = self._transport.session(self.DEFAULT_HEADERS, impersonate=IMPERSONATE)
         self._cached_key = None
         self._last_fetch_time = 0
         self._cache_ttl = 48  # 48 seconds
+        self._deadline = None
+        self.timeout = timeout
+        self.url = url  # Fixed ts.wseq URL; by default the server-assigned host is used
         self.debug = debug
+        self._responses = client_response_logger("srt", self) if debug else _responses
+        self.metrics = metrics or default_metrics()
 
-    def run(self):
+    def run(self, cancel_token=None, deadline=None):
+        """Return a NetFunnel key, waiting in the queue if needed.
+
+        Args:
+            cancel_token: Optional threading.Event; setting it ends the queue
+                wait immediately with SRTCancelledError
+            deadline: Optional time.monotonic() value; requests and the queue
+                wait past it raise SRTTimeoutError
+
+        A pass that is not served from the cache, queue wait included, is
+        recorded as "netfunnel" in self.metrics and traced as a "netfunnel"
+        span with the initial queue position.
+        """
         current_time = time.time()
         if self._is_cache_valid(current_time):
             return self._cached_key
 
-        try:
-            status, self._cached_key, nwait, ip = self._start()
-            self._last_fetch_time = current_time
-
-            # Keep checking until we get a pass status
-            while status == self.WAIT_STATUS_FAIL:
-                print(f"\r현재 {nwait}명 대기중...", end="", flush=True)
-                time.sleep(1)
-                status, self._cached_key, nwait, ip = self._check(ip)
-
-            # Complete the funnel process
-            status, *_ = self._complete(ip)
-            if status in (self.WAIT_STATUS_PASS, self.ALREADY_COMPLETED):
-                return self._cached_key
-
-            self.clear()
-            raise SRTNetFunnelError("Failed to complete NetFunnel")
+        with self.metrics.timed("netfunnel"), span("netfunnel") as queue:
+            self._deadline = deadline
+            try:
+                _raise_if_cancelled(cancel_token)
+                status, self._cached_key, nwait, ip = self._start()
+                self._last_fetch_time = current_time
+                queue.set(position=nwait)
+
+                # Keep checking until we get a pass status
+                if status == self.WAIT_STATUS_FAIL:
+                    log.info("NetFunnel 대기열 진입: %s명 대기중", nwait)
+                while status == self.WAIT_STATUS_FAIL:
+                    self._set_queue_position(nwait)
+                    log.debug("현재 %s명 대기중...", nwait)
+                    self._wait(1, cancel_token)
+                    status, self._cached_key, nwait, ip = self._check(ip)
+
+                # Complete the funnel process
+                status, *_ = self._complete(ip)
+                if status in (self.WAIT_STATUS_PASS, self.ALREADY_COMPLETED):
+                    return self._cached_key
+
+                self.clear()
+                raise SRTNetFunnelError("Failed to complete NetFunnel")
+
+            except (SRTCancelledError, SRTTimeoutError):
+                self.clear()
+                raise
+
+            except Exception as ex:
+                self.clear()
+                raise SRTNetFunnelError(str(ex))
+
+            finally:
+                self._deadline = None
+                self._set_queue_position(0)
+
+    def _set_queue_position(self, nwait) -> None:
+        self.metrics.set_gauge(NETFUNNEL_QUEUE, int(nwait) if str(nwait).isdigit() else 0)
 
-        except Exception as ex:
-            self.clear()
-            raise SRTNetFunnelError(str(ex))
+    @staticmethod
+    def _wait(seconds: float, cancel_token=None) -> None:
+        if cancel_token is None:
+            time.sleep(seconds)
+        elif cancel_token.wait(seconds):
+            raise SRTCancelledError()
 
     def clear(self):
         self._cached_key = None
@@ -587,11 +771,20 @@ class NetFunnelHelper:
         return self._make_request("setComplete", ip)
 
     def _make_request(self, opcode: str, ip: str | None = None):
-        url = f"https://{ip or 'nf.letskorail.com'}/ts.wseq"
         params = self._build_params(self.OP_CODE[opcode])
-        r = self._session.get(url, params=params, verify=False)
-        if self.debug:
-            print(r.text)
+        timeout = _capped_timeout(self.timeout, self._deadline, "netfunnel")
+        with self.metrics.timed(self.METRIC_NAMES[opcode]):
+            try:
+                r = self._session.get(self._url(ip), params=params, verify=False, timeout=timeout)
+            except TransportTimeout as ex:
+                raise SRTTimeoutError(f"netfunnel timed out after {timeout:.1f}s") from ex
+        log_response(self._responses, self.METRIC_NAMES[opcode], r)
+        return self._result(r)
+
+    def _url(self, ip: str | None = None) -> str:
+        return self.url or f"https://{ip or 'nf.letskorail.com'}/ts.wseq"
+
+    def _result(self, r):
         response = self._parse(r.text)
         return map(response.get, ("status", "key", "nwait", "ip"))
 
@@ -637,6 +830,91 @@ class NetFunnelHelper:
         )
 
 
+class AsyncNetFunnelHelper(NetFunnelHelper):
+    """NetFunnelHelper whose requests and queue wait run on an asyncio loop.
+
+    Concurrent callers share one pass through the queue: a coroutine that
+    arrives while another is queueing waits for that key instead of taking a
+    second place in line.
+    """
+
+    CANCEL_POLL_INTERVAL = 0.05  # seconds between cancel_token checks while queued
+
+    def __init__(
+        self, debug=False, timeout=DEFAULT_TIMEOUTS["netfunnel"], url=None, transport=None, metrics=None
+    ):
+        super().__init__(debug, timeout, url, transport or default_async_transport(), metrics)
+        self._lock = asyncio.Lock()
+
+    async def run(self, cancel_token=None, deadline=None):
+        """Return a NetFunnel key, waiting in the queue if needed.
+
+        Same contract as NetFunnelHelper.run; cancel_token is still a
+        threading.Event, polled between short sleeps so the loop stays free.
+        """
+        async with self._lock:
+            current_time = time.time()
+            if self._is_cache_valid(current_time):
+                return self._cached_key
+
+            with self.metrics.timed("netfunnel"), span("netfunnel") as queue:
+                self._deadline = deadline
+                try:
+                    _raise_if_cancelled(cancel_token)
+                    status, self._cached_key, nwait, ip = await self._start()
+                    self._last_fetch_time = current_time
+                    queue.set(position=nwait)
+
+                    if status == self.WAIT_STATUS_FAIL:
+                        log.info("NetFunnel 대기열 진입: %s명 대기중", nwait)
+                    while status == self.WAIT_STATUS_FAIL:
+                        self._set_queue_position(nwait)
+                        log.debug("현재 %s명 대기중...", nwait)
+                        await self._wait(1, cancel_token)
+                        status, self._cached_key, nwait, ip = await self._check(ip)
+
+                    status, *_ = await self._complete(ip)
+                    if status in (self.WAIT_STATUS_PASS, self.ALREADY_COMPLETED):
+                        return self._cached_key
+
+                    self.clear()
+                    raise SRTNetFunnelError("Failed to complete NetFunnel")
+
+                except (SRTCancelledError, SRTTimeoutError, asyncio.CancelledError):
+                    self.clear()
+                    raise
+
+                except Exception as ex:
+                    self.clear()
+                    raise SRTNetFunnelError(str(ex))
+
+                finally:
+                    self._deadline = None
+                    self._set_queue_position(0)
+
+    @classmethod
+    async def _wait(cls, seconds: float, cancel_token=None) -> None:
+        if cancel_token is None:
+            await asyncio.sleep(seconds)
+            return
+        end = time.monotonic() + seconds
+        while (remaining := end - time.monotonic()) > 0:
+            if cancel_token.is_set():
+                raise SRTCancelledError()
+            await asyncio.sleep(min(remaining, cls.CANCEL_POLL_INTERVAL))
+
+    async def _make_request(self, opcode: str, ip: str | None = None):
+        params = self._build_params(self.OP_CODE[opcode])
+        timeout = _capped_timeout(self.timeout, self._deadline, "netfunnel")
+        with self.metrics.timed(self.METRIC_NAMES[opcode]):
+            try:
+                r = await self._session.get(self._url(ip), params=params, verify=False, timeout=timeout)
+            except TransportTimeout as ex:
+                raise SRTTimeoutError(f"netfunnel timed out after {timeout:.1f}s") from ex
+        log_response(self._responses, self.METRIC_NAMES[opcode], r)
+        return self._result(r)
+
+
 # SRT class
 class SRT:
     """SRT client class for interacting with the SRT train booking system.
@@ -645,7 +923,25 @@ class SRT:
         srt_id (str): SRT account ID (membership number, email, or phone)
         srt_pw (str): SRT account password
         auto_login (bool): Whether to automatically login on initialization
-        verbose (bool): Whether to print debug logs
+        verbose (bool): Whether to log the response bodies of this client (to
+            a child of the "responses.srt" logger); other clients' bodies stay
+            as src.infrastructure.logs configured them
+        cancel_token (threading.Event): Optional event; once set, search and
+            reserve calls (including the NetFunnel wait) raise SRTCancelledError
+        timeouts (dict): Per-endpoint request timeouts in seconds, merged over
+            DEFAULT_TIMEOUTS. A request that times out raises SRTTimeoutError.
+            Setting ``deadline`` (a time.monotonic() value) additionally caps
+            every request and NetFunnel wait to the time left before it, except
+            the lookup of a seat that reserve has already held.
+        base_url (str): Root of the SRT mobile API (default: SRT_MOBILE)
+        netfunnel_url (str): NetFunnel ts.wseq URL to use instead of the
+            default host. Together with base_url this points the client at a
+            local stand-in server.
+        transport (Transport): Creates the HTTP sessions of the client and its
+            NetFunnel helper (default: default_transport())
+        metrics (MetricsRegistry): Records the count, errors and latency of
+            every request by endpoint name, NetFunnel steps included
+            (default: default_metrics())
 
     Examples:
         >>> srt = SRT("1234567890", YOUR_PASSWORD) # with membership number
@@ -653,25 +949,39 @@ class SRT:
         >>> srt = SRT("010-1234-xxxx", YOUR_PASSWORD) # with phone number
     """
 
+    _netfunnel_class = NetFunnelHelper
+
     def __init__(
-        self, srt_id: str | None = None, srt_pw: str | None = None, auto_login: bool = True, verbose: bool = False
+        self,
+        srt_id: str | None = None,
+        srt_pw: str | None = None,
+        auto_login: bool = True,
+        verbose: bool = False,
+        cancel_token=None,
+        timeouts: Dict[str, float] | None = None,
+        base_url: str | None = None,
+        netfunnel_url: str | None = None,
+        transport: Transport | None = None,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
-        if HAS_CURL_CFFI:
-            try:
-                import certifi
-                self._session = curl_cffi.Session(
-                    impersonate="chrome",
-                    verify=certifi.where()
-                )
-            except ImportError:
-                self._session = curl_cffi.Session(impersonate="chrome")
-        else:
-            self._session = requests.session()
-        self._session.headers.update(DEFAULT_HEADERS)
-        self._netfunnel = NetFunnelHelper(debug=verbose)
+        self._transport = transport or default_transport()
+        self._session = self._transport.session(DEFAULT_HEADERS, impersonate=IMPERSONATE)
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.deadline = None
+        self.endpoints = API_ENDPOINTS if base_url is None else build_endpoints(base_url)
+        self.metrics = metrics or default_metrics()
+        self._netfunnel = self._netfunnel_class(
+            debug=verbose,
+            timeout=self.timeouts["netfunnel"],
+            url=netfunnel_url,
+            transport=self._transport,
+            metrics=self.metrics,
+        )
         self.srt_id = srt_id
         self.srt_pw = srt_pw
         self.verbose = verbose
+        self._responses = client_response_logger("srt", self) if verbose else _responses
+        self.cancel_token = cancel_token
         self.is_login = False
         self.membership_number = None
         self.membership_name = None
@@ -680,9 +990,33 @@ class SRT:
         if auto_login:
             self.login()
 
-    def _log(self, msg: str) -> None:
-        if self.verbose:
-            print("[*] " + msg)
+    def _post(self, endpoint: str, **kwargs):
+        """POST to self.endpoints[endpoint] with that endpoint's timeout, timed in self.metrics
+
+        The response body is logged to the "responses.srt" logger (off by default).
+        """
+        timeout = self._timeout(endpoint)
+        with self.metrics.timed(endpoint):
+            try:
+                r = self._session.post(url=self.endpoints[endpoint], timeout=timeout, **kwargs)
+            except TransportTimeout as ex:
+                raise SRTTimeoutError(f"{endpoint} timed out after {timeout:.1f}s") from ex
+        log_response(self._responses, endpoint, r)
+        return r
+
+    def _timeout(self, endpoint: str) -> float:
+        return _capped_timeout(
+            self.timeouts.get(endpoint, self.timeouts["default"]), self.deadline, endpoint
+        )
+
+    def _checked(self, r) -> SRTResponseData:
+        """Parse a response, raising SRTResponseError on failure"""
+        parser = SRTResponseData.from_response(r)
+
+        if not parser.success():
+            raise _response_error(parser.message())
+
+        return parser
 
     def login(self, srt_id: str | None = None, srt_pw: str | None = None) -> bool:
         """Login to SRT server.
@@ -699,6 +1033,10 @@ class SRT:
         Raises:
             SRTLoginError: If login fails
         """
+        r = self._post("login", data=self._login_data(srt_id, srt_pw))
+        return self._on_login(r)
+
+    def _login_data(self, srt_id: str | None, srt_pw: str | None) -> dict:
         srt_id = srt_id or self.srt_id
         srt_pw = srt_pw or self.srt_pw
 
@@ -711,21 +1049,19 @@ class SRT:
         if login_type == "3":
             srt_id = re.sub("-", "", srt_id)
 
-        data = {
+        return {
             "auto": "Y",
             "check": "Y",
             "page": "menu",
             "deviceKey": "-",
             "customerYn": "",
-            "login_referer": API_ENDPOINTS["main"],
+            "login_referer": self.endpoints["main"],
             "srchDvCd": login_type,
             "srchDvNm": srt_id,
             "hmpgPwdCphd": srt_pw,
         }
 
-        r = self._session.post(url=API_ENDPOINTS["login"], data=data)
-        self._log(r.text)
-
+    def _on_login(self, r) -> bool:
         if "존재하지않는 회원입니다" in r.text:
             raise SRTLoginError(r.json()["MSG"])
         if "비밀번호 오류" in r.text:
@@ -734,13 +1070,14 @@ class SRT:
             raise SRTLoginError(r.text.strip())
 
         self.is_login = True
-        user_info = json.loads(r.text)["userMap"]
+        user_info = response_json(r)["userMap"]
         self.membership_number = user_info["MB_CRD_NO"]
         self.membership_name = user_info["CUST_NM"]
         self.phone_number = user_info["MBL_PHONE"]
 
-        print(
-            f"로그인 성공: {self.membership_name} (멤버십번호: {self.membership_number}, 전화번호: {self.phone_number})"
+        log.info(
+            "로그인 성공: %s (멤버십번호: %s, 전화번호: %s)",
+            self.membership_name, self.membership_number, self.phone_number,
         )
         return True
 
@@ -756,9 +1093,9 @@ class SRT:
         if not self.is_login:
             return True
 
-        r = self._session.post(url=API_ENDPOINTS["logout"])
-        self._log(r.text)
+        return self._on_logout(self._post("logout"))
 
+    def _on_logout(self, r) -> bool:
         if not r.ok:
             raise SRTResponseError(r.text)
 
@@ -775,6 +1112,8 @@ class SRT:
         time_limit: str | None = None,
         passengers: list[Passenger] | None = None,
         available_only: bool = True,
+        train_numbers: Collection[str] | None = None,
+        seat_filter: Callable[[dict], bool] | None = None,
     ) -> list[SRTTrain]:
         """Search for available trains.
 
@@ -786,6 +1125,12 @@ class SRT:
             time_limit: Only return trains before this time
             passengers: List of passengers (default: 1 adult)
             available_only: Only return trains with available seats
+            train_numbers: Only return these trains (ideally a set)
+            seat_filter: Test of a raw result row, such as row_seat_available,
+                used instead of the available_only test
+
+        Rows are filtered on their raw fields, so a poll that only cares about
+        a few trains builds SRTTrain objects for just those.
 
         Returns:
             List of matching SRTTrain objects
@@ -793,6 +1138,24 @@ class SRT:
         Raises:
             ValueError: If invalid station names provided
         """
+        data = self._search_data(dep, arr, date, time, passengers)
+        cancel_token = self.cancel_token
+        _raise_if_cancelled(cancel_token)
+        data["netfunnelKey"] = self._netfunnel.run(cancel_token, self.deadline)
+
+        _raise_if_cancelled(cancel_token)
+        r = self._post("search_schedule", data=data)
+        return self._trains_from_response(r, time_limit, available_only, train_numbers, seat_filter)
+
+    def _search_data(
+        self,
+        dep: str,
+        arr: str,
+        date: str | None,
+        time: str | None,
+        passengers: list[Passenger] | None,
+    ) -> dict:
+        """Validate a search and build its form data, less the NetFunnel key"""
         if dep not in STATION_CODE or arr not in STATION_CODE:
             raise ValueError(f'Invalid station: "{dep}" or "{arr}"')
 
@@ -811,7 +1174,7 @@ class SRT:
 
         passengers = Passenger.combine(passengers or [Adult()])
 
-        data = {
+        return {
             "chtnDvCd": "1",
             "dptDt": date,
             "dptTm": time,
@@ -830,26 +1193,31 @@ class SRT:
             "tkTrnNo": "",
             "tkTripChgFlg": "",
             "dlayTnumAplFlg": "Y",
-            "netfunnelKey": self._netfunnel.run(),
         }
 
-        r = self._session.post(url=API_ENDPOINTS["search_schedule"], data=data)
-        self._log(r.text)
-        parser = SRTResponseData(r.text)
-
-        if not parser.success():
-            raise SRTResponseError(parser.message())
-
-        return [
-            train
-            for train in (
-                SRTTrain(t)
-                for t in parser.get_all()["outDataSets"]["dsOutput1"]
-                if t["stlbTrnClsfCd"] == "17"
-            )
-            if (not available_only or train.seat_available())
-            and (not time_limit or train.dep_time <= time_limit)
-        ]
+    def _trains_from_response(
+        self,
+        r,
+        time_limit: str | None,
+        available_only: bool,
+        train_numbers: Collection[str] | None = None,
+        seat_filter: Callable[[dict], bool] | None = None,
+    ) -> list[SRTTrain]:
+        with span("parse") as parsing:
+            rows = self._checked(r).get_all()["outDataSets"]["dsOutput1"]
+            if seat_filter is None and available_only:
+                seat_filter = row_seat_available
+
+            trains = [
+                SRTTrain(row)
+                for row in rows
+                if row["stlbTrnClsfCd"] == "17"
+                and (train_numbers is None or row["trnNo"] in train_numbers)
+                and (seat_filter is None or seat_filter(row))
+                and (not time_limit or row["dptTm"] <= time_limit)
+            ]
+            parsing.set(rows=len(rows), trains=len(trains))
+        return trains
 
     def reserve(
         self,
@@ -955,6 +1323,43 @@ class SRT:
             ValueError: If train is not SRT
             SRTError: If reservation not found after creation
         """
+        self._check_reservable(train)
+        cancel_token = self.cancel_token
+        _raise_if_cancelled(cancel_token)
+        netfunnel_key = self._netfunnel.run(cancel_token, self.deadline)
+        data = self._reserve_data(
+            jobid, train, passengers, option, mblPhone, window_seat, netfunnel_key
+        )
+
+        _raise_if_cancelled(cancel_token)
+        r = self._post("reserve", data=data)
+        reserved = self._checked(r).get_all()["reservListMap"][0]
+
+        with self._reservation_lookup():
+            reservation = self._reservation_from_response(train, reserved)
+            if reservation is None:
+                reservation = self.get_reservation(reserved["pnrNo"])
+        if reservation is None:
+            raise SRTError("Ticket not found: check reservation status")
+        return reservation
+
+    @contextmanager
+    def _reservation_lookup(self):
+        """Span of the lookup of a seat just reserved, run without the deadline
+
+        The seat is held once the reserve request succeeds. A lookup that
+        missed the attempt deadline would lose its reservation number and
+        turn the held seat into a retried attempt, so only the endpoint's own
+        timeout applies to it.
+        """
+        deadline, self.deadline = self.deadline, None
+        try:
+            with span("reservation_lookup"):
+                yield
+        finally:
+            self.deadline = deadline
+
+    def _check_reservable(self, train: SRTTrain) -> None:
         if not self.is_login:
             raise SRTNotLoggedInError()
 
@@ -964,6 +1369,16 @@ class SRT:
         if train.train_name != "SRT":
             raise ValueError(f'Expected "SRT" train, got {train.train_name}')
 
+    def _reserve_data(
+        self,
+        jobid: str,
+        train: SRTTrain,
+        passengers: list[Passenger] | None,
+        option: SeatType,
+        mblPhone: str | None,
+        window_seat: bool | None,
+        netfunnel_key: str,
+    ) -> dict:
         passengers = Passenger.combine(passengers or [Adult()])
 
         is_special_seat = {
@@ -998,7 +1413,7 @@ class SRT:
             "dptStnRunOrdr1": train.dep_station_run_order,
             "arvStnRunOrdr1": train.arr_station_run_order,
             "mblPhone": mblPhone,
-            "netfunnelKey": self._netfunnel.run(),
+            "netfunnelKey": netfunnel_key,
         }
 
         if jobid == RESERVE_JOBID["PERSONAL"]:
@@ -1009,21 +1424,61 @@ class SRT:
                 passengers, special_seat=is_special_seat, window_seat=window_seat
             )
         )
+        return data
 
-        r = self._session.post(url=API_ENDPOINTS["reserve"], data=data)
-        self._log(r.text)
-        parser = SRTResponseData(r.text)
+    def _reservation_from_response(
+        self, train: SRTTrain, reserved: dict
+    ) -> SRTReservation | None:
+        """Build a reservation handle from a reserve response.
 
-        if not parser.success():
-            raise SRTResponseError(parser.message())
+        Schedule fields come from the reserved train and the payment deadline
+        from ``reservListMap``; cost and seat count are read from a single
+        ticket_info lookup of the new reservation.
 
-        reservation_number = parser.get_all()["reservListMap"][0]["pnrNo"]
+        Args:
+            train: Train that was reserved
+            reserved: First ``reservListMap`` row of the reserve response
 
-        for ticket in self.get_reservations():
-            if ticket.reservation_number == reservation_number:
-                return ticket
+        Returns:
+            SRTReservation, or None if the response lacks the needed fields
+        """
+        if "iseLmtDt" not in reserved or "iseLmtTm" not in reserved:
+            return None
 
-        raise SRTError("Ticket not found: check reservation status")
+        try:
+            tickets = self.ticket_info(reserved["pnrNo"])
+        except SRTResponseError:
+            return None
+
+        return self._reservation_from_tickets(train, reserved, tickets)
+
+    @staticmethod
+    def _reservation_from_tickets(
+        train: SRTTrain, reserved: dict, tickets: list[SRTTicket]
+    ) -> SRTReservation | None:
+        if not tickets:
+            return None
+
+        train_data = {
+            "pnrNo": reserved["pnrNo"],
+            "rcvdAmt": str(sum(ticket.price for ticket in tickets)),
+            "seatNum": str(len(tickets)),
+            # Present for every reservation that is not running yet (see SRTReservation.is_running)
+            "tkSpecNum": len(tickets),
+        }
+        pay_data = {
+            "stlbTrnClsfCd": train.train_code,
+            "trnNo": train.train_number,
+            "dptDt": train.dep_date,
+            "dptTm": train.dep_time,
+            "dptRsStnCd": train.dep_station_code,
+            "arvTm": train.arr_time,
+            "arvRsStnCd": train.arr_station_code,
+            "iseLmtDt": reserved["iseLmtDt"],
+            "iseLmtTm": reserved["iseLmtTm"],
+            "stlFlg": "N",
+        }
+        return SRTReservation(train_data, pay_data, tickets)
 
     def reserve_standby_option_settings(
         self,
@@ -1051,19 +1506,24 @@ class SRT:
         if not self.is_login:
             raise SRTNotLoggedInError()
 
-        reservation_number = getattr(reservation, "reservation_number", reservation)
+        data = self._standby_option_data(reservation, isAgreeSMS, isAgreeClassChange, telNo)
+        r = self._post("standby_option", data=data)
+        return r.status_code == 200
 
-        data = {
-            "pnrNo": reservation_number,
+    @staticmethod
+    def _standby_option_data(
+        reservation: SRTReservation | int,
+        isAgreeSMS: bool,
+        isAgreeClassChange: bool,
+        telNo: str | None,
+    ) -> dict:
+        return {
+            "pnrNo": getattr(reservation, "reservation_number", reservation),
             "psrmClChgFlg": "Y" if isAgreeClassChange else "N",
             "smsSndFlg": "Y" if isAgreeSMS else "N",
             "telNo": telNo if isAgreeSMS else "",
         }
 
-        r = self._session.post(url=API_ENDPOINTS["standby_option"], data=data)
-        self._log(r.text)
-        return r.status_code == 200
-
     def get_reservations(self, paid_only: bool = False) -> list[SRTReservation]:
         """Get all reservations.
 
@@ -1077,23 +1537,44 @@ class SRT:
             SRTNotLoggedInError: If not logged in
             SRTResponseError: If server returns error
         """
+        return [
+            SRTReservation(train, pay, ticket_loader=self.ticket_info)
+            for train, pay in self._reservation_rows()
+            if not paid_only or pay["stlFlg"] != "N"
+        ]
+
+    def get_reservation(self, reservation_number: str) -> SRTReservation | None:
+        """Get a single reservation by its reservation number.
+
+        Makes one reservation list request; ticket details are fetched lazily
+        on first access to ``SRTReservation.tickets``.
+
+        Args:
+            reservation_number: Reservation number (pnrNo)
+
+        Returns:
+            Matching SRTReservation, or None if not found
+
+        Raises:
+            SRTNotLoggedInError: If not logged in
+            SRTResponseError: If server returns error
+        """
+        for train, pay in self._reservation_rows():
+            if train.get("pnrNo") == reservation_number:
+                return SRTReservation(train, pay, ticket_loader=self.ticket_info)
+        return None
+
+    def _reservation_rows(self) -> list[tuple[dict, dict]]:
+        """Fetch raw (trainListMap, payListMap) pairs of all reservations."""
         if not self.is_login:
             raise SRTNotLoggedInError()
 
-        r = self._session.post(url=API_ENDPOINTS["tickets"], data={"pageNo": "0"})
-        self._log(r.text)
-        parser = SRTResponseData(r.text)
+        r = self._post("tickets", data={"pageNo": "0"})
+        return self._rows_from_response(r)
 
-        if not parser.success():
-            raise SRTResponseError(parser.message())
-
-        return [
-            SRTReservation(train, pay, self.ticket_info(train["pnrNo"]))
-            for train, pay in zip(
-                parser.get_all()["trainListMap"], parser.get_all()["payListMap"]
-            )
-            if not paid_only or pay["stlFlg"] != "N"
-        ]
+    def _rows_from_response(self, r) -> list[tuple[dict, dict]]:
+        data = self._checked(r).get_all()
+        return list(zip(data["trainListMap"], data["payListMap"]))
 
     def ticket_info(self, reservation: SRTReservation | int) -> list[SRTTicket]:
         """Get detailed ticket information.
@@ -1113,17 +1594,14 @@ class SRT:
 
         reservation_number = getattr(reservation, "reservation_number", reservation)
 
-        r = self._session.post(
-            url=API_ENDPOINTS["ticket_info"],
+        r = self._post(
+            "ticket_info",
             data={"pnrNo": reservation_number, "jrnySqno": "1"},
         )
-        self._log(r.text)
-        parser = SRTResponseData(r.text)
+        return self._tickets_from_response(r)
 
-        if not parser.success():
-            raise SRTResponseError(parser.message())
-
-        return [SRTTicket(ticket) for ticket in parser.get_all()["trainListMap"]]
+    def _tickets_from_response(self, r) -> list[SRTTicket]:
+        return [SRTTicket(ticket) for ticket in self._checked(r).get_all()["trainListMap"]]
 
     def cancel(self, reservation: SRTReservation | int) -> bool:
         """Cancel a reservation.
@@ -1151,13 +1629,7 @@ class SRT:
 
         data = {"pnrNo": reservation_number, "jrnyCnt": "1", "rsvChgTno": "0"}
 
-        r = self._session.post(url=API_ENDPOINTS["cancel"], data=data)
-        self._log(r.text)
-        parser = SRTResponseData(r.text)
-
-        if not parser.success():
-            raise SRTResponseError(parser.message())
-
+        self._checked(self._post("cancel", data=data))
         return True
 
     def pay_with_card(
@@ -1195,7 +1667,22 @@ class SRT:
         if not self.is_login:
             raise SRTNotLoggedInError()
 
-        data = {
+        data = self._payment_data(
+            reservation, number, password, validation_number, expire_date, installment, card_type
+        )
+        return self._on_payment(self._post("payment", data=data))
+
+    def _payment_data(
+        self,
+        reservation: SRTReservation,
+        number: str,
+        password: str,
+        validation_number: str,
+        expire_date: str,
+        installment: int,
+        card_type: str,
+    ) -> dict:
+        return {
             "stlDmnDt": datetime.now().strftime("%Y%m%d"),
             "mbCrdNo": self.membership_number,
             "stlMnsSqno1": "1",
@@ -1229,9 +1716,8 @@ class SRT:
             "pageUrl": "",
         }
 
-        r = self._session.post(url=API_ENDPOINTS["payment"], data=data)
-        self._log(r.text)
-        response = json.loads(r.text)
+    def _on_payment(self, r) -> bool:
+        response = response_json(r)
 
         if response["outDataSets"]["dsOutput0"][0]["strResult"] == "FAIL":
             raise SRTResponseError(response["outDataSets"]["dsOutput0"][0]["msgTxt"])
@@ -1239,11 +1725,15 @@ class SRT:
         return True
 
     def reserve_info(self, reservation: SRTReservation | int) -> bool:
-        referer = API_ENDPOINTS["reserve_info_referer"] + reservation.reservation_number
+        self._set_reserve_info_referer(reservation)
+        return self._on_reserve_info(self._post("reserve_info"))
+
+    def _set_reserve_info_referer(self, reservation: SRTReservation) -> None:
+        referer = self.endpoints["reserve_info_referer"] + reservation.reservation_number
         self._session.headers.update({"Referer": referer})
-        r = self._session.post(url=API_ENDPOINTS["reserve_info"])
-        self._log(r.text)
-        response = json.loads(r.text)
+
+    def _on_reserve_info(self, r) -> dict:
+        response = response_json(r)
         if response.get("ErrorCode") == "0" and response.get("ErrorMsg") == "":
             return response.get("outDataSets").get("dsOutput1")[0]
         else:
@@ -1251,7 +1741,12 @@ class SRT:
 
     def refund(self, reservation: SRTReservation | int) -> bool:
         info = self.reserve_info(reservation)
-        data = {
+        self._checked(self._post("refund", data=self._refund_data(info)))
+        return True
+
+    @staticmethod
+    def _refund_data(info: dict) -> dict:
+        return {
             "pnr_no": info.get("pnrNo"),
             "cnc_dmn_cont": "승차권 환불로 취소",
             "saleDt": info.get("ogtkSaleDt"),
@@ -1261,15 +1756,293 @@ class SRT:
             "psgNm": info.get("buyPsNm"),
         }
 
-        r = self._session.post(url=API_ENDPOINTS["refund"], data=data)
-        self._log(r.text)
-        response = SRTResponseData(r.text)
+    def clear(self):
+        log.debug("Clearing the netfunnel key")
+        self._netfunnel.clear()
+
+
+class AsyncSRT(SRT):
+    """SRT client whose requests run on an asyncio loop.
+
+    Shares its request building and response parsing with SRT; every method
+    that talks to the server is a coroutine. Clients created on one loop can
+    share a single AsyncTransport and its connection pool, and
+    get_reservations fetches the ticket details of all reservations
+    concurrently instead of lazily one by one. There is no auto_login:
+    ``await client.login()`` after creating the client, and ``await
+    client.close()`` (or use ``async with``) when done.
+
+    Args:
+        srt_id, srt_pw, verbose, cancel_token, timeouts, base_url,
+        netfunnel_url, metrics: As for SRT. cancel_token stays a threading.Event so
+            the same token can stop sync and async clients.
+        transport (AsyncTransport): Creates the HTTP sessions of the client
+            and its NetFunnel helper (default: default_async_transport())
+
+    Examples:
+        >>> async with AsyncSRT("1234567890", YOUR_PASSWORD) as srt:
+        ...     await srt.login()
+        ...     trains = await srt.search_train("수서", "부산", "20250101", "080000")
+    """
+
+    _netfunnel_class = AsyncNetFunnelHelper
+
+    def __init__(
+        self,
+        srt_id: str | None = None,
+        srt_pw: str | None = None,
+        verbose: bool = False,
+        cancel_token=None,
+        timeouts: Dict[str, float] | None = None,
+        base_url: str | None = None,
+        netfunnel_url: str | None = None,
+        transport: AsyncTransport | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        super().__init__(
+            srt_id,
+            srt_pw,
+            auto_login=False,
+            verbose=verbose,
+            cancel_token=cancel_token,
+            timeouts=timeouts,
+            base_url=base_url,
+            netfunnel_url=netfunnel_url,
+            transport=transport or default_async_transport(),
+            metrics=metrics,
+        )
+
+    async def __aenter__(self) -> "AsyncSRT":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP sessions of the client and its NetFunnel helper"""
+        await self._session.close()
+        await self._netfunnel._session.close()
 
-        if not response.success():
-            raise SRTResponseError(response.message())
+    async def _post(self, endpoint: str, **kwargs):
+        timeout = self._timeout(endpoint)
+        with self.metrics.timed(endpoint):
+            try:
+                r = await self._session.post(url=self.endpoints[endpoint], timeout=timeout, **kwargs)
+            except TransportTimeout as ex:
+                raise SRTTimeoutError(f"{endpoint} timed out after {timeout:.1f}s") from ex
+        log_response(self._responses, endpoint, r)
+        return r
+
+    async def login(self, srt_id: str | None = None, srt_pw: str | None = None) -> bool:
+        r = await self._post("login", data=self._login_data(srt_id, srt_pw))
+        return self._on_login(r)
+
+    async def logout(self) -> bool:
+        if not self.is_login:
+            return True
+        return self._on_logout(await self._post("logout"))
+
+    async def search_train(
+        self,
+        dep: str,
+        arr: str,
+        date: str | None = None,
+        time: str | None = None,
+        time_limit: str | None = None,
+        passengers: list[Passenger] | None = None,
+        available_only: bool = True,
+        train_numbers: Collection[str] | None = None,
+        seat_filter: Callable[[dict], bool] | None = None,
+    ) -> list[SRTTrain]:
+        data = self._search_data(dep, arr, date, time, passengers)
+        cancel_token = self.cancel_token
+        _raise_if_cancelled(cancel_token)
+        data["netfunnelKey"] = await self._netfunnel.run(cancel_token, self.deadline)
+
+        _raise_if_cancelled(cancel_token)
+        r = await self._post("search_schedule", data=data)
+        return self._trains_from_response(r, time_limit, available_only, train_numbers, seat_filter)
+
+    async def reserve(
+        self,
+        train: SRTTrain,
+        passengers: list[Passenger] | None = None,
+        option: SeatType = SeatType.GENERAL_FIRST,
+        window_seat: bool | None = None,
+    ) -> SRTReservation:
+        if not train.seat_available() and train.reserve_wait_possible_code >= 0:
+            reservation = await self.reserve_standby(
+                train, passengers, option=option, mblPhone=self.phone_number
+            )
+            if self.phone_number:
+                agree_class_change = (
+                    option == SeatType.SPECIAL_FIRST or option == SeatType.GENERAL_FIRST
+                )
+                await self.reserve_standby_option_settings(
+                    reservation,
+                    isAgreeSMS=True,
+                    isAgreeClassChange=agree_class_change,
+                    telNo=self.phone_number,
+                )
+            return reservation
+
+        return await self._reserve(
+            RESERVE_JOBID["PERSONAL"],
+            train,
+            passengers,
+            option,
+            window_seat=window_seat,
+        )
 
+    async def reserve_standby(
+        self,
+        train: SRTTrain,
+        passengers: list[Passenger] | None = None,
+        option: SeatType = SeatType.GENERAL_FIRST,
+        mblPhone: str | None = None,
+    ) -> SRTReservation:
+        if option == SeatType.SPECIAL_FIRST:
+            option = SeatType.SPECIAL_ONLY
+        elif option == SeatType.GENERAL_FIRST:
+            option = SeatType.GENERAL_ONLY
+        return await self._reserve(
+            RESERVE_JOBID["STANDBY"], train, passengers, option, mblPhone=mblPhone
+        )
+
+    async def _reserve(
+        self,
+        jobid: str,
+        train: SRTTrain,
+        passengers: list[Passenger] | None = None,
+        option: SeatType = SeatType.GENERAL_FIRST,
+        mblPhone: str | None = None,
+        window_seat: bool | None = None,
+    ) -> SRTReservation:
+        self._check_reservable(train)
+        cancel_token = self.cancel_token
+        _raise_if_cancelled(cancel_token)
+        netfunnel_key = await self._netfunnel.run(cancel_token, self.deadline)
+        data = self._reserve_data(
+            jobid, train, passengers, option, mblPhone, window_seat, netfunnel_key
+        )
+
+        _raise_if_cancelled(cancel_token)
+        r = await self._post("reserve", data=data)
+        reserved = self._checked(r).get_all()["reservListMap"][0]
+
+        with self._reservation_lookup():
+            reservation = await self._reservation_from_response(train, reserved)
+            if reservation is None:
+                reservation = await self.get_reservation(reserved["pnrNo"])
+        if reservation is None:
+            raise SRTError("Ticket not found: check reservation status")
+        return reservation
+
+    async def _reservation_from_response(
+        self, train: SRTTrain, reserved: dict
+    ) -> SRTReservation | None:
+        if "iseLmtDt" not in reserved or "iseLmtTm" not in reserved:
+            return None
+
+        try:
+            tickets = await self.ticket_info(reserved["pnrNo"])
+        except SRTResponseError:
+            return None
+
+        return self._reservation_from_tickets(train, reserved, tickets)
+
+    async def reserve_standby_option_settings(
+        self,
+        reservation: SRTReservation | int,
+        isAgreeSMS: bool,
+        isAgreeClassChange: bool,
+        telNo: str | None = None,
+    ) -> bool:
+        if not self.is_login:
+            raise SRTNotLoggedInError()
+
+        data = self._standby_option_data(reservation, isAgreeSMS, isAgreeClassChange, telNo)
+        r = await self._post("standby_option", data=data)
+        return r.status_code == 200
+
+    async def get_reservations(self, paid_only: bool = False) -> list[SRTReservation]:
+        """Get all reservations, with their tickets fetched concurrently."""
+        rows = [
+            (train, pay)
+            for train, pay in await self._reservation_rows()
+            if not paid_only or pay["stlFlg"] != "N"
+        ]
+        tickets = await asyncio.gather(*(self.ticket_info(train["pnrNo"]) for train, _ in rows))
+        return [
+            SRTReservation(train, pay, tickets=ticket_list)
+            for (train, pay), ticket_list in zip(rows, tickets)
+        ]
+
+    async def get_reservation(self, reservation_number: str) -> SRTReservation | None:
+        """Get a single reservation by its reservation number, without its tickets.
+
+        A property cannot await, so the tickets cannot be loaded on first
+        access as SRT does; ``tickets`` stays None and
+        ``await ticket_info(reservation)`` fetches them. Looking up a
+        reservation to pay for it thus costs one request.
+        """
+        for train, pay in await self._reservation_rows():
+            if train.get("pnrNo") == reservation_number:
+                return SRTReservation(train, pay)
+        return None
+
+    async def _reservation_rows(self) -> list[tuple[dict, dict]]:
+        if not self.is_login:
+            raise SRTNotLoggedInError()
+
+        return self._rows_from_response(await self._post("tickets", data={"pageNo": "0"}))
+
+    async def ticket_info(self, reservation: SRTReservation | int) -> list[SRTTicket]:
+        if not self.is_login:
+            raise SRTNotLoggedInError()
+
+        reservation_number = getattr(reservation, "reservation_number", reservation)
+
+        r = await self._post(
+            "ticket_info",
+            data={"pnrNo": reservation_number, "jrnySqno": "1"},
+        )
+        return self._tickets_from_response(r)
+
+    async def cancel(self, reservation: SRTReservation | int) -> bool:
+        if not self.is_login:
+            raise SRTNotLoggedInError()
+
+        reservation_number = getattr(reservation, "reservation_number", reservation)
+
+        data = {"pnrNo": reservation_number, "jrnyCnt": "1", "rsvChgTno": "0"}
+
+        self._checked(await self._post("cancel", data=data))
         return True
 
-    def clear(self):
-        self._log("Clearing the netfunnel key")
-        self._netfunnel.clear()
+    async def pay_with_card(
+        self,
+        reservation: SRTReservation,
+        number: str,
+        password: str,
+        validation_number: str,
+        expire_date: str,
+        installment: int = 0,
+        card_type: str = "J",
+    ) -> bool:
+        if not self.is_login:
+            raise SRTNotLoggedInError()
+
+        data = self._payment_data(
+            reservation, number, password, validation_number, expire_date, installment, card_type
+        )
+        return self._on_payment(await self._post("payment", data=data))
+
+    async def reserve_info(self, reservation: SRTReservation | int) -> bool:
+        self._set_reserve_info_referer(reservation)
+        return self._on_reserve_info(await self._post("reserve_info"))
+
+    async def refund(self, reservation: SRTReservation | int) -> bool:
+        info = await self.reserve_info(reservation)
+        self._checked(await self._post("refund", data=self._refund_data(info)))
+        return True
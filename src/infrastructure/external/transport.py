@@ -0,0 +1,490 @@
+"""HTTP transports shared by the SRT and Korail clients
+
+A transport creates the HTTP sessions of the API clients and their NetFunnel
+helpers. It applies one TransportConfig (keep-alive, connection pool size,
+HTTP/2, compression, TLS verification) to every session and reports each
+request to its timing hooks. Backends:
+
+- CurlTransport / AsyncCurlTransport: curl_cffi with browser impersonation
+- RequestsTransport: requests, the fallback when curl_cffi is missing
+- InMemoryTransport: answers from a handler function, without sockets
+- ThreadedAsyncTransport: runs any sync transport's requests in worker threads
+
+Sessions keep the requests-style ``get``/``post``/``headers`` surface the
+clients use. Backend timeouts are raised as TransportTimeout and other
+request failures as TransportError, whichever backend is in use.
+
+Clients use ``default_transport()`` unless given one. Replacing it with
+``set_default_transport()`` changes the backend, settings and hooks of every
+client created afterwards.
+"""
+import asyncio
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+try:
+    import curl_cffi
+    from curl_cffi import CurlHttpVersion, CurlOpt
+    from curl_cffi.requests.exceptions import RequestException as CurlRequestError, Timeout as CurlTimeout
+    HAS_CURL_CFFI = True
+except ImportError:
+    HAS_CURL_CFFI = False
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+try:
+    import certifi
+    CA_BUNDLE: str | None = certifi.where()
+except ImportError:
+    CA_BUNDLE = None
+
+
+class TransportError(Exception):
+    """A request failed without a response"""
+
+
+class TransportTimeout(TransportError):
+    """A request timed out"""
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Connection settings applied to every session of a transport
+
+    ``http2`` only affects curl_cffi (requests speaks HTTP/1.1 only).
+    ``compression=False`` asks servers for uncompressed bodies, trading
+    bandwidth for the decompression cost.
+    """
+    keep_alive: bool = True
+    pool_size: int = 10  # connections kept open per session
+    http2: bool = True
+    compression: bool = True
+    verify: bool = True  # verify TLS certificates (against certifi's bundle when installed)
+
+
+@dataclass(frozen=True)
+class RequestTiming:
+    """One request as reported to the timing hooks"""
+    transport: str
+    method: str
+    url: str
+    elapsed: float  # seconds from sending the request to having the whole body
+    status: int | None = None  # None when the request failed
+    size: int = 0  # response body bytes
+    error: BaseException | None = None
+
+
+TimingHook = Callable[[RequestTiming], None]
+
+
+@dataclass
+class InMemoryRequest:
+    """A request handed to an InMemoryTransport handler"""
+    method: str
+    url: str
+    params: dict = field(default_factory=dict)
+    data: dict = field(default_factory=dict)
+    headers: dict = field(default_factory=dict)
+    timeout: float | None = None
+
+
+class InMemoryResponse:
+    """Response of an InMemoryTransport with the attributes the clients read"""
+
+    def __init__(self, text: str = "", status_code: int = 200, headers: dict | None = None):
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode("utf-8")
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class Session:
+    """HTTP session of a Transport: the backend session plus error translation and timing"""
+
+    def __init__(self, transport: "Transport", backend: Any):
+        self._transport = transport
+        self._backend = backend
+
+    @property
+    def headers(self):
+        return self._backend.headers
+
+    @property
+    def cookies(self):
+        return self._backend.cookies
+
+    def request(self, method: str, url: str, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = self._backend.request(method, url, **kwargs)
+        except Exception as ex:
+            error = self._transport._translate(ex)
+            self._transport._report(method, url, time.perf_counter() - start, error=error)
+            if error is ex:
+                raise
+            raise error from ex
+        self._transport._report(method, url, time.perf_counter() - start, response=response)
+        return response
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        self._backend.close()
+
+
+class AsyncSession:
+    """Async counterpart of Session"""
+
+    def __init__(self, transport: "AsyncTransport", backend: Any):
+        self._transport = transport
+        self._backend = backend
+
+    @property
+    def headers(self):
+        return self._backend.headers
+
+    @property
+    def cookies(self):
+        return self._backend.cookies
+
+    async def request(self, method: str, url: str, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = await self._backend.request(method, url, **kwargs)
+        except Exception as ex:
+            error = self._transport._translate(ex)
+            self._transport._report(method, url, time.perf_counter() - start, error=error)
+            if error is ex:
+                raise
+            raise error from ex
+        self._transport._report(method, url, time.perf_counter() - start, response=response)
+        return response
+
+    async def get(self, url: str, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self) -> None:
+        await self._backend.close()
+
+
+class _BaseTransport(ABC):
+    name = "base"
+
+    def __init__(self, config: TransportConfig | None = None):
+        self.config = config or TransportConfig()
+        self._hooks: tuple[TimingHook, ...] = ()
+
+    def add_hook(self, hook: TimingHook) -> None:
+        """Call hook with a RequestTiming after every request of every session
+
+        Hooks run on the requesting thread and should return quickly.
+        """
+        self._hooks = (*self._hooks, hook)
+
+    def remove_hook(self, hook: TimingHook) -> None:
+        self._hooks = tuple(h for h in self._hooks if h != hook)
+
+    def _report(self, method: str, url: str, elapsed: float, response=None, error=None) -> None:
+        hooks = self._hooks
+        if not hooks:
+            return
+        if response is not None:
+            timing = RequestTiming(
+                self.name, method, url, elapsed, status=response.status_code, size=len(response.content)
+            )
+        else:
+            timing = RequestTiming(self.name, method, url, elapsed, error=error)
+        for hook in hooks:
+            hook(timing)
+
+    def _translate(self, error: Exception) -> Exception:
+        """Map a backend exception to TransportTimeout/TransportError; others pass through"""
+        return error
+
+    def _session_headers(self, headers: dict | None) -> dict:
+        merged = dict(headers or {})
+        if not self.config.keep_alive:
+            merged["Connection"] = "close"
+        if not self.config.compression:
+            merged["Accept-Encoding"] = "identity"
+        return merged
+
+    @property
+    def _verify(self) -> bool | str:
+        return (CA_BUNDLE or True) if self.config.verify else False
+
+
+class Transport(_BaseTransport):
+    """Creates the sync HTTP sessions of the API clients"""
+
+    def session(self, headers: dict | None = None, impersonate: str | None = None) -> Session:
+        """New session sending headers by default
+
+        ``impersonate`` names the browser fingerprint to present where the
+        backend supports it (curl_cffi).
+        """
+        session = Session(self, self._new_backend(impersonate))
+        session.headers.update(self._session_headers(headers))
+        return session
+
+    @abstractmethod
+    def _new_backend(self, impersonate: str | None) -> Any:
+        """Backend session with the config applied"""
+
+
+class AsyncTransport(_BaseTransport):
+    """Creates the async HTTP sessions of the API clients"""
+
+    def session(self, headers: dict | None = None, impersonate: str | None = None) -> AsyncSession:
+        session = AsyncSession(self, self._new_backend(impersonate))
+        session.headers.update(self._session_headers(headers))
+        return session
+
+    @abstractmethod
+    def _new_backend(self, impersonate: str | None) -> Any:
+        """Backend session with the config applied"""
+
+
+def _curl_options(config: TransportConfig) -> dict:
+    options = {CurlOpt.MAXCONNECTS: config.pool_size}
+    if not config.keep_alive:
+        options[CurlOpt.FORBID_REUSE] = 1
+    return options
+
+
+def _curl_http_version(config: TransportConfig):
+    return CurlHttpVersion.V2_0 if config.http2 else CurlHttpVersion.V1_1
+
+
+def _translate_curl(error: Exception) -> Exception:
+    if isinstance(error, CurlTimeout):
+        return TransportTimeout(str(error))
+    if isinstance(error, CurlRequestError):
+        return TransportError(str(error))
+    return error
+
+
+class CurlTransport(Transport):
+    """curl_cffi sessions impersonating a browser's TLS/HTTP2 fingerprint"""
+    name = "curl_cffi"
+
+    def __init__(self, config: TransportConfig | None = None):
+        if not HAS_CURL_CFFI:
+            raise ImportError("CurlTransport requires curl_cffi")
+        super().__init__(config)
+
+    def _new_backend(self, impersonate: str | None):
+        return curl_cffi.Session(
+            impersonate=impersonate,
+            verify=self._verify,
+            http_version=_curl_http_version(self.config),
+            curl_options=_curl_options(self.config),
+        )
+
+    def _translate(self, error: Exception) -> Exception:
+        return _translate_curl(error)
+
+
+class AsyncCurlTransport(AsyncTransport):
+    """curl_cffi AsyncSession; pool_size bounds the requests in flight per session"""
+    name = "curl_cffi"
+
+    def __init__(self, config: TransportConfig | None = None):
+        if not HAS_CURL_CFFI:
+            raise ImportError("AsyncCurlTransport requires curl_cffi")
+        super().__init__(config)
+
+    def _new_backend(self, impersonate: str | None):
+        return curl_cffi.AsyncSession(
+            impersonate=impersonate,
+            verify=self._verify,
+            http_version=_curl_http_version(self.config),
+            curl_options=_curl_options(self.config),
+            max_clients=self.config.pool_size,
+        )
+
+    def _translate(self, error: Exception) -> Exception:
+        return _translate_curl(error)
+
+
+class RequestsTransport(Transport):
+    """requests sessions (HTTP/1.1, no impersonation)"""
+    name = "requests"
+
+    def __init__(self, config: TransportConfig | None = None):
+        if not HAS_REQUESTS:
+            raise ImportError("RequestsTransport requires requests")
+        super().__init__(config)
+
+    def _new_backend(self, impersonate: str | None):
+        backend = requests.Session()
+        backend.verify = self._verify
+        adapter = HTTPAdapter(pool_connections=self.config.pool_size, pool_maxsize=self.config.pool_size)
+        backend.mount("https://", adapter)
+        backend.mount("http://", adapter)
+        return backend
+
+    def _translate(self, error: Exception) -> Exception:
+        if isinstance(error, requests.exceptions.Timeout):
+            return TransportTimeout(str(error))
+        if isinstance(error, requests.exceptions.RequestException):
+            return TransportError(str(error))
+        return error
+
+
+class _InMemoryBackend:
+    def __init__(self, handler: Callable[[InMemoryRequest], InMemoryResponse]):
+        self._handler = handler
+        self.headers: dict[str, str] = {}
+        self.cookies: dict[str, str] = {}
+
+    def request(self, method: str, url: str, params=None, data=None, headers=None, timeout=None, **kwargs):
+        request = InMemoryRequest(
+            method=method,
+            url=url,
+            params=dict(params or {}),
+            data=dict(data or {}),
+            headers={**self.headers, **(headers or {})},
+            timeout=timeout,
+        )
+        return self._handler(request)
+
+    def close(self) -> None:
+        pass
+
+
+class InMemoryTransport(Transport):
+    """Answers every request by calling handler(InMemoryRequest) -> InMemoryResponse
+
+    A handler raising TimeoutError simulates a timeout. Used to exercise the
+    clients and measure their own overhead without any network I/O.
+    """
+    name = "memory"
+
+    def __init__(self, handler: Callable[[InMemoryRequest], InMemoryResponse], config: TransportConfig | None = None):
+        super().__init__(config)
+        self.handler = handler
+
+    def _new_backend(self, impersonate: str | None):
+        return _InMemoryBackend(self.handler)
+
+    def _translate(self, error: Exception) -> Exception:
+        if isinstance(error, TimeoutError):
+            return TransportTimeout(str(error) or "timed out")
+        return error
+
+
+class _ThreadedBackend:
+    def __init__(self, session: Session):
+        self._session = session
+
+    @property
+    def headers(self):
+        return self._session.headers
+
+    @property
+    def cookies(self):
+        return self._session.cookies
+
+    async def request(self, method: str, url: str, **kwargs):
+        return await asyncio.to_thread(self._session.request, method, url, **kwargs)
+
+    async def close(self) -> None:
+        self._session.close()
+
+
+class ThreadedAsyncTransport(AsyncTransport):
+    """Async sessions that run a sync transport's requests in worker threads
+
+    Errors are already translated and requests already reported by the sync
+    transport, so this transport adds no hooks of its own: add them to it.
+    """
+
+    def __init__(self, transport: Transport):
+        super().__init__(transport.config)
+        self.transport = transport
+        self.name = transport.name
+
+    def add_hook(self, hook: TimingHook) -> None:
+        self.transport.add_hook(hook)
+
+    def remove_hook(self, hook: TimingHook) -> None:
+        self.transport.remove_hook(hook)
+
+    def _new_backend(self, impersonate: str | None):
+        return _ThreadedBackend(self.transport.session(impersonate=impersonate))
+
+
+# Process-wide defaults
+
+_default_lock = threading.Lock()
+_default_transport: Transport | None = None
+_default_async_transport: AsyncTransport | None = None
+
+
+def create_transport(config: TransportConfig | None = None) -> Transport:
+    """curl_cffi transport, or requests when curl_cffi is not installed"""
+    return CurlTransport(config) if HAS_CURL_CFFI else RequestsTransport(config)
+
+
+def create_async_transport(config: TransportConfig | None = None) -> AsyncTransport:
+    """curl_cffi async transport, or requests in worker threads"""
+    return AsyncCurlTransport(config) if HAS_CURL_CFFI else ThreadedAsyncTransport(RequestsTransport(config))
+
+
+def default_transport() -> Transport:
+    """Transport used by clients that are not given one"""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = create_transport()
+        return _default_transport
+
+
+def set_default_transport(transport: Transport | None) -> None:
+    """Replace the default transport; None restores the built-in one"""
+    global _default_transport
+    with _default_lock:
+        _default_transport = transport
+
+
+def default_async_transport() -> AsyncTransport:
+    """Async transport used by async clients that are not given one"""
+    global _default_async_transport
+    with _default_lock:
+        if _default_async_transport is None:
+            _default_async_transport = create_async_transport()
+        return _default_async_transport
+
+
+def set_default_async_transport(transport: AsyncTransport | None) -> None:
+    """Replace the default async transport; None restores the built-in one"""
+    global _default_async_transport
+    with _default_lock:
+        _default_async_transport = transport
@@ -0,0 +1,132 @@
+"""Application logging: per-module loggers, response bodies on request
+
+Modules log through the standard library with a logger of their own,
+``log = logging.getLogger(__name__)``, passing %-style arguments so a message
+is only formatted once a handler takes it. Until configure_logging() runs
+nothing below WARNING is enabled, and a disabled call costs a cached level
+check: the reservation loop formats no strings when nobody listens.
+
+Response bodies are logged at DEBUG to loggers of their own under
+RESPONSE_LOGGER ("responses.srt", "responses.korail", ...). They stay off at
+any application level until configure_logging(response_bodies=True) or
+enable_response_bodies() turns them on for every client. A client created
+verbose logs through a child logger of its own (client_response_logger()), so
+other clients of the same kind stay as configured. A body longer than
+BODY_LIMIT characters is cut when it is formatted.
+
+configure_logging() routes the records to any of a GUI handler, a size-rotated
+file and stderr.
+"""
+import logging
+import sys
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Iterable
+
+APP_LOGGER = "src"  # parent of every module logger of the application
+RESPONSE_LOGGER = "responses"
+BODY_LIMIT = 2000  # characters of a response body that are logged
+FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+_OFF = logging.CRITICAL + 1
+_installed: list[logging.Handler] = []
+
+logging.getLogger(RESPONSE_LOGGER).setLevel(_OFF)
+
+
+def default_log_path() -> Path:
+    """~/.ktx-srt-macro/logs/app.log, next to the credentials database"""
+    return Path.home() / ".ktx-srt-macro" / "logs" / "app.log"
+
+
+def response_logger(client: str) -> logging.Logger:
+    """Logger for the response bodies of one client, e.g. response_logger("srt")"""
+    return logging.getLogger(f"{RESPONSE_LOGGER}.{client}")
+
+
+def client_response_logger(client: str, owner: object) -> logging.Logger:
+    """Child of response_logger(client) that logs the bodies of owner alone, already on
+
+    Its records still propagate to the handlers of the parent loggers.
+    """
+    logger = response_logger(f"{client}.{id(owner):x}")
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def enable_response_bodies(enabled: bool = True) -> None:
+    """Turn response body logging on or off for every client"""
+    logging.getLogger(RESPONSE_LOGGER).setLevel(logging.DEBUG if enabled else _OFF)
+
+
+class _Body:
+    """Response text cut to limit characters when formatted"""
+
+    __slots__ = ("text", "limit")
+
+    def __init__(self, text: str, limit: int):
+        self.text = text
+        self.limit = limit
+
+    def __str__(self) -> str:
+        if len(self.text) <= self.limit:
+            return self.text
+        return f"{self.text[:self.limit]}... [{len(self.text) - self.limit} more characters]"
+
+
+def log_response(logger: logging.Logger, endpoint: str, r, limit: int = BODY_LIMIT) -> None:
+    """Log the body of response r at DEBUG; r.text is not even decoded when logger is off"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s %s: %s", endpoint, r.status_code, _Body(r.text, limit))
+
+
+def configure_logging(
+    level: int = logging.INFO,
+    handlers: Iterable[logging.Handler] = (),
+    log_file: str | Path | None = None,
+    stderr: bool = False,
+    response_bodies: bool = False,
+) -> list[logging.Handler]:
+    """Send application records at level and above to handlers, a log file and/or stderr
+
+    Handlers go on the root logger, so warnings of libraries reach them too.
+    Calling it again replaces the handlers installed by the previous call.
+
+    Args:
+        level: Lowest level logged by the application's modules (APP_LOGGER)
+        handlers: Handlers of the caller, e.g. one feeding the GUI
+        log_file: File rotated at LOG_FILE_MAX_BYTES, keeping LOG_FILE_BACKUPS
+        stderr: Whether to log to sys.stderr as well
+        response_bodies: Whether to log response bodies (see enable_response_bodies)
+
+    Returns:
+        The handlers now installed
+    """
+    root = logging.getLogger()
+    for handler in _installed:
+        root.removeHandler(handler)
+        handler.close()
+    _installed.clear()
+
+    formatter = logging.Formatter(FORMAT)
+    if log_file is not None:
+        log_file = Path(log_file)
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS, encoding="utf-8", delay=True
+        )
+        file_handler.setFormatter(formatter)
+        _installed.append(file_handler)
+    if stderr and sys.stderr is not None:
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(formatter)
+        _installed.append(stream_handler)
+    _installed.extend(handlers)
+
+    for handler in _installed:
+        root.addHandler(handler)
+    logging.getLogger(APP_LOGGER).setLevel(level)
+    enable_response_bodies(response_bodies)
+    return list(_installed)
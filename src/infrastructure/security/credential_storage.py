@@ -1,10 +1,22 @@
 """Secure credential storage using SQLite with AES-256-CBC encryption"""
-from src.infrastructure.security.dto import LoginCredentials, PaymentCredentials
+import threading
+import time
+from typing import Callable
+
+from src.infrastructure.security.dto import LoginCredentials, PaymentCredentials, StoredCredentials
 from src.infrastructure.security.encryption import EncryptionService
 from src.infrastructure.database.session import DatabaseManager
 from src.domain.repositories.credential_repository import IUserRepository, ICardRepository
 
 
+TRAIN_TYPES = ("KORAIL", "SRT")
+
+
+def _train_type_key(train_type) -> str:
+    """Normalize a stored train type (enum or plain string) to KORAIL or SRT"""
+    return getattr(train_type, "value", train_type)
+
+
 class CredentialStorage:
     """
     SQLite-based secure credential storage with AES-256-CBC encryption
@@ -15,12 +27,18 @@ class CredentialStorage:
     This class follows Clean Architecture principles:
     - Depends on domain interfaces (IUserRepository, ICardRepository)
     - Infrastructure implementations are injected via constructor
+
+    Decrypted credentials are kept in a write-through in-memory cache, so repeated
+    loads cost no database or decryption work. save_*/delete_* update the cache,
+    and with cache_idle_timeout set the cache is dropped after that many seconds
+    without access.
     """
 
     def __init__(
         self,
         user_repository: IUserRepository,
-        card_repository: ICardRepository
+        card_repository: ICardRepository,
+        cache_idle_timeout: float | None = None
     ) -> None:
         """
         Initialize credential storage with repository dependencies
@@ -28,12 +46,198 @@ class CredentialStorage:
         Args:
             user_repository: Implementation of IUserRepository
             card_repository: Implementation of ICardRepository
+            cache_idle_timeout: Seconds without access after which decrypted
+                credentials are dropped from memory (None keeps them)
         """
         self._user_repo = user_repository
         self._card_repo = card_repository
+        self._cache_idle_timeout = cache_idle_timeout
+        self._cache: dict[tuple[str, str], LoginCredentials | PaymentCredentials | None] = {}
+        self._cache_lock = threading.RLock()
+        self._last_access = time.monotonic()
+        self._idle_timer: threading.Timer | None = None
         # Ensure database is initialized when instance is created
         DatabaseManager.initialize()
 
+    # Decrypted credential cache
+    def clear_cache(self) -> None:
+        """Drop all decrypted credentials held in memory"""
+        with self._cache_lock:
+            self._cache.clear()
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+
+    def _cached(self, key: tuple[str, str], loader: Callable[[], LoginCredentials | PaymentCredentials | None]):
+        """Return the cached value for key, loading it from the database on a miss"""
+        with self._cache_lock:
+            self._touch()
+            if key not in self._cache:
+                self._cache[key] = loader()
+                self._schedule_idle_clear()
+            return self._cache[key]
+
+    def _remember(self, key: tuple[str, str], value: LoginCredentials | PaymentCredentials | None) -> None:
+        """Write a freshly saved or deleted value through to the cache"""
+        with self._cache_lock:
+            self._touch()
+            self._cache[key] = value
+            self._schedule_idle_clear()
+
+    def _touch(self) -> None:
+        """Record an access, dropping the cache first if it has been idle too long"""
+        now = time.monotonic()
+        if (
+            self._cache_idle_timeout is not None
+            and now - self._last_access >= self._cache_idle_timeout
+        ):
+            self._cache.clear()
+        self._last_access = now
+
+    def _schedule_idle_clear(self) -> None:
+        """Start the idle timer that drops the cache while nobody is using it"""
+        if self._cache_idle_timeout is None or self._idle_timer is not None:
+            return
+        self._idle_timer = threading.Timer(self._cache_idle_timeout, self._on_idle_timer)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _on_idle_timer(self) -> None:
+        with self._cache_lock:
+            self._idle_timer = None
+            remaining = self._cache_idle_timeout - (time.monotonic() - self._last_access)
+            if remaining <= 0:
+                self._cache.clear()
+            elif self._cache:
+                # Accessed since the timer started: wait for the rest of the period
+                self._idle_timer = threading.Timer(remaining, self._on_idle_timer)
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+
+    # Batch access
+    def load_all(self) -> StoredCredentials:
+        """
+        Load every saved login and card (decrypted)
+
+        Users and cards are read with one query each inside a single transaction.
+
+        Rows that no longer decrypt (e.g. after the key changed) are deleted,
+        as load_ktx_login() does for its row.
+
+        Returns:
+            StoredCredentials holding only the entries that exist and decrypt
+        """
+        keys = [(kind, train_type) for kind in ("login", "payment") for train_type in TRAIN_TYPES]
+
+        with self._cache_lock:
+            self._touch()
+            if not all(key in self._cache for key in keys):
+                self._cache.update(self._read_all())
+                self._schedule_idle_clear()
+
+            stored = StoredCredentials()
+            for kind, train_type in keys:
+                value = self._cache.get((kind, train_type))
+                if value is not None:
+                    target = stored.logins if kind == "login" else stored.payments
+                    target[train_type] = value
+            return stored
+
+    def save_all(self, credentials: StoredCredentials) -> None:
+        """
+        Save several logins and cards (encrypted) in a single transaction
+
+        Entries absent from credentials are left untouched.
+
+        Args:
+            credentials: Logins and payments keyed by train type ("KORAIL" or "SRT")
+        """
+        logins = list(credentials.logins.items())
+        payments = list(credentials.payments.items())
+
+        plaintexts = []
+        for _, login in logins:
+            plaintexts += [login.username, login.password]
+        for _, payment in payments:
+            plaintexts += [payment.card_number, payment.card_password,
+                           payment.expire, payment.validation_number]
+        encrypted = iter([EncryptionService.encrypt(plaintext) for plaintext in plaintexts])
+
+        user_entries = [
+            {"username": next(encrypted), "password": next(encrypted), "train_type": train_type}
+            for train_type, _ in logins
+        ]
+        card_entries = [
+            {
+                "card_number": next(encrypted),
+                "card_password": next(encrypted),
+                "card_expired_date": next(encrypted),
+                "card_validate_number": next(encrypted),
+                "is_corporate": payment.is_corporate,
+                "train_type": train_type,
+            }
+            for train_type, payment in payments
+        ]
+
+        with DatabaseManager.get_session():
+            if user_entries:
+                self._user_repo.save_all(user_entries)
+            if card_entries:
+                self._card_repo.save_all(card_entries)
+
+        for train_type, login in logins:
+            self._remember(("login", train_type), login)
+        for train_type, payment in payments:
+            self._remember(("payment", train_type), payment)
+
+    def _read_all(self) -> dict[tuple[str, str], LoginCredentials | PaymentCredentials | None]:
+        with DatabaseManager.get_session():
+            users = self._user_repo.find_all()
+            cards = self._card_repo.find_all()
+
+        encrypted = []
+        for user in users:
+            encrypted += [user.username, user.password]
+        for card in cards:
+            encrypted += [card.card_number, card.card_password,
+                          card.card_expired_date, card.card_validate_number]
+        decrypted = iter([EncryptionService.decrypt(value) for value in encrypted])
+
+        values: dict[tuple[str, str], LoginCredentials | PaymentCredentials | None] = {
+            (kind, train_type): None for kind in ("login", "payment") for train_type in TRAIN_TYPES
+        }
+        corrupted_users, corrupted_cards = [], []
+        for user in users:
+            username, password = next(decrypted), next(decrypted)
+            if username and password:
+                values[("login", _train_type_key(user.train_type))] = LoginCredentials(
+                    username=username, password=password
+                )
+            else:
+                corrupted_users.append(_train_type_key(user.train_type))
+        for card in cards:
+            fields = [next(decrypted) for _ in range(4)]
+            if all(fields):
+                card_number, card_password, expire, validation_number = fields
+                values[("payment", _train_type_key(card.train_type))] = PaymentCredentials(
+                    card_number=card_number,
+                    card_password=card_password,
+                    expire=expire,
+                    validation_number=validation_number,
+                    is_corporate=card.is_corporate
+                )
+            else:
+                corrupted_cards.append(_train_type_key(card.train_type))
+
+        if corrupted_users or corrupted_cards:
+            # Decryption failed - delete corrupted data
+            with DatabaseManager.get_session():
+                for train_type in corrupted_users:
+                    self._user_repo.delete(train_type)
+                for train_type in corrupted_cards:
+                    self._card_repo.delete(train_type)
+        return values
+
     # KTX Login Credentials
     def save_ktx_login(self, username: str, password: str) -> None:
         """Save KTX login credentials (encrypted)"""
@@ -47,9 +251,13 @@ class CredentialStorage:
             password=encrypted_password,
             train_type="KORAIL"
         )
+        self._remember(("login", "KORAIL"), LoginCredentials(username=username, password=password))
 
     def load_ktx_login(self) -> LoginCredentials | None:
         """Load KTX login credentials (decrypted)"""
+        return self._cached(("login", "KORAIL"), self._read_ktx_login)
+
+    def _read_ktx_login(self) -> LoginCredentials | None:
         try:
             # Load using repository
             user = self._user_repo.find_by_train_type("KORAIL")
@@ -77,6 +285,7 @@ class CredentialStorage:
     def delete_ktx_login(self) -> None:
         """Delete KTX login credentials"""
         self._user_repo.delete("KORAIL")
+        self._remember(("login", "KORAIL"), None)
 
     # SRT Login Credentials
     def save_srt_login(self, username: str, password: str) -> None:
@@ -91,9 +300,13 @@ class CredentialStorage:
             password=encrypted_password,
             train_type="SRT"
         )
+        self._remember(("login", "SRT"), LoginCredentials(username=username, password=password))
 
     def load_srt_login(self) -> LoginCredentials | None:
         """Load SRT login credentials (decrypted)"""
+        return self._cached(("login", "SRT"), self._read_srt_login)
+
+    def _read_srt_login(self) -> LoginCredentials | None:
         # Load using repository
         user = self._user_repo.find_by_train_type("SRT")
 
@@ -110,6 +323,7 @@ class CredentialStorage:
     def delete_srt_login(self) -> None:
         """Delete SRT login credentials"""
         self._user_repo.delete("SRT")
+        self._remember(("login", "SRT"), None)
 
     # Payment Credentials
     def save_payment(
@@ -147,6 +361,16 @@ class CredentialStorage:
             is_corporate=is_corporate,
             train_type=train_type
         )
+        self._remember(
+            ("payment", train_type),
+            PaymentCredentials(
+                card_number=card_number,
+                card_password=card_password,
+                expire=expire,
+                validation_number=validation_number,
+                is_corporate=is_corporate
+            )
+        )
 
     def load_payment(self, train_type: str = "KORAIL") -> PaymentCredentials | None:
         """
@@ -158,6 +382,9 @@ class CredentialStorage:
         Returns:
             PaymentCredentials if found, None otherwise
         """
+        return self._cached(("payment", train_type), lambda: self._read_payment(train_type))
+
+    def _read_payment(self, train_type: str) -> PaymentCredentials | None:
         # Load using repository
         card = self._card_repo.find_by_train_type(train_type)
 
@@ -187,3 +414,4 @@ class CredentialStorage:
             train_type: "KORAIL" or "SRT" (default: "KORAIL")
         """
         self._card_repo.delete(train_type)
+        self._remember(("payment", train_type), None)
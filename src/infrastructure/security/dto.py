@@ -1,5 +1,5 @@
 """Data Transfer Objects for security credentials"""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -17,3 +17,10 @@ class PaymentCredentials:
     expire: str
     validation_number: str  # 생년월일 또는 사업자번호
     is_corporate: bool
+
+
+@dataclass
+class StoredCredentials:
+    """All saved credentials, keyed by train type ("KORAIL" or "SRT")"""
+    logins: dict[str, LoginCredentials] = field(default_factory=dict)
+    payments: dict[str, PaymentCredentials] = field(default_factory=dict)
@@ -1,16 +1,27 @@
 """AES-256-CBC encryption utility using machine ID as encryption key"""
 import hashlib
+import logging
 import platform
 import subprocess
+import threading
 from base64 import b64encode, b64decode
 
 from Crypto.Cipher import AES
 from Crypto.Random import get_random_bytes
 from Crypto.Util.Padding import pad, unpad
 
+log = logging.getLogger(__name__)
+
 
 class EncryptionService:
-    """AES-256-CBC encryption service using machine-specific identifier as key"""
+    """AES-256-CBC encryption service using machine-specific identifier as key
+
+    The derived key is cached process-wide after the first use, since looking up
+    the machine ID may spawn a subprocess. Call clear_key_cache() to reset it.
+    """
+
+    _cached_key: bytes | None = None
+    _key_lock = threading.Lock()
 
     @staticmethod
     def _get_machine_id() -> str:
@@ -66,21 +77,32 @@ class EncryptionService:
 
         except Exception as e:
             # If all else fails, fall back to a combination of system identifiers
-            print(f"Warning: Could not get machine ID ({e}), using fallback method")
-            pass
+            log.warning("Could not get machine ID (%s), using fallback method", e)
 
         # Fallback: use a combination of hostname and platform info
         import socket
         fallback_id = f"{socket.gethostname()}-{platform.node()}-{platform.machine()}"
         return fallback_id
 
-    @staticmethod
-    def _derive_key() -> bytes:
-        """Derive a 256-bit key from the machine ID using SHA-256"""
-        machine_id = EncryptionService._get_machine_id()
-        # Use SHA-256 to derive a 32-byte (256-bit) key from machine ID
-        key = hashlib.sha256(machine_id.encode('utf-8')).digest()
-        return key
+    @classmethod
+    def _derive_key(cls) -> bytes:
+        """Derive a 256-bit key from the machine ID using SHA-256 (cached)"""
+        key = cls._cached_key
+        if key is not None:
+            return key
+
+        with cls._key_lock:
+            if cls._cached_key is None:
+                machine_id = cls._get_machine_id()
+                # Use SHA-256 to derive a 32-byte (256-bit) key from machine ID
+                cls._cached_key = hashlib.sha256(machine_id.encode('utf-8')).digest()
+            return cls._cached_key
+
+    @classmethod
+    def clear_key_cache(cls) -> None:
+        """Forget the cached key so the next call derives it again (used by tests)"""
+        with cls._key_lock:
+            cls._cached_key = None
 
     @staticmethod
     def encrypt(plaintext: str) -> str:
@@ -146,5 +168,5 @@ class EncryptionService:
 
         except Exception as e:
             # Decryption failed (wrong key, corrupted data, etc.)
-            print(f"Decryption error: {e}")
+            log.error("Decryption error: %s", e)
             return None
@@ -0,0 +1,4 @@
+"""Export and analysis of reservation attempt traces"""
+from .jsonl_exporter import JsonlSpanExporter, default_trace_path
+
+__all__ = ["JsonlSpanExporter", "default_trace_path"]
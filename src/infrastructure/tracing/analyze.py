@@ -0,0 +1,168 @@
+"""Report where the wall time of reservation attempts goes
+
+Reads trace files written by JsonlSpanExporter (a file and its rotated
+backups, oldest first) and summarizes them:
+
+- attempts by result and by service, and their total wall time
+- per span name: count, errors, total and self time (time not spent in
+  child spans), the share of all attempt time spent in it, and p50/p95/max
+  durations
+- the pause between consecutive attempts of one loop, i.e. retry pacing
+
+Usage:
+    python -m src.infrastructure.tracing.analyze ~/.ktx-srt-macro/traces/attempts.jsonl
+"""
+import argparse
+import json
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT_NAME = "attempt"
+
+
+def trace_files(path: str | Path) -> list[Path]:
+    """path and its rotated backups (path.1, path.2, ...), oldest first"""
+    path = Path(path)
+    backups = [p for p in path.parent.glob(f"{path.name}.*") if p.suffix[1:].isdigit()]
+    backups.sort(key=lambda p: int(p.suffix[1:]), reverse=True)
+    return backups + ([path] if path.exists() else [])
+
+
+def load_spans(paths: list[str | Path]) -> list[dict]:
+    """Span records of trace files; unreadable lines (a torn last write) are skipped"""
+    records = []
+    for path in paths:
+        for file in trace_files(path):
+            with open(file, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+    return records
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(len(sorted_values) * percent / 100) - 1))
+    return sorted_values[index]
+
+
+@dataclass
+class SpanStats:
+    """Durations of every span with one name"""
+    name: str
+    durations: list[float] = field(default_factory=list)
+    self_total: float = 0.0
+    errors: Counter = field(default_factory=Counter)
+
+    @property
+    def count(self) -> int:
+        return len(self.durations)
+
+    @property
+    def total(self) -> float:
+        return sum(self.durations)
+
+
+@dataclass
+class TraceSummary:
+    attempts: int = 0
+    attempt_time: float = 0.0
+    results: Counter = field(default_factory=Counter)
+    services: Counter = field(default_factory=Counter)
+    spans: dict[str, SpanStats] = field(default_factory=dict)
+    pauses: list[float] = field(default_factory=list)
+
+
+def summarize(records: list[dict]) -> TraceSummary:
+    """Aggregate span records by name, counting self time and retry pauses"""
+    summary = TraceSummary()
+    by_trace: dict[str, list[dict]] = defaultdict(list)
+    for record in records:
+        by_trace[record["trace"]].append(record)
+
+    roots = []
+    for spans in by_trace.values():
+        child_time: dict[int, float] = defaultdict(float)
+        for span in spans:
+            if span["parent"] is not None:
+                child_time[span["parent"]] += span["end"] - span["start"]
+        for span in spans:
+            duration = span["end"] - span["start"]
+            stats = summary.spans.setdefault(span["name"], SpanStats(span["name"]))
+            stats.durations.append(duration)
+            # Concurrent children (async gathers) can add up to more than their parent
+            stats.self_total += max(0.0, duration - child_time[span["span"]])
+            if "error" in span["attrs"]:
+                stats.errors[span["attrs"]["error"]] += 1
+            if span["parent"] is None:
+                roots.append(span)
+
+    for root in roots:
+        if root["name"] != ROOT_NAME:
+            continue
+        attrs = root["attrs"]
+        summary.attempts += 1
+        summary.attempt_time += root["end"] - root["start"]
+        summary.results[attrs.get("result", "unknown")] += 1
+        summary.services[attrs.get("service", "unknown")] += 1
+
+    # Pauses between attempt n and n + 1 of the same loop
+    loops: dict[tuple, dict[int, dict]] = defaultdict(dict)
+    for root in roots:
+        attrs = root["attrs"]
+        if root["name"] == ROOT_NAME and isinstance(attrs.get("attempt"), int):
+            loops[attrs.get("service"), attrs.get("loop")][attrs["attempt"]] = root
+    for attempts in loops.values():
+        for number, root in attempts.items():
+            following = attempts.get(number + 1)
+            if following is not None and following["start"] >= root["end"]:
+                summary.pauses.append(following["start"] - root["end"])
+    return summary
+
+
+def report(summary: TraceSummary) -> str:
+    """Plain-text tables of a summary"""
+    lines = [
+        f"{summary.attempts} attempts, {summary.attempt_time:.1f}s in attempts",
+        "  results:  " + ", ".join(f"{name} {count}" for name, count in summary.results.most_common()),
+        "  services: " + ", ".join(f"{name} {count}" for name, count in summary.services.most_common()),
+        "",
+        f"  {'span':<20s} {'count':>7s} {'errors':>7s} {'total s':>9s} {'self s':>9s} {'self %':>7s}"
+        f" {'p50 ms':>8s} {'p95 ms':>8s} {'max ms':>9s}",
+    ]
+    for stats in sorted(summary.spans.values(), key=lambda s: s.self_total, reverse=True):
+        durations = sorted(stats.durations)
+        share = stats.self_total / summary.attempt_time * 100 if summary.attempt_time else 0.0
+        lines.append(
+            f"  {stats.name:<20s} {stats.count:7d} {sum(stats.errors.values()):7d} {stats.total:9.2f}"
+            f" {stats.self_total:9.2f} {share:6.1f}% {_percentile(durations, 50) * 1000:8.1f}"
+            f" {_percentile(durations, 95) * 1000:8.1f} {durations[-1] * 1000:9.1f}"
+        )
+    errors = Counter()
+    for stats in summary.spans.values():
+        errors.update({f"{stats.name}: {error}": count for error, count in stats.errors.items()})
+    if errors:
+        lines += ["", "  errors:"] + [f"    {name} {count}" for name, count in errors.most_common()]
+    if summary.pauses:
+        pauses = sorted(summary.pauses)
+        lines += [
+            "",
+            f"  pause between attempts: {len(pauses)} pauses, total {sum(pauses):.1f}s,"
+            f" p50 {_percentile(pauses, 50):.2f}s, p95 {_percentile(pauses, 95):.2f}s, max {pauses[-1]:.2f}s",
+        ]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="trace files; rotated backups are read too")
+    args = parser.parse_args()
+    print(report(summarize(load_spans(args.paths))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Span exporter writing traces to a size-rotated JSON Lines file"""
+import json
+import threading
+from pathlib import Path
+
+from src.domain.services.tracing import Span, SpanExporter
+
+
+def default_trace_path() -> Path:
+    """~/.ktx-srt-macro/traces/attempts.jsonl, next to the credentials database"""
+    return Path.home() / ".ktx-srt-macro" / "traces" / "attempts.jsonl"
+
+
+def span_record(span: Span) -> dict:
+    """JSON-ready form of a span, one line of a trace file"""
+    record = {
+        "trace": span.trace_id,
+        "span": span.span_id,
+        "parent": span.parent_id,
+        "name": span.name,
+        "start": round(span.start, 6),
+        "end": round(span.end, 6),
+        "attrs": span.attributes,
+    }
+    if span.wall_start is not None:
+        record["wall_start"] = round(span.wall_start, 3)
+    return record
+
+
+class JsonlSpanExporter(SpanExporter):
+    """
+    Appends every span as one JSON line to path
+
+    Each trace is written and flushed in one piece. Once the file reaches
+    ``max_bytes`` it is renamed to ``path.1`` (shifting older files up to
+    ``path.<backup_count>``, the oldest dropped) and a new file is started, so
+    the traces never take more than about (backup_count + 1) * max_bytes.
+    Write errors do not reach the traced code; the spans are counted in
+    ``dropped`` instead.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.dropped = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        lines = "".join(
+            json.dumps(span_record(span), ensure_ascii=False, default=str) + "\n" for span in spans
+        )
+        with self._lock:
+            try:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, "a", encoding="utf-8")
+                self._file.write(lines)
+                self._file.flush()
+                if self._file.tell() >= self.max_bytes:
+                    self._rotate()
+            except OSError:
+                self.dropped += len(spans)
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        if self.backup_count <= 0:
+            self.path.unlink()
+            return
+        for n in range(self.backup_count - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{n}")
+            if older.exists():
+                older.replace(self.path.with_name(f"{self.path.name}.{n + 1}"))
+        self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
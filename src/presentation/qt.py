@@ -2,29 +2,42 @@
 import sys
 import os
 import datetime
-import random
 import time
 import threading
 import platform
+import logging
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from collections import deque
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QPushButton, QLineEdit, QTextEdit, QTabWidget,
+    QLabel, QPushButton, QLineEdit, QListView, QTabWidget,
     QCheckBox, QScrollArea, QFrame
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QAbstractListModel, QModelIndex
 from PyQt6.QtGui import QIcon, QPalette, QColor
-from domain.models.entities import ReservationRequest, Passenger, TrainSchedule, ReservationResult, CreditCard, PaymentResult
+from domain.models.entities import ReservationRequest, Passenger, TrainSchedule, CreditCard
 from domain.models.enums import PassengerType, TrainType
+from src.domain.services.reservation_engine import (
+    ReservationEngine, ReservationEvent, ReservationEventType, ReservationJob
+)
+from src.domain.services.tracing import Tracer
 from src.infrastructure.adapters.ktx_service import KTXService
 from src.infrastructure.adapters.srt_service import SRTService
+from src.infrastructure.external.metrics import NETFUNNEL_QUEUE
 from src.infrastructure.security.credential_storage import CredentialStorage
+from src.infrastructure.logs import configure_logging, default_log_path
+from src.infrastructure.tracing import JsonlSpanExporter, default_trace_path
 from src.constants.ui import (
     DEFAULT_KTX_DEPARTURE, DEFAULT_KTX_ARRIVAL,
     DEFAULT_SRT_DEPARTURE, DEFAULT_SRT_ARRIVAL,
-    RETRY_DELAY_MIN, RETRY_DELAY_MAX,
+    PERF_PANEL_FPS, PERF_RATE_WINDOW,
+    LOG_BUFFER_LINES, LOG_FLUSH_INTERVAL_MS, LOG_SPILL_MAX_BYTES, LOG_SPILL_BACKUPS,
 )
 
+log = logging.getLogger(__name__)
+
 
 def resource_path(relative_path):
     """PyInstaller로 패키징된 리소스 파일의 절대 경로를 반환합니다."""
@@ -304,7 +317,7 @@ QCheckBox::indicator:checked {
 }
 
 /* 로그 디스플레이 - Dark */
-QTextEdit#logDisplay {
+QListView#logDisplay {
     background: rgba(17, 24, 39, 0.8);
     color: #10b981;
     border: 1.5px solid rgba(75, 85, 99, 0.3);
@@ -393,6 +406,96 @@ class LogSignals(QObject):
     show_ktx_alert_button = pyqtSignal()  # KTX 알림음 중지 버튼 표시 시그널
 
 
+class LogListModel(QAbstractListModel):
+    """최근 로그 줄만 보관하는 링 버퍼 모델
+
+    append()는 어느 스레드에서나 호출할 수 있으며 줄을 대기열에만 넣습니다.
+    GUI 스레드의 flush()가 모인 줄을 한 번에 행으로 추가하므로 뷰는 줄마다가
+    아니라 flush마다 한 번 다시 그려집니다. max_lines를 넘는 오래된 줄은
+    버려지거나, spill_path가 있으면 크기 기준으로 순환되는 파일에 기록됩니다.
+    """
+
+    def __init__(self, max_lines: int = LOG_BUFFER_LINES, spill_path: str | Path | None = None, parent=None):
+        super().__init__(parent)
+        self.max_lines = max_lines
+        self._lines: deque[str] = deque()
+        self._pending: deque[str] = deque()  # append/popleft는 스레드 안전
+        self._spill = None
+        if spill_path is not None:
+            spill_path = Path(spill_path)
+            spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill = RotatingFileHandler(
+                spill_path, maxBytes=LOG_SPILL_MAX_BYTES, backupCount=LOG_SPILL_BACKUPS,
+                encoding="utf-8", delay=True,
+            )
+            self._spill.setFormatter(logging.Formatter("%(message)s"))
+
+    def append(self, message: str):
+        """로그 한 줄을 대기열에 추가 (스레드 안전)"""
+        timestamp = datetime.datetime.now().strftime('%H:%M:%S')
+        self._pending.append(f"[{timestamp}] {message}")
+
+    def flush(self) -> int:
+        """대기 중인 줄을 모델에 반영하고 추가된 줄 수를 반환"""
+        if not self._pending:
+            return 0
+        batch = [self._pending.popleft() for _ in range(len(self._pending))]
+        evicted = []
+        if len(batch) > self.max_lines:
+            evicted = batch[:-self.max_lines]
+            batch = batch[-self.max_lines:]
+        overflow = len(self._lines) + len(batch) - self.max_lines
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            evicted = [self._lines.popleft() for _ in range(overflow)] + evicted
+            self.endRemoveRows()
+        if evicted and self._spill is not None:
+            for line in evicted:
+                self._spill.handle(logging.makeLogRecord({"msg": line}))
+
+        first = len(self._lines)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self._lines.extend(batch)
+        self.endInsertRows()
+        return len(batch)
+
+    def clear(self):
+        """모든 줄 삭제 (spill 파일은 유지)"""
+        self.beginResetModel()
+        self._lines.clear()
+        self._pending.clear()
+        self.endResetModel()
+
+    def lines(self) -> list[str]:
+        return list(self._lines)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._lines)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._lines[index.row()]
+        return None
+
+
+class LogModelHandler(logging.Handler):
+    """로깅 레코드를 로그 모델로 보내는 핸들러 (어느 스레드에서나 사용 가능)"""
+
+    def __init__(self, model: LogListModel, level=logging.INFO):
+        super().__init__(level)
+        self.model = model
+        self.setFormatter(logging.Formatter("%(message)s"))
+
+    def emit(self, record):
+        try:
+            message = self.format(record)
+            if record.levelno >= logging.WARNING:
+                message = f"⚠️ {message}"
+            self.model.append(message)
+        except Exception:
+            self.handleError(record)
+
+
 class TrainItemWidget(QWidget):
     """열차 항목 위젯"""
     def __init__(self, train_info: str, parent=None):
@@ -442,6 +545,152 @@ class SectionCard(QFrame):
         self.main_layout.addLayout(layout)
 
 
+class PerformancePanel(QFrame):
+    """예약 성능 지표 패널 (접기/펼치기)
+
+    펼쳐져 있는 동안 PERF_PANEL_FPS 주기로 metrics 스냅샷을 읽어 표시합니다.
+    로그 한 줄마다 다시 그리지 않으므로 예약 루프가 빨라져도 UI 부하는 일정합니다.
+    """
+
+    ROWS = (
+        ("rate", "분당 시도"),
+        ("search", "조회 지연 (최근 / p95)"),
+        ("reserve", "예약 지연 (최근 / p95)"),
+        ("queue", "대기열 위치"),
+        ("errors", "오류율"),
+        ("last_search", "마지막 조회 성공"),
+        ("session", "세션 유지 시간"),
+    )
+
+    def __init__(self, metrics, attempts, queue: bool = True, parent=None):
+        """
+        Args:
+            metrics: 서비스의 MetricsRegistry
+            attempts: 현재 예약 루프의 시도 횟수를 반환하는 함수 (루프가 없으면 0)
+            queue: 대기열 위치 표시 여부 (NetFunnel을 거치지 않는 KTX는 False)
+        """
+        super().__init__(parent)
+        self.setObjectName("card")
+        self.metrics = metrics
+        self.attempts = attempts
+        self._samples = deque()  # (time.monotonic(), 시도 횟수)
+
+        self.main_layout = QVBoxLayout(self)
+        self.main_layout.setSpacing(12)
+        self.main_layout.setContentsMargins(20, 12, 20, 12)
+
+        self.toggle_btn = QPushButton("▼ 성능 지표 보기")
+        self.toggle_btn.setObjectName("clearButton")
+        self.toggle_btn.clicked.connect(self.toggle)
+        self.main_layout.addWidget(self.toggle_btn)
+
+        self.content = QWidget()
+        grid = QGridLayout(self.content)
+        grid.setContentsMargins(0, 0, 0, 0)
+        grid.setHorizontalSpacing(16)
+        self.values: dict[str, QLabel] = {}
+        rows = [(key, title) for key, title in self.ROWS if queue or key != "queue"]
+        for row, (key, title) in enumerate(rows):
+            title_label = QLabel(title)
+            title_label.setStyleSheet("color: #9ca3af;")
+            value_label = QLabel("-")
+            grid.addWidget(title_label, row, 0)
+            grid.addWidget(value_label, row, 1)
+            self.values[key] = value_label
+        self.content.setVisible(False)
+        self.main_layout.addWidget(self.content)
+
+        # 펼쳐져 있을 때만 동작하는 고정 주기 타이머
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000 // PERF_PANEL_FPS)
+        self.timer.timeout.connect(self._tick)
+
+    @property
+    def expanded(self) -> bool:
+        return not self.content.isHidden()
+
+    def toggle(self):
+        """지표 보기/숨기기 토글"""
+        expanded = not self.expanded
+        self.content.setVisible(expanded)
+        if expanded:
+            self.toggle_btn.setText("▲ 성능 지표 숨기기")
+            self.refresh()
+            self.timer.start()
+        else:
+            self.toggle_btn.setText("▼ 성능 지표 보기")
+            self.timer.stop()
+
+    def _tick(self):
+        # 다른 탭에 가려진 패널은 건너뜀
+        if self.isVisible():
+            self.refresh()
+
+    def refresh(self, now: float | None = None):
+        """metrics 스냅샷으로 모든 값 갱신"""
+        now = time.monotonic() if now is None else now
+        snapshot = self.metrics.snapshot()
+        queue = self.metrics.gauges().get(NETFUNNEL_QUEUE)
+        search = snapshot.get("search_schedule")
+        login = snapshot.get("login")
+
+        self._set("rate", self._attempt_rate(now))
+        self._set("search", self._latency(search))
+        self._set("reserve", self._latency(snapshot.get("reserve")))
+        self._set("queue", "-" if queue is None else f"{queue:,}명" if queue else "대기 없음")
+        self._set("errors", self._error_rates(snapshot))
+        self._set("last_search", self._since(now, search, "전"))
+        self._set("session", self._since(now, login, ""))
+
+    def _set(self, key: str, text: str):
+        label = self.values.get(key)
+        if label is not None and label.text() != text:
+            label.setText(text)
+
+    def _attempt_rate(self, now: float) -> str:
+        attempts = self.attempts()
+        if self._samples and attempts < self._samples[-1][1]:
+            self._samples.clear()  # 새 예약 루프
+        self._samples.append((now, attempts))
+        while now - self._samples[0][0] > PERF_RATE_WINDOW:
+            self._samples.popleft()
+        start, first = self._samples[0]
+        if now - start <= 0:
+            return "-"
+        return f"{(attempts - first) * 60 / (now - start):.1f}회"
+
+    @staticmethod
+    def _latency(endpoint) -> str:
+        if endpoint is None:
+            return "-"
+        return f"{endpoint.last * 1000:.0f} ms / {endpoint.p95 * 1000:.0f} ms"
+
+    @staticmethod
+    def _error_rates(snapshot) -> str:
+        calls = sum(endpoint.count for endpoint in snapshot.values())
+        errors: dict[str, int] = {}
+        for endpoint in snapshot.values():
+            for name, count in endpoint.errors.items():
+                errors[name] = errors.get(name, 0) + count
+        if not errors:
+            return "없음" if calls else "-"
+        top = sorted(errors.items(), key=lambda item: item[1], reverse=True)[:3]
+        return ", ".join(f"{name} {count / calls:.1%}" for name, count in top)
+
+    @staticmethod
+    def _since(now: float, endpoint, suffix: str) -> str:
+        if endpoint is None or endpoint.last_success is None:
+            return "-"
+        seconds = int(now - endpoint.last_success)
+        if seconds < 60:
+            text = f"{seconds}초"
+        elif seconds < 3600:
+            text = f"{seconds // 60}분 {seconds % 60}초"
+        else:
+            text = f"{seconds // 3600}시간 {seconds % 3600 // 60}분"
+        return f"{text} {suffix}".rstrip()
+
+
 class TrainReservationApp(QMainWindow):
     """기차표 예약 메인 윈도우"""
 
@@ -468,18 +717,32 @@ class TrainReservationApp(QMainWindow):
         # 서비스 초기화
         self.ktx_service = KTXService()
         self.srt_service = SRTService()
+        # 예약 시도별 구간 기록 (~/.ktx-srt-macro/traces, 분석: python -m src.infrastructure.tracing.analyze)
+        self.tracer = Tracer(JsonlSpanExporter(default_trace_path()))
 
         # 상태 변수
         self.ktx_trains = []
         self.srt_trains = []
         self.ktx_train_widgets = []
         self.srt_train_widgets = []
-        self.is_ktx_running = False
-        self.is_srt_running = False
+        self.ktx_engine: ReservationEngine | None = None
+        self.srt_engine: ReservationEngine | None = None
         self.is_log_visible = False
         self.is_alert_playing = False
         self.alert_thread = None
 
+        # 로그 (링 버퍼, 밀려난 줄은 ~/.ktx-srt-macro/logs/ui.log로)
+        self.log_model = LogListModel(spill_path=Path.home() / ".ktx-srt-macro" / "logs" / "ui.log")
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self.log_flush_timer.timeout.connect(self.flush_log)
+        # 모듈 로그: 화면(INFO 이상), ~/.ktx-srt-macro/logs/app.log, 콘솔이 있으면 stderr
+        configure_logging(
+            handlers=[LogModelHandler(self.log_model)],
+            log_file=default_log_path(),
+            stderr=sys.stderr is not None,
+        )
+
         # 로그 시그널
         self.log_signals = LogSignals()
         self.log_signals.log_message.connect(self.append_log)
@@ -495,6 +758,8 @@ class TrainReservationApp(QMainWindow):
         # 저장된 자격 증명 로드
         self.load_saved_credentials()
 
+        self.log_flush_timer.start()
+
     def init_ui(self):
         """UI 초기화"""
         # 중앙 위젯
@@ -752,6 +1017,14 @@ class TrainReservationApp(QMainWindow):
         self.ktx_action_widget.setVisible(False)
         layout.addWidget(self.ktx_action_widget)
 
+        # 성능 지표
+        self.ktx_perf_panel = PerformancePanel(
+            self.ktx_service.metrics,
+            lambda: self.ktx_engine.attempt if self.ktx_engine else 0,
+            queue=False,
+        )
+        layout.addWidget(self.ktx_perf_panel)
+
         layout.addStretch()
         scroll.setWidget(container)
 
@@ -977,6 +1250,13 @@ class TrainReservationApp(QMainWindow):
         self.srt_action_widget.setVisible(False)
         layout.addWidget(self.srt_action_widget)
 
+        # 성능 지표
+        self.srt_perf_panel = PerformancePanel(
+            self.srt_service.metrics,
+            lambda: self.srt_engine.attempt if self.srt_engine else 0,
+        )
+        layout.addWidget(self.srt_perf_panel)
+
         layout.addStretch()
         scroll.setWidget(container)
 
@@ -1010,10 +1290,14 @@ class TrainReservationApp(QMainWindow):
 
         main_layout.addLayout(header_layout)
 
-        # 로그 디스플레이
-        self.log_display = QTextEdit()
+        # 로그 디스플레이 (보이는 줄만 그리는 리스트 뷰)
+        self.log_display = QListView()
         self.log_display.setObjectName("logDisplay")
-        self.log_display.setReadOnly(True)
+        self.log_display.setModel(self.log_model)
+        self.log_display.setUniformItemSizes(True)
+        self.log_display.setWordWrap(False)
+        self.log_display.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.log_display.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
         self.log_display.setMinimumHeight(200)
         self.log_display.setMaximumHeight(250)
         main_layout.addWidget(self.log_display)
@@ -1021,38 +1305,45 @@ class TrainReservationApp(QMainWindow):
         return card
 
     def add_log(self, message: str):
-        """로그 추가 (스레드 안전)"""
-        self.log_signals.log_message.emit(message)
+        """로그 추가 (스레드 안전, 다음 flush에 표시)"""
+        self.log_model.append(message)
 
     def append_log(self, message: str):
-        """로그 표시"""
-        timestamp = datetime.datetime.now().strftime('%H:%M:%S')
-        self.log_display.append(f"[{timestamp}] {message}")
+        """로그 표시 (log_message 시그널용)"""
+        self.log_model.append(message)
+
+    def flush_log(self):
+        """모인 로그를 한 번에 표시하고, 맨 아래를 보고 있었다면 계속 따라감"""
         scrollbar = self.log_display.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        if self.log_model.flush() and at_bottom:
+            self.log_display.scrollToBottom()
 
     def clear_log(self):
         """로그 지우기"""
-        self.log_display.clear()
+        self.log_model.clear()
 
     def load_saved_credentials(self):
         """저장된 자격 증명 로드"""
+        # 로그인/결제 정보를 한 번에 로드
+        stored = self.credential_storage.load_all()
+
         # KTX 로그인 정보 로드
-        ktx_login = self.credential_storage.load_ktx_login()
+        ktx_login = stored.logins.get("KORAIL")
         if ktx_login:
             self.ktx_id_input.setText(ktx_login.username)
             self.ktx_pw_input.setText(ktx_login.password)
             self.ktx_save_login_check.setChecked(True)
 
         # SRT 로그인 정보 로드
-        srt_login = self.credential_storage.load_srt_login()
+        srt_login = stored.logins.get("SRT")
         if srt_login:
             self.srt_id_input.setText(srt_login.username)
             self.srt_pw_input.setText(srt_login.password)
             self.srt_save_login_check.setChecked(True)
 
         # KTX 결제 정보 로드
-        ktx_payment = self.credential_storage.load_payment("KORAIL")
+        ktx_payment = stored.payments.get("KORAIL")
         if ktx_payment:
             self.ktx_payment_card_num_input.setText(ktx_payment.card_number)
             self.ktx_payment_card_pw_input.setText(ktx_payment.card_password)
@@ -1065,7 +1356,7 @@ class TrainReservationApp(QMainWindow):
             self.ktx_save_payment_check.setChecked(True)
 
         # SRT 결제 정보 로드
-        srt_payment = self.credential_storage.load_payment("SRT")
+        srt_payment = stored.payments.get("SRT")
         if srt_payment:
             self.srt_payment_card_num_input.setText(srt_payment.card_number)
             self.srt_payment_card_pw_input.setText(srt_payment.card_password)
@@ -1132,17 +1423,9 @@ class TrainReservationApp(QMainWindow):
             departure_time = self.ktx_time_input.text() + "00"
 
             # 승객 정보 수집
-            passengers = []
-            adult_count = int(self.ktx_adult_input.text() or "0")
-            child_count = int(self.ktx_child_input.text() or "0")
-            senior_count = int(self.ktx_senior_input.text() or "0")
-
-            if adult_count > 0:
-                passengers.append(Passenger(PassengerType.ADULT, adult_count))
-            if child_count > 0:
-                passengers.append(Passenger(PassengerType.CHILD, child_count))
-            if senior_count > 0:
-                passengers.append(Passenger(PassengerType.SENIOR, senior_count))
+            passengers = self._collect_passengers(
+                self.ktx_adult_input, self.ktx_child_input, self.ktx_senior_input
+            )
 
             if not passengers:
                 self.add_log("✗ 최소 1명 이상의 승객이 필요합니다")
@@ -1224,154 +1507,65 @@ class TrainReservationApp(QMainWindow):
             return
 
         # 결제 정보 미리 저장 (체크박스가 체크되어 있고 정보가 유효한 경우)
-        if self.ktx_save_payment_check.isChecked() and self._validate_ktx_payment_info():
+        credit_card = self._ktx_credit_card()
+        if self.ktx_save_payment_check.isChecked() and credit_card:
             try:
-                card_number = self.ktx_payment_card_num_input.text()
-                card_pw = self.ktx_payment_card_pw_input.text()
-                is_corporate = self.ktx_payment_corporate_check.isChecked()
-                validation_number = (
-                    self.ktx_payment_birth_input.text()
-                    if not is_corporate
-                    else self.ktx_payment_business_num_input.text()
-                )
-                expire = self.ktx_payment_expire_input.text()
-
                 self.credential_storage.save_payment(
-                    card_number=card_number,
-                    card_password=card_pw,
-                    expire=expire,
-                    validation_number=validation_number,
-                    is_corporate=is_corporate,
+                    card_number=credit_card.number,
+                    card_password=credit_card.password,
+                    expire=credit_card.expire,
+                    validation_number=credit_card.validation_number,
+                    is_corporate=credit_card.is_corporate,
                     train_type="KORAIL"
                 )
             except Exception:
                 pass  # 저장 실패 시 조용히 무시
 
-        self.is_ktx_running = True
+        selected_trains = [self.ktx_trains[i] for i in selected_indices]
+        job = ReservationJob(
+            trains=selected_trains,
+            request=self._build_ktx_request(selected_trains[0]),
+            user_id=self.ktx_id_input.text(),
+            password=self.ktx_pw_input.text(),
+            credit_card=credit_card
+        )
+        self.ktx_engine = ReservationEngine(self.ktx_service, job, self._on_ktx_event, tracer=self.tracer)
+
         self.ktx_start_btn.setEnabled(False)
         self.ktx_stop_btn.setEnabled(True)
 
         self.add_log("🚀 KTX 예약을 시작합니다")
 
-        threading.Thread(
-            target=self._ktx_reservation_loop,
-            args=(selected_indices,),
-            daemon=True
-        ).start()
-
-    def _ktx_reservation_loop(self, selected_indices):
-        """KTX 예약 루프"""
-        selected_trains = [self.ktx_trains[i] for i in selected_indices]
-        attempt = 0
-
-        # 승객 정보 수집
-        passengers = []
-        adult_count = int(self.ktx_adult_input.text() or "0")
-        child_count = int(self.ktx_child_input.text() or "0")
-        senior_count = int(self.ktx_senior_input.text() or "0")
-
-        if adult_count > 0:
-            passengers.append(Passenger(PassengerType.ADULT, adult_count))
-        if child_count > 0:
-            passengers.append(Passenger(PassengerType.CHILD, child_count))
-        if senior_count > 0:
-            passengers.append(Passenger(PassengerType.SENIOR, senior_count))
-
-        while self.is_ktx_running:
-            attempt += 1
-            self.add_log(f"🔄 예약 시도 #{attempt}")
-
-            # 500번마다 세션 초기화
-            if attempt % 500 == 0:
-                self.add_log("🔄 세션 초기화 중...")
-                try:
-                    username = self.ktx_id_input.text()
-                    password = self.ktx_pw_input.text()
-                    self.ktx_service.clear()
-                    self.add_log("✓ 세션 초기화 완료")
-                    self.add_log("🔐 재로그인 중...")
-                    login_result = self.ktx_service.login(username, password)
-                    if login_result:
-                        self.add_log("✓ 재로그인 성공")
-                    else:
-                        self.add_log("✗ 재로그인 실패")
-                        self.is_ktx_running = False
-                        return
-                except Exception as e:
-                    self.add_log(f"✗ 세션 초기화 중 오류: {str(e)}")
-                    self.is_ktx_running = False
-                    return
+        self.ktx_engine.start()
+
+    def _build_ktx_request(self, first_train: TrainSchedule) -> ReservationRequest:
+        """선택한 열차 기준 KTX 예약 요청 생성"""
+        return ReservationRequest(
+            departure_station=first_train.departure_station,
+            arrival_station=first_train.arrival_station,
+            departure_date=first_train.departure_time.date(),
+            departure_time=first_train.departure_time.strftime("%H%M%S"),
+            passengers=self._collect_passengers(
+                self.ktx_adult_input, self.ktx_child_input, self.ktx_senior_input
+            ),
+            train_type=TrainType.KTX,
+            is_special_seat_allowed=self.ktx_special_seat_check.isChecked(),
+            is_only_special_seat=self.ktx_only_special_seat_check.isChecked()
+        )
 
-            try:
-                # 선택한 모든 열차를 한 번에 시도
-                train_numbers = ", ".join([t.train_number for t in selected_trains])
-                self.add_log(f"  → 열차 예약 시도 중: {train_numbers}")
-
-                request = ReservationRequest(
-                    departure_station=selected_trains[0].departure_station,
-                    arrival_station=selected_trains[0].arrival_station,
-                    departure_date=selected_trains[0].departure_time.date(),
-                    departure_time=selected_trains[0].departure_time.strftime("%H%M%S"),
-                    passengers=passengers,
-                    train_type=TrainType.KTX,
-                    is_special_seat_allowed=self.ktx_special_seat_check.isChecked(),
-                    is_only_special_seat=self.ktx_only_special_seat_check.isChecked()
-                )
-                reservation = self.ktx_service.reserve_train(selected_trains, request)
-                if reservation.success:
-                    self.add_log(f"  ✓ 예약 성공! (열차: {reservation.train_schedule.train_number})")
-                    self.add_log(f"  예약번호: {reservation.reservation_number}")
-
-                    # 결제 정보 검증
-                    if not self._validate_ktx_payment_info():
-                        self.add_log("  ✗ 예약은 완료되었으나 결제 정보가 입력되지 않았습니다.")
-                        self.add_log(f"    예약번호: {reservation.reservation_number}")
-                        self.add_log("    알림음 중지 버튼을 눌러 알림음을 중지하고")
-                        self.add_log("    앱에 들어가 10분 내에 결제해주세요.")
-                        self.is_ktx_running = False  # 예약 루프 중지
-                        # 반복 알림음 재생 시작
-                        self.alert_thread = threading.Thread(target=self._play_alert_sound_loop, daemon=True)
-                        self.alert_thread.start()
-                        # 시그널로 알림음 중지 버튼 표시
-                        self.log_signals.show_ktx_alert_button.emit()
-                        return  # 예약 루프 종료
-
-                    # 결제 진행
-                    payment = self._process_ktx_payment(reservation)
-
-                    if payment.success:
-                        self.add_log(f"  ✓ 결제 완료!")
-                        self.is_ktx_running = False
-                        # 버튼 상태 업데이트
-                        QTimer.singleShot(0, lambda: self.ktx_start_btn.setEnabled(True))
-                        QTimer.singleShot(0, lambda: self.ktx_stop_btn.setEnabled(False))
-                        return  # 예약 루프 종료
-                    else:
-                        self.add_log("  ✗ 예약은 완료되었으나 결제에 실패했습니다.")
-                        self.add_log(f"    예약번호: {payment.reservation_number}")
-                        self.add_log("    알림음 중지 버튼을 눌러 알림음을 중지하고")
-                        self.add_log("    앱에 들어가 10분 내에 결제해주세요.")
-                        self.is_ktx_running = False  # 예약 루프 중지
-                        # 반복 알림음 재생 시작
-                        self.alert_thread = threading.Thread(target=self._play_alert_sound_loop, daemon=True)
-                        self.alert_thread.start()
-                        # 시그널로 알림음 중지 버튼 표시
-                        self.log_signals.show_ktx_alert_button.emit()
-                        return  # 예약 루프 종료
-                else:
-                    self.add_log(f"  ✗ 예약 실패: {reservation.message}")
-                    delay = random.uniform(RETRY_DELAY_MIN, RETRY_DELAY_MAX)
-                    self.add_log(f"⏳ {delay:.1f}초 후 재시도...")
-                    time.sleep(delay)
-
-            except Exception as e:
-                self.add_log(f"  ✗ 오류: {str(e)}")
-                delay = random.uniform(RETRY_DELAY_MIN, RETRY_DELAY_MAX)
-                time.sleep(delay)
+    def _on_ktx_event(self, event: ReservationEvent):
+        """KTX 예약 엔진 이벤트 처리 (엔진 스레드에서 호출)"""
+        self._log_reservation_event(
+            event,
+            self.log_signals.show_ktx_alert_button,
+            self.ktx_start_btn,
+            self.ktx_stop_btn
+        )
 
     def stop_ktx(self):
         """KTX 예약 중지"""
-        self.is_ktx_running = False
+        if self.ktx_engine:
+            self.ktx_engine.stop()
         self.is_alert_playing = False  # 알림음 중지
         self.add_log("⏹ KTX 예약을 중지했습니다")
         self.ktx_start_btn.setEnabled(True)
@@ -1414,17 +1608,9 @@ class TrainReservationApp(QMainWindow):
             departure_time = self.srt_time_input.text() + "00"
 
             # 승객 정보 수집
-            passengers = []
-            adult_count = int(self.srt_adult_input.text() or "0")
-            child_count = int(self.srt_child_input.text() or "0")
-            senior_count = int(self.srt_senior_input.text() or "0")
-
-            if adult_count > 0:
-                passengers.append(Passenger(PassengerType.ADULT, adult_count))
-            if child_count > 0:
-                passengers.append(Passenger(PassengerType.CHILD, child_count))
-            if senior_count > 0:
-                passengers.append(Passenger(PassengerType.SENIOR, senior_count))
+            passengers = self._collect_passengers(
+                self.srt_adult_input, self.srt_child_input, self.srt_senior_input
+            )
 
             if not passengers:
                 self.add_log("✗ 최소 1명 이상의 승객이 필요합니다")
@@ -1506,51 +1692,118 @@ class TrainReservationApp(QMainWindow):
             return
 
         # 결제 정보 미리 저장 (체크박스가 체크되어 있고 정보가 유효한 경우)
-        if self.srt_save_payment_check.isChecked() and self._validate_srt_payment_info():
+        credit_card = self._srt_credit_card()
+        if self.srt_save_payment_check.isChecked() and credit_card:
             try:
-                card_number = self.srt_payment_card_num_input.text()
-                card_pw = self.srt_payment_card_pw_input.text()
-                is_corporate = self.srt_payment_corporate_check.isChecked()
-                validation_number = (
-                    self.srt_payment_birth_input.text()
-                    if not is_corporate
-                    else self.srt_payment_business_num_input.text()
-                )
-                expire = self.srt_payment_expire_input.text()
-
                 self.credential_storage.save_payment(
-                    card_number=card_number,
-                    card_password=card_pw,
-                    expire=expire,
-                    validation_number=validation_number,
-                    is_corporate=is_corporate,
+                    card_number=credit_card.number,
+                    card_password=credit_card.password,
+                    expire=credit_card.expire,
+                    validation_number=credit_card.validation_number,
+                    is_corporate=credit_card.is_corporate,
                     train_type="SRT"
                 )
             except Exception:
                 pass  # 저장 실패 시 조용히 무시
 
-        self.is_srt_running = True
+        selected_trains = [self.srt_trains[i] for i in selected_indices]
+        job = ReservationJob(
+            trains=selected_trains,
+            request=self._build_srt_request(selected_trains[0]),
+            user_id=self.srt_id_input.text(),
+            password=self.srt_pw_input.text(),
+            credit_card=credit_card
+        )
+        self.srt_engine = ReservationEngine(self.srt_service, job, self._on_srt_event, tracer=self.tracer)
+
         self.srt_start_btn.setEnabled(False)
         self.srt_stop_btn.setEnabled(True)
 
         self.add_log("🚀 SRT 예약을 시작합니다")
 
-        threading.Thread(
-            target=self._srt_reservation_loop,
-            args=(selected_indices,),
-            daemon=True,
-        ).start()
+        self.srt_engine.start()
+
+    def _build_srt_request(self, first_train: TrainSchedule) -> ReservationRequest:
+        """선택한 열차 기준 SRT 예약 요청 생성"""
+        return ReservationRequest(
+            departure_station=first_train.departure_station,
+            arrival_station=first_train.arrival_station,
+            departure_date=first_train.departure_time.date(),
+            departure_time=first_train.departure_time.strftime("%H%M%S"),
+            passengers=self._collect_passengers(
+                self.srt_adult_input, self.srt_child_input, self.srt_senior_input
+            ),
+            train_type=TrainType.SRT,
+            is_special_seat_allowed=self.srt_special_seat_check.isChecked(),
+            is_only_special_seat=self.srt_only_special_seat_check.isChecked()
+        )
 
-    def _srt_reservation_loop(self, selected_indices):
-        """SRT 예약 루프"""
-        selected_trains: list[TrainSchedule] = [self.srt_trains[i] for i in selected_indices]
-        attempt = 0
+    def _on_srt_event(self, event: ReservationEvent):
+        """SRT 예약 엔진 이벤트 처리 (엔진 스레드에서 호출)"""
+        self._log_reservation_event(
+            event,
+            self.log_signals.show_alert_button,
+            self.srt_start_btn,
+            self.srt_stop_btn
+        )
 
-        # 승객 정보 수집
+    def _log_reservation_event(self, event: ReservationEvent, show_alert_button, start_btn, stop_btn):
+        """예약 엔진 이벤트를 로그/알림으로 표시"""
+        if event.type == ReservationEventType.ATTEMPT:
+            self.add_log(f"🔄 예약 시도 #{event.attempt}")
+            self.add_log(f"  → 열차 예약 시도 중: {event.message}")
+        elif event.type == ReservationEventType.SESSION_RESET:
+            self.add_log("🔄 세션 초기화 중...")
+        elif event.type == ReservationEventType.RELOGGED_IN:
+            self.add_log("✓ 재로그인 성공")
+        elif event.type == ReservationEventType.RELOGIN_FAILED:
+            if event.message:
+                self.add_log(f"✗ 세션 초기화 중 오류: {event.message}")
+            else:
+                self.add_log("✗ 재로그인 실패")
+        elif event.type == ReservationEventType.RESERVE_FAILED:
+            self.add_log(f"  ✗ 예약 실패: {event.message}")
+            self.add_log(f"⏳ {event.delay:.1f}초 후 재시도...")
+        elif event.type == ReservationEventType.ERROR:
+            self.add_log(f"  ✗ 오류: {event.message}")
+        elif event.type == ReservationEventType.TIMEOUT:
+            self.add_log(f"  ✗ 시간 초과: {event.message}")
+            self.add_log("⏳ 즉시 재시도...")
+        elif event.type == ReservationEventType.RESERVED:
+            self.add_log(f"  ✓ 예약 성공! (열차: {event.reservation.train_schedule.train_number})")
+            self.add_log(f"  예약번호: {event.reservation.reservation_number}")
+        elif event.type == ReservationEventType.PAYMENT_STARTED:
+            self.add_log("💳 결제 진행 중...")
+        elif event.type == ReservationEventType.PAID:
+            self.add_log(f"  ✓ 결제 완료!")
+            # 버튼 상태 업데이트
+            QTimer.singleShot(0, lambda: start_btn.setEnabled(True))
+            QTimer.singleShot(0, lambda: stop_btn.setEnabled(False))
+        elif event.type in (ReservationEventType.PAYMENT_INFO_MISSING, ReservationEventType.PAYMENT_FAILED):
+            if event.type == ReservationEventType.PAYMENT_INFO_MISSING:
+                self.add_log("  ✗ 예약은 완료되었으나 결제 정보가 입력되지 않았습니다.")
+                reservation_number = event.reservation.reservation_number
+            else:
+                if event.message:
+                    self.add_log(f"💳 결제 오류: {event.message}")
+                self.add_log("  ✗ 예약은 완료되었으나 결제에 실패했습니다.")
+                reservation_number = event.payment.reservation_number or event.reservation.reservation_number
+            self.add_log(f"    예약번호: {reservation_number}")
+            self.add_log("    알림음 중지 버튼을 눌러 알림음을 중지하고")
+            self.add_log("    앱에 들어가 10분 내에 결제해주세요.")
+            # 반복 알림음 재생 시작
+            self.alert_thread = threading.Thread(target=self._play_alert_sound_loop, daemon=True)
+            self.alert_thread.start()
+            # 시그널로 알림음 중지 버튼 표시
+            show_alert_button.emit()
+
+    @staticmethod
+    def _collect_passengers(adult_input: QLineEdit, child_input: QLineEdit, senior_input: QLineEdit) -> list[Passenger]:
+        """승객 정보 수집"""
         passengers = []
-        adult_count = int(self.srt_adult_input.text() or "0")
-        child_count = int(self.srt_child_input.text() or "0")
-        senior_count = int(self.srt_senior_input.text() or "0")
+        adult_count = int(adult_input.text() or "0")
+        child_count = int(child_input.text() or "0")
+        senior_count = int(senior_input.text() or "0")
 
         if adult_count > 0:
             passengers.append(Passenger(PassengerType.ADULT, adult_count))
@@ -1558,98 +1811,7 @@ class TrainReservationApp(QMainWindow):
             passengers.append(Passenger(PassengerType.CHILD, child_count))
         if senior_count > 0:
             passengers.append(Passenger(PassengerType.SENIOR, senior_count))
-
-        while self.is_srt_running:
-            attempt += 1
-            self.add_log(f"🔄 예약 시도 #{attempt}")
-
-            # 500번마다 세션 초기화
-            if attempt % 500 == 0:
-                self.add_log("🔄 세션 초기화 중...")
-                try:
-                    username = self.srt_id_input.text()
-                    password = self.srt_pw_input.text()
-                    self.srt_service.clear()
-                    self.add_log("✓ 세션 초기화 완료")
-                    self.add_log("🔐 재로그인 중...")
-                    login_result = self.srt_service.login(username, password)
-                    if login_result:
-                        self.add_log("✓ 재로그인 성공")
-                    else:
-                        self.add_log("✗ 재로그인 실패")
-                        self.is_srt_running = False
-                        return
-                except Exception as e:
-                    self.add_log(f"✗ 세션 초기화 중 오류: {str(e)}")
-                    self.is_srt_running = False
-                    return
-
-            try:
-                # 선택한 모든 열차를 한 번에 시도
-                train_numbers = ", ".join([t.train_number for t in selected_trains])
-                self.add_log(f"  → 열차 예약 시도 중: {train_numbers}")
-
-                request = ReservationRequest(
-                    departure_station=selected_trains[0].departure_station,
-                    arrival_station=selected_trains[0].arrival_station,
-                    departure_date=selected_trains[0].departure_time.date(),
-                    departure_time=selected_trains[0].departure_time.strftime("%H%M%S"),
-                    passengers=passengers,
-                    train_type=TrainType.SRT,
-                    is_special_seat_allowed=self.srt_special_seat_check.isChecked(),
-                    is_only_special_seat=self.srt_only_special_seat_check.isChecked()
-                )
-                reservation = self.srt_service.reserve_train(selected_trains, request)
-                if reservation.success:
-                    self.add_log(f"  ✓ 예약 성공! (열차: {reservation.train_schedule.train_number})")
-                    self.add_log(f"  예약번호: {reservation.reservation_number}")
-
-                    # 결제 정보 검증
-                    if not self._validate_srt_payment_info():
-                        self.add_log("  ✗ 예약은 완료되었으나 결제 정보가 입력되지 않았습니다.")
-                        self.add_log(f"    예약번호: {reservation.reservation_number}")
-                        self.add_log("    알림음 중지 버튼을 눌러 알림음을 중지하고")
-                        self.add_log("    앱에 들어가 10분 내에 결제해주세요.")
-                        self.is_srt_running = False  # 예약 루프 중지
-                        # 반복 알림음 재생 시작
-                        self.alert_thread = threading.Thread(target=self._play_alert_sound_loop, daemon=True)
-                        self.alert_thread.start()
-                        # 시그널로 알림음 중지 버튼 표시
-                        self.log_signals.show_alert_button.emit()
-                        return  # 예약 루프 종료
-
-                    # 결제 진행
-                    payment = self._process_srt_payment(reservation)
-
-                    if payment.success:
-                        self.add_log(f"  ✓ 결제 완료!")
-                        self.is_srt_running = False
-                        # 버튼 상태 업데이트
-                        QTimer.singleShot(0, lambda: self.srt_start_btn.setEnabled(True))
-                        QTimer.singleShot(0, lambda: self.srt_stop_btn.setEnabled(False))
-                        return  # 예약 루프 종료
-                    else:
-                        self.add_log("  ✗ 예약은 완료되었으나 결제에 실패했습니다.")
-                        self.add_log(f"    예약번호: {payment.reservation_number}")
-                        self.add_log("    알림음 중지 버튼을 눌러 알림음을 중지하고")
-                        self.add_log("    앱에 들어가 10분 내에 결제해주세요.")
-                        self.is_srt_running = False  # 예약 루프 중지
-                        # 반복 알림음 재생 시작
-                        self.alert_thread = threading.Thread(target=self._play_alert_sound_loop, daemon=True)
-                        self.alert_thread.start()
-                        # 시그널로 알림음 중지 버튼 표시
-                        self.log_signals.show_alert_button.emit()
-                        return  # 예약 루프 종료
-                else:
-                    self.add_log(f"  ✗ 예약 실패: {reservation.message}")
-                    delay = random.uniform(RETRY_DELAY_MIN, RETRY_DELAY_MAX)
-                    self.add_log(f"⏳ {delay:.1f}초 후 재시도...")
-                    time.sleep(delay)
-
-            except Exception as e:
-                self.add_log(f"  ✗ 오류: {str(e)}")
-                delay = random.uniform(RETRY_DELAY_MIN, RETRY_DELAY_MAX)
-                time.sleep(delay)
+        return passengers
 
     def _play_single_alert_sound(self):
         """OS에 따라 알림음 1회 재생"""
@@ -1665,7 +1827,7 @@ class TrainReservationApp(QMainWindow):
                 import os
                 os.system('paplay /usr/share/sounds/freedesktop/stereo/alarm-clock-elapsed.oga 2>/dev/null || beep 2>/dev/null')
         except Exception as e:
-            print(f"알림음 재생 실패: {e}")
+            log.warning("알림음 재생 실패: %s", e)
 
     def _play_alert_sound_loop(self):
         """알림음을 반복 재생 (정지 버튼을 누를 때까지)"""
@@ -1696,42 +1858,28 @@ class TrainReservationApp(QMainWindow):
 
         return True
 
-    def _process_srt_payment(self, reservation: ReservationResult) -> PaymentResult:
-        """SRT 결제 처리"""
-        try:
-            self.add_log("💳 결제 진행 중...")
+    def _srt_credit_card(self) -> CreditCard | None:
+        """입력된 SRT 결제 정보 (미입력 시 None)"""
+        if not self._validate_srt_payment_info():
+            return None
 
-            card_number = self.srt_payment_card_num_input.text()
-            card_pw = self.srt_payment_card_pw_input.text()
-            is_corporate = self.srt_payment_corporate_check.isChecked()
-            validation_number = (
+        is_corporate = self.srt_payment_corporate_check.isChecked()
+        return CreditCard(
+            number=self.srt_payment_card_num_input.text(),
+            password=self.srt_payment_card_pw_input.text(),
+            validation_number=(
                 self.srt_payment_birth_input.text()
                 if not is_corporate
                 else self.srt_payment_business_num_input.text()
-            )
-            expire = self.srt_payment_expire_input.text()
-
-            # 결제 API 호출
-            credit_card = CreditCard(
-                number=card_number,
-                password=card_pw,
-                validation_number=validation_number,
-                expire=expire,
-                is_corporate=is_corporate
-            )
-            payment_result = self.srt_service.payment_reservation(
-                reservation,
-                credit_card,
-            )
-
-            return payment_result
-        except Exception as e:
-            self.add_log(f"💳 결제 오류: {str(e)}")
-            return PaymentResult(success=False, message=f"Payment error: {str(e)}")
+            ),
+            expire=self.srt_payment_expire_input.text(),
+            is_corporate=is_corporate
+        )
 
     def stop_srt(self):
         """SRT 예약 중지"""
-        self.is_srt_running = False
+        if self.srt_engine:
+            self.srt_engine.stop()
         self.is_alert_playing = False  # 알림음 중지
         self.add_log("⏹ SRT 예약을 중지했습니다")
         self.srt_start_btn.setEnabled(True)
@@ -1740,7 +1888,8 @@ class TrainReservationApp(QMainWindow):
     def stop_alert(self):
         """SRT 알림음 중지"""
         self.is_alert_playing = False
-        self.is_srt_running = False  # 예약도 중지
+        if self.srt_engine:
+            self.srt_engine.stop()  # 예약도 중지
         self.add_log("🔇 알림음을 중지했습니다")
         self.add_log("⏹ SRT 예약을 중지했습니다")
         self.srt_alert_stop_btn.setVisible(False)
@@ -1759,7 +1908,8 @@ class TrainReservationApp(QMainWindow):
     def stop_ktx_alert(self):
         """KTX 알림음 중지"""
         self.is_alert_playing = False
-        self.is_ktx_running = False  # 예약도 중지
+        if self.ktx_engine:
+            self.ktx_engine.stop()  # 예약도 중지
         self.add_log("🔇 알림음을 중지했습니다")
         self.add_log("⏹ KTX 예약을 중지했습니다")
         self.ktx_alert_stop_btn.setVisible(False)
@@ -1797,38 +1947,23 @@ class TrainReservationApp(QMainWindow):
 
         return True
 
-    def _process_ktx_payment(self, reservation: ReservationResult) -> PaymentResult:
-        """KTX 결제 처리"""
-        try:
-            self.add_log("💳 결제 진행 중...")
+    def _ktx_credit_card(self) -> CreditCard | None:
+        """입력된 KTX 결제 정보 (미입력 시 None)"""
+        if not self._validate_ktx_payment_info():
+            return None
 
-            card_number = self.ktx_payment_card_num_input.text()
-            card_pw = self.ktx_payment_card_pw_input.text()
-            is_corporate = self.ktx_payment_corporate_check.isChecked()
-            validation_number = (
+        is_corporate = self.ktx_payment_corporate_check.isChecked()
+        return CreditCard(
+            number=self.ktx_payment_card_num_input.text(),
+            password=self.ktx_payment_card_pw_input.text(),
+            validation_number=(
                 self.ktx_payment_birth_input.text()
                 if not is_corporate
                 else self.ktx_payment_business_num_input.text()
-            )
-            expire = self.ktx_payment_expire_input.text()
-
-            # 결제 API 호출
-            credit_card = CreditCard(
-                number=card_number,
-                password=card_pw,
-                validation_number=validation_number,
-                expire=expire,
-                is_corporate=is_corporate
-            )
-            payment_result = self.ktx_service.payment_reservation(
-                reservation,
-                credit_card,
-            )
-
-            return payment_result
-        except Exception as e:
-            self.add_log(f"💳 결제 오류: {str(e)}")
-            return PaymentResult(success=False, message=f"Payment error: {str(e)}")
+            ),
+            expire=self.ktx_payment_expire_input.text(),
+            is_corporate=is_corporate
+        )
 
 
 def main():
@@ -0,0 +1 @@
+"""Local stand-in servers for the train APIs, used by tests and benchmarks"""
@@ -0,0 +1,275 @@
+"""Shared machinery of the local fake train API servers
+
+FakeAPIServer runs a ThreadingHTTPServer on 127.0.0.1 and maps request paths
+to endpoint names. It counts requests per endpoint, injects latency and HTTP
+503 errors, and holds a mutable seat inventory. Subclasses implement one
+``_on_<endpoint>(params)`` method per endpoint. The method returns a dict,
+which is sent as JSON, or a str, which is sent as is.
+"""
+import json
+import random
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from urllib.parse import parse_qsl, urlparse
+
+
+@dataclass
+class FakeTrain:
+    """One train of a fake timetable"""
+    train_number: str
+    dep_time: str = "100000"
+    arr_time: str = "123000"
+    general_seats: int = 0
+    special_seats: int = 0
+    price: int = 52000
+
+
+@dataclass
+class FakeReservation:
+    """A reservation held by a fake server"""
+    reservation_number: str
+    train: FakeTrain
+    dep_date: str
+    dep_code: str
+    arr_code: str
+    special: bool
+    seat_count: int
+    paid: bool = False
+    seats: list[str] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients that time out hang up before the (delayed) response is sent
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FakeAPIServer(ABC):
+    """Threaded localhost HTTP server with a scriptable seat inventory"""
+
+    SEARCH_ENDPOINT = "search_schedule"
+    UNTHROTTLED: frozenset[str] = frozenset()  # endpoints exempt from latency and errors
+
+    def __init__(
+        self,
+        trains: list[FakeTrain] | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Args:
+            trains: Timetable served for every search
+            latency: Seconds added to every API response
+            jitter: Extra random delay of up to this many seconds
+            error_rate: Share (0-1) of API requests answered with HTTP 503
+            seed: Seed for the latency and error draws
+        """
+        self.trains = {train.train_number: train for train in trains or []}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.reservations: dict[str, FakeReservation] = {}
+        self.counts: dict[str, int] = {}
+        self.released_at: dict[str, float] = {}  # train number -> time.perf_counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._scripted: list[tuple[int, Callable[["FakeAPIServer"], None]]] = []
+        self._timers: list[threading.Timer] = []
+        self._next_reservation = 1
+        self._server: _HTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @abstractmethod
+    def _paths(self) -> dict[str, str]:
+        """Map of request path to endpoint name"""
+        pass
+
+    # Lifecycle
+
+    def start(self):
+        self._routes = self._paths()
+        self._server = _HTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        for timer in self._timers:
+            timer.cancel()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    # Inventory
+
+    def set_seats(self, train_number: str, general: int | None = None, special: int | None = None) -> None:
+        """Change the remaining seats of a train"""
+        with self._lock:
+            train = self.trains[train_number]
+            if general is not None:
+                train.general_seats = general
+            if special is not None:
+                train.special_seats = special
+
+    def release_seats(self, train_number: str, general: int = 0, special: int = 0) -> None:
+        """Add seats to a train, as when another passenger cancels
+
+        The release time is recorded in ``released_at``.
+        """
+        with self._lock:
+            train = self.trains[train_number]
+            train.general_seats += general
+            train.special_seats += special
+            self.released_at[train_number] = time.perf_counter()
+
+    def release_after(self, seconds: float, train_number: str, general: int = 0, special: int = 0) -> None:
+        """Call release_seats after the given delay"""
+        timer = threading.Timer(seconds, self.release_seats, (train_number, general, special))
+        timer.daemon = True
+        self._timers.append(timer)
+        timer.start()
+
+    def schedule(self, after_searches: int, action: Callable[["FakeAPIServer"], None]) -> None:
+        """Run action once the search endpoint has been served after_searches times"""
+        with self._lock:
+            self._scripted.append((after_searches, action))
+
+    def _hold(self, train: FakeTrain, special: bool, seat_count: int, **details) -> FakeReservation | None:
+        """Take seats from train and record a reservation; None if sold out"""
+        with self._lock:
+            if (train.special_seats if special else train.general_seats) < seat_count:
+                return None
+            if special:
+                train.special_seats -= seat_count
+            else:
+                train.general_seats -= seat_count
+            reservation = FakeReservation(
+                reservation_number=f"{self._next_reservation:010d}",
+                train=train,
+                special=special,
+                seat_count=seat_count,
+                seats=[f"{i + 1}A" for i in range(seat_count)],
+                **details,
+            )
+            self._next_reservation += 1
+            self.reservations[reservation.reservation_number] = reservation
+            return reservation
+
+    def reservations_for(self, train_number: str) -> list[str]:
+        """Numbers of the reservations held on a train"""
+        with self._lock:
+            return [n for n, r in self.reservations.items() if r.train.train_number == train_number]
+
+    def cancel_reservation(self, reservation_number: str) -> FakeReservation | None:
+        """Drop a reservation and return its seats to the train"""
+        with self._lock:
+            reservation = self.reservations.pop(reservation_number, None)
+            if reservation is not None:
+                if reservation.special:
+                    reservation.train.special_seats += reservation.seat_count
+                else:
+                    reservation.train.general_seats += reservation.seat_count
+                self.released_at[reservation.train.train_number] = time.perf_counter()
+            return reservation
+
+    def _pay(self, reservation_number: str) -> FakeReservation | None:
+        with self._lock:
+            reservation = self.reservations.get(reservation_number)
+            if reservation is not None:
+                reservation.paid = True
+            return reservation
+
+    # Request handling
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+            def do_GET(self):
+                server._dispatch(self)
+
+            def do_POST(self):
+                server._dispatch(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _dispatch(self, request: BaseHTTPRequestHandler) -> None:
+        url = urlparse(request.path)
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        length = int(request.headers.get("Content-Length") or 0)
+        if length:
+            params.update(parse_qsl(request.rfile.read(length).decode("utf-8"), keep_blank_values=True))
+
+        name = self._routes.get(url.path)
+        if name is None:
+            self._send(request, 404, "Not Found", "text/plain")
+            return
+
+        self._count(name)
+        if name not in self.UNTHROTTLED:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            if delay:
+                time.sleep(delay)
+            if self.error_rate and self._random.random() < self.error_rate:
+                self._send(request, 503, "Service Unavailable", "text/plain")
+                return
+
+        handler = getattr(self, f"_on_{name}", None)
+        body = handler(params) if handler else self._default_response(name)
+        if isinstance(body, str):
+            self._send(request, 200, body, "text/javascript")
+        else:
+            self._send(request, 200, json.dumps(body, ensure_ascii=False), "application/json")
+
+    def _default_response(self, name: str) -> dict:
+        raise NotImplementedError
+
+    @staticmethod
+    def _send(request: BaseHTTPRequestHandler, status: int, body: str, content_type: str) -> None:
+        payload = body.encode("utf-8")
+        request.send_response(status)
+        request.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        request.send_header("Content-Length", str(len(payload)))
+        if request.close_connection:
+            request.send_header("Connection", "close")  # client asked for it; keeps it from reusing the socket
+        request.end_headers()
+        request.wfile.write(payload)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+            if name != self.SEARCH_ENDPOINT:
+                return
+            due = [item for item in self._scripted if item[0] <= self.counts[name]]
+            self._scripted = [item for item in self._scripted if item not in due]
+        for _, action in due:
+            action(self)
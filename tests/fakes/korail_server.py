@@ -0,0 +1,189 @@
+"""Local stand-in for the Korail mobile API
+
+Serves the paths of ``ktx.API_ENDPOINTS`` that the booking flow uses (code.do
+password key, Login, ScheduleView, TicketReservation, ReservationView,
+ReservationList, ReservationPayment and ReservationCancelChk) over real HTTP on
+127.0.0.1. Point a client at it with::
+
+    with FakeKorailServer([FakeTrain("101", general_seats=1)]) as server:
+        korail = Korail(auto_login=False, **server.client_options())
+
+Seat inventory is mutable at runtime (``set_seats``, ``release_seats``,
+``cancel_reservation``) and can be scripted to change after a number of
+searches (``schedule``) or a delay (``release_after``). Each release is
+stamped in ``released_at``, so a caller can measure the time from a seat
+freeing up to its hold being confirmed. ``latency``/``jitter`` delay every
+response and ``error_rate`` answers that share of requests with HTTP 503.
+"""
+from datetime import timedelta
+from urllib.parse import urlparse
+
+from src.constants.stations import KTX_STATIONS
+from src.infrastructure.external.ktx import KORAIL_HOST, build_endpoints
+from tests.fakes.base import FakeAPIServer, FakeReservation, FakeTrain
+
+__all__ = ["FakeKorailServer", "FakeTrain"]
+
+KTX_TRAIN_TYPE = "100"
+# 32 characters: the client uses it as the AES-256 key and its first 16 as the IV
+PASSWORD_KEY = "fakekorail0123456789abcdef012345"
+BUY_LIMIT = timedelta(minutes=20)
+UNKNOWN_STATION_CODE = "NAT000000"
+
+# h_msg_cd values the client maps to NoResultsError, SoldOutError and
+# NeedToLoginError; any other code surfaces as a plain KorailError
+NO_RESULTS_CODE = "P100"
+SOLD_OUT_CODE = "ERR211161"
+NEED_LOGIN_CODE = "P058"
+NOT_FOUND_CODE = "ERR000000"
+
+STATION_CODES = {station.name: station.code for station in KTX_STATIONS}
+STATION_NAMES = {station.code: station.name for station in KTX_STATIONS}
+
+
+def _fail(code: str, message: str = "") -> dict:
+    return {"strResult": "FAIL", "h_msg_cd": code, "h_msg_txt": message}
+
+
+class FakeKorailServer(FakeAPIServer):
+    """Threaded HTTP server imitating the Korail endpoints the client uses"""
+
+    def _paths(self) -> dict[str, str]:
+        return {urlparse(url).path: name for name, url in build_endpoints(KORAIL_HOST).items()}
+
+    def client_options(self) -> dict[str, str]:
+        """Keyword arguments that point Korail (or KTXService) at this server"""
+        return {"base_url": self.base_url}
+
+    def _default_response(self, name: str) -> dict:
+        return {"strResult": "SUCC"}
+
+    def _on_code(self, params: dict) -> dict:
+        return {"strResult": "SUCC", "app.login.cphd": {"idx": "1", "key": PASSWORD_KEY}}
+
+    def _on_login(self, params: dict) -> dict:
+        if not params.get("txtMemberNo") or not params.get("txtPwd"):
+            return _fail(NEED_LOGIN_CODE, "로그인 정보를 입력하세요.")
+        return {
+            "strResult": "SUCC",
+            "strMbCrdNo": "1234567890",
+            "strCustNm": "홍길동",
+            "strEmailAdr": "test@example.com",
+            "strCpNo": "010-1234-5678",
+        }
+
+    def _on_search_schedule(self, params: dict) -> dict:
+        with self._lock:
+            trains = [self._train_row(train, params) for train in self.trains.values()]
+        if not trains:
+            return _fail(NO_RESULTS_CODE, "조회 결과가 없습니다.")
+        return {"strResult": "SUCC", "trn_infos": {"trn_info": trains}}
+
+    @staticmethod
+    def _train_row(train: FakeTrain, params: dict) -> dict:
+        date = params.get("txtGoAbrdDt", "")
+        dep, arr = params.get("txtGoStart", ""), params.get("txtGoEnd", "")
+        available = train.general_seats > 0 or train.special_seats > 0
+        return {
+            "h_trn_clsf_cd": KTX_TRAIN_TYPE,
+            "h_trn_clsf_nm": "KTX",
+            "h_trn_gp_cd": KTX_TRAIN_TYPE,
+            "h_trn_no": train.train_number,
+            "h_expct_dlay_hr": "0",
+            "h_dpt_rs_stn_nm": dep,
+            "h_dpt_rs_stn_cd": STATION_CODES.get(dep, UNKNOWN_STATION_CODE),
+            "h_dpt_dt": date,
+            "h_dpt_tm": train.dep_time,
+            "h_arv_rs_stn_nm": arr,
+            "h_arv_rs_stn_cd": STATION_CODES.get(arr, UNKNOWN_STATION_CODE),
+            "h_arv_dt": date,
+            "h_arv_tm": train.arr_time,
+            "h_run_dt": date,
+            "h_rsv_psb_flg": "Y" if available else "N",
+            "h_rsv_psb_nm": "예약하기" if available else "좌석매진",
+            "h_spe_rsv_cd": "11" if train.special_seats > 0 else "13",
+            "h_gen_rsv_cd": "11" if train.general_seats > 0 else "13",
+            "h_wait_rsv_flg": "-1",
+        }
+
+    def _on_reserve(self, params: dict) -> dict:
+        train = self.trains.get(params.get("txtTrnNo1", ""))
+        if train is None:
+            return _fail(NOT_FOUND_CODE, "열차 정보가 없습니다.")
+
+        reservation = self._hold(
+            train,
+            special=params.get("txtPsrmClCd1") == "2",
+            seat_count=int(params.get("txtTotPsgCnt", "1")),
+            dep_date=params.get("txtDptDt1", ""),
+            dep_code=params.get("txtDptRsStnCd1", ""),
+            arr_code=params.get("txtArvRsStnCd1", ""),
+        )
+        if reservation is None:
+            return _fail(SOLD_OUT_CODE, "잔여석이 없습니다.")
+        return {"strResult": "SUCC", "h_pnr_no": reservation.reservation_number}
+
+    def _on_myreservationview(self, params: dict) -> dict:
+        with self._lock:
+            rows = [self._reservation_row(r) for r in self.reservations.values() if not r.paid]
+        if not rows:
+            return _fail(NO_RESULTS_CODE, "예약 내역이 없습니다.")
+        return {"strResult": "SUCC", "jrny_infos": {"jrny_info": [{"train_infos": {"train_info": rows}}]}}
+
+    @staticmethod
+    def _reservation_row(reservation: FakeReservation) -> dict:
+        train = reservation.train
+        limit = reservation.created_at + BUY_LIMIT
+        return {
+            "h_trn_clsf_cd": KTX_TRAIN_TYPE,
+            "h_trn_clsf_nm": "KTX",
+            "h_trn_gp_cd": KTX_TRAIN_TYPE,
+            "h_trn_no": train.train_number,
+            "h_dpt_rs_stn_nm": STATION_NAMES.get(reservation.dep_code, ""),
+            "h_dpt_rs_stn_cd": reservation.dep_code,
+            "h_dpt_dt": reservation.dep_date,
+            "h_dpt_tm": train.dep_time,
+            "h_arv_rs_stn_nm": STATION_NAMES.get(reservation.arr_code, ""),
+            "h_arv_rs_stn_cd": reservation.arr_code,
+            "h_arv_dt": reservation.dep_date,
+            "h_arv_tm": train.arr_time,
+            "h_run_dt": reservation.dep_date,
+            "h_pnr_no": reservation.reservation_number,
+            "h_tot_seat_cnt": str(reservation.seat_count),
+            "h_ntisu_lmt_dt": limit.strftime("%Y%m%d"),
+            "h_ntisu_lmt_tm": limit.strftime("%H%M%S"),
+            "h_rsv_amt": str(train.price * reservation.seat_count),
+        }
+
+    def _on_myreservationlist(self, params: dict) -> dict:
+        reservation = self.reservations.get(params.get("hidPnrNo", ""))
+        if reservation is None:
+            return _fail(NO_RESULTS_CODE, "예약 내역이 없습니다.")
+        price = reservation.train.price
+        seats = [
+            {
+                "h_srcar_no": "5",
+                "h_seat_no": seat,
+                "h_psrm_cl_nm": "특실" if reservation.special else "일반실",
+                "h_psg_tp_dv_nm": "어른",
+                "h_rcvd_amt": str(price),
+                "h_seat_prc": str(price),
+                "h_dcnt_amt": "0",
+            }
+            for seat in reservation.seats
+        ]
+        return {
+            "strResult": "SUCC",
+            "h_wct_no": "0000000001",
+            "jrny_infos": {"jrny_info": [{"seat_infos": {"seat_info": seats}}]},
+        }
+
+    def _on_pay(self, params: dict) -> dict:
+        if self._pay(params.get("hidPnrNo", "")) is None:
+            return _fail(NOT_FOUND_CODE, "예약 내역이 없습니다.")
+        return {"strResult": "SUCC", "h_msg_txt": "결제 완료"}
+
+    def _on_cancel(self, params: dict) -> dict:
+        if self.cancel_reservation(params.get("txtPnrNo", "")) is None:
+            return _fail(NOT_FOUND_CODE, "예약 내역이 없습니다.")
+        return {"strResult": "SUCC", "h_msg_txt": "취소 완료"}
@@ -0,0 +1,213 @@
+"""Local stand-in for the SRT mobile API and its NetFunnel queue
+
+Serves the paths of ``srt.API_ENDPOINTS`` (login, logout, search_schedule,
+reserve, tickets, ticket_info, cancel, payment) plus NetFunnel ``ts.wseq`` over
+real HTTP on 127.0.0.1, so the client's HTTP, JSON and threading costs are
+exercised end to end. Point a client at it with::
+
+    with FakeSRTServer([FakeTrain("301", general_seats=1)]) as server:
+        srt = SRT(auto_login=False, **server.client_options())
+
+Seat inventory is mutable at runtime (``set_seats``, ``release_seats``,
+``cancel_reservation``) and can be scripted to change after a number of
+searches (``schedule``) or a delay (``release_after``). ``latency``/``jitter``
+delay every API response and ``error_rate`` answers that share of API requests
+with HTTP 503.
+"""
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+from src.infrastructure.external.srt import SRT_MOBILE, build_endpoints
+from tests.fakes.base import FakeAPIServer, FakeReservation, FakeTrain
+
+__all__ = ["FakeSRTServer", "FakeTrain"]
+
+SRT_TRAIN_CODE = "17"
+NETFUNNEL_PATH = "/ts.wseq"
+
+
+def _result(success: bool, message: str = "") -> dict:
+    return {"resultMap": [{"strResult": "SUCC" if success else "FAIL", "msgTxt": message}]}
+
+
+class FakeSRTServer(FakeAPIServer):
+    """Threaded HTTP server imitating the SRT endpoints the client uses"""
+
+    UNTHROTTLED = frozenset({"netfunnel"})
+
+    def __init__(self, trains: list[FakeTrain] | None = None, netfunnel_waits: int = 0, **kwargs) -> None:
+        """
+        Args:
+            trains: Timetable served for every search
+            netfunnel_waits: chkEnter polls answered with "wait" before passing
+            **kwargs: latency, jitter, error_rate and seed (see FakeAPIServer)
+        """
+        super().__init__(trains, **kwargs)
+        self.netfunnel_waits = netfunnel_waits
+        self._netfunnel_polls: dict[str, int] = {}
+        self._netfunnel_lock = threading.Lock()
+
+    def _paths(self) -> dict[str, str]:
+        paths = {urlparse(url).path: name for name, url in build_endpoints(SRT_MOBILE).items()}
+        paths[NETFUNNEL_PATH] = "netfunnel"
+        return paths
+
+    @property
+    def netfunnel_url(self) -> str:
+        return f"{self.base_url}{NETFUNNEL_PATH}"
+
+    def client_options(self) -> dict[str, str]:
+        """Keyword arguments that point SRT (or SRTService) at this server"""
+        return {"base_url": self.base_url, "netfunnel_url": self.netfunnel_url}
+
+    def _default_response(self, name: str) -> dict:
+        return _result(True)
+
+    # NetFunnel ts.wseq
+
+    def _on_netfunnel(self, params: dict) -> str:
+        opcode = params.get("opcode")
+        with self._netfunnel_lock:
+            if opcode == "5101":
+                key = f"KEY{self._random.getrandbits(32):08X}"
+                self._netfunnel_polls[key] = 0
+                status = "201" if self.netfunnel_waits else "200"
+            elif opcode == "5002":
+                key = params.get("key", "")
+                polls = self._netfunnel_polls.get(key, 0) + 1
+                self._netfunnel_polls[key] = polls
+                status = "201" if polls < self.netfunnel_waits else "200"
+            else:
+                key = params.get("key", "")
+                self._netfunnel_polls.pop(key, None)
+                status = "200"
+        nwait = 0 if status == "200" else self.netfunnel_waits
+        return f"NetFunnel.gControl.result='{opcode}:{status}:key={key}&nwait={nwait}&nnext=0';"
+
+    # SRT API
+
+    def _on_login(self, params: dict) -> dict:
+        return {
+            "strResult": "SUCC",
+            "userMap": {
+                "MB_CRD_NO": "1234567890",
+                "CUST_NM": "홍길동",
+                "MBL_PHONE": "010-1234-5678",
+            },
+        }
+
+    def _on_search_schedule(self, params: dict) -> dict:
+        with self._lock:
+            trains = [self._train_row(train, params) for train in self.trains.values()]
+        return {**_result(True, "조회 완료"), "outDataSets": {"dsOutput1": trains}}
+
+    def _train_row(self, train: FakeTrain, params: dict) -> dict:
+        date = params.get("dptDt", "")
+        return {
+            "stlbTrnClsfCd": SRT_TRAIN_CODE,
+            "trnNo": train.train_number,
+            "dptDt": date,
+            "dptTm": train.dep_time,
+            "dptRsStnCd": params.get("dptRsStnCd", ""),
+            "dptStnRunOrdr": "000001",
+            "dptStnConsOrdr": "000001",
+            "arvDt": date,
+            "arvTm": train.arr_time,
+            "arvRsStnCd": params.get("arvRsStnCd", ""),
+            "arvStnRunOrdr": "000010",
+            "arvStnConsOrdr": "000010",
+            "gnrmRsvPsbStr": "예약가능" if train.general_seats > 0 else "매진",
+            "sprmRsvPsbStr": "예약가능" if train.special_seats > 0 else "매진",
+            "rsvWaitPsbCdNm": "",
+            "rsvWaitPsbCd": "-1",
+        }
+
+    def _on_reserve(self, params: dict) -> dict:
+        train = self.trains.get(str(int(params.get("trnNo1", "0"))))
+        if train is None:
+            return _result(False, "열차 정보가 없습니다.")
+
+        reservation = self._hold(
+            train,
+            special=params.get("psrmClCd1") == "2",
+            seat_count=int(params.get("totPrnb", "1")),
+            dep_date=params.get("dptDt1", ""),
+            dep_code=params.get("dptRsStnCd1", ""),
+            arr_code=params.get("arvRsStnCd1", ""),
+        )
+        if reservation is None:
+            return _result(False, "잔여석없음")
+
+        limit = datetime.now() + timedelta(minutes=10)
+        return {
+            **_result(True, "예약 완료"),
+            "reservListMap": [{
+                "pnrNo": reservation.reservation_number,
+                "iseLmtDt": limit.strftime("%Y%m%d"),
+                "iseLmtTm": limit.strftime("%H%M%S"),
+            }],
+        }
+
+    def _on_ticket_info(self, params: dict) -> dict:
+        reservation = self.reservations.get(params.get("pnrNo", ""))
+        if reservation is None:
+            return _result(False, "예약 내역이 없습니다.")
+        price = reservation.train.price
+        tickets = [
+            {
+                "scarNo": "5",
+                "seatNo": seat,
+                "psrmClCd": "2" if reservation.special else "1",
+                "dcntKndCd": "000",
+                "rcvdAmt": str(price),
+                "stdrPrc": str(price),
+                "dcntPrc": "0",
+            }
+            for seat in reservation.seats
+        ]
+        return {**_result(True), "trainListMap": tickets}
+
+    def _on_tickets(self, params: dict) -> dict:
+        with self._lock:
+            reservations = list(self.reservations.values())
+        return {
+            **_result(True),
+            "trainListMap": [self._reservation_train_row(r) for r in reservations],
+            "payListMap": [self._reservation_pay_row(r) for r in reservations],
+        }
+
+    @staticmethod
+    def _reservation_train_row(reservation: FakeReservation) -> dict:
+        return {
+            "pnrNo": reservation.reservation_number,
+            "rcvdAmt": str(reservation.train.price * reservation.seat_count),
+            "tkSpecNum": str(reservation.seat_count),
+        }
+
+    @staticmethod
+    def _reservation_pay_row(reservation: FakeReservation) -> dict:
+        return {
+            "stlbTrnClsfCd": SRT_TRAIN_CODE,
+            "trnNo": reservation.train.train_number,
+            "dptDt": reservation.dep_date,
+            "dptTm": reservation.train.dep_time,
+            "dptRsStnCd": reservation.dep_code,
+            "arvTm": reservation.train.arr_time,
+            "arvRsStnCd": reservation.arr_code,
+            "iseLmtDt": "" if reservation.paid else reservation.dep_date,
+            "iseLmtTm": "" if reservation.paid else "235959",
+            "stlFlg": "Y" if reservation.paid else "N",
+        }
+
+    def _on_cancel(self, params: dict) -> dict:
+        if self.cancel_reservation(params.get("pnrNo", "")) is None:
+            return _result(False, "예약 내역이 없습니다.")
+        return _result(True, "취소 완료")
+
+    def _on_payment(self, params: dict) -> dict:
+        if self._pay(params.get("pnrNo", "")) is None:
+            status = {"strResult": "FAIL", "msgTxt": "예약 내역이 없습니다."}
+        else:
+            status = {"strResult": "SUCC", "msgTxt": "결제 완료"}
+        return {"outDataSets": {"dsOutput0": [status]}}
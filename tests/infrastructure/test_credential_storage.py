@@ -6,6 +6,7 @@ from pathlib import Path
 from src.infrastructure.security.credential_storage import CredentialStorage
 from src.infrastructure.database.session import DatabaseManager
 from src.infrastructure.database.repository import SQLAlchemyUserRepository, SQLAlchemyCardRepository
+from src.infrastructure.security.dto import LoginCredentials, PaymentCredentials, StoredCredentials
 
 
 @pytest.fixture
@@ -455,3 +456,68 @@ class TestCredentialStorageIntegration:
         assert srt_login.username == "srt_user"
         assert ktx_payment.card_number == "1111111111111111"
         assert srt_payment.card_number == "2222222222222222"
+
+
+class TestBatchCredentials:
+    """Test cases for load_all/save_all"""
+
+    def test_save_all_and_load_all(self, credential_storage: CredentialStorage) -> None:
+        """Test saving and loading every credential in one call"""
+        stored = StoredCredentials(
+            logins={
+                "KORAIL": LoginCredentials(username="ktx_user", password="ktx_pass"),
+                "SRT": LoginCredentials(username="srt_user", password="srt_pass"),
+            },
+            payments={
+                "SRT": PaymentCredentials(
+                    card_number="9876543210987654",
+                    card_password="99",
+                    expire="2612",
+                    validation_number="1234567890",
+                    is_corporate=True
+                ),
+            },
+        )
+
+        credential_storage.save_all(stored)
+
+        # A fresh instance has an empty cache, so this reads from the database
+        fresh = CredentialStorage(
+            user_repository=SQLAlchemyUserRepository(),
+            card_repository=SQLAlchemyCardRepository()
+        )
+        loaded = fresh.load_all()
+
+        assert loaded == stored
+        assert fresh.load_payment("KORAIL") is None
+        assert fresh.load_ktx_login().username == "ktx_user"
+
+    def test_load_all_empty(self, credential_storage: CredentialStorage) -> None:
+        """Test that load_all returns empty mappings when nothing is saved"""
+        loaded = credential_storage.load_all()
+
+        assert loaded.logins == {}
+        assert loaded.payments == {}
+
+    def test_load_all_deletes_corrupted_rows(self, credential_storage: CredentialStorage) -> None:
+        """Test that rows which no longer decrypt are dropped from the database"""
+        credential_storage.save_srt_login("srt_user", "srt_pass")
+        credential_storage.save_payment("1234567890123456", "12", "2512", "900101", False)
+        SQLAlchemyUserRepository().save(username="not-a-ciphertext", password="x", train_type="KORAIL")
+        SQLAlchemyCardRepository().save(
+            card_number="not-a-ciphertext",
+            card_password="x",
+            card_expired_date="x",
+            card_validate_number="x",
+            is_corporate=False,
+            train_type="SRT"
+        )
+        credential_storage.clear_cache()
+
+        loaded = credential_storage.load_all()
+
+        assert set(loaded.logins) == {"SRT"}
+        assert set(loaded.payments) == {"KORAIL"}
+        assert SQLAlchemyUserRepository().find_by_train_type("KORAIL") is None
+        assert SQLAlchemyCardRepository().find_by_train_type("SRT") is None
+        assert SQLAlchemyUserRepository().find_by_train_type("SRT") is not None
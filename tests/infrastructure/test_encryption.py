@@ -104,3 +104,26 @@ class TestEncryptionService:
 
         # Should be 32 bytes (256 bits)
         assert len(key1) == 32
+
+    def test_key_derivation_is_cached(self, mocker) -> None:
+        """Test that the machine ID is looked up once until the cache is cleared"""
+        EncryptionService.clear_key_cache()
+        get_machine_id = mocker.patch.object(
+            EncryptionService, "_get_machine_id", return_value="machine-a"
+        )
+
+        try:
+            encrypted = EncryptionService.encrypt("secret")
+            assert EncryptionService.decrypt(encrypted) == "secret"
+            EncryptionService._derive_key()
+
+            assert get_machine_id.call_count == 1
+
+            # After invalidation the key is derived again from the new machine ID
+            EncryptionService.clear_key_cache()
+            get_machine_id.return_value = "machine-b"
+
+            assert EncryptionService.decrypt(encrypted) is None
+            assert get_machine_id.call_count == 2
+        finally:
+            EncryptionService.clear_key_cache()
@@ -175,6 +175,57 @@ class TestUserRepository:
         assert srt_user.username == "srt_user"
 
 
+    def test_find_all(self) -> None:
+        """Test that find_all returns every stored user"""
+        repo = SQLAlchemyUserRepository()
+        assert repo.find_all() == []
+
+        repo.save(username="korail_user", password="korail_pass", train_type="KORAIL")
+        repo.save(username="srt_user", password="srt_pass", train_type="SRT")
+
+        users = {user.train_type: user for user in repo.find_all()}
+
+        assert set(users) == {TrainType.KORAIL, TrainType.SRT}
+        assert users[TrainType.KORAIL].username == "korail_user"
+        assert users[TrainType.SRT].password == "srt_pass"
+
+    def test_save_all_inserts_and_updates(self) -> None:
+        """Test that save_all updates existing users and inserts new ones"""
+        repo = SQLAlchemyUserRepository()
+        original = repo.save(username="old_user", password="old_pass", train_type="KORAIL")
+
+        saved = repo.save_all([
+            {"username": "new_user", "password": "new_pass", "train_type": "KORAIL"},
+            {"username": "srt_user", "password": "srt_pass", "train_type": "SRT"},
+        ])
+
+        assert [user.train_type for user in saved] == [TrainType.KORAIL, TrainType.SRT]
+        assert saved[0].id == original.id
+        assert repo.find_by_train_type("KORAIL").username == "new_user"
+        assert repo.find_by_train_type("SRT").username == "srt_user"
+
+    def test_nested_sessions_share_one_transaction(self) -> None:
+        """Test that repository calls inside get_session() roll back together"""
+        user_repo = SQLAlchemyUserRepository()
+        card_repo = SQLAlchemyCardRepository()
+
+        with pytest.raises(RuntimeError):
+            with DatabaseManager.get_session():
+                user_repo.save(username="user", password="pass", train_type="KORAIL")
+                card_repo.save(
+                    card_number="number",
+                    card_password="pass",
+                    card_expired_date="2512",
+                    card_validate_number="900101",
+                    is_corporate=False,
+                    train_type="KORAIL"
+                )
+                raise RuntimeError("abort")
+
+        assert user_repo.find_all() == []
+        assert card_repo.find_all() == []
+
+
 class TestCardRepository:
     """Test cases for CardRepository"""
 
@@ -311,3 +362,32 @@ class TestCardRepository:
         assert srt_card.card_number == "srt_number"
         assert korail_card.is_corporate is False
         assert srt_card.is_corporate is True
+
+    def test_find_all_and_save_all(self) -> None:
+        """Test batch saving and loading of cards"""
+        repo = SQLAlchemyCardRepository()
+
+        repo.save_all([
+            {
+                "card_number": "korail_number",
+                "card_password": "korail_pass",
+                "card_expired_date": "2512",
+                "card_validate_number": "900101",
+                "is_corporate": False,
+                "train_type": "KORAIL",
+            },
+            {
+                "card_number": "srt_number",
+                "card_password": "srt_pass",
+                "card_expired_date": "2612",
+                "card_validate_number": "1234567890",
+                "is_corporate": True,
+                "train_type": "SRT",
+            },
+        ])
+
+        cards = {card.train_type: card for card in repo.find_all()}
+
+        assert set(cards) == {TrainType.KORAIL, TrainType.SRT}
+        assert cards[TrainType.KORAIL].card_number == "korail_number"
+        assert cards[TrainType.SRT].is_corporate is True
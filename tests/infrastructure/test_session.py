@@ -0,0 +1,135 @@
+"""Tests for database session management"""
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.database.models import Base
+from src.infrastructure.database.session import DatabaseManager, SCHEMA_REVISION
+from src.infrastructure.database.repository import SQLAlchemyUserRepository
+
+
+@pytest.fixture
+def db_file(tmp_path: Path, monkeypatch) -> Path:
+    """Point DatabaseManager at a fresh database file for each test"""
+    test_db_file = tmp_path / "test_session.db"
+    monkeypatch.setattr(DatabaseManager, "get_db_path", classmethod(lambda cls: test_db_file))
+    DatabaseManager._engine = None
+    DatabaseManager._session_factory = None
+
+    yield test_db_file
+
+    if DatabaseManager._engine is not None:
+        DatabaseManager._engine.dispose()
+    DatabaseManager._engine = None
+    DatabaseManager._session_factory = None
+
+
+def _restart() -> None:
+    """Simulate a new process start against the same database file"""
+    DatabaseManager._engine.dispose()
+    DatabaseManager._engine = None
+    DatabaseManager._session_factory = None
+
+
+class TestDatabaseManager:
+    """Test cases for DatabaseManager"""
+
+    def test_sqlite_pragmas_applied(self, db_file: Path) -> None:
+        """Test that connections use WAL journal mode and synchronous=NORMAL"""
+        DatabaseManager.initialize()
+
+        with DatabaseManager.get_session() as session:
+            journal_mode = session.execute(text("PRAGMA journal_mode")).scalar()
+            synchronous = session.execute(text("PRAGMA synchronous")).scalar()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+    def test_initialize_stamps_schema_revision(self, db_file: Path) -> None:
+        """Test that a new database records the current Alembic revision"""
+        DatabaseManager.initialize()
+
+        with DatabaseManager.get_session() as session:
+            revision = session.execute(text("SELECT version_num FROM alembic_version")).scalar()
+
+        assert revision == SCHEMA_REVISION
+
+    def test_warm_start_skips_create_all(self, db_file: Path, mocker) -> None:
+        """Test that schema creation is skipped when the revision matches"""
+        DatabaseManager.initialize()
+        SQLAlchemyUserRepository().save(username="user", password="pass", train_type="KORAIL")
+        _restart()
+        create_all = mocker.patch("src.infrastructure.database.session.Base.metadata.create_all")
+
+        DatabaseManager.initialize()
+
+        create_all.assert_not_called()
+        assert SQLAlchemyUserRepository().find_by_train_type("KORAIL").username == "user"
+
+    def test_pre_alembic_database_is_stamped(self, db_file: Path) -> None:
+        """Test that a database with tables but no alembic_version keeps its rows and is stamped"""
+        DatabaseManager.initialize()
+        SQLAlchemyUserRepository().save(username="user", password="pass", train_type="KORAIL")
+        with DatabaseManager.get_session() as session:
+            session.execute(text("DROP TABLE alembic_version"))
+        _restart()
+
+        DatabaseManager.initialize()
+
+        with DatabaseManager.get_session() as session:
+            assert session.execute(text("SELECT version_num FROM alembic_version")).scalar() == SCHEMA_REVISION
+        assert SQLAlchemyUserRepository().find_by_train_type("KORAIL").username == "user"
+
+    def test_other_revision_requires_upgrade(self, db_file: Path, mocker) -> None:
+        """Test that a database at another revision is neither recreated nor stamped"""
+        DatabaseManager.initialize()
+        with DatabaseManager.get_session() as session:
+            session.execute(text("UPDATE alembic_version SET version_num = 'old'"))
+        _restart()
+        create_all = mocker.spy(Base.metadata, "create_all")
+
+        with pytest.raises(RuntimeError, match="alembic upgrade head"):
+            DatabaseManager.initialize()
+
+        create_all.assert_not_called()
+        assert DatabaseManager._engine is None
+        with closing(sqlite3.connect(db_file)) as connection:
+            assert connection.execute("SELECT version_num FROM alembic_version").fetchone() == ("old",)
+
+    def test_sessions_from_worker_threads(self, db_file: Path) -> None:
+        """Test that sessions opened from several threads share the pooled engine"""
+        DatabaseManager.initialize()
+        repo = SQLAlchemyUserRepository()
+        errors = []
+
+        def worker(train_type: str) -> None:
+            try:
+                for i in range(20):
+                    repo.save(username=f"user{i}", password="pass", train_type=train_type)
+                    repo.find_by_train_type(train_type)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in ("KORAIL", "SRT")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert repo.find_by_train_type("SRT").username == "user19"
+
+    def test_schema_revision_matches_alembic_head(self) -> None:
+        """Test that SCHEMA_REVISION is kept in sync with the migration scripts"""
+        from alembic.config import Config
+        from alembic.script import ScriptDirectory
+
+        root = Path(__file__).resolve().parents[2]
+        config = Config(str(root / "alembic.ini"))
+        config.set_main_option("script_location", str(root / "alembic"))
+
+        assert ScriptDirectory.from_config(config).get_current_head() == SCHEMA_REVISION
@@ -154,7 +154,7 @@ class TestSRTServiceIntegration:
         mock_srt_train.seat_available.return_value = True
         mock_srt.search_train.return_value = [mock_srt_train]
         mock_srt.reserve.return_value = mock_srt_reservation
-        mock_srt.get_reservations.return_value = [mock_srt_reservation]
+        mock_srt.get_reservation.return_value = mock_srt_reservation
         mock_srt.pay_with_card.return_value = True
 
         srt_service._srt = mock_srt
@@ -0,0 +1,243 @@
+"""Tests of AsyncKTXService and AsyncSRTService against the local fake servers."""
+
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from src.domain.exceptions import (
+    TrainServiceConnectionError,
+    TrainServiceLoginError,
+    TrainServiceLoginExpiredError,
+    TrainServiceSoldOutError,
+    TrainServiceTimeoutError,
+)
+from src.domain.models.entities import CreditCard, ReservationRequest
+from src.infrastructure.adapters.ktx_service import AsyncKTXService
+from src.infrastructure.adapters.srt_service import AsyncSRTService
+from src.infrastructure.external.transport import create_async_transport
+from tests.fakes import korail_server as korail_fake
+from tests.fakes.korail_server import FakeKorailServer
+from tests.fakes.srt_server import FakeSRTServer, FakeTrain
+
+CARD = CreditCard("1234567812345678", "12", "900101", "2912", is_corporate=False)
+
+
+def _request(departure: str, arrival: str) -> ReservationRequest:
+    return ReservationRequest(departure, arrival, date.today() + timedelta(days=7), "080000")
+
+
+@pytest.fixture
+def korail_server():
+    with FakeKorailServer([FakeTrain("101", general_seats=1), FakeTrain("103")]) as fake:
+        yield fake
+
+
+@pytest.fixture
+def srt_server():
+    with FakeSRTServer([FakeTrain("301", general_seats=1), FakeTrain("303")]) as fake:
+        yield fake
+
+
+async def _logged_in(service):
+    await service.login("test@example.com", "password")
+    return service
+
+
+class TestAsyncKTXService:
+    """Test AsyncKTXService and the errors it raises."""
+
+    def test_search_reserve_and_pay(self, korail_server):
+        """Test a successful attempt end to end."""
+        request = _request("서울", "부산")
+
+        async def attempt():
+            service = await _logged_in(AsyncKTXService(**korail_server.client_options()))
+            try:
+                schedules = await service.search_trains(request)
+                reservation = await service.reserve_train(schedules, request)
+                return schedules, reservation, await service.payment_reservation(reservation, CARD)
+            finally:
+                await service.close()
+
+        schedules, reservation, payment = asyncio.run(attempt())
+
+        assert [s.train_number for s in schedules] == ["101", "103"]
+        assert reservation.success is True
+        assert reservation.train_schedule.train_number == "101"
+        assert payment.success is True
+        assert payment.reservation_number == reservation.reservation_number
+
+    def test_sold_out_raises(self, korail_server):
+        """Test that no seat on the requested trains raises TrainServiceSoldOutError."""
+        # Arrange
+        request = _request("서울", "부산")
+
+        async def attempt():
+            service = await _logged_in(AsyncKTXService(**korail_server.client_options()))
+            try:
+                schedules = await service.search_trains(request)
+                korail_server.set_seats("101", general=0)
+                await service.reserve_train(schedules, request)
+            finally:
+                await service.close()
+
+        # Act & Assert
+        with pytest.raises(TrainServiceSoldOutError):
+            asyncio.run(attempt())
+
+    def test_rejected_login_raises(self, korail_server, monkeypatch):
+        """Test that a failed login raises TrainServiceLoginError."""
+        # Arrange
+        monkeypatch.setattr(
+            korail_server, "_on_login", lambda params: korail_fake._fail("WRG000000", "비밀번호 오류")
+        )
+
+        async def login():
+            service = AsyncKTXService(**korail_server.client_options())
+            try:
+                await service.login("test@example.com", "wrong")
+            finally:
+                await service.close()
+
+        # Act & Assert
+        with pytest.raises(TrainServiceLoginError):
+            asyncio.run(login())
+
+    def test_expired_session_raises(self, korail_server, monkeypatch):
+        """Test that a need-to-login reply raises TrainServiceLoginExpiredError."""
+        # Arrange
+        monkeypatch.setattr(
+            korail_server,
+            "_on_search_schedule",
+            lambda params: korail_fake._fail(korail_fake.NEED_LOGIN_CODE, "로그인 후 이용하세요."),
+        )
+
+        async def search():
+            service = await _logged_in(AsyncKTXService(**korail_server.client_options()))
+            try:
+                await service.search_trains(_request("서울", "부산"))
+            finally:
+                await service.close()
+
+        # Act & Assert
+        with pytest.raises(TrainServiceLoginExpiredError):
+            asyncio.run(search())
+
+    def test_not_logged_in_raises_without_request(self, korail_server):
+        """Test that calls before login raise TrainServiceLoginExpiredError."""
+        async def search():
+            service = AsyncKTXService(**korail_server.client_options())
+            try:
+                await service.search_trains(_request("서울", "부산"))
+            finally:
+                await service.close()
+
+        with pytest.raises(TrainServiceLoginExpiredError):
+            asyncio.run(search())
+        assert korail_server.counts.get("search_schedule", 0) == 0
+
+    def test_timeout_raises(self, korail_server):
+        """Test that a slow reply raises TrainServiceTimeoutError."""
+        korail_server.latency = 0.5
+
+        async def login():
+            service = AsyncKTXService(timeouts={"login": 0.2}, **korail_server.client_options())
+            try:
+                await service.login("test@example.com", "password")
+            finally:
+                await service.close()
+
+        with pytest.raises(TrainServiceTimeoutError):
+            asyncio.run(login())
+
+    def test_unreachable_host_raises_connection_error(self, korail_server):
+        """Test that a refused connection raises TrainServiceConnectionError."""
+        base_url = korail_server.base_url
+        korail_server.stop()
+
+        async def login():
+            service = AsyncKTXService(base_url=base_url)
+            try:
+                await service.login("test@example.com", "password")
+            finally:
+                await service.close()
+
+        with pytest.raises(TrainServiceConnectionError):
+            asyncio.run(login())
+
+
+class TestAsyncSRTService:
+    """Test AsyncSRTService and the errors it raises."""
+
+    def test_search_reserve_and_pay(self, srt_server):
+        """Test a successful attempt end to end."""
+        request = _request("수서", "부산")
+
+        async def attempt():
+            service = await _logged_in(AsyncSRTService(**srt_server.client_options()))
+            try:
+                schedules = await service.search_trains(request)
+                reservation = await service.reserve_train(schedules, request)
+                return schedules, reservation, await service.payment_reservation(reservation, CARD)
+            finally:
+                await service.close()
+
+        schedules, reservation, payment = asyncio.run(attempt())
+
+        assert [s.train_number for s in schedules] == ["301", "303"]
+        assert reservation.train_schedule.train_number == "301"
+        assert payment.success is True
+
+    def test_seat_taken_between_search_and_reserve(self, srt_server, monkeypatch):
+        """Test that the server's sold-out reply raises TrainServiceSoldOutError."""
+        # Arrange: searches still report the seat the reserve call finds gone
+        request = _request("수서", "부산")
+        reserve = srt_server._on_reserve
+
+        def sold_out_reserve(params):
+            srt_server.set_seats("301", general=0)
+            return reserve(params)
+
+        monkeypatch.setattr(srt_server, "_on_reserve", sold_out_reserve)
+
+        async def attempt():
+            service = await _logged_in(AsyncSRTService(**srt_server.client_options()))
+            try:
+                await service.reserve_train(await service.search_trains(request), request)
+            finally:
+                await service.close()
+
+        # Act & Assert
+        with pytest.raises(TrainServiceSoldOutError):
+            asyncio.run(attempt())
+
+
+class TestServicesOnOneLoop:
+    """Test several async services sharing one loop and transport."""
+
+    def test_ktx_and_srt_jobs_overlap(self, korail_server, srt_server):
+        """Test that a KTX and an SRT search run concurrently over one transport."""
+        # Arrange
+        korail_server.latency = srt_server.latency = 0.3
+        transport = create_async_transport()
+
+        async def both():
+            ktx = await _logged_in(AsyncKTXService(transport=transport, **korail_server.client_options()))
+            srt = await _logged_in(AsyncSRTService(transport=transport, **srt_server.client_options()))
+            try:
+                loop = asyncio.get_running_loop()
+                started = loop.time()
+                results = await asyncio.gather(
+                    ktx.search_trains(_request("서울", "부산")), srt.search_trains(_request("수서", "부산"))
+                )
+                return results, loop.time() - started
+            finally:
+                await asyncio.gather(ktx.close(), srt.close())
+
+        # Act
+        (ktx_trains, srt_trains), elapsed = asyncio.run(both())
+
+        # Assert
+        assert len(ktx_trains) == 2 and len(srt_trains) == 2
+        assert elapsed < 1.2  # the SRT search alone is 3 round trips (NetFunnel x2 + search)
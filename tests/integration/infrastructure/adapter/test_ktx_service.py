@@ -3,8 +3,11 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, date
 from src.infrastructure.adapters.ktx_service import KTXService
+from src.infrastructure.external.ktx import Reservation
 from src.domain.models.entities import ReservationRequest, Passenger, CreditCard, ReservationResult
+from src.domain.exceptions import TrainServiceTimeoutError
 from src.domain.models.enums import PassengerType, TrainType
+from src.infrastructure.external.ktx import KorailTimeoutError
 
 
 @pytest.fixture
@@ -216,6 +219,7 @@ class TestKTXServiceReserveTrain:
         assert result.success is True
         assert result.reservation_number == "R123456"
         assert result.train_schedule == sample_train_schedule
+        assert result.handle is mock_reservation
 
     @patch('src.infrastructure.adapters.ktx_service.Korail')
     def test_reserve_train_success_second_train(self, mock_korail_class, ktx_service, sample_reservation_request):
@@ -380,6 +384,129 @@ class TestKTXServicePayment:
         assert result.message == "Reservation not found"
 
 
+    @patch('src.infrastructure.adapters.ktx_service.Korail')
+    def test_payment_reuses_held_reservation(self, mock_korail_class, ktx_service):
+        """Test payment uses the reservation held by reserve_train without re-fetching"""
+        # Arrange
+        ktx_service._logged_in = True
+        mock_korail = Mock()
+        mock_korail.pay_with_card.return_value = True
+        ktx_service._korail = mock_korail
+
+        held = Reservation({
+            "h_pnr_no": "R123456",
+            "h_tot_seat_cnt": "1",
+            "h_rsv_amt": "59800",
+        })
+        held.tickets, held.wct_no = [], "001"
+        mock_reservation = ReservationResult(
+            success=True,
+            reservation_number="R123456",
+            message="Success",
+            handle=held,
+        )
+        mock_card = CreditCard(
+            number="1234567812345678",
+            password="12",
+            validation_number="990101",
+            expire="2512",
+            is_corporate=False
+        )
+
+        # Act
+        result = ktx_service.payment_reservation(mock_reservation, mock_card)
+
+        # Assert
+        assert result.success is True
+        mock_korail.reservations.assert_not_called()
+        assert mock_korail.pay_with_card.call_args.args[0] is held
+
+
+class TestKTXServiceTimeouts:
+    """Tests for request timeouts and the reserve -> pay deadline"""
+
+    @patch('src.infrastructure.adapters.ktx_service.Korail')
+    def test_client_timeout_raises_service_timeout(self, mock_ktx_class, ktx_service, sample_reservation_request, sample_train_schedule):
+        """Test that a client timeout surfaces as TrainServiceTimeoutError"""
+        # Arrange
+        ktx_service._logged_in = True
+        mock_client = Mock()
+        mock_client.search_train.side_effect = KorailTimeoutError("search_schedule timed out after 5.0s")
+        ktx_service._korail = mock_client
+
+        # Act / Assert
+        with pytest.raises(TrainServiceTimeoutError, match="search_schedule timed out"):
+            ktx_service.reserve_train([sample_train_schedule], sample_reservation_request)
+        assert mock_client.deadline is None
+
+    @patch('src.infrastructure.adapters.ktx_service.Korail')
+    def test_payment_continues_attempt_deadline(self, mock_ktx_class, ktx_service, sample_reservation_request, sample_train_schedule):
+        """Test that paying the reservation just made shares the reserve deadline"""
+        # Arrange
+        ktx_service._logged_in = True
+        mock_client = Mock()
+        deadlines = {}
+
+        mock_train = Mock()
+        mock_train.train_no = "001"
+        mock_train.has_seat.return_value = True
+        mock_reservation = Mock()
+        mock_reservation.rsv_id = "R123456"
+
+        def reserve(**kwargs):
+            deadlines["reserve"] = mock_client.deadline
+            return mock_reservation
+
+        def pay_with_card(*args, **kwargs):
+            deadlines["pay"] = mock_client.deadline
+            return True
+
+        mock_client.search_train.return_value = [mock_train]
+        mock_client.reserve.side_effect = reserve
+        mock_client.pay_with_card.side_effect = pay_with_card
+        ktx_service._korail = mock_client
+        card = CreditCard(
+            number="1234567812345678",
+            password="12",
+            validation_number="990101",
+            expire="2512",
+            is_corporate=False
+        )
+
+        # Act
+        reservation = ktx_service.reserve_train([sample_train_schedule], sample_reservation_request)
+        assert mock_client.deadline is None
+        payment = ktx_service.payment_reservation(reservation, card)
+
+        # Assert
+        assert payment.success is True
+        assert deadlines["reserve"] is not None
+        assert deadlines["pay"] == deadlines["reserve"]
+        assert mock_client.deadline is None
+
+    @patch('src.infrastructure.adapters.ktx_service.Korail')
+    def test_payment_timeout_raises_service_timeout(self, mock_ktx_class, ktx_service):
+        """Test that a payment timeout surfaces as TrainServiceTimeoutError"""
+        # Arrange
+        ktx_service._logged_in = True
+        mock_client = Mock()
+        mock_client.pay_with_card.side_effect = KorailTimeoutError("Deadline exceeded")
+        ktx_service._korail = mock_client
+        reservation = ReservationResult(success=True, reservation_number="R123456", message="Success")
+        card = CreditCard(
+            number="1234567812345678",
+            password="12",
+            validation_number="990101",
+            expire="2512",
+            is_corporate=False
+        )
+
+        # Act / Assert
+        with pytest.raises(TrainServiceTimeoutError):
+            ktx_service.payment_reservation(reservation, card)
+        assert mock_client.deadline is None
+
+
 class TestKTXServiceClear:
     """Tests for KTXService clear method"""
 
@@ -415,5 +542,7 @@ class TestKTXServiceClear:
         ktx_service.clear()
 
         # Assert
-        mock_korail_class.assert_called_once_with(auto_login=False)
+        mock_korail_class.assert_called_once_with(
+            auto_login=False, cancel_token=None, timeouts=None, base_url=None, metrics=ktx_service.metrics
+        )
         assert ktx_service._korail == new_mock_korail
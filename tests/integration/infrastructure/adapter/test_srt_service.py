@@ -3,8 +3,11 @@ import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime, date
 from src.infrastructure.adapters.srt_service import SRTService
+from src.infrastructure.external.srt import SRTReservation
 from src.domain.models.entities import ReservationRequest, Passenger, CreditCard, ReservationResult
+from src.domain.exceptions import TrainServiceTimeoutError
 from src.domain.models.enums import PassengerType, TrainType
+from src.infrastructure.external.srt import SRTTimeoutError
 
 
 @pytest.fixture
@@ -223,6 +226,7 @@ class TestSRTServiceReserveTrain:
         assert result.success is True
         assert result.reservation_number == "R123456"
         assert result.train_schedule == sample_srt_train_schedule
+        assert result.handle is mock_reservation
 
     @patch('src.infrastructure.adapters.srt_service.SRT')
     def test_reserve_train_success_second_train(self, mock_srt_class, srt_service, sample_reservation_request):
@@ -363,7 +367,7 @@ class TestSRTServicePayment:
         # Arrange
         srt_service._logged_in = True
         mock_srt = Mock()
-        mock_srt.get_reservations.return_value = []
+        mock_srt.get_reservation.return_value = None
         srt_service._srt = mock_srt
 
         mock_reservation = ReservationResult(
@@ -387,6 +391,140 @@ class TestSRTServicePayment:
         assert result.message == "Reservation not found"
 
 
+    @patch('src.infrastructure.adapters.srt_service.SRT')
+    def test_payment_reuses_held_reservation(self, mock_srt_class, srt_service):
+        """Test payment uses the reservation held by reserve_train without re-fetching"""
+        # Arrange
+        srt_service._logged_in = True
+        mock_srt = Mock()
+        mock_srt.pay_with_card.return_value = True
+        srt_service._srt = mock_srt
+
+        held = SRTReservation(
+            {"pnrNo": "R123456", "rcvdAmt": "52000", "seatNum": "1"},
+            {
+                "stlbTrnClsfCd": "17",
+                "trnNo": "301",
+                "dptDt": "20250115",
+                "dptTm": "100000",
+                "dptRsStnCd": "0551",
+                "arvTm": "123000",
+                "arvRsStnCd": "0020",
+                "iseLmtDt": "20250115",
+                "iseLmtTm": "095959",
+                "stlFlg": "N",
+            },
+            [],
+        )
+        mock_reservation = ReservationResult(
+            success=True,
+            reservation_number="R123456",
+            message="Success",
+            handle=held,
+        )
+        mock_card = CreditCard(
+            number="1234567812345678",
+            password="12",
+            validation_number="990101",
+            expire="2512",
+            is_corporate=False
+        )
+
+        # Act
+        result = srt_service.payment_reservation(mock_reservation, mock_card)
+
+        # Assert
+        assert result.success is True
+        mock_srt.get_reservation.assert_not_called()
+        mock_srt.get_reservations.assert_not_called()
+        assert mock_srt.pay_with_card.call_args.args[0] is held
+
+
+class TestSRTServiceTimeouts:
+    """Tests for request timeouts and the reserve -> pay deadline"""
+
+    @patch('src.infrastructure.adapters.srt_service.SRT')
+    def test_client_timeout_raises_service_timeout(self, mock_srt_class, srt_service, sample_reservation_request, sample_srt_train_schedule):
+        """Test that a client timeout surfaces as TrainServiceTimeoutError"""
+        # Arrange
+        srt_service._logged_in = True
+        mock_client = Mock()
+        mock_client.search_train.side_effect = SRTTimeoutError("search_schedule timed out after 5.0s")
+        srt_service._srt = mock_client
+
+        # Act / Assert
+        with pytest.raises(TrainServiceTimeoutError, match="search_schedule timed out"):
+            srt_service.reserve_train([sample_srt_train_schedule], sample_reservation_request)
+        assert mock_client.deadline is None
+
+    @patch('src.infrastructure.adapters.srt_service.SRT')
+    def test_payment_continues_attempt_deadline(self, mock_srt_class, srt_service, sample_reservation_request, sample_srt_train_schedule):
+        """Test that paying the reservation just made shares the reserve deadline"""
+        # Arrange
+        srt_service._logged_in = True
+        mock_client = Mock()
+        deadlines = {}
+
+        mock_train = Mock()
+        mock_train.train_number = "S001"
+        mock_train.seat_available.return_value = True
+        mock_reservation = Mock()
+        mock_reservation.reservation_number = "R123456"
+
+        def reserve(**kwargs):
+            deadlines["reserve"] = mock_client.deadline
+            return mock_reservation
+
+        def pay_with_card(*args, **kwargs):
+            deadlines["pay"] = mock_client.deadline
+            return True
+
+        mock_client.search_train.return_value = [mock_train]
+        mock_client.reserve.side_effect = reserve
+        mock_client.pay_with_card.side_effect = pay_with_card
+        srt_service._srt = mock_client
+        card = CreditCard(
+            number="1234567812345678",
+            password="12",
+            validation_number="990101",
+            expire="2512",
+            is_corporate=False
+        )
+
+        # Act
+        reservation = srt_service.reserve_train([sample_srt_train_schedule], sample_reservation_request)
+        assert mock_client.deadline is None
+        payment = srt_service.payment_reservation(reservation, card)
+
+        # Assert
+        assert payment.success is True
+        assert deadlines["reserve"] is not None
+        assert deadlines["pay"] == deadlines["reserve"]
+        assert mock_client.deadline is None
+
+    @patch('src.infrastructure.adapters.srt_service.SRT')
+    def test_payment_timeout_raises_service_timeout(self, mock_srt_class, srt_service):
+        """Test that a payment timeout surfaces as TrainServiceTimeoutError"""
+        # Arrange
+        srt_service._logged_in = True
+        mock_client = Mock()
+        mock_client.pay_with_card.side_effect = SRTTimeoutError("Deadline exceeded")
+        srt_service._srt = mock_client
+        reservation = ReservationResult(success=True, reservation_number="R123456", message="Success")
+        card = CreditCard(
+            number="1234567812345678",
+            password="12",
+            validation_number="990101",
+            expire="2512",
+            is_corporate=False
+        )
+
+        # Act / Assert
+        with pytest.raises(TrainServiceTimeoutError):
+            srt_service.payment_reservation(reservation, card)
+        assert mock_client.deadline is None
+
+
 class TestSRTServiceClear:
     """Tests for SRTService clear method"""
 
@@ -425,5 +563,12 @@ class TestSRTServiceClear:
         srt_service.clear()
 
         # Assert
-        mock_srt_class.assert_called_once_with(auto_login=False)
+        mock_srt_class.assert_called_once_with(
+            auto_login=False,
+            cancel_token=None,
+            timeouts=None,
+            base_url=None,
+            netfunnel_url=None,
+            metrics=srt_service.metrics,
+        )
         assert srt_service._srt == new_mock_srt
@@ -0,0 +1,75 @@
+"""Tests of attempt traces written by the engine and services against the fake SRT server."""
+
+from datetime import date, datetime, time, timedelta
+
+from src.domain.models.entities import CreditCard, ReservationRequest, TrainSchedule
+from src.domain.models.enums import TrainType
+from src.domain.services.reservation_engine import ReservationEngine, ReservationJob, ReservationState
+from src.domain.services.tracing import Tracer
+from src.infrastructure.adapters.srt_service import SRTService
+from src.infrastructure.tracing import JsonlSpanExporter
+from src.infrastructure.tracing.analyze import load_spans, report, summarize, trace_files
+from tests.fakes.srt_server import FakeSRTServer, FakeTrain
+
+CARD = CreditCard("1234567812345678", "12", "900101", "2912", is_corporate=False)
+
+
+class TestAttemptTraces:
+    """Test the JSONL traces of a reservation loop and their analysis."""
+
+    def test_loop_trace_is_written_and_analyzed(self, tmp_path):
+        """Test that failed and successful attempts produce nested spans the analyzer breaks down."""
+        # Arrange: the only train gets a seat once it has been searched twice
+        path = tmp_path / "attempts.jsonl"
+        travel_date = date.today() + timedelta(days=7)
+        request = ReservationRequest("수서", "부산", travel_date, "080000")
+        train = TrainSchedule(
+            "301", "수서", "부산", datetime.combine(travel_date, time(8)), datetime.combine(travel_date, time(10)),
+            TrainType.SRT, 0,
+        )
+        with FakeSRTServer([FakeTrain("301")]) as server:
+            server.schedule(2, lambda fake: fake.release_seats("301", general=1))
+            service = SRTService(**server.client_options())
+            service.login("test@example.com", "password")
+            job = ReservationJob([train], request, "test@example.com", "password", CARD)
+            exporter = JsonlSpanExporter(path)
+            engine = ReservationEngine(service, job, lambda event: None, sleep=lambda _: None, tracer=Tracer(exporter))
+
+            # Act
+            state = engine.run()
+            exporter.close()
+
+        # Assert
+        assert state == ReservationState.COMPLETED
+        records = load_spans([path])
+        by_name = {}
+        for record in records:
+            by_name.setdefault(record["name"], []).append(record)
+        assert {"attempt", "search", "netfunnel", "parse", "select", "reserve", "reservation_lookup", "payment"} <= set(by_name)
+        search = by_name["search"][0]
+        assert by_name["netfunnel"][0]["parent"] == search["span"]
+        assert by_name["parse"][0]["parent"] == search["span"]
+        assert by_name["reserve"][0]["attrs"]["train"] == "301"
+
+        summary = summarize(records)
+        assert summary.attempts == 2
+        assert dict(summary.results) == {"reserve_failed": 1, "paid": 1}
+        assert len(summary.pauses) == 1
+        assert "payment" in report(summary)
+
+    def test_exporter_rotates_files(self, tmp_path):
+        """Test that a full trace file is rotated and the backups are read oldest first."""
+        path = tmp_path / "attempts.jsonl"
+        # Every trace fills the file, so each one ends up in a backup of its own
+        exporter = JsonlSpanExporter(path, max_bytes=1, backup_count=2)
+        tracer = Tracer(exporter)
+
+        for attempt in range(1, 6):
+            with tracer.trace("attempt", attempt=attempt, result="reserve_failed"):
+                pass
+        exporter.close()
+
+        files = trace_files(path)
+        assert [f.name for f in files] == ["attempts.jsonl.2", "attempts.jsonl.1"]
+        attempts = [record["attrs"]["attempt"] for record in load_spans([path])]
+        assert attempts == sorted(attempts) and attempts[-1] == 5
@@ -0,0 +1,177 @@
+"""End-to-end tests of AsyncSRT and AsyncKorail against the local fake servers."""
+
+import asyncio
+import threading
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from src.infrastructure.external.ktx import AsyncKorail, Reservation
+from src.infrastructure.external.srt import AsyncSRT, SRTCancelledError, SRTTimeoutError
+from src.infrastructure.external.transport import create_async_transport
+from tests.fakes.korail_server import FakeKorailServer
+from tests.fakes.srt_server import FakeSRTServer, FakeTrain
+
+
+def _travel_date() -> str:
+    return (date.today() + timedelta(days=7)).strftime("%Y%m%d")
+
+
+@pytest.fixture
+def srt_server():
+    with FakeSRTServer([FakeTrain("301", general_seats=2), FakeTrain("303")]) as fake:
+        yield fake
+
+
+@pytest.fixture
+def korail_server():
+    with FakeKorailServer([FakeTrain("101", general_seats=2), FakeTrain("103")]) as fake:
+        yield fake
+
+
+class TestAsyncSRT:
+    """Test AsyncSRT over real HTTP against FakeSRTServer."""
+
+    def test_search_reserve_pay_and_cancel(self, srt_server):
+        """Test the full flow with the same results as the sync client."""
+        async def flow():
+            async with AsyncSRT("test@example.com", "password", **srt_server.client_options()) as srt:
+                assert await srt.login() is True
+                trains = await srt.search_train("수서", "부산", _travel_date(), "080000", available_only=False)
+                reservation = await srt.reserve(trains[0])
+                paid = await srt.pay_with_card(reservation, "1234567812345678", "12", "900101", "2912")
+                other = await srt.reserve(trains[0])
+                cancelled = await srt.cancel(other)
+                return trains, reservation, paid, cancelled
+
+        trains, reservation, paid, cancelled = asyncio.run(flow())
+
+        assert [t.train_number for t in trains] == ["301", "303"]
+        assert reservation.train_number == "301"
+        assert reservation.total_cost == 52000
+        assert len(reservation.tickets) == 1
+        assert paid is True and cancelled is True
+        assert srt_server.trains["301"].general_seats == 1
+
+    def test_get_reservations_fetches_tickets_up_front(self, srt_server):
+        """Test that get_reservations returns reservations whose tickets need no further request."""
+        # Arrange
+        async def flow():
+            async with AsyncSRT("test@example.com", "password", **srt_server.client_options()) as srt:
+                await srt.login()
+                trains = await srt.search_train("수서", "부산", _travel_date(), "080000")
+                await asyncio.gather(srt.reserve(trains[0]), srt.reserve(trains[0]))
+                before = srt_server.counts["ticket_info"]
+                reservations = await srt.get_reservations()
+                return reservations, srt_server.counts["ticket_info"] - before
+
+        # Act
+        reservations, ticket_requests = asyncio.run(flow())
+
+        # Assert
+        assert ticket_requests == 2
+        assert [len(r.tickets) for r in reservations] == [1, 1]
+        assert srt_server.counts["netfunnel"] == 2  # the concurrent reserves shared one queue pass
+
+    def test_get_reservation_leaves_tickets_to_ticket_info(self, srt_server):
+        """Test that get_reservation makes no ticket request and ticket_info fetches them."""
+        # Arrange
+        async def flow():
+            async with AsyncSRT("test@example.com", "password", **srt_server.client_options()) as srt:
+                await srt.login()
+                reserved = await srt.reserve((await srt.search_train("수서", "부산", _travel_date(), "080000"))[0])
+                before = srt_server.counts["ticket_info"]
+                reservation = await srt.get_reservation(reserved.reservation_number)
+                requests = srt_server.counts["ticket_info"] - before
+                return reservation, requests, await srt.ticket_info(reservation)
+
+        # Act
+        reservation, ticket_requests, tickets = asyncio.run(flow())
+
+        # Assert
+        assert ticket_requests == 0
+        assert reservation.tickets is None
+        assert len(tickets) == 1
+
+    def test_cancel_token_ends_netfunnel_wait(self, srt_server):
+        """Test that setting the threading.Event token stops a queued search promptly."""
+        # Arrange
+        srt_server.netfunnel_waits = 100
+        token = threading.Event()
+        threading.Timer(0.1, token.set).start()
+
+        async def search():
+            async with AsyncSRT(cancel_token=token, **srt_server.client_options()) as srt:
+                await srt.search_train("수서", "부산", _travel_date(), "080000")
+
+        # Act & Assert
+        started = time.monotonic()
+        with pytest.raises(SRTCancelledError):
+            asyncio.run(search())
+        assert time.monotonic() - started < 1.0
+
+    def test_timeout_raises_client_error(self, srt_server):
+        """Test that a slow response raises SRTTimeoutError."""
+        srt_server.latency = 0.5
+
+        async def login():
+            async with AsyncSRT(timeouts={"login": 0.2}, **srt_server.client_options()) as srt:
+                await srt.login("test@example.com", "password")
+
+        with pytest.raises(SRTTimeoutError):
+            asyncio.run(login())
+
+
+class TestAsyncKorail:
+    """Test AsyncKorail over real HTTP against FakeKorailServer."""
+
+    def test_search_reserve_pay_and_cancel(self, korail_server):
+        """Test the full flow and that reservations come with their seats loaded."""
+        async def flow():
+            async with AsyncKorail(**korail_server.client_options()) as korail:
+                assert await korail.login("test@example.com", "password") is True
+                trains = await korail.search_train("서울", "부산", _travel_date(), "080000")
+                reservation = await korail.reserve(trains[0])
+                other = await korail.reserve(trains[0])
+                pending = await korail.reservations()
+                cancelled = await korail.cancel(other)
+                paid = await korail.pay_with_card(reservation, "1234567812345678", "12", "900101", "2912")
+                return trains, reservation, pending, cancelled, paid
+
+        trains, reservation, pending, cancelled, paid = asyncio.run(flow())
+
+        assert [t.train_no for t in trains] == ["101"]
+        assert isinstance(reservation, Reservation)
+        assert reservation.wct_no is not None
+        assert len(reservation.tickets) == 1
+        assert [len(r.tickets) for r in pending] == [1, 1]
+        assert cancelled is True and paid is True
+        assert korail_server.trains["101"].general_seats == 1
+
+    def test_clients_share_one_transport(self, korail_server):
+        """Test that several clients on one loop run their searches concurrently over one transport."""
+        # Arrange
+        korail_server.latency = 0.2
+        transport = create_async_transport()
+        timings = []
+        transport.add_hook(timings.append)
+
+        async def watch(n):
+            clients = [AsyncKorail(transport=transport, **korail_server.client_options()) for _ in range(n)]
+            try:
+                await asyncio.gather(*(c.login("test@example.com", "password") for c in clients))
+                started = time.monotonic()
+                await asyncio.gather(
+                    *(c.search_train("서울", "부산", _travel_date(), "080000") for c in clients)
+                )
+                return time.monotonic() - started
+            finally:
+                await asyncio.gather(*(c.close() for c in clients))
+
+        # Act
+        elapsed = asyncio.run(watch(4))
+
+        # Assert
+        assert elapsed < 0.6
+        assert len(timings) == 4 * 3  # code + login + search per client
@@ -0,0 +1,137 @@
+"""Tests of recording client traffic against the fake servers and replaying it."""
+
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from src.infrastructure.external.cassette import (
+    REDACTED,
+    CassetteError,
+    RecordingTransport,
+    ReplayTransport,
+    load_cassette,
+)
+from src.infrastructure.external.ktx import Korail
+from src.infrastructure.external.srt import SRT, SRTTimeoutError
+from src.infrastructure.external.transport import create_transport
+from tests.fakes.korail_server import FakeKorailServer
+from tests.fakes.srt_server import FakeSRTServer, FakeTrain
+
+CARD = ("9410123412341234", "12", "900101", "2912")
+
+
+def _travel_date() -> str:
+    return (date.today() + timedelta(days=7)).strftime("%Y%m%d")
+
+
+def _srt_flow(srt: SRT):
+    srt.login("user@example.com", "s3cret-pass")
+    trains = srt.search_train("수서", "부산", _travel_date(), "080000")
+    reservation = srt.reserve(trains[0])
+    paid = srt.pay_with_card(reservation, *CARD)
+    return [t.train_number for t in trains], reservation.reservation_number, paid
+
+
+class TestRecordAndReplay:
+    """Test RecordingTransport and ReplayTransport with the real clients."""
+
+    def test_replayed_srt_flow_matches_the_recording(self, tmp_path):
+        """Test that a recorded SRT flow replays to the same results without a server."""
+        # Arrange: record the flow against the fake server
+        cassette = tmp_path / "srt.jsonl"
+        with FakeSRTServer([FakeTrain("301", general_seats=1)]) as server:
+            recorder = RecordingTransport(cassette, create_transport())
+            recorded = _srt_flow(SRT(auto_login=False, transport=recorder, **server.client_options()))
+            base_url, netfunnel_url = server.base_url, server.netfunnel_url
+
+        # Act
+        replay = ReplayTransport(cassette)
+        replayed = _srt_flow(SRT(auto_login=False, transport=replay, base_url=base_url, netfunnel_url=netfunnel_url))
+
+        # Assert
+        assert replayed == recorded == (["301"], recorded[1], True)
+        assert replay.unplayed == 0
+
+    def test_credentials_and_card_are_scrubbed(self, tmp_path):
+        """Test that no login or card value reaches the cassette file."""
+        cassette = tmp_path / "srt.jsonl"
+        with FakeSRTServer([FakeTrain("301", general_seats=1)]) as server:
+            _srt_flow(SRT(auto_login=False, transport=RecordingTransport(cassette), **server.client_options()))
+
+        text = cassette.read_text(encoding="utf-8")
+        for secret in ("user@example.com", "s3cret-pass", *CARD[:1], "2912", "900101"):
+            assert secret not in text
+        login = next(i for i in load_cassette(cassette) if i.data.get("srchDvNm"))
+        assert login.data["srchDvNm"] == login.data["hmpgPwdCphd"] == REDACTED
+
+    def test_bodies_sharing_digits_with_the_card_still_parse(self, tmp_path):
+        """Test that card expiry and birthday values do not mangle dates in later bodies."""
+        # Arrange: a card whose expiry (YYMM) and birthday (YYMMDD) are part of the travel date
+        travel_date = _travel_date()
+        card = (CARD[0], CARD[1], travel_date[2:], travel_date[2:6])
+
+        def flow(srt: SRT):
+            srt.login("user@example.com", "s3cret-pass")
+            reservation = srt.reserve(srt.search_train("수서", "부산", travel_date, "080000")[0])
+            srt.pay_with_card(reservation, *card)
+            return [(r.reservation_number, r.dep_date, r.total_cost, r.paid) for r in srt.get_reservations()]
+
+        cassette = tmp_path / "srt.jsonl"
+        with FakeSRTServer([FakeTrain("301", general_seats=1)]) as server:
+            recorded = flow(SRT(auto_login=False, transport=RecordingTransport(cassette), **server.client_options()))
+            options = server.client_options()
+
+        # Act
+        replayed = flow(SRT(auto_login=False, transport=ReplayTransport(cassette), **options))
+
+        # Assert
+        assert replayed == recorded
+        assert recorded[0][1] == travel_date
+
+    def test_korail_flow_replays(self, tmp_path):
+        """Test record and replay of a Korail login, search and reserve."""
+        cassette = tmp_path / "korail.jsonl"
+        with FakeKorailServer([FakeTrain("101", general_seats=1)]) as server:
+            korail = Korail("user@example.com", "pw1234", transport=RecordingTransport(cassette), **server.client_options())
+            recorded = korail.reserve(korail.search_train("서울", "부산", _travel_date(), "080000")[0]).rsv_id
+            base_url = server.base_url
+
+        korail = Korail("user@example.com", "pw1234", transport=ReplayTransport(cassette), base_url=base_url)
+        replayed = korail.reserve(korail.search_train("서울", "부산", _travel_date(), "080000")[0]).rsv_id
+
+        assert korail.logined is True
+        assert replayed == recorded
+
+    def test_original_timing_and_timeouts_replay(self, tmp_path):
+        """Test that speed=1.0 keeps the recorded latency and a recorded timeout raises again."""
+        # Arrange: one slow search, then one that times out
+        cassette = tmp_path / "slow.jsonl"
+        with FakeSRTServer([FakeTrain("301", general_seats=1)]) as server:
+            srt = SRT(auto_login=False, transport=RecordingTransport(cassette), **server.client_options())
+            srt.login("user@example.com", "s3cret-pass")
+            server.latency = 0.2
+            srt.search_train("수서", "부산", _travel_date(), "080000")
+            server.latency = 0.5
+            srt.timeouts["search_schedule"] = 0.3
+            with pytest.raises(SRTTimeoutError):
+                srt.search_train("수서", "부산", _travel_date(), "080000")
+            options = server.client_options()
+
+        srt = SRT(auto_login=False, transport=ReplayTransport(cassette, speed=1.0), **options)
+        srt.login("user@example.com", "s3cret-pass")
+
+        # Act & Assert
+        started = time.monotonic()
+        srt.search_train("수서", "부산", _travel_date(), "080000")
+        assert time.monotonic() - started >= 0.2
+        with pytest.raises(SRTTimeoutError):
+            srt.search_train("수서", "부산", _travel_date(), "080000")
+
+    def test_exhausted_cassette_raises(self, tmp_path):
+        """Test that a request beyond the recording raises CassetteError."""
+        cassette = tmp_path / "empty.jsonl"
+        cassette.write_text("", encoding="utf-8")
+
+        with pytest.raises(CassetteError):
+            SRT(auto_login=False, transport=ReplayTransport(cassette)).login("user@example.com", "pw")
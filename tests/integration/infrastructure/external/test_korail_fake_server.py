@@ -0,0 +1,154 @@
+"""End-to-end tests of the Korail client and KTXService against the local fake Korail server."""
+
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.domain.models.entities import ReservationRequest, TrainSchedule
+from src.domain.models.enums import TrainType
+from src.domain.services.reservation_engine import (
+    ReservationEngine, ReservationEventType, ReservationJob, ReservationState
+)
+from src.infrastructure.adapters.ktx_service import KTXService
+from src.infrastructure.external.ktx import Korail, NoResultsError, SoldOutError, row_has_seat
+from tests.fakes.korail_server import FakeKorailServer, FakeTrain
+
+
+def _travel_date() -> date:
+    return date.today() + timedelta(days=7)
+
+
+@pytest.fixture
+def server():
+    with FakeKorailServer([FakeTrain("101", general_seats=1), FakeTrain("103")]) as fake:
+        yield fake
+
+
+@pytest.fixture
+def korail(server):
+    client = Korail("test@example.com", "password", **server.client_options())
+    assert client.logined is True
+    return client
+
+
+def _search(korail: Korail):
+    return korail.search_train("서울", "부산", _travel_date().strftime("%Y%m%d"), "080000", include_no_seats=True)
+
+
+class TestKorailFakeServer:
+    """Test the Korail client over real HTTP against FakeKorailServer."""
+
+    def test_search_reserve_and_pay(self, server, korail):
+        """Test the full search -> reserve -> pay flow and the seat inventory."""
+        trains = _search(korail)
+        assert [t.train_no for t in trains] == ["101", "103"]
+        assert trains[0].has_general_seat() is True
+        assert trains[1].has_seat() is False
+        assert trains[0].dep_code == "NAT010000"
+
+        reservation = korail.reserve(trains[0])
+
+        assert reservation.train_no == "101"
+        assert reservation.price == 52000
+        assert [seat.seat for seat in reservation.tickets] == ["1A"]
+        assert server.trains["101"].general_seats == 0
+        assert korail.pay_with_card(reservation, "1234567812345678", "12", "900101", "2912") is True
+        assert korail.reservations() == []
+
+    def test_lookup_of_held_seat_ignores_spent_deadline(self, server, korail):
+        """Test that a reserve using up the attempt deadline still returns the held seat."""
+        # Arrange: the deadline runs out while the reserve request is answered
+        train = _search(korail)[0]
+        get = korail._session.get
+
+        def reserve_past_deadline(url, **kwargs):
+            r = get(url, **kwargs)
+            if url == korail.endpoints["reserve"]:
+                korail.deadline = time.monotonic() - 1
+            return r
+
+        korail._session.get = reserve_past_deadline
+        korail.deadline = time.monotonic() + 30
+
+        # Act
+        reservation = korail.reserve(train)
+
+        # Assert
+        assert reservation.train_no == "101"
+        assert server.trains["101"].general_seats == 0
+        assert korail.deadline < time.monotonic()  # restored for the rest of the attempt
+
+    def test_sold_out_reserve_fails(self, server, korail):
+        """Test that reserving a train whose last seat is gone raises SoldOutError."""
+        train = _search(korail)[0]
+        server.set_seats("101", general=0)
+
+        with pytest.raises(SoldOutError):
+            korail.reserve(train)
+
+    def test_cancel_returns_seats(self, server, korail):
+        """Test that cancelling a reservation puts its seats back on sale."""
+        reservation = korail.reserve(_search(korail)[0])
+
+        assert korail.cancel(reservation) is True
+        assert server.trains["101"].general_seats == 1
+        assert "101" in server.released_at
+
+    def test_timed_seat_release(self, server, korail):
+        """Test that release_after frees seats once the delay has passed."""
+        server.release_after(0.05, "103", general=1)
+
+        assert _search(korail)[1].has_seat() is False
+        time.sleep(0.2)
+        assert _search(korail)[1].has_seat() is True
+
+    def test_search_builds_only_requested_trains(self, server, korail):
+        """Test that train_numbers and seat_filter narrow the rows before trains are built."""
+        travel_date = _travel_date().strftime("%Y%m%d")
+
+        trains = korail.search_train("서울", "부산", travel_date, "080000", train_numbers={"101"})
+
+        assert [t.train_no for t in trains] == ["101"]
+        with pytest.raises(NoResultsError):
+            korail.search_train(
+                "서울", "부산", travel_date, "080000", train_numbers={"103"}, seat_filter=row_has_seat
+            )
+
+
+class TestKTXServiceFakeServer:
+    """Test KTXService in the reservation loop against FakeKorailServer."""
+
+    def test_engine_holds_released_seat(self, server):
+        """Test that the reservation loop reserves a seat released while it polls."""
+        # Arrange
+        service = KTXService(**server.client_options())
+        assert service.login("test@example.com", "password") is True
+        departure = datetime.combine(_travel_date(), datetime.min.time()) + timedelta(hours=10)
+        job = ReservationJob(
+            trains=[TrainSchedule(
+                train_number="103",
+                departure_station="서울",
+                arrival_station="부산",
+                departure_time=departure,
+                arrival_time=departure + timedelta(hours=2, minutes=30),
+                train_type=TrainType.KTX,
+                available_seats=0,
+            )],
+            request=ReservationRequest("서울", "부산", _travel_date(), "080000"),
+            user_id="test@example.com",
+            password="password",
+        )
+        events = []
+        engine = ReservationEngine(service, job, events.append, retry_delay=(0.01, 0.01))
+        server.release_after(0.1, "103", general=1)
+
+        # Act
+        state = engine.run()
+
+        # Assert
+        assert state == ReservationState.AWAITING_PAYMENT
+        reserved = [e for e in events if e.type == ReservationEventType.RESERVED]
+        assert reserved[0].reservation.train_schedule.train_number == "103"
+        assert server.trains["103"].general_seats == 0
+        assert engine.attempt > 1
@@ -273,6 +273,105 @@ class TestKorailReservationIntegration:
         assert reservations[0].rsv_id == "12345"
         assert reservations[0].price == 119600
 
+    @staticmethod
+    def _reservation_view(*rsv_ids):
+        response = Mock()
+        response.text = json.dumps({
+            "strResult": "SUCC",
+            "jrny_infos": {
+                "jrny_info": [
+                    {
+                        "train_infos": {
+                            "train_info": [
+                                {
+                                    "h_trn_clsf_cd": "100",
+                                    "h_trn_clsf_nm": "KTX",
+                                    "h_trn_gp_cd": "300",
+                                    "h_trn_no": "001",
+                                    "h_dpt_rs_stn_nm": "서울",
+                                    "h_dpt_rs_stn_cd": "0001",
+                                    "h_dpt_dt": "20250110",
+                                    "h_dpt_tm": "100000",
+                                    "h_arv_rs_stn_nm": "부산",
+                                    "h_arv_rs_stn_cd": "0020",
+                                    "h_arv_dt": "20250110",
+                                    "h_arv_tm": "125959",
+                                    "h_run_dt": "20250110",
+                                    "h_pnr_no": rsv_id,
+                                    "h_tot_seat_cnt": "1",
+                                    "h_ntisu_lmt_dt": "20250110",
+                                    "h_ntisu_lmt_tm": "095959",
+                                    "h_rsv_amt": "59800",
+                                }
+                            ]
+                        }
+                    }
+                    for rsv_id in rsv_ids
+                ]
+            }
+        })
+        return response
+
+    @staticmethod
+    def _reservation_list():
+        response = Mock()
+        response.text = json.dumps({
+            "strResult": "SUCC",
+            "h_wct_no": "777",
+            "jrny_infos": {
+                "jrny_info": [
+                    {
+                        "seat_infos": {
+                            "seat_info": [
+                                {
+                                    "h_srcar_no": "05",
+                                    "h_seat_no": "12A",
+                                    "h_psrm_cl_nm": "일반실",
+                                    "h_psg_tp_dv_nm": "어른",
+                                    "h_rcvd_amt": "59800",
+                                    "h_seat_prc": "59800",
+                                    "h_dcnt_amt": "0",
+                                }
+                            ]
+                        }
+                    }
+                ]
+            }
+        })
+        return response
+
+    def test_get_reservation_by_id_skips_other_reservations(self):
+        """Test targeted lookup fetches details only for the matching reservation."""
+        mock_session = Mock()
+        mock_session.get.side_effect = [
+            self._reservation_view("11111", "22222", "33333"),
+            self._reservation_list(),
+        ]
+
+        korail = Korail(korail_id="test_id", korail_pw="test_pw", auto_login=False)
+        korail._session = mock_session
+
+        reservation = korail.reservations("33333")
+
+        assert reservation.rsv_id == "33333"
+        assert mock_session.get.call_count == 1
+
+        assert reservation.wct_no == "777"
+        assert reservation.tickets[0].seat == "12A"
+        assert mock_session.get.call_count == 2
+        assert mock_session.get.call_args.kwargs["params"]["hidPnrNo"] == "33333"
+
+    def test_get_reservation_by_id_not_found(self):
+        """Test targeted lookup returns an empty result when nothing matches."""
+        mock_session = Mock()
+        mock_session.get.side_effect = [self._reservation_view("11111")]
+
+        korail = Korail(korail_id="test_id", korail_pw="test_pw", auto_login=False)
+        korail._session = mock_session
+
+        assert not korail.reservations("99999")
+        assert mock_session.get.call_count == 1
+
     def test_get_tickets_flow(self):
         """Test getting tickets."""
         # Mock myticketlist response
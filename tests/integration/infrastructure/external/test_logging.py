@@ -0,0 +1,53 @@
+"""Tests of the clients' logging against the fake servers."""
+
+import logging
+from datetime import date, timedelta
+
+from src.infrastructure.external.srt import SRT
+from src.infrastructure.logs import response_logger
+from tests.fakes.srt_server import FakeSRTServer, FakeTrain
+
+
+def _travel_date() -> str:
+    return (date.today() + timedelta(days=7)).strftime("%Y%m%d")
+
+
+class TestClientLogging:
+    """Test that the SRT client logs through its module and response loggers."""
+
+    def test_login_is_logged_and_bodies_are_not(self, caplog):
+        """Test that a login is an INFO record and no response body is logged by default."""
+        caplog.set_level(logging.DEBUG)
+        with FakeSRTServer([FakeTrain("301", general_seats=1)]) as server:
+            srt = SRT(auto_login=False, **server.client_options())
+            srt.login("user@example.com", "pw1234")
+            srt.search_train("수서", "부산", _travel_date(), "080000")
+
+        assert [r.levelno for r in caplog.records if r.getMessage().startswith("로그인 성공")] == [logging.INFO]
+        assert not [r for r in caplog.records if r.name.startswith("responses")]
+
+    def test_verbose_client_logs_bodies_per_endpoint(self, caplog):
+        """Test that verbose=True logs every response under its endpoint name."""
+        caplog.set_level(logging.DEBUG)
+        with FakeSRTServer([FakeTrain("301", general_seats=1)]) as server:
+            srt = SRT(auto_login=False, verbose=True, **server.client_options())
+            srt.login("user@example.com", "pw1234")
+            srt.search_train("수서", "부산", _travel_date(), "080000")
+
+        endpoints = [r.args[0] for r in caplog.records if r.name.startswith("responses.srt.")]
+        assert endpoints[0] == "login"
+        assert {"netfunnel_start", "search_schedule"} <= set(endpoints)
+
+    def test_verbose_client_leaves_other_clients_quiet(self, caplog):
+        """Test that verbose=True turns on the bodies of that client only."""
+        caplog.set_level(logging.DEBUG)
+        with FakeSRTServer([FakeTrain("301", general_seats=1)]) as server:
+            verbose = SRT(auto_login=False, verbose=True, **server.client_options())
+            verbose.login("user@example.com", "pw1234")
+            caplog.clear()
+            quiet = SRT(auto_login=False, **server.client_options())
+            quiet.login("user@example.com", "pw1234")
+            quiet.search_train("수서", "부산", _travel_date(), "080000")
+
+        assert not [r for r in caplog.records if r.name.startswith("responses")]
+        assert not response_logger("srt").isEnabledFor(logging.DEBUG)
@@ -0,0 +1,79 @@
+"""Tests of the clients' request metrics against the fake servers."""
+
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from src.infrastructure.external.ktx import AsyncKorail, Korail
+from src.infrastructure.external.metrics import NETFUNNEL_QUEUE, MetricsRegistry
+from src.infrastructure.external.srt import SRT, SRTTimeoutError
+from tests.fakes.korail_server import FakeKorailServer
+from tests.fakes.srt_server import FakeSRTServer, FakeTrain
+
+
+def _travel_date() -> str:
+    return (date.today() + timedelta(days=7)).strftime("%Y%m%d")
+
+
+class TestClientMetrics:
+    """Test that client requests are recorded per endpoint."""
+
+    def test_srt_flow_is_recorded_per_endpoint(self):
+        """Test that login, NetFunnel steps, search and reserve each get their own entry."""
+        # Arrange
+        metrics = MetricsRegistry()
+        with FakeSRTServer([FakeTrain("301", general_seats=1)]) as server:
+            srt = SRT(auto_login=False, metrics=metrics, **server.client_options())
+
+            # Act
+            srt.login("user@example.com", "pw1234")
+            srt.reserve(srt.search_train("수서", "부산", _travel_date(), "080000")[0])
+
+        # Assert
+        snapshot = metrics.snapshot()
+        for name in ("login", "netfunnel", "netfunnel_start", "netfunnel_complete", "search_schedule", "reserve"):
+            assert snapshot[name].count >= 1, name
+            assert snapshot[name].error_count == 0
+        assert snapshot["netfunnel"].max >= snapshot["netfunnel_start"].max
+        assert metrics.gauges() == {NETFUNNEL_QUEUE: 0}
+
+    def test_timeouts_are_counted_by_class(self):
+        """Test that a timed-out search is counted as an SRTTimeoutError of search_schedule."""
+        metrics = MetricsRegistry()
+        with FakeSRTServer([FakeTrain("301", general_seats=1)]) as server:
+            srt = SRT(auto_login=False, metrics=metrics, **server.client_options())
+            srt.login("user@example.com", "pw1234")
+            server.latency = 0.5
+            srt.timeouts["search_schedule"] = 0.2
+            with pytest.raises(SRTTimeoutError):
+                srt.search_train("수서", "부산", _travel_date(), "080000")
+
+        snapshot = metrics.snapshot()["search_schedule"]
+        assert dict(snapshot.errors) == {"SRTTimeoutError": 1}
+        assert snapshot.min >= 0.2
+
+    def test_korail_endpoints_use_common_names(self):
+        """Test that Korail's pay and ticket list endpoints are recorded as payment and tickets."""
+        metrics = MetricsRegistry()
+        with FakeKorailServer([FakeTrain("101", general_seats=1)]) as server:
+            korail = Korail("user@example.com", "pw1234", metrics=metrics, **server.client_options())
+            reservation = korail.reserve(korail.search_train("서울", "부산", _travel_date(), "080000")[0])
+            korail.pay_with_card(reservation, "9410123412341234", "1234", 12, 29, "900101")
+            korail.tickets()
+
+        assert {"login_key", "login", "search_schedule", "reserve", "payment", "tickets"} <= set(metrics.snapshot())
+
+    def test_async_client_records(self):
+        """Test that the async Korail client records into the same kind of registry."""
+        metrics = MetricsRegistry()
+
+        async def flow(options):
+            async with AsyncKorail(metrics=metrics, **options) as korail:
+                await korail.login("user@example.com", "pw1234")
+                await korail.search_train("서울", "부산", _travel_date(), "080000")
+
+        with FakeKorailServer([FakeTrain("101", general_seats=1)]) as server:
+            asyncio.run(flow(server.client_options()))
+
+        assert metrics.snapshot()["search_schedule"].count == 1
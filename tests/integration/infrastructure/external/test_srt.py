@@ -15,6 +15,7 @@ from src.infrastructure.external.srt import (
     SRTLoginError,
     SRTResponseError,
     SRTNotLoggedInError,
+    API_ENDPOINTS,
 )
 
 
@@ -300,6 +301,105 @@ class TestSRTReservationIntegration:
         assert reservations[0].reservation_number == "12345"
         assert reservations[0].total_cost == 119600
 
+    def test_get_reservations_loads_tickets_lazily(self):
+        """Test that ticket details are fetched only on first access."""
+        list_response = Mock()
+        list_response.text = json.dumps({
+            "resultMap": [{"strResult": "SUCC"}],
+            "trainListMap": [
+                {"pnrNo": "11111", "rcvdAmt": "59800", "seatNum": "1"},
+                {"pnrNo": "22222", "rcvdAmt": "59800", "seatNum": "1"},
+            ],
+            "payListMap": [
+                {
+                    "stlbTrnClsfCd": "17",
+                    "trnNo": "301",
+                    "dptDt": "20250110",
+                    "dptTm": "100000",
+                    "dptRsStnCd": "0551",
+                    "arvTm": "125959",
+                    "arvRsStnCd": "0020",
+                    "iseLmtDt": "20250110",
+                    "iseLmtTm": "095959",
+                    "stlFlg": "N",
+                },
+            ] * 2
+        })
+        ticket_response = Mock()
+        ticket_response.text = json.dumps({
+            "resultMap": [{"strResult": "SUCC"}],
+            "trainListMap": [
+                {
+                    "scarNo": "05",
+                    "seatNo": "12A",
+                    "psrmClCd": "1",
+                    "dcntKndCd": "000",
+                    "rcvdAmt": "59800",
+                    "stdrPrc": "59800",
+                    "dcntPrc": "0",
+                }
+            ]
+        })
+
+        mock_session = Mock()
+        mock_session.post.side_effect = [list_response, ticket_response]
+
+        srt = SRT(srt_id="test_id", srt_pw="test_pw", auto_login=False)
+        srt._session = mock_session
+        srt.is_login = True
+
+        reservations = srt.get_reservations()
+        assert mock_session.post.call_count == 1
+
+        tickets = reservations[1].tickets
+        assert mock_session.post.call_count == 2
+        assert mock_session.post.call_args.kwargs["data"]["pnrNo"] == "22222"
+        assert tickets[0].seat == "12A"
+
+        # Memoized: no further request
+        assert reservations[1].tickets is tickets
+        assert mock_session.post.call_count == 2
+
+    def test_get_reservation_by_number(self):
+        """Test targeted lookup makes a single list request."""
+        list_response = Mock()
+        list_response.text = json.dumps({
+            "resultMap": [{"strResult": "SUCC"}],
+            "trainListMap": [
+                {"pnrNo": "11111", "rcvdAmt": "59800", "seatNum": "1"},
+                {"pnrNo": "22222", "rcvdAmt": "119600", "seatNum": "2"},
+            ],
+            "payListMap": [
+                {
+                    "stlbTrnClsfCd": "17",
+                    "trnNo": "301",
+                    "dptDt": "20250110",
+                    "dptTm": "100000",
+                    "dptRsStnCd": "0551",
+                    "arvTm": "125959",
+                    "arvRsStnCd": "0020",
+                    "iseLmtDt": "20250110",
+                    "iseLmtTm": "095959",
+                    "stlFlg": "N",
+                },
+            ] * 2
+        })
+
+        mock_session = Mock()
+        mock_session.post.return_value = list_response
+
+        srt = SRT(srt_id="test_id", srt_pw="test_pw", auto_login=False)
+        srt._session = mock_session
+        srt.is_login = True
+
+        reservation = srt.get_reservation("22222")
+        missing = srt.get_reservation("99999")
+
+        assert reservation.reservation_number == "22222"
+        assert reservation.total_cost == 119600
+        assert missing is None
+        assert mock_session.post.call_count == 2
+
     def test_get_reservations_not_logged_in(self):
         """Test getting reservations when not logged in."""
         srt = SRT(srt_id="test_id", srt_pw="test_pw", auto_login=False)
@@ -308,6 +408,116 @@ class TestSRTReservationIntegration:
             srt.get_reservations()
 
 
+class TestSRTReserveIntegration:
+    """Test SRT reserve flow with mocking."""
+
+    TRAIN_DATA = {
+        "stlbTrnClsfCd": "17",
+        "trnNo": "301",
+        "dptDt": "20250110",
+        "dptTm": "100000",
+        "dptRsStnCd": "0551",
+        "dptStnRunOrdr": "1",
+        "dptStnConsOrdr": "1",
+        "arvDt": "20250110",
+        "arvTm": "125959",
+        "arvRsStnCd": "0020",
+        "arvStnRunOrdr": "10",
+        "arvStnConsOrdr": "10",
+        "gnrmRsvPsbStr": "예약가능",
+        "sprmRsvPsbStr": "예약가능",
+        "rsvWaitPsbCdNm": "가능",
+        "rsvWaitPsbCd": "9",
+    }
+
+    TICKET_DATA = {
+        "scarNo": "05",
+        "seatNo": "12A",
+        "psrmClCd": "1",
+        "dcntKndCd": "000",
+        "rcvdAmt": "59800",
+        "stdrPrc": "59800",
+        "dcntPrc": "0",
+    }
+
+    def _make_srt(self, responses):
+        mock_netfunnel = Mock()
+        mock_netfunnel.run.return_value = "mock_key"
+        mock_session = Mock()
+        mock_session.post.side_effect = responses
+
+        srt = SRT(srt_id="test_id", srt_pw="test_pw", auto_login=False)
+        srt._session = mock_session
+        srt._netfunnel = mock_netfunnel
+        srt.is_login = True
+        return srt, mock_session
+
+    def test_reserve_builds_reservation_from_response(self):
+        """Test reserve skips the reservation list when the response has the deadline."""
+        reserve_response = Mock()
+        reserve_response.text = json.dumps({
+            "resultMap": [{"strResult": "SUCC"}],
+            "reservListMap": [
+                {"pnrNo": "12345", "iseLmtDt": "20250110", "iseLmtTm": "095959"}
+            ],
+        })
+        ticket_response = Mock()
+        ticket_response.text = json.dumps({
+            "resultMap": [{"strResult": "SUCC"}],
+            "trainListMap": [self.TICKET_DATA, self.TICKET_DATA],
+        })
+        srt, mock_session = self._make_srt([reserve_response, ticket_response])
+
+        reservation = srt.reserve(SRTTrain(self.TRAIN_DATA), passengers=[Adult(2)])
+
+        assert mock_session.post.call_count == 2
+        called_urls = [c.kwargs["url"] for c in mock_session.post.call_args_list]
+        assert API_ENDPOINTS["tickets"] not in called_urls
+        assert reservation.reservation_number == "12345"
+        assert reservation.total_cost == 119600
+        assert reservation.seat_count == 2
+        assert reservation.payment_date == "20250110"
+        assert reservation.is_waiting is False
+        assert reservation.is_running is False
+        assert "(운행중)" not in reservation.dump()
+        assert "구입기한 01월 10일 09:59" in reservation.dump()
+        assert len(reservation.tickets) == 2
+
+    def test_reserve_falls_back_to_reservation_list(self):
+        """Test reserve looks up the reservation list when fields are missing."""
+        reserve_response = Mock()
+        reserve_response.text = json.dumps({
+            "resultMap": [{"strResult": "SUCC"}],
+            "reservListMap": [{"pnrNo": "12345"}],
+        })
+        list_response = Mock()
+        list_response.text = json.dumps({
+            "resultMap": [{"strResult": "SUCC"}],
+            "trainListMap": [{"pnrNo": "12345", "rcvdAmt": "59800", "seatNum": "1"}],
+            "payListMap": [
+                {
+                    "stlbTrnClsfCd": "17",
+                    "trnNo": "301",
+                    "dptDt": "20250110",
+                    "dptTm": "100000",
+                    "dptRsStnCd": "0551",
+                    "arvTm": "125959",
+                    "arvRsStnCd": "0020",
+                    "iseLmtDt": "20250110",
+                    "iseLmtTm": "095959",
+                    "stlFlg": "N",
+                }
+            ],
+        })
+        srt, mock_session = self._make_srt([reserve_response, list_response])
+
+        reservation = srt.reserve(SRTTrain(self.TRAIN_DATA))
+
+        assert mock_session.post.call_args.kwargs["url"] == API_ENDPOINTS["tickets"]
+        assert reservation.reservation_number == "12345"
+        assert reservation.total_cost == 59800
+
+
 class TestSRTErrorHandlingIntegration:
     """Test SRT error handling in integration scenarios."""
 
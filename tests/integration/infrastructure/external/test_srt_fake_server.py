@@ -0,0 +1,110 @@
+"""End-to-end tests of the SRT client against the local fake SRT server."""
+
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from src.infrastructure.external.srt import SRT, SRTResponseError, SRTTimeoutError, row_seat_available
+from tests.fakes.srt_server import FakeSRTServer, FakeTrain
+
+
+def _travel_date() -> str:
+    return (date.today() + timedelta(days=7)).strftime("%Y%m%d")
+
+
+@pytest.fixture
+def server():
+    with FakeSRTServer([FakeTrain("301", general_seats=1), FakeTrain("303")]) as fake:
+        yield fake
+
+
+@pytest.fixture
+def srt(server):
+    client = SRT("test@example.com", "password", **server.client_options())
+    assert client.is_login is True
+    return client
+
+
+class TestSRTFakeServer:
+    """Test the SRT client over real HTTP against FakeSRTServer."""
+
+    def test_search_reserve_and_pay(self, server, srt):
+        """Test the full search -> reserve -> pay flow and the seat inventory."""
+        trains = srt.search_train("수서", "부산", _travel_date(), "080000", available_only=False)
+        assert [t.train_number for t in trains] == ["301", "303"]
+        assert trains[0].seat_available() is True
+        assert trains[1].seat_available() is False
+
+        reservation = srt.reserve(trains[0])
+
+        assert reservation.train_number == "301"
+        assert reservation.total_cost == 52000
+        assert len(reservation.tickets) == 1
+        assert server.trains["301"].general_seats == 0
+        assert srt.pay_with_card(reservation, "1234567812345678", "12", "900101", "2912") is True
+        assert srt.get_reservation(reservation.reservation_number).paid is True
+        assert server.counts["netfunnel"] == 2  # key cached between search and reserve
+
+    def test_lookup_of_held_seat_ignores_spent_deadline(self, server, srt):
+        """Test that a reserve using up the attempt deadline still returns the held seat."""
+        # Arrange: the deadline runs out while the reserve request is answered
+        train = srt.search_train("수서", "부산", _travel_date(), "080000")[0]
+        post = srt._session.post
+
+        def reserve_past_deadline(url, **kwargs):
+            r = post(url=url, **kwargs)
+            if url == srt.endpoints["reserve"]:
+                srt.deadline = time.monotonic() - 1
+            return r
+
+        srt._session.post = reserve_past_deadline
+        srt.deadline = time.monotonic() + 30
+
+        # Act
+        reservation = srt.reserve(train)
+
+        # Assert
+        assert reservation.train_number == "301"
+        assert server.counts["ticket_info"] == 1
+        assert srt.deadline < time.monotonic()  # restored for the rest of the attempt
+
+    def test_sold_out_reserve_fails(self, server, srt):
+        """Test that reserving a train whose last seat is gone raises."""
+        train = srt.search_train("수서", "부산", _travel_date(), "080000")[0]
+        server.set_seats("301", general=0)
+
+        with pytest.raises(SRTResponseError, match="잔여석없음"):
+            srt.reserve(train)
+
+    def test_scheduled_seat_release(self, server, srt):
+        """Test that scripted inventory changes apply after the given number of searches."""
+        server.schedule(2, lambda fake: fake.set_seats("303", general=2))
+
+        first = srt.search_train("수서", "부산", _travel_date(), "080000")
+        second = srt.search_train("수서", "부산", _travel_date(), "080000")
+
+        assert [t.train_number for t in first] == ["301"]
+        assert [t.train_number for t in second] == ["301", "303"]
+
+    def test_search_builds_only_requested_trains(self, server, srt):
+        """Test that train_numbers and seat_filter narrow the rows before trains are built."""
+        # Act
+        targeted = srt.search_train(
+            "수서", "부산", _travel_date(), "080000", train_numbers={"303"}, available_only=False
+        )
+        with_seats = srt.search_train(
+            "수서", "부산", _travel_date(), "080000", train_numbers={"303"}, seat_filter=row_seat_available
+        )
+
+        # Assert
+        assert [t.train_number for t in targeted] == ["303"]
+        assert with_seats == []
+
+    def test_injected_latency_hits_timeout(self, server):
+        """Test that a response slower than the endpoint timeout raises SRTTimeoutError."""
+        srt = SRT(auto_login=False, timeouts={"login": 0.2}, **server.client_options())
+        server.latency = 0.5
+
+        with pytest.raises(SRTTimeoutError):
+            srt.login("test@example.com", "password")
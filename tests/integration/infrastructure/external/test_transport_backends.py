@@ -0,0 +1,104 @@
+"""Integration tests of the real HTTP transports against the local fake Korail server."""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.external import transport as transport_module
+from src.infrastructure.external.ktx import Korail, KorailTimeoutError
+from src.infrastructure.external.transport import (
+    AsyncCurlTransport,
+    CurlTransport,
+    RequestsTransport,
+    TransportConfig,
+    TransportTimeout,
+)
+from tests.fakes.korail_server import FakeKorailServer, FakeTrain
+
+requires_curl = pytest.mark.skipif(not transport_module.HAS_CURL_CFFI, reason="curl_cffi not installed")
+BACKENDS = [pytest.param(CurlTransport, marks=requires_curl), RequestsTransport]
+
+
+@pytest.fixture
+def server():
+    with FakeKorailServer([FakeTrain("101", general_seats=1)]) as fake:
+        yield fake
+
+
+@pytest.mark.parametrize("transport_class", BACKENDS)
+class TestSyncBackends:
+    """Test the Korail client over each sync backend."""
+
+    def test_login_over_backend(self, server, transport_class):
+        """Test that login succeeds and every request reaches the hooks."""
+        # Arrange
+        transport = transport_class(TransportConfig(pool_size=2))
+        timings = []
+        transport.add_hook(timings.append)
+
+        # Act
+        korail = Korail("test@example.com", "password", transport=transport, **server.client_options())
+
+        # Assert
+        assert korail.logined is True
+        assert [t.url.rsplit(".", 1)[-1] for t in timings] == ["do", "Login"]
+        assert all(t.status == 200 and t.transport == transport.name for t in timings)
+
+    def test_backend_timeout_becomes_client_timeout(self, server, transport_class):
+        """Test that a backend timeout surfaces as the client's timeout error."""
+        korail = Korail(
+            auto_login=False, timeouts={"login": 0.2}, transport=transport_class(), **server.client_options()
+        )
+        server.latency = 0.5
+
+        with pytest.raises(KorailTimeoutError):
+            korail.login("test@example.com", "password")
+
+
+@requires_curl
+class TestAsyncCurlTransport:
+    """Test curl_cffi async sessions."""
+
+    def test_concurrent_requests(self, server):
+        """Test that requests of one async session run concurrently."""
+        # Arrange
+        server.latency = 0.2
+        transport = AsyncCurlTransport(TransportConfig(pool_size=4))
+        url = f"{server.base_url}/classes/com.korail.mobile.common.code.do"
+
+        async def fetch_all():
+            session = transport.session()
+            try:
+                return await asyncio.gather(*(session.post(url) for _ in range(4)))
+            finally:
+                await session.close()
+
+        # Act
+        responses, elapsed = asyncio.run(_timed(fetch_all()))
+
+        # Assert
+        assert [r.status_code for r in responses] == [200] * 4
+        assert elapsed < 0.6
+
+    def test_timeout_is_translated(self, server):
+        """Test that an async timeout raises TransportTimeout."""
+        server.latency = 0.5
+        transport = AsyncCurlTransport()
+        url = f"{server.base_url}/classes/com.korail.mobile.common.code.do"
+
+        async def fetch():
+            session = transport.session()
+            try:
+                await session.post(url, timeout=0.1)
+            finally:
+                await session.close()
+
+        with pytest.raises(TransportTimeout):
+            asyncio.run(fetch())
+
+
+async def _timed(coro):
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result = await coro
+    return result, loop.time() - start
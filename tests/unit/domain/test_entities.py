@@ -74,6 +74,22 @@ class TestTrainSchedule:
         assert schedule.available_seats == 10
         assert schedule.price == 59800
 
+    def test_train_schedule_is_frozen(self):
+        """Test that a schedule cannot be changed"""
+        schedule = TrainSchedule(
+            train_number="001",
+            departure_station="서울",
+            arrival_station="부산",
+            departure_time=datetime(2025, 1, 15, 10, 0, 0),
+            arrival_time=datetime(2025, 1, 15, 12, 30, 0),
+            train_type=TrainType.KTX,
+            available_seats=10,
+        )
+
+        with pytest.raises(AttributeError):
+            schedule.available_seats = 0
+        assert not hasattr(schedule, "__dict__")
+
 
 @pytest.mark.unit
 @pytest.mark.domain
@@ -149,6 +165,17 @@ class TestReservationResult:
         assert result.reservation_number is None
         assert result.message == "No seats available"
         assert result.train_schedule is None
+        assert result.handle is None
+
+    def test_handle_excluded_from_equality_and_repr(self):
+        """Test provider handle does not affect equality or repr"""
+        handle = object()
+        with_handle = ReservationResult(success=True, reservation_number="R1", handle=handle)
+        without_handle = ReservationResult(success=True, reservation_number="R1")
+
+        assert with_handle.handle is handle
+        assert with_handle == without_handle
+        assert "handle" not in repr(with_handle)
 
 
 @pytest.mark.unit
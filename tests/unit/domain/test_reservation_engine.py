@@ -0,0 +1,332 @@
+"""Unit tests for ReservationEngine"""
+import threading
+import time
+from datetime import date, datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.exceptions import TrainServiceTimeoutError
+from src.domain.models.entities import (
+    CreditCard, PaymentResult, ReservationRequest, ReservationResult, TrainSchedule
+)
+from src.domain.models.enums import TrainType
+from src.domain.services.reservation_engine import (
+    ReservationEngine, ReservationEventType, ReservationJob, ReservationState
+)
+from src.domain.services.tracing import SpanExporter, Tracer
+
+
+def _train(number: str) -> TrainSchedule:
+    return TrainSchedule(
+        train_number=number,
+        departure_station="서울",
+        arrival_station="부산",
+        departure_time=datetime(2025, 1, 15, 10, 0, 0),
+        arrival_time=datetime(2025, 1, 15, 12, 30, 0),
+        train_type=TrainType.KTX,
+        available_seats=0
+    )
+
+
+def _job(credit_card: CreditCard | None = None) -> ReservationJob:
+    return ReservationJob(
+        trains=[_train("001"), _train("003")],
+        request=ReservationRequest(
+            departure_station="서울",
+            arrival_station="부산",
+            departure_date=date(2025, 1, 15),
+            departure_time="100000"
+        ),
+        user_id="user",
+        password="pass",
+        credit_card=credit_card
+    )
+
+
+def _card() -> CreditCard:
+    return CreditCard(
+        number="1234567812345678",
+        password="12",
+        validation_number="990101",
+        expire="2512",
+        is_corporate=False
+    )
+
+
+def _reserved() -> ReservationResult:
+    return ReservationResult(
+        success=True,
+        reservation_number="R123456",
+        message="Reservation successful",
+        train_schedule=_train("003")
+    )
+
+
+def _make_engine(service, job, **kwargs):
+    events = []
+    engine = ReservationEngine(service, job, events.append, sleep=lambda _: None, **kwargs)
+    return engine, events
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+class TestReservationEngine:
+    """Tests for the reservation state machine"""
+
+    def test_retries_until_reserved_and_paid(self):
+        """Test that failed attempts are retried and the reservation is paid"""
+        # Arrange
+        service = Mock()
+        service.reserve_train.side_effect = [
+            ReservationResult(success=False, message="No seats available"),
+            RuntimeError("timeout"),
+            _reserved(),
+        ]
+        service.payment_reservation.return_value = PaymentResult(
+            success=True, message="Payment successful", reservation_number="R123456"
+        )
+        job = _job(_card())
+        engine, events = _make_engine(service, job)
+
+        # Act
+        state = engine.run()
+
+        # Assert
+        assert state == ReservationState.COMPLETED
+        assert engine.attempt == 3
+        assert [e.type for e in events] == [
+            ReservationEventType.ATTEMPT,
+            ReservationEventType.RESERVE_FAILED,
+            ReservationEventType.ATTEMPT,
+            ReservationEventType.ERROR,
+            ReservationEventType.ATTEMPT,
+            ReservationEventType.RESERVED,
+            ReservationEventType.PAYMENT_STARTED,
+            ReservationEventType.PAID,
+        ]
+        assert events[0].message == "001, 003"
+        assert events[1].message == "No seats available"
+        assert 1.0 <= events[1].delay <= 4.0
+        assert events[3].message == "timeout"
+        service.reserve_train.assert_called_with(job.trains, job.request)
+        service.payment_reservation.assert_called_once_with(events[5].reservation, job.credit_card)
+
+    def test_each_attempt_is_traced_with_its_result(self):
+        """Test that every iteration exports an attempt span and the retry wait falls between them"""
+        # Arrange
+        traces = []
+        exporter = Mock(spec=SpanExporter)
+        exporter.export.side_effect = lambda spans: traces.append(list(spans))
+        service = Mock(service_name="KTX")
+        service.reserve_train.side_effect = [
+            ReservationResult(success=False, message="No seats available"),
+            TrainServiceTimeoutError("reserve timed out"),
+            _reserved(),
+        ]
+        sleeps = []
+        engine = ReservationEngine(
+            service, _job(), [].append, sleep=lambda delay: sleeps.append(len(traces)), tracer=Tracer(exporter)
+        )
+
+        # Act
+        state = engine.run()
+
+        # Assert
+        assert state == ReservationState.AWAITING_PAYMENT
+        roots = [spans[-1] for spans in traces]
+        assert [root.attributes["result"] for root in roots] == [
+            "reserve_failed", "timeout", "payment_info_missing"
+        ]
+        assert [root.attributes["attempt"] for root in roots] == [1, 2, 3]
+        assert roots[0].attributes["service"] == "KTX"
+        assert roots[0].attributes["trains"] == "001, 003"
+        assert roots[1].attributes["error"] == "TrainServiceTimeoutError"
+        assert sleeps == [1]  # after the first attempt was exported, before the second began
+        assert roots[0].end <= roots[1].start
+
+    def test_timeout_retries_without_delay(self):
+        """Test that a timed-out attempt is retried at once instead of backing off"""
+        # Arrange
+        service = Mock()
+        service.reserve_train.side_effect = [TrainServiceTimeoutError("reserve timed out"), _reserved()]
+        sleep = Mock()
+        events = []
+        engine = ReservationEngine(service, _job(), events.append, sleep=sleep)
+
+        # Act
+        state = engine.run()
+
+        # Assert
+        assert state == ReservationState.AWAITING_PAYMENT
+        assert events[1].type == ReservationEventType.TIMEOUT
+        assert events[1].message == "reserve timed out"
+        sleep.assert_not_called()
+
+    def test_missing_payment_info_awaits_manual_payment(self):
+        """Test that a reservation without card details stops for manual payment"""
+        # Arrange
+        service = Mock()
+        service.reserve_train.return_value = _reserved()
+        engine, events = _make_engine(service, _job())
+
+        # Act
+        state = engine.run()
+
+        # Assert
+        assert state == ReservationState.AWAITING_PAYMENT
+        assert events[-1].type == ReservationEventType.PAYMENT_INFO_MISSING
+        service.payment_reservation.assert_not_called()
+
+    def test_payment_exception_reported_as_failure(self):
+        """Test that an exception during payment ends in PAYMENT_FAILED"""
+        # Arrange
+        service = Mock()
+        service.reserve_train.return_value = _reserved()
+        service.payment_reservation.side_effect = RuntimeError("card declined")
+        engine, events = _make_engine(service, _job(_card()))
+
+        # Act
+        state = engine.run()
+
+        # Assert
+        assert state == ReservationState.AWAITING_PAYMENT
+        assert events[-1].type == ReservationEventType.PAYMENT_FAILED
+        assert events[-1].message == "card declined"
+        assert events[-1].payment.success is False
+
+    def test_session_reset_and_relogin_failure(self):
+        """Test that the session is reset on the interval and a failed relogin stops the loop"""
+        # Arrange
+        service = Mock()
+        service.reserve_train.return_value = ReservationResult(success=False, message="No seats")
+        service.login.return_value = False
+        engine, events = _make_engine(service, _job(), reset_interval=2)
+
+        # Act
+        state = engine.run()
+
+        # Assert
+        assert state == ReservationState.FAILED
+        assert engine.attempt == 2
+        service.clear.assert_called_once()
+        service.login.assert_called_once_with("user", "pass")
+        assert [e.type for e in events[-3:]] == [
+            ReservationEventType.ATTEMPT,
+            ReservationEventType.SESSION_RESET,
+            ReservationEventType.RELOGIN_FAILED,
+        ]
+
+    def test_stop_ends_loop(self):
+        """Test that stop() ends the loop after the current attempt"""
+        # Arrange
+        service = Mock()
+        service.reserve_train.return_value = ReservationResult(success=False, message="No seats")
+        events = []
+        engine = ReservationEngine(service, _job(), events.append, sleep=lambda _: engine.stop())
+
+        # Act
+        state = engine.run()
+
+        # Assert
+        assert state == ReservationState.STOPPED
+        assert engine.is_running is False
+        assert engine.attempt == 1
+        assert events[-1].type == ReservationEventType.STOPPED
+
+    def test_start_runs_on_background_thread(self):
+        """Test that start() runs the loop on a daemon thread"""
+        # Arrange
+        service = Mock()
+        service.reserve_train.return_value = _reserved()
+        engine, events = _make_engine(service, _job())
+
+        # Act
+        thread = engine.start()
+        thread.join(timeout=5)
+
+        # Assert
+        assert thread.daemon is True
+        assert engine.state == ReservationState.AWAITING_PAYMENT
+        assert engine.is_running is False
+
+    def test_stop_interrupts_retry_wait(self):
+        """Test that stop() wakes the default retry wait instead of sleeping it out"""
+        # Arrange
+        service = Mock()
+        service.reserve_train.return_value = ReservationResult(success=False, message="No seats")
+        waiting = threading.Event()
+
+        def on_event(event):
+            if event.type == ReservationEventType.RESERVE_FAILED:
+                waiting.set()
+
+        engine = ReservationEngine(service, _job(), on_event, retry_delay=(10.0, 10.0))
+
+        # Act
+        thread = engine.start()
+        assert waiting.wait(timeout=5)
+        started = time.monotonic()
+        engine.stop()
+        thread.join(timeout=5)
+
+        # Assert
+        assert not thread.is_alive()
+        assert time.monotonic() - started < 1.0
+        assert engine.state == ReservationState.STOPPED
+        assert engine.cancel_token.cancelled is True
+
+    def test_cancel_token_handed_to_service(self):
+        """Test that the service receives the token for the run and releases it afterwards"""
+        # Arrange
+        service = Mock()
+        service.reserve_train.return_value = _reserved()
+        engine, _ = _make_engine(service, _job())
+
+        # Act
+        engine.run()
+
+        # Assert
+        service.set_cancel_token.assert_called_once_with(engine.cancel_token)
+        service.release_cancel_token.assert_called_once_with(engine.cancel_token)
+
+    def test_cancelled_reserve_call_ends_stopped(self):
+        """Test that a reserve call aborted by stop() is not reported as an error"""
+        # Arrange
+        service = Mock()
+        events = []
+        engine = ReservationEngine(service, _job(), events.append, sleep=lambda _: None)
+
+        def reserve(trains, request):
+            engine.stop()
+            raise RuntimeError("Cancelled")
+
+        service.reserve_train.side_effect = reserve
+
+        # Act
+        state = engine.run()
+
+        # Assert
+        assert state == ReservationState.STOPPED
+        assert [e.type for e in events] == [ReservationEventType.ATTEMPT, ReservationEventType.STOPPED]
+
+    def test_reservation_made_while_stopping_is_not_paid(self):
+        """Test that a reservation completed after stop() is reported but not paid"""
+        # Arrange
+        service = Mock()
+        events = []
+        engine = ReservationEngine(service, _job(_card()), events.append, sleep=lambda _: None)
+
+        def reserve(trains, request):
+            engine.stop()
+            return _reserved()
+
+        service.reserve_train.side_effect = reserve
+
+        # Act
+        state = engine.run()
+
+        # Assert
+        assert state == ReservationState.STOPPED
+        assert ReservationEventType.RESERVED in [e.type for e in events]
+        service.payment_reservation.assert_not_called()
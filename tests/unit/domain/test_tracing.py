@@ -0,0 +1,90 @@
+"""Unit tests for attempt tracing"""
+import asyncio
+
+import pytest
+
+from src.domain.services.tracing import NOOP_SPAN, NULL_TRACER, SpanExporter, Tracer, current_span, span
+
+
+class _Collect(SpanExporter):
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(list(spans))
+
+
+class _CodedError(Exception):
+    code = "ERR001"
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+class TestTracer:
+    """Tests for Tracer and span()"""
+
+    def test_spans_nest_and_export_with_the_root(self):
+        """Test that child spans get their parent's id and the trace is exported once, root last"""
+        # Arrange
+        exporter = _Collect()
+        tracer = Tracer(exporter)
+
+        # Act
+        with tracer.trace("attempt", attempt=1) as root:
+            with span("search") as search:
+                with span("netfunnel"):
+                    pass
+                search.set(found=2)
+            root.set(result="reserved")
+
+        # Assert
+        (spans,) = exporter.traces
+        assert [s.name for s in spans] == ["netfunnel", "search", "attempt"]
+        netfunnel, search, attempt = spans
+        assert netfunnel.parent_id == search.span_id
+        assert search.parent_id == attempt.span_id and attempt.parent_id is None
+        assert {s.trace_id for s in spans} == {attempt.trace_id}
+        assert search.attributes == {"found": 2}
+        assert attempt.attributes == {"attempt": 1, "result": "reserved"}
+        assert attempt.start <= search.start <= netfunnel.end <= attempt.end
+        assert attempt.wall_start is not None and search.wall_start is None
+
+    def test_exception_is_recorded_and_propagates(self):
+        """Test that an exception leaving a span sets error and error_code"""
+        exporter = _Collect()
+
+        with pytest.raises(_CodedError):
+            with Tracer(exporter).trace("attempt"):
+                with span("reserve"):
+                    raise _CodedError()
+
+        reserve, attempt = exporter.traces[0]
+        assert reserve.attributes == {"error": "_CodedError", "error_code": "ERR001"}
+        assert attempt.attributes["error"] == "_CodedError"
+
+    def test_no_trace_means_no_op(self):
+        """Test that spans outside a trace and a disabled tracer do nothing"""
+        assert span("search") is NOOP_SPAN
+        assert current_span() is NOOP_SPAN
+        with NULL_TRACER.trace("attempt") as root:
+            root.set(result="ignored")
+            assert span("search") is NOOP_SPAN
+
+    def test_async_tasks_inherit_the_current_span(self):
+        """Test that spans in gathered tasks become children of the span that started them"""
+        exporter = _Collect()
+
+        async def lookup():
+            with span("reservation_lookup"):
+                await asyncio.sleep(0)
+
+        async def attempt():
+            with Tracer(exporter).trace("attempt"):
+                with span("payment") as payment:
+                    await asyncio.gather(lookup(), lookup())
+                    return payment.span_id
+
+        payment_id = asyncio.run(attempt())
+
+        lookups = [s for s in exporter.traces[0] if s.name == "reservation_lookup"]
+        assert [s.parent_id for s in lookups] == [payment_id, payment_id]
@@ -1,8 +1,11 @@
 """Unit tests for TrainService abstract base class"""
+import inspect
 import pytest
 from abc import ABC
-from src.domain.services.train_service import TrainService
-from src.domain.models.entities import Station, TrainSchedule, ReservationRequest, ReservationResult
+from src.domain.services.train_service import AsyncTrainService, TrainService
+from src.domain.models.entities import (
+    CreditCard, PaymentResult, Station, TrainSchedule, ReservationRequest, ReservationResult
+)
 from datetime import datetime, date
 
 
@@ -27,6 +30,7 @@ class TestTrainServiceInterface:
             'logout',
             'search_trains',
             'reserve_train',
+            'payment_reservation',
             'get_stations',
             'is_logged_in',
             'clear',
@@ -63,6 +67,9 @@ class TestTrainServiceImplementation:
             def reserve_train(self, schedule: TrainSchedule, request: ReservationRequest) -> ReservationResult:
                 return ReservationResult(success=True, message="Test")
 
+            def payment_reservation(self, reservation: ReservationResult, credit_card: CreditCard) -> PaymentResult:
+                return PaymentResult(success=True, message="Test")
+
             def get_stations(self) -> list[Station]:
                 return []
 
@@ -128,6 +135,9 @@ class TestTrainServiceImplementation:
                     message="Success"
                 )
 
+            def payment_reservation(self, reservation: ReservationResult, credit_card: CreditCard) -> PaymentResult:
+                return PaymentResult(success=True, message="Paid")
+
             def get_stations(self) -> list[Station]:
                 return [Station("서울", "0001"), Station("부산", "0002")]
 
@@ -158,3 +168,20 @@ class TestTrainServiceImplementation:
         # Test logout
         assert service.logout() is True
         assert service.is_logged_in() is False
+
+
+@pytest.mark.unit
+@pytest.mark.domain
+class TestAsyncTrainServiceInterface:
+    """Tests for the AsyncTrainService abstract interface"""
+
+    def test_cannot_instantiate_async_train_service(self):
+        """Test that AsyncTrainService cannot be instantiated directly"""
+        with pytest.raises(TypeError):
+            AsyncTrainService()
+
+    def test_io_methods_are_coroutines(self):
+        """Test that methods which talk to the service are declared async"""
+        for name in ('login', 'logout', 'search_trains', 'reserve_train', 'payment_reservation', 'clear', 'close'):
+            assert inspect.iscoroutinefunction(getattr(AsyncTrainService, name)), name
+        assert not inspect.iscoroutinefunction(AsyncTrainService.get_stations)
@@ -0,0 +1,48 @@
+"""Unit tests for cassette scrubbing."""
+
+import json
+
+from src.infrastructure.external.cassette import REDACTED, scrub_body, scrub_fields
+
+
+class TestScrubbing:
+    """Test scrub_fields and scrub_body."""
+
+    def test_secret_fields_are_redacted_and_remembered(self):
+        """Test that credential and card fields are redacted and textual values collected."""
+        secrets = set()
+
+        scrubbed = scrub_fields(
+            {"txtMemberNo": "010-1234-5678", "hidStlCrCrdNo1": "9410123412341234", "txtPsgTpCd1": "1"}, secrets
+        )
+
+        assert scrubbed == {"txtMemberNo": REDACTED, "hidStlCrCrdNo1": REDACTED, "txtPsgTpCd1": "1"}
+        assert secrets == {"010-1234-5678"}
+
+    def test_short_and_numeric_values_are_not_remembered(self):
+        """Test that expiry, birthday and short values are redacted but not collected."""
+        secrets = set()
+
+        scrubbed = scrub_fields({"hidCrdVlidTrm1": "2512", "hidAthnVal1": "900101", "txtPwd": "ab1"}, secrets)
+
+        assert set(scrubbed.values()) == {REDACTED}
+        assert secrets == set()
+
+    def test_json_bodies_are_scrubbed_by_field_only(self):
+        """Test that nested secret fields are redacted and other JSON values kept."""
+        secrets = {"010-1234-5678"}
+
+        body = json.loads(scrub_body(
+            json.dumps({"userMap": [{"CUST_NM": "홍길동", "h_run_dt": "20251225", "note": "010-1234-5678"}]}),
+            secrets,
+        ))
+
+        assert body == {"userMap": [{"CUST_NM": REDACTED, "h_run_dt": "20251225", "note": "010-1234-5678"}]}
+
+    def test_other_bodies_are_scrubbed_by_whole_token(self):
+        """Test that known secrets are redacted in text only where they stand alone."""
+        secrets = {"010-1234-5678", "s3cret"}
+
+        text = scrub_body("key=010-1234-5678&x=1&y=s3crets", secrets)
+
+        assert text == f"key={REDACTED}&x=1&y=s3crets"
@@ -0,0 +1,44 @@
+"""Unit tests for JSON decoding of API responses."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.infrastructure.external import json_codec
+from src.infrastructure.external.json_codec import response_json
+from src.infrastructure.external.transport import InMemoryResponse
+
+
+class TestResponseJson:
+    """Test response_json."""
+
+    def test_parses_body_bytes(self):
+        """Test that the raw content is parsed without reading text."""
+        response = Mock(spec=["content"], content='{"역": "서울"}'.encode("utf-8"))
+
+        assert response_json(response) == {"역": "서울"}
+
+    def test_response_without_bytes_uses_text(self):
+        """Test that responses that only carry text are still decoded."""
+        response = Mock()
+        response.text = '{"strResult": "SUCC"}'
+
+        assert response_json(response) == {"strResult": "SUCC"}
+
+    def test_non_utf8_body_falls_back_to_text(self):
+        """Test that a body in another charset is decoded through text."""
+        response = Mock(content='{"역": "서울"}'.encode("euc-kr"), text='{"역": "서울"}')
+
+        assert response_json(response) == {"역": "서울"}
+
+    def test_malformed_body_raises_json_error(self):
+        """Test that malformed JSON raises json.JSONDecodeError with either parser."""
+        with pytest.raises(json.JSONDecodeError):
+            response_json(InMemoryResponse("<html>"))
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test that loads works with the stdlib parser when orjson is missing."""
+        monkeypatch.setattr(json_codec, "loads", json.loads)
+
+        assert response_json(InMemoryResponse('{"a": [1, 2]}')) == {"a": [1, 2]}
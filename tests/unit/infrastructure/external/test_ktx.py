@@ -1,5 +1,9 @@
 """Unit tests for KTX external module."""
 
+import copy
+import threading
+import time
+
 import pytest
 
 from src.infrastructure.external.ktx import (
@@ -18,9 +22,13 @@ from src.infrastructure.external.ktx import (
     NoResultsError,
     SoldOutError,
     NetFunnelHelper,
+    KorailCancelledError,
+    KorailTimeoutError,
+    DEFAULT_TIMEOUTS,
     TrainType,
     ReserveOption,
 )
+from src.infrastructure.external.transport import TransportTimeout
 
 
 class TestSchedule:
@@ -189,6 +197,37 @@ class TestTrain:
         assert train.has_general_waiting_list() is True
         assert train.has_waiting_list() is True
 
+    def test_train_is_read_only_and_slotted(self):
+        """Test that a Train rejects writes, has no __dict__ and survives copying."""
+        data = {
+            "h_trn_clsf_cd": "100",
+            "h_trn_no": "001",
+            "h_dpt_rs_stn_nm": "서울",
+            "h_dpt_dt": "20250109",
+            "h_dpt_tm": "100000",
+            "h_arv_dt": "20250109",
+            "h_arv_tm": "125959",
+            "h_gen_rsv_cd": "11",
+        }
+        train = Train(data)
+
+        with pytest.raises(AttributeError):
+            train.general_seat = "13"
+        assert not hasattr(train, "__dict__")
+        assert copy.copy(train).train_no == "001"
+
+    def test_train_interns_strings(self):
+        """Test that station names of separately parsed rows share one string object."""
+        rows = [
+            {"h_dpt_rs_stn_nm": "".join(["서", "울"]), "h_dpt_dt": "20250109", "h_dpt_tm": "100000",
+             "h_arv_dt": "20250109", "h_arv_tm": "125959"}
+            for _ in range(2)
+        ]
+
+        first, second = (Train(row) for row in rows)
+
+        assert first.dep_name is second.dep_name
+
 
 class TestTicket:
     """Test Ticket class."""
@@ -237,6 +276,8 @@ class TestTicket:
         assert ticket.car_no == "05"
         assert ticket.seat_no == "01"
         assert ticket.pnr_no == "12345"
+        assert ticket._replace(seat_no="02").seat_no == "02"
+        assert ticket.seat_no == "01"
 
     def test_get_ticket_no(self):
         """Test ticket number generation."""
@@ -546,6 +587,44 @@ class TestNetFunnelHelper:
         assert helper._cached_key is None
         assert helper._last_fetch_time == 0
 
+    def test_run_cancelled_while_waiting(self, mocker):
+        """Test that setting the cancel token ends the queue wait immediately"""
+        helper = NetFunnelHelper()
+        mocker.patch.object(helper, "_start", return_value=("201", "key", "5"))
+        mocker.patch.object(helper, "_check", return_value=("201", "key", "5"))
+        token = threading.Event()
+        threading.Timer(0.1, token.set).start()
+
+        started = time.monotonic()
+        with pytest.raises(KorailCancelledError):
+            helper.run(token)
+
+        assert time.monotonic() - started < 1.0
+        assert helper._cached_key is None
+
+    def test_make_request_timeout_raises_timeout_error(self, mocker):
+        """Test that NetFunnel requests use the helper timeout and raise KorailTimeoutError"""
+        helper = NetFunnelHelper(timeout=2.0)
+        get = mocker.patch.object(helper._session, "get", side_effect=TransportTimeout("timed out"))
+
+        with pytest.raises(KorailTimeoutError):
+            helper.run()
+
+        assert get.call_args.kwargs["timeout"] == 2.0
+        assert helper._cached_key is None
+
+    def test_run_with_cancelled_token_skips_request(self, mocker):
+        """Test that an already cancelled token raises before contacting NetFunnel"""
+        helper = NetFunnelHelper()
+        start = mocker.patch.object(helper, "_start")
+        token = threading.Event()
+        token.set()
+
+        with pytest.raises(KorailCancelledError):
+            helper.run(token)
+
+        start.assert_not_called()
+
 
 class TestKorail:
     """Test Korail class."""
@@ -560,6 +639,50 @@ class TestKorail:
         assert korail.korail_pw == "test_pw"
         assert korail.logined is False
 
+    def test_korail_request_uses_endpoint_timeout(self, mocker):
+        """Test that requests carry the per-endpoint timeout, overridable per client"""
+        korail = Korail(auto_login=False, timeouts={"reserve": 3.0})
+        get = mocker.patch.object(korail._session, "get")
+
+        korail._get("reserve", params={})
+        korail._get("myticketlist", params={})
+
+        assert get.call_args_list[0].kwargs["timeout"] == 3.0
+        assert get.call_args_list[1].kwargs["timeout"] == DEFAULT_TIMEOUTS["default"]
+
+    def test_korail_request_timeout_raises_timeout_error(self, mocker):
+        """Test that an HTTP timeout is raised as KorailTimeoutError"""
+        korail = Korail(auto_login=False)
+        mocker.patch.object(korail._session, "post", side_effect=TransportTimeout("timed out"))
+
+        with pytest.raises(KorailTimeoutError):
+            korail._post("pay", data={})
+
+    def test_korail_expired_deadline_skips_request(self, mocker):
+        """Test that no request is sent once the deadline has passed"""
+        korail = Korail(auto_login=False)
+        get = mocker.patch.object(korail._session, "get")
+        korail.deadline = time.monotonic() - 0.1
+
+        with pytest.raises(KorailTimeoutError):
+            korail._get("reserve", params={})
+
+        get.assert_not_called()
+
+    def test_korail_search_train_cancelled(self, mocker):
+        """Test that search_train raises without a request once the token is set"""
+        token = threading.Event()
+        token.set()
+        korail = Korail(
+            korail_id="test_id", korail_pw="test_pw", auto_login=False, cancel_token=token
+        )
+        get = mocker.patch.object(korail._session, "get")
+
+        with pytest.raises(KorailCancelledError):
+            korail.search_train("서울", "부산", "20250115", "100000")
+
+        get.assert_not_called()
+
     def test_result_check_success(self):
         """Test successful result check."""
         korail = Korail(
@@ -0,0 +1,109 @@
+"""Unit tests for the per-endpoint request metrics."""
+
+import pytest
+
+from src.infrastructure.external.metrics import NETFUNNEL_QUEUE, LatencyHistogram, MetricsRegistry
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram."""
+
+    def test_percentiles_within_precision(self):
+        """Test that percentiles of 1..1000 ms are within the histogram's relative error."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.min == 0.001
+        assert histogram.max == 1.0
+        for percent, expected in ((50, 0.5), (90, 0.9), (99, 0.99)):
+            assert histogram.percentile(percent) == pytest.approx(expected, rel=1 / 64)
+
+    def test_percentile_never_exceeds_max(self):
+        """Test that a bucket's upper bound is clamped to the largest recorded value."""
+        histogram = LatencyHistogram()
+        histogram.record(0.123456)
+
+        assert histogram.percentile(100) == 0.123456
+
+    def test_out_of_range_values_are_kept(self):
+        """Test that zero and very long durations land in the first and last buckets."""
+        histogram = LatencyHistogram()
+        histogram.record(0.0)
+        histogram.record(10 ** 7)
+
+        assert histogram.count == 2
+        assert histogram.counts[0] == histogram.counts[-1] == 1
+
+    def test_empty_histogram(self):
+        """Test that an empty histogram reports zero."""
+        assert LatencyHistogram().percentile(99) == 0.0
+
+
+class TestMetricsRegistry:
+    """Test MetricsRegistry."""
+
+    def test_records_counts_and_errors_by_class(self):
+        """Test that calls and exception classes are counted per endpoint."""
+        metrics = MetricsRegistry()
+        metrics.record("search_schedule", 0.1)
+        metrics.record("search_schedule", 0.3, TimeoutError("slow"))
+        metrics.record("reserve", 0.2, ValueError())
+        metrics.record("reserve", 0.2, ValueError())
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["search_schedule"].count == 2
+        assert snapshot["search_schedule"].errors == {"TimeoutError": 1}
+        assert snapshot["search_schedule"].mean == pytest.approx(0.2)
+        assert snapshot["reserve"].error_count == 2
+
+    def test_timed_records_the_block(self):
+        """Test that timed() records the block's exception and lets it propagate."""
+        metrics = MetricsRegistry()
+        with metrics.timed("login"):
+            pass
+        with pytest.raises(KeyError):
+            with metrics.timed("login"):
+                raise KeyError("x")
+
+        snapshot = metrics.snapshot()["login"]
+        assert snapshot.count == 2
+        assert dict(snapshot.errors) == {"KeyError": 1}
+
+    def test_snapshot_is_immutable_and_detached(self):
+        """Test that a snapshot neither changes later nor can be changed."""
+        metrics = MetricsRegistry()
+        metrics.record("tickets", 0.05, OSError())
+        snapshot = metrics.snapshot()["tickets"]
+
+        metrics.record("tickets", 0.05, OSError())
+        metrics.reset()
+
+        assert snapshot.count == 1
+        with pytest.raises(TypeError):
+            snapshot.errors["OSError"] = 0
+        assert metrics.snapshot() == {}
+
+    def test_last_call_and_last_success(self):
+        """Test that the last duration is kept and only calls without error move last_success."""
+        metrics = MetricsRegistry()
+        metrics.record("search_schedule", 0.2)
+        succeeded = metrics.snapshot()["search_schedule"].last_success
+
+        metrics.record("search_schedule", 0.4, TimeoutError())
+
+        snapshot = metrics.snapshot()["search_schedule"]
+        assert snapshot.last == 0.4
+        assert snapshot.last_success == succeeded is not None
+
+    def test_gauges_hold_the_latest_value(self):
+        """Test that set_gauge() replaces the value and reset() clears gauges."""
+        metrics = MetricsRegistry()
+        metrics.set_gauge(NETFUNNEL_QUEUE, 120)
+        metrics.set_gauge(NETFUNNEL_QUEUE, 80)
+
+        assert metrics.gauges() == {NETFUNNEL_QUEUE: 80}
+        metrics.reset()
+        assert metrics.gauges() == {}
@@ -1,9 +1,14 @@
 """Unit tests for SRT external module."""
 
+import threading
+import time
+
 import pytest
 import json
 
 from src.infrastructure.external.srt import (
+    SRTLoginExpiredError,
+    SRTSoldOutError,
     SRT,
     SRTTrain,
     SRTTicket,
@@ -22,11 +27,15 @@ from src.infrastructure.external.srt import (
     SRTNotLoggedInError,
     SRTNetFunnelError,
     NetFunnelHelper,
+    SRTCancelledError,
+    SRTTimeoutError,
+    DEFAULT_TIMEOUTS,
     STATION_CODE,
     STATION_NAME,
     TRAIN_NAME,
     WINDOW_SEAT,
 )
+from src.infrastructure.external.transport import TransportTimeout
 
 
 class TestPassenger:
@@ -325,6 +334,32 @@ class TestSRTTrain:
         assert "수서" in dump_str
         assert "부산" in dump_str
 
+    def test_train_is_read_only(self):
+        """Test that SRTTrain rejects writes and has no per-instance __dict__."""
+        data = {
+            "stlbTrnClsfCd": "17",
+            "trnNo": "301",
+            "dptDt": "20250109",
+            "dptTm": "100000",
+            "dptRsStnCd": "0551",
+            "dptStnRunOrdr": "1",
+            "dptStnConsOrdr": "1",
+            "arvDt": "20250109",
+            "arvTm": "125959",
+            "arvRsStnCd": "0020",
+            "arvStnRunOrdr": "10",
+            "arvStnConsOrdr": "10",
+            "gnrmRsvPsbStr": "예약가능",
+            "sprmRsvPsbStr": "매진",
+            "rsvWaitPsbCdNm": "",
+            "rsvWaitPsbCd": "-1",
+        }
+        train = SRTTrain(data)
+
+        with pytest.raises(AttributeError):
+            train.general_seat_state = "매진"
+        assert not hasattr(train, "__dict__")
+
 
 class TestSRTReservation:
     """Test SRTReservation class."""
@@ -479,6 +514,8 @@ class TestSRTResponseData:
 
         assert "resultMap" in all_data
         assert "extra" in all_data
+        with pytest.raises(TypeError):
+            all_data["extra"] = "changed"
 
     def test_response_data_get_status(self):
         """Test getting status data."""
@@ -528,6 +565,24 @@ class TestSRTErrors:
         assert error.msg == "NetFunnel error"
         assert isinstance(error, SRTError)
 
+    def test_failure_messages_map_to_specific_errors(self, mocker):
+        """Test that sold-out and login-required replies raise SRTResponseError subclasses."""
+        srt = SRT(auto_login=False)
+        reply = mocker.Mock()
+
+        reply.text = json.dumps({"resultMap": [{"strResult": "FAIL", "msgTxt": "잔여석없음"}]})
+        with pytest.raises(SRTSoldOutError):
+            srt._checked(reply)
+
+        reply.text = json.dumps({"resultMap": [{"strResult": "FAIL", "msgTxt": "로그인 후 사용하십시오."}]})
+        with pytest.raises(SRTLoginExpiredError):
+            srt._checked(reply)
+
+        reply.text = json.dumps({"resultMap": [{"strResult": "FAIL", "msgTxt": "열차 정보가 없습니다."}]})
+        with pytest.raises(SRTResponseError) as excinfo:
+            srt._checked(reply)
+        assert type(excinfo.value) is SRTResponseError
+
 
 class TestNetFunnelHelper:
     """Test NetFunnelHelper class."""
@@ -599,6 +654,44 @@ class TestNetFunnelHelper:
         assert helper._cached_key is None
         assert helper._last_fetch_time == 0
 
+    def test_run_cancelled_while_waiting(self, mocker):
+        """Test that setting the cancel token ends the queue wait immediately"""
+        helper = NetFunnelHelper()
+        mocker.patch.object(helper, "_start", return_value=("201", "key", "5", None))
+        mocker.patch.object(helper, "_check", return_value=("201", "key", "5", None))
+        token = threading.Event()
+        threading.Timer(0.1, token.set).start()
+
+        started = time.monotonic()
+        with pytest.raises(SRTCancelledError):
+            helper.run(token)
+
+        assert time.monotonic() - started < 1.0
+        assert helper._cached_key is None
+
+    def test_make_request_timeout_raises_timeout_error(self, mocker):
+        """Test that NetFunnel requests use the helper timeout and raise SRTTimeoutError"""
+        helper = NetFunnelHelper(timeout=2.0)
+        get = mocker.patch.object(helper._session, "get", side_effect=TransportTimeout("timed out"))
+
+        with pytest.raises(SRTTimeoutError):
+            helper.run()
+
+        assert get.call_args.kwargs["timeout"] == 2.0
+        assert helper._cached_key is None
+
+    def test_run_with_cancelled_token_skips_request(self, mocker):
+        """Test that an already cancelled token raises before contacting NetFunnel"""
+        helper = NetFunnelHelper()
+        start = mocker.patch.object(helper, "_start")
+        token = threading.Event()
+        token.set()
+
+        with pytest.raises(SRTCancelledError):
+            helper.run(token)
+
+        start.assert_not_called()
+
 
 class TestSRT:
     """Test SRT class."""
@@ -636,6 +729,51 @@ class TestSRT:
         assert srt._netfunnel._cached_key is None
         assert srt._netfunnel._last_fetch_time == 0
 
+    def test_srt_request_uses_endpoint_timeout(self, mocker):
+        """Test that requests carry the per-endpoint timeout, overridable per client"""
+        srt = SRT(auto_login=False, timeouts={"reserve": 3.0})
+        post = mocker.patch.object(srt._session, "post")
+
+        srt._post("reserve", data={})
+        srt._post("tickets")
+
+        assert post.call_args_list[0].kwargs["timeout"] == 3.0
+        assert post.call_args_list[1].kwargs["timeout"] == DEFAULT_TIMEOUTS["default"]
+
+    def test_srt_request_timeout_raises_timeout_error(self, mocker):
+        """Test that an HTTP timeout is raised as SRTTimeoutError"""
+        srt = SRT(auto_login=False)
+        mocker.patch.object(srt._session, "post", side_effect=TransportTimeout("timed out"))
+
+        with pytest.raises(SRTTimeoutError, match="search_schedule timed out"):
+            srt._post("search_schedule", data={})
+
+    def test_srt_deadline_caps_and_expires(self, mocker):
+        """Test that the deadline shortens timeouts and rejects requests once passed"""
+        srt = SRT(auto_login=False)
+        post = mocker.patch.object(srt._session, "post")
+
+        srt.deadline = time.monotonic() + 1.0
+        srt._post("payment", data={})
+        assert post.call_args.kwargs["timeout"] <= 1.0
+
+        srt.deadline = time.monotonic() - 0.1
+        with pytest.raises(SRTTimeoutError, match="Deadline exceeded"):
+            srt._post("payment", data={})
+        assert post.call_count == 1
+
+    def test_srt_search_train_cancelled(self, mocker):
+        """Test that search_train raises without a request once the token is set"""
+        token = threading.Event()
+        token.set()
+        srt = SRT(srt_id="test_id", srt_pw="test_pw", auto_login=False, cancel_token=token)
+        post = mocker.patch.object(srt._session, "post")
+
+        with pytest.raises(SRTCancelledError):
+            srt.search_train("수서", "부산", "20991231", "100000")
+
+        post.assert_not_called()
+
 
 class TestSeatType:
     """Test SeatType enum."""
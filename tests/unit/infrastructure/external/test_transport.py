@@ -0,0 +1,169 @@
+"""Unit tests for the shared HTTP transport layer."""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.external import transport as transport_module
+from src.infrastructure.external.ktx import Korail
+from src.infrastructure.external.srt import SRT
+from src.infrastructure.external.transport import (
+    InMemoryResponse,
+    InMemoryTransport,
+    RequestTiming,
+    ThreadedAsyncTransport,
+    TransportConfig,
+    TransportTimeout,
+    default_transport,
+    set_default_transport,
+)
+
+
+def _echo(request):
+    return InMemoryResponse(f"{request.method} {request.params.get('q', '')}")
+
+
+class TestInMemoryTransport:
+    """Test sessions of InMemoryTransport."""
+
+    def test_request_reaches_handler(self):
+        """Test that the handler gets the method, params, data and session headers."""
+        # Arrange
+        seen = []
+        transport = InMemoryTransport(lambda request: seen.append(request) or InMemoryResponse("{}"))
+        session = transport.session({"User-Agent": "test"})
+
+        # Act
+        session.post("http://fake/api", data={"a": "1"}, timeout=3)
+
+        # Assert
+        assert seen[0].method == "POST"
+        assert seen[0].url == "http://fake/api"
+        assert seen[0].data == {"a": "1"}
+        assert seen[0].headers["User-Agent"] == "test"
+        assert seen[0].timeout == 3
+
+    def test_timing_hook_reports_each_request(self):
+        """Test that hooks get a RequestTiming with status and body size."""
+        # Arrange
+        transport = InMemoryTransport(_echo)
+        timings: list[RequestTiming] = []
+        transport.add_hook(timings.append)
+        session = transport.session()
+
+        # Act
+        response = session.get("http://fake/search", params={"q": "abc"})
+
+        # Assert
+        assert response.text == "GET abc"
+        assert len(timings) == 1
+        assert timings[0].transport == "memory"
+        assert timings[0].method == "GET"
+        assert timings[0].status == 200
+        assert timings[0].size == len("GET abc")
+        assert timings[0].elapsed >= 0
+
+    def test_removed_hook_is_not_called(self):
+        """Test that remove_hook stops the reports."""
+        transport = InMemoryTransport(_echo)
+        timings = []
+        transport.add_hook(timings.append)
+        transport.remove_hook(timings.append)
+
+        transport.session().get("http://fake/")
+
+        assert timings == []
+
+    def test_timeout_is_translated(self):
+        """Test that a handler TimeoutError surfaces as TransportTimeout and is reported."""
+        # Arrange
+        def handler(request):
+            raise TimeoutError("slow")
+
+        transport = InMemoryTransport(handler)
+        timings = []
+        transport.add_hook(timings.append)
+
+        # Act & Assert
+        with pytest.raises(TransportTimeout, match="slow"):
+            transport.session().get("http://fake/")
+        assert timings[0].status is None
+        assert isinstance(timings[0].error, TransportTimeout)
+
+
+class TestTransportConfig:
+    """Test how TransportConfig shapes session headers."""
+
+    def test_defaults_keep_client_headers(self):
+        """Test that the default config leaves the client's headers alone."""
+        session = InMemoryTransport(_echo).session({"Connection": "Keep-Alive", "Accept-Encoding": "gzip"})
+
+        assert session.headers["Connection"] == "Keep-Alive"
+        assert session.headers["Accept-Encoding"] == "gzip"
+
+    def test_keep_alive_and_compression_disabled(self):
+        """Test that disabling keep-alive and compression overrides the client's headers."""
+        config = TransportConfig(keep_alive=False, compression=False)
+
+        session = InMemoryTransport(_echo, config).session({"Connection": "Keep-Alive", "Accept-Encoding": "gzip"})
+
+        assert session.headers["Connection"] == "close"
+        assert session.headers["Accept-Encoding"] == "identity"
+
+
+class TestDefaultTransport:
+    """Test the process-wide default transport."""
+
+    def test_clients_use_default_transport(self):
+        """Test that clients and their NetFunnel helper take sessions from the default transport."""
+        # Arrange
+        fake = InMemoryTransport(_echo)
+        set_default_transport(fake)
+        try:
+            # Act
+            srt = SRT(auto_login=False)
+            korail = Korail(auto_login=False)
+        finally:
+            set_default_transport(None)
+
+        # Assert
+        assert srt._transport is fake
+        assert srt._netfunnel._transport is fake
+        assert korail._transport is fake
+        assert default_transport() is not fake
+
+    def test_explicit_transport_wins(self):
+        """Test that a transport passed to a client is used instead of the default."""
+        fake = InMemoryTransport(_echo)
+
+        korail = Korail(auto_login=False, transport=fake)
+
+        assert korail._transport is fake
+        assert korail._session.headers["Host"] == "smart.letskorail.com"
+
+    def test_default_backend_matches_install(self):
+        """Test that the built-in default is curl_cffi when installed, else requests."""
+        expected = "curl_cffi" if transport_module.HAS_CURL_CFFI else "requests"
+
+        assert transport_module.create_transport().name == expected
+
+
+class TestThreadedAsyncTransport:
+    """Test async sessions backed by a sync transport."""
+
+    def test_async_request_runs_sync_session(self):
+        """Test that an awaited request returns the sync response and reports once."""
+        # Arrange
+        sync = InMemoryTransport(_echo)
+        transport = ThreadedAsyncTransport(sync)
+        timings = []
+        transport.add_hook(timings.append)
+        session = transport.session({"User-Agent": "test"})
+
+        # Act
+        response = asyncio.run(session.get("http://fake/", params={"q": "x"}))
+
+        # Assert
+        assert response.text == "GET x"
+        assert session.headers["User-Agent"] == "test"
+        assert len(timings) == 1
@@ -372,3 +372,105 @@ class TestCredentialStoragePayment:
         mock_card_repo.save.assert_called_once()
         call_args = mock_card_repo.save.call_args
         assert call_args.kwargs['train_type'] == "KORAIL"
+
+
+class TestCredentialStorageCache:
+    """Tests for the in-memory decrypted credential cache"""
+
+    def test_repeated_load_payment_uses_cache(self):
+        """Test that only the first load hits the repository and decrypts"""
+        # Arrange
+        storage, _, mock_card_repo = create_credential_storage()
+
+        mock_card = MagicMock()
+        mock_card.card_number = "encrypted_1234567890123456"
+        mock_card.card_password = "encrypted_12"
+        mock_card.card_expired_date = "encrypted_2512"
+        mock_card.card_validate_number = "encrypted_900101"
+        mock_card.is_corporate = False
+        mock_card_repo.find_by_train_type.return_value = mock_card
+
+        from unittest.mock import patch
+        with patch('src.infrastructure.security.credential_storage.EncryptionService') as mock_enc:
+            mock_enc.decrypt.side_effect = lambda x: x.replace("encrypted_", "")
+
+            # Act
+            first = storage.load_payment("KORAIL")
+            second = storage.load_payment("KORAIL")
+
+            # Assert
+            assert first == second
+            mock_card_repo.find_by_train_type.assert_called_once_with("KORAIL")
+            assert mock_enc.decrypt.call_count == 4
+
+    def test_missing_credentials_are_cached(self):
+        """Test that a miss is remembered until something is saved"""
+        # Arrange
+        storage, mock_user_repo, _ = create_credential_storage()
+        mock_user_repo.find_by_train_type.return_value = None
+
+        # Act
+        assert storage.load_srt_login() is None
+        assert storage.load_srt_login() is None
+
+        # Assert
+        mock_user_repo.find_by_train_type.assert_called_once_with("SRT")
+
+    def test_save_writes_through_to_cache(self):
+        """Test that saved credentials are served from memory afterwards"""
+        # Arrange
+        storage, mock_user_repo, mock_card_repo = create_credential_storage()
+
+        # Act
+        storage.save_ktx_login("user", "pass")
+        storage.save_payment("1234567890123456", "12", "2512", "900101", False, train_type="SRT")
+        login = storage.load_ktx_login()
+        payment = storage.load_payment("SRT")
+
+        # Assert
+        assert login == LoginCredentials(username="user", password="pass")
+        assert payment.card_number == "1234567890123456"
+        mock_user_repo.find_by_train_type.assert_not_called()
+        mock_card_repo.find_by_train_type.assert_not_called()
+
+    def test_delete_invalidates_cache(self):
+        """Test that deleted credentials are no longer returned"""
+        # Arrange
+        storage, mock_user_repo, _ = create_credential_storage()
+        storage.save_ktx_login("user", "pass")
+
+        # Act
+        storage.delete_ktx_login()
+
+        # Assert
+        assert storage.load_ktx_login() is None
+        mock_user_repo.find_by_train_type.assert_not_called()
+
+    def test_cache_dropped_after_idle_timeout(self, mocker):
+        """Test that an idle cache is cleared and reloaded from the repository"""
+        # Arrange
+        clock = mocker.patch(
+            'src.infrastructure.security.credential_storage.time.monotonic', return_value=100.0
+        )
+        mock_user_repo = MagicMock()
+        storage = CredentialStorage(
+            user_repository=mock_user_repo,
+            card_repository=MagicMock(),
+            cache_idle_timeout=60
+        )
+        mock_user_repo.find_by_train_type.return_value = None
+
+        try:
+            storage.load_ktx_login()
+            clock.return_value = 130.0
+            storage.load_ktx_login()
+            assert mock_user_repo.find_by_train_type.call_count == 1
+
+            # Act
+            clock.return_value = 200.0
+            storage.load_ktx_login()
+
+            # Assert
+            assert mock_user_repo.find_by_train_type.call_count == 2
+        finally:
+            storage.clear_cache()
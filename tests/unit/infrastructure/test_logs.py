@@ -0,0 +1,98 @@
+"""Unit tests for the application logging setup."""
+
+import logging
+
+import pytest
+
+from src.infrastructure.logs import (
+    APP_LOGGER,
+    client_response_logger,
+    configure_logging,
+    enable_response_bodies,
+    log_response,
+    response_logger,
+)
+from src.infrastructure.external.transport import InMemoryResponse
+
+
+class _UnreadResponse:
+    """Response whose body must not be touched"""
+
+    status_code = 200
+
+    @property
+    def text(self):
+        raise AssertionError("response body was read")
+
+
+@pytest.fixture
+def restore_logging():
+    """Undo configure_logging() and response body switches after a test"""
+    yield
+    configure_logging()
+    logging.getLogger(APP_LOGGER).setLevel(logging.NOTSET)
+
+
+class TestResponseBodies:
+    """Test log_response()."""
+
+    def test_bodies_are_off_by_default(self, caplog, restore_logging):
+        """Test that a disabled response logger neither logs nor decodes the body."""
+        caplog.set_level(logging.DEBUG)
+        enable_response_bodies(False)
+
+        log_response(response_logger("srt"), "search_schedule", _UnreadResponse())
+
+        assert caplog.records == []
+
+    def test_enabled_bodies_are_truncated(self, caplog, restore_logging):
+        """Test that an enabled body is logged at DEBUG and cut to the limit."""
+        caplog.set_level(logging.DEBUG)
+        enable_response_bodies()
+
+        log_response(response_logger("korail"), "reserve", InMemoryResponse("x" * 30), limit=10)
+
+        [record] = caplog.records
+        assert record.name == "responses.korail"
+        assert record.levelno == logging.DEBUG
+        assert record.getMessage() == "reserve 200: xxxxxxxxxx... [20 more characters]"
+
+    def test_client_logger_is_on_alone(self, caplog, restore_logging):
+        """Test that a client's own logger logs while the shared one stays off."""
+        caplog.set_level(logging.DEBUG)
+        enable_response_bodies(False)
+        owner = object()
+
+        log_response(client_response_logger("srt", owner), "login", InMemoryResponse("{}"))
+        log_response(response_logger("srt"), "login", _UnreadResponse())
+
+        [record] = caplog.records
+        assert record.name == f"responses.srt.{id(owner):x}"
+
+
+class TestConfigureLogging:
+    """Test configure_logging()."""
+
+    def test_routes_application_records_to_handlers_and_file(self, tmp_path, restore_logging):
+        """Test that module records at the level reach the given handler and the log file."""
+        received = []
+        handler = logging.Handler()
+        handler.emit = received.append
+        path = tmp_path / "logs" / "app.log"
+
+        configure_logging(logging.INFO, handlers=[handler], log_file=path)
+        logging.getLogger(f"{APP_LOGGER}.infrastructure.external.srt").info("로그인 성공: %s", "홍길동")
+        logging.getLogger(f"{APP_LOGGER}.infrastructure.external.srt").debug("hidden")
+
+        assert [record.getMessage() for record in received] == ["로그인 성공: 홍길동"]
+        assert "로그인 성공: 홍길동" in path.read_text(encoding="utf-8")
+
+    def test_second_call_replaces_handlers(self, restore_logging):
+        """Test that handlers of a previous call are removed from the root logger."""
+        first = logging.NullHandler()
+        configure_logging(handlers=[first])
+
+        installed = configure_logging(handlers=[])
+
+        assert installed == []
+        assert first not in logging.getLogger().handlers
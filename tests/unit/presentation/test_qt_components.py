@@ -35,6 +35,64 @@ class TestLogSignals:
         assert received[0] == "Test message"
 
 
+@pytest.mark.unit
+@pytest.mark.ui
+class TestLogListModel:
+    """Tests for LogListModel"""
+
+    @pytest.fixture
+    def model(self, qtbot):
+        """Create LogListModel instance with a small line cap"""
+        from src.presentation.qt import LogListModel
+        return LogListModel(max_lines=3)
+
+    def test_append_waits_for_flush(self, model):
+        """Test that appended lines only become rows on flush, in one batch"""
+        inserted = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+        model.append("first")
+        model.append("second")
+
+        assert model.rowCount() == 0
+        assert model.flush() == 2
+        assert inserted == [(0, 1)]
+        assert model.data(model.index(1)).endswith("] second")
+        assert model.flush() == 0
+
+    def test_oldest_lines_are_dropped_at_cap(self, model):
+        """Test that the model keeps only the newest max_lines lines"""
+        for n in range(5):
+            model.append(f"line {n}")
+            model.flush()
+
+        assert [line.split("] ")[1] for line in model.lines()] == ["line 2", "line 3", "line 4"]
+
+    def test_dropped_lines_spill_to_file(self, qtbot, tmp_path):
+        """Test that lines leaving the buffer are written to the spill file, oldest first"""
+        from src.presentation.qt import LogListModel
+        path = tmp_path / "ui.log"
+        model = LogListModel(max_lines=2, spill_path=path)
+        for n in range(5):
+            model.append(f"line {n}")
+        model.flush()
+
+        assert [line.split("] ")[1] for line in path.read_text(encoding="utf-8").splitlines()] == [
+            "line 0", "line 1", "line 2"
+        ]
+        assert model.rowCount() == 2
+
+    def test_clear_removes_rows_and_pending_lines(self, model):
+        """Test that clear empties both the rows and the lines not yet flushed"""
+        model.append("shown")
+        model.flush()
+        model.append("pending")
+
+        model.clear()
+
+        assert model.rowCount() == 0
+        assert model.flush() == 0
+
+
 @pytest.mark.unit
 @pytest.mark.ui
 class TestTrainItemWidget:
@@ -100,6 +158,81 @@ class TestSectionCard:
         assert label.parent() == section_card
 
 
+@pytest.mark.unit
+@pytest.mark.ui
+class TestPerformancePanel:
+    """Tests for PerformancePanel widget"""
+
+    @pytest.fixture
+    def metrics(self):
+        """Create a MetricsRegistry with a few recorded requests"""
+        from src.infrastructure.external.metrics import MetricsRegistry
+        metrics = MetricsRegistry()
+        metrics.record("login", 0.1)
+        metrics.record("search_schedule", 0.2)
+        metrics.record("search_schedule", 0.3, TimeoutError())
+        return metrics
+
+    @pytest.fixture
+    def panel(self, qtbot, metrics):
+        """Create PerformancePanel instance with a settable attempt count"""
+        from src.presentation.qt import PerformancePanel
+        panel = PerformancePanel(metrics, lambda: panel.attempt_count)
+        panel.attempt_count = 0
+        qtbot.addWidget(panel)
+        return panel
+
+    def test_panel_starts_collapsed_without_refreshing(self, panel):
+        """Test that the panel is collapsed and its timer idle until opened"""
+        assert not panel.expanded
+        assert not panel.timer.isActive()
+        assert panel.values["search"].text() == "-"
+
+    def test_toggle_runs_timer_only_while_expanded(self, panel):
+        """Test that opening the panel fills it in and starts the fixed-rate timer"""
+        panel.toggle()
+        assert panel.expanded
+        assert panel.timer.isActive()
+        assert panel.values["search"].text() == "300 ms / 300 ms"
+
+        panel.toggle()
+        assert not panel.timer.isActive()
+
+    def test_refresh_shows_rates_queue_and_errors(self, panel, metrics):
+        """Test attempts per minute, queue position and error rate from a snapshot"""
+        from src.infrastructure.external.metrics import NETFUNNEL_QUEUE
+        panel.refresh(now=1000.0)
+        panel.attempt_count = 10
+        metrics.set_gauge(NETFUNNEL_QUEUE, 1234)
+
+        panel.refresh(now=1030.0)
+
+        assert panel.values["rate"].text() == "20.0회"
+        assert panel.values["queue"].text() == "1,234명"
+        assert panel.values["errors"].text() == "TimeoutError 33.3%"
+
+    def test_queue_row_can_be_left_out(self, qtbot, metrics):
+        """Test that a panel for a service without NetFunnel has no queue row"""
+        from src.presentation.qt import PerformancePanel
+        panel = PerformancePanel(metrics, lambda: 0, queue=False)
+        qtbot.addWidget(panel)
+
+        panel.refresh()
+
+        assert "queue" not in panel.values
+        assert panel.values["search"].text() == "300 ms / 300 ms"
+
+    def test_new_loop_restarts_attempt_rate(self, panel):
+        """Test that a smaller attempt count (a new loop) drops older samples"""
+        panel.attempt_count = 50
+        panel.refresh(now=1000.0)
+        panel.attempt_count = 2
+
+        panel.refresh(now=1010.0)
+
+        assert panel.values["rate"].text() == "-"
+
+
 @pytest.mark.unit
 @pytest.mark.ui
 class TestResourcePath: